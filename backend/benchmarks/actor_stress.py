@@ -0,0 +1,122 @@
+"""Stress the per-game actors with concurrent answers and round timeouts.
+
+Each game gets thousands of SubmitAnswer calls issued at once: every
+player answers every round several times over, some answers name a
+question from a round that has already closed, and round timeouts are
+fired into the same mailboxes as the answers. The report gives answer
+throughput and how many messages each actor batch drained; that rounds
+advance once and scores match the accepted answers is checked by
+tests/test_actor.py.
+
+Run from backend/:  python -m benchmarks.actor_stress
+"""
+import argparse
+import asyncio
+import random
+import time
+
+from generated import game_pb2
+from game.game_logic import GameServiceImpl, _TIMEOUT
+
+
+class _Context:
+    def set_code(self, code):
+        raise AssertionError(f"unexpected status {code}")
+
+    def set_details(self, details):
+        pass
+
+
+async def play_round(service, game, player_ids, duplicates, timeout_rate):
+    round_index = game.current_question_index
+    question = game.question(round_index)
+    previous = game.question(round_index - 1).question_id if round_index else ""
+    calls = []
+    for player_id in player_ids:
+        for _ in range(duplicates):
+            stale = previous and random.random() < 0.1
+            calls.append(game_pb2.AnswerRequest(
+                game_id=game.game_id, player_id=player_id,
+                question_id=previous if stale else question.question_id,
+                selected_option=random.choice(question.options)))
+    random.shuffle(calls)
+
+    context = _Context()
+    submissions = [service.SubmitAnswer(request, context) for request in calls]
+    timeout = random.random() < timeout_rate
+    if timeout:
+        # Race the round clock against the answers, landing anywhere among them.
+        submissions.insert(random.randrange(len(submissions) + 1), fire_timeout(game, round_index))
+    await asyncio.gather(*submissions)
+    return len(calls)
+
+
+async def fire_timeout(game, round_index):
+    game.actor.tell((_TIMEOUT, round_index))
+
+
+async def run(args):
+    service = GameServiceImpl()
+    context = _Context()
+    games = []
+    for _ in range(args.games):
+        first = await service.JoinGame(game_pb2.JoinRequest(player_name="p0", question_count=args.rounds), context)
+        game = service.games[first.game_id]
+        player_ids = [first.player_id]
+        for i in range(1, args.players):
+            joined = await service.JoinGame(game_pb2.JoinRequest(player_name=f"p{i}", game_id=game.game_id), context)
+            player_ids.append(joined.player_id)
+        transitions = []
+        game.session_listeners.append(_Transitions(transitions))
+        games.append((game, player_ids, transitions))
+
+    # The bank may hold fewer questions than asked for.
+    total_rounds = games[0][0].total_rounds
+    submitted = 0
+    start = time.perf_counter()
+    for _ in range(total_rounds):
+        rounds = await asyncio.gather(*(
+            play_round(service, game, player_ids, args.duplicates, args.timeout_rate)
+            for game, player_ids, _ in games))
+        submitted += sum(rounds)
+    elapsed = time.perf_counter() - start
+
+    batches = sum(game.actor.batches for game, _, _ in games)
+    timed_out = sum(event.round.timed_out for _, _, transitions in games for event in transitions)
+    print(f"{args.games} games x {args.players} players x {total_rounds} rounds, "
+          f"{args.duplicates} submissions per player per round")
+    print(f"  answers submitted : {submitted}")
+    print(f"  throughput        : {submitted / elapsed:,.0f} answers/s")
+    print(f"  actor batches     : {batches} ({submitted / batches:.0f} messages per batch)")
+    print(f"  rounds timed out  : {timed_out} of {args.games * total_rounds}")
+
+
+class _Transitions:
+    """Collects the round transitions pushed to a game's sessions."""
+
+    def __init__(self, events):
+        self.events = events
+
+    def put_nowait(self, event):
+        if isinstance(event, game_pb2.SessionEvent) and event.WhichOneof("event") == "round":
+            self.events.append(event)
+
+    def qsize(self):
+        return 0
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--games", type=int, default=20)
+    parser.add_argument("--players", type=int, default=50)
+    parser.add_argument("--rounds", type=int, default=5)
+    parser.add_argument("--duplicates", type=int, default=40, help="submissions per player per round")
+    parser.add_argument("--timeout-rate", type=float, default=0.3, help="share of rounds raced by a timeout")
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args()
+    random.seed(args.seed)
+    asyncio.run(run(args))
+
+
+if __name__ == "__main__":
+    main()
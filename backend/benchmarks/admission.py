@@ -0,0 +1,178 @@
+"""Well-behaved games next to an abusive client, with and without limits.
+
+Starts run_server.py three times: quiet (well-behaved games only), then
+the same games alongside an abusive client process, first with no
+limits and then with admission control. The well-behaved games are
+--games rooms of --players, seated before the abuse starts, that play
+over PlaySession, thinking before each answer and reading the
+leaderboard once a round. The abusive client polls
+GetNextQuestion and GetLeaderboard in a tight loop as one player, and
+runs a reconnect storm of JoinGame plus StreamLeaderboard opens.
+
+The report gives the well-behaved players' p50/p99 latency per RPC, how
+many abusive calls were served or refused (and how many of those carried
+a retry hint), how many well-behaved sessions failed, and the server's
+CPU time. Well-behaved clients wait out refusals as the retry hint says
+(GameClient does this). That throttling keeps games playing while the
+abuser is refused is checked by tests/test_admission.py.
+
+Run from backend/:  python -m benchmarks.admission
+"""
+import argparse
+import asyncio
+import json
+import os
+import random
+import statistics
+import subprocess
+import sys
+import time
+
+import grpc
+
+from benchmarks.runtime_modes import _wait_ready
+from generated import game_pb2
+from game.client import GameClient, retry_after
+
+LIMITS = ["--player-rate", "10", "--join-rate", "100", "--stream-limit", "500", "--max-loop-lag-ms", "50"]
+RUNS = (("quiet", [], False), ("abused", [], True), ("abused + limits", LIMITS, True))
+
+
+async def well_behaved(target, args, start_abuse):
+    latencies = {"session answer": [], "GetLeaderboard": []}
+    failures = []
+
+    async def play(player):
+        try:
+            async with player.session() as session:
+                async for event in session:
+                    kind = event.WhichOneof("event")
+                    if kind == "question":
+                        await asyncio.sleep(random.uniform(0.5, 2.5))  # thinking
+                        sent = time.perf_counter()
+                        session.answer(random.choice(event.question.options), event.question.question_id)
+                    elif kind == "answer_result":
+                        latencies["session answer"].append(time.perf_counter() - sent)
+                        start = time.perf_counter()
+                        await player.leaderboard(limit=10)
+                        latencies["GetLeaderboard"].append(time.perf_counter() - start)
+        except grpc.aio.AioRpcError as error:
+            failures.append(error.code().name)
+
+    async with GameClient(target, deadline=30.0) as client:
+        rooms = []
+        for room in range(args.games):
+            first = await client.join(f"r{room}p0", question_count=args.rounds)
+            rest = [await client.join(f"r{room}p{i}", first.game_id) for i in range(1, args.players)]
+            rooms.append([first] + rest)
+        await asyncio.to_thread(start_abuse)
+        start = time.perf_counter()
+        await asyncio.gather(*(play(player) for room in rooms for player in room))
+        seconds = time.perf_counter() - start
+    return latencies, failures, seconds
+
+
+async def abuse(target, seconds):
+    """Run the abusive client; returns calls served and refused."""
+    counts = {"served": 0, "refused": 0, "hinted": 0}
+    deadline = time.perf_counter() + seconds
+
+    async def call(coroutine):
+        try:
+            result = await coroutine
+            counts["served"] += 1
+            return result
+        except grpc.aio.AioRpcError as error:
+            if error.code() == grpc.StatusCode.RESOURCE_EXHAUSTED:
+                counts["refused"] += 1
+                counts["hinted"] += retry_after(error) is not None
+            return None
+
+    # The abuser ignores retry hints; well-behaved clients wait them out.
+    async with GameClient(target, deadline=10.0, admission_retries=0) as client:
+        player = await client.join("poller")
+
+        async def poll():
+            while time.perf_counter() < deadline:
+                await call(player.next_question())
+                await call(player.leaderboard())
+
+        async def storm():
+            while time.perf_counter() < deadline:
+                joined = await call(client.join("storm"))
+                if joined is None:
+                    continue
+                stream = client.pool.stub().StreamLeaderboard(game_pb2.GameId(game_id=joined.game_id))
+                await call(stream.read())
+                stream.cancel()
+
+        await asyncio.gather(*(poll() for _ in range(20)), *(storm() for _ in range(20)))
+    return counts
+
+
+def cpu_seconds(pid):
+    """User plus system CPU time a process has used."""
+    with open(f"/proc/{pid}/stat") as stat:
+        fields = stat.read().rpartition(")")[2].split()
+    return (int(fields[11]) + int(fields[12])) / os.sysconf("SC_CLK_TCK")
+
+
+def run(name, flags, abused, args):
+    server = subprocess.Popen(
+        [sys.executable, "run_server.py", "--port", str(args.port), "--metrics-port", "0", *flags],
+        stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+    )
+    target = f"127.0.0.1:{args.port}"
+    abuser = None
+
+    def start_abuse():
+        # Once the rooms are seated: the abuser shares their address, so
+        # its join storm would otherwise share their join budget too.
+        nonlocal abuser
+        if abused:
+            abuser = subprocess.Popen([sys.executable, "-m", "benchmarks.admission", "--abuser", target,
+                                       "--abuse-seconds", str(args.abuse_seconds)], stdout=subprocess.PIPE)
+            time.sleep(1.0)  # let the abuse get going
+
+    try:
+        asyncio.run(_wait_ready(target))
+        result = asyncio.run(well_behaved(target, args, start_abuse))
+        counts = json.loads(abuser.communicate()[0].splitlines()[-1]) if abuser else None
+        return result, counts, cpu_seconds(server.pid)
+    finally:
+        if abuser is not None and abuser.poll() is None:
+            abuser.kill()
+        server.terminate()
+        server.wait()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--games", type=int, default=40)
+    parser.add_argument("--players", type=int, default=10)
+    parser.add_argument("--rounds", type=int, default=3)
+    parser.add_argument("--abuse-seconds", type=float, default=10.0)
+    parser.add_argument("--port", type=int, default=50178)
+    parser.add_argument("--abuser", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+    if args.abuser:
+        print(json.dumps(asyncio.run(abuse(args.abuser, args.abuse_seconds))))
+        return
+
+    print(f"{args.games} games x {args.players} players, {args.rounds} rounds; abuser: 20 pollers + 20 joiners")
+    print(f"{'run':16} {'rpc':15} {'p50 ms':>8} {'p99 ms':>8}   abusive calls")
+    for name, flags, abused in RUNS:
+        (latencies, failures, seconds), counts, cpu = run(name, flags, abused, args)
+        abuse_text = (f"{counts['served']} served, {counts['refused']} refused ({counts['hinted']} with retry hint)"
+                      if counts else "-")
+        for rpc, samples in latencies.items():
+            samples.sort()
+            print(f"{name:16} {rpc:15} {statistics.median(samples) * 1e3:8.2f} "
+                  f"{samples[int(len(samples) * 0.99)] * 1e3:8.2f}   {abuse_text}")
+            abuse_text = ""
+        print(f"{'':16} games took {seconds:.1f}s, server used {cpu:.1f}s CPU, "
+              f"{len(failures)} well-behaved sessions failed")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,111 @@
+"""Startup time and per-process memory of the question bank at 1M questions.
+
+Writes a synthetic bank as JSON and compiles it, then starts fresh
+processes that load it two ways: parsing the JSON into Question objects,
+id map and pools as the bank used to, and mapping the compiled file. Each
+reports its load time and private (anonymous) resident memory; the
+mapped file's pages are page cache shared by every process, reported as
+file-backed memory. Each mapped process also draws 1000 games of
+questions and checks them against their filters, the id index and, for
+JSON files under 50 MB, the source text.
+
+Run from backend/:  python -m benchmarks.bank_loading --questions 1000000
+"""
+import argparse
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+from array import array
+
+from benchmarks.game_creation import synthetic_records
+
+
+def rss_kb():
+    fields = {}
+    with open("/proc/self/status") as f:
+        for line in f:
+            name, _, value = line.partition(":")
+            if name in ("RssAnon", "RssFile"):
+                fields[name] = int(value.split()[0])
+    return fields
+
+
+def legacy_load(path):
+    from game.questions import Question
+    with open(path, "r", encoding="utf-8") as f:
+        records = json.load(f)
+    questions = [Question(i, data) for i, data in enumerate(records)]
+    by_id = {q.question_id: q.index for q in questions}
+    pools = {}
+    for q in questions:
+        for key in ((q.category, q.difficulty), (q.category, ""), ("", q.difficulty), ("", "")):
+            pools.setdefault(key, array("i")).append(q.index)
+    return questions, by_id, pools
+
+
+def child(mode, path, json_path):
+    before = rss_kb()
+    start = time.perf_counter()
+    if mode == "json":
+        loaded = legacy_load(path)
+    else:
+        from game.questions import QuestionBank
+        loaded = QuestionBank(path)
+    seconds = time.perf_counter() - start
+    after = rss_kb()
+    if mode == "mapped":
+        records = None
+        if os.path.getsize(json_path) < 50_000_000:
+            with open(json_path, "r", encoding="utf-8") as f:
+                records = json.load(f)
+        for _ in range(1000):
+            for index in loaded.sample(10, "science", "hard"):
+                question = loaded[index]
+                assert (question.category, question.difficulty) == ("science", "hard")
+                assert loaded.get_question_by_id(question.question_id) is question
+                if records is not None:
+                    assert records[index]["question_text"] == question.question_text
+    print(json.dumps({"seconds": seconds, "anon_kb": after["RssAnon"] - before["RssAnon"],
+                      "file_kb": after["RssFile"] - before["RssFile"]}))
+
+
+def measure(mode, path, json_path):
+    out = subprocess.run([sys.executable, "-m", "benchmarks.bank_loading", "--child", mode, path, json_path],
+                         check=True, capture_output=True, text=True).stdout
+    return json.loads(out.splitlines()[-1])
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--questions", type=int, default=1_000_000)
+    parser.add_argument("--child", nargs=3, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+    if args.child:
+        child(*args.child)
+        return
+
+    from game.bankfile import compile_bank
+
+    with tempfile.TemporaryDirectory() as tmp:
+        json_path = os.path.join(tmp, "questions.json")
+        with open(json_path, "w", encoding="utf-8") as f:
+            json.dump(list(synthetic_records(args.questions)), f)
+        start = time.perf_counter()
+        bank_path = compile_bank(json_path)
+        compile_seconds = time.perf_counter() - start
+
+        print(f"{args.questions} questions: JSON {os.path.getsize(json_path) / 1e6:.0f} MB, "
+              f"compiled {os.path.getsize(bank_path) / 1e6:.0f} MB in {compile_seconds:.1f}s (build step)")
+        print(f"{'load':8} {'startup ms':>11} {'private MB':>11} {'shared MB':>10}")
+        for mode, path in (("json", json_path), ("mapped", bank_path)):
+            result = measure(mode, path, json_path)
+            print(f"{mode:8} {result['seconds'] * 1e3:11.1f} {result['anon_kb'] / 1024:11.1f} "
+                  f"{result['file_kb'] / 1024:10.1f}")
+        print("  checks: mapped samples match their filters and id lookups")
+
+
+if __name__ == "__main__":
+    main()
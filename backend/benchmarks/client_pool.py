@@ -0,0 +1,131 @@
+"""10k bots with a channel each, against the pooled client.
+
+Starts run_server.py once per mode and seats --bots players in rooms of
+--room-size, all connected at once: "per-player" gives every bot its own
+GameClient and so its own connection, "pooled" shares one GameClient with
+--channels connections. Once everyone is seated, each bot answers the
+current question and reads its leaderboard position. The report gives
+the time to seat every bot, p50/p99 of each RPC, the connections open
+to the server and the client's resident memory. Every answer must be
+graded and every bot must find itself on its room's board.
+
+Run from backend/:  python -m benchmarks.client_pool --bots 10000
+"""
+import argparse
+import asyncio
+import statistics
+import subprocess
+import sys
+import time
+
+from benchmarks.runtime_modes import _wait_ready
+from game.client import GameClient
+
+
+def rss_mb():
+    with open("/proc/self/status") as f:
+        for line in f:
+            if line.startswith("VmRSS:"):
+                return int(line.split()[1]) / 1024
+    return 0.0
+
+
+def connections(port):
+    """Established TCP connections to port on this host."""
+    count = 0
+    for table in ("/proc/net/tcp", "/proc/net/tcp6"):
+        with open(table) as f:
+            for line in f.readlines()[1:]:
+                fields = line.split()
+                if fields[3] == "01" and int(fields[2].rsplit(":", 1)[1], 16) == port:
+                    count += 1
+    return count
+
+
+async def drive(target, mode, args):
+    latencies = {"JoinGame": [], "SubmitAnswer": [], "GetLeaderboard": []}
+    gate = asyncio.Semaphore(args.concurrency)
+    shared = GameClient(target, channels=args.channels, deadline=args.deadline) if mode == "pooled" else None
+    clients = []
+
+    def client():
+        if shared is not None:
+            return shared
+        own = GameClient(target, channels=1, deadline=args.deadline)
+        clients.append(own)
+        return own
+
+    async def timed(rpc, call):
+        async with gate:
+            start = time.perf_counter()
+            result = await call
+            latencies[rpc].append(time.perf_counter() - start)
+            return result
+
+    async def seat(room):
+        first = await timed("JoinGame", client().join(f"bot{room}-0"))
+        rest = [timed("JoinGame", client().join(f"bot{room}-{i}", first.game_id)) for i in range(1, args.room_size)]
+        return [first] + list(await asyncio.gather(*rest))
+
+    async def play(player):
+        question = await player.next_question()
+        result = await timed("SubmitAnswer", player.answer(question.options[0], question.question_id))
+        board = await timed("GetLeaderboard", player.leaderboard(limit=10))
+        return result, board
+
+    try:
+        start = time.perf_counter()
+        rooms = await asyncio.gather(*(seat(room) for room in range(args.bots // args.room_size)))
+        seat_seconds = time.perf_counter() - start
+        players = [player for room in rooms for player in room]
+        sockets, rss = connections(args.port), rss_mb()
+
+        for player, (result, board) in zip(players, await asyncio.gather(*(play(p) for p in players))):
+            assert result.explanation, "an answer was not graded"
+            assert board.player_entry.player_id == player.player_id, "a bot is missing from its board"
+            assert board.total_players == args.room_size
+    finally:
+        await asyncio.gather(*(c.close() for c in clients + ([shared] if shared else [])))
+    return {"seat_seconds": seat_seconds, "sockets": sockets, "rss": rss, "latencies": latencies}
+
+
+def run_mode(mode, args):
+    server = subprocess.Popen(
+        [sys.executable, "run_server.py", "--port", str(args.port), "--metrics-port", "0"],
+        stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+    )
+    try:
+        target = f"127.0.0.1:{args.port}"
+        asyncio.run(_wait_ready(target))
+        return asyncio.run(drive(target, mode, args))
+    finally:
+        server.terminate()
+        server.wait()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--modes", nargs="+", choices=("per-player", "pooled"), default=["per-player", "pooled"])
+    parser.add_argument("--bots", type=int, default=10_000)
+    parser.add_argument("--room-size", type=int, default=50)
+    parser.add_argument("--channels", type=int, default=4, help="connections in the pooled client")
+    parser.add_argument("--concurrency", type=int, default=1000, help="RPCs in flight at once")
+    parser.add_argument("--deadline", type=float, default=60.0)
+    parser.add_argument("--port", type=int, default=50176)
+    args = parser.parse_args()
+
+    print(f"{args.bots} bots in rooms of {args.room_size}, {args.concurrency} RPCs in flight")
+    print(f"{'mode':11} {'seat s':>7} {'conns':>8} {'RSS MB':>7}  {'rpc':15} {'p50 ms':>8} {'p99 ms':>8}")
+    for mode in args.modes:
+        result = run_mode(mode, args)
+        head = f"{mode:11} {result['seat_seconds']:7.1f} {result['sockets']:8} {result['rss']:7.0f}"
+        for rpc, samples in result["latencies"].items():
+            samples.sort()
+            print(f"{head}  {rpc:15} {statistics.median(samples) * 1e3:8.2f} "
+                  f"{samples[int(len(samples) * 0.99)] * 1e3:8.2f}")
+            head = " " * len(head)
+    print("  checks: every answer graded; every bot on its room's board")
+
+
+if __name__ == "__main__":
+    main()
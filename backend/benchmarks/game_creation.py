@@ -0,0 +1,72 @@
+"""Question selection cost per new game against a large synthetic bank.
+
+Run from backend/:  python -m benchmarks.game_creation --questions 500000
+"""
+import argparse
+import random
+import time
+
+from game.questions import QuestionBank
+
+CATEGORIES = ["geography", "science", "history", "sports", "music", "film", "art", "food"]
+DIFFICULTIES = ["easy", "medium", "hard"]
+
+
+def synthetic_records(count):
+    for i in range(count):
+        yield {
+            "question_id": f"q{i}",
+            "question_text": f"Question {i}?",
+            "options": ["A", "B", "C", "D"],
+            "correct_option": "A",
+            "category": CATEGORIES[i % len(CATEGORIES)],
+            "difficulty": DIFFICULTIES[i % len(DIFFICULTIES)],
+        }
+
+
+def linear_pick(questions, count, category, difficulty):
+    # What picking looked like without pools: filter the whole bank per game.
+    matching = [q.index for q in questions
+                if (not category or q.category == category)
+                and (not difficulty or q.difficulty == difficulty)]
+    return random.sample(matching, min(count, len(matching)))
+
+
+def per_game_us(fn, games):
+    start = time.perf_counter()
+    for _ in range(games):
+        fn()
+    return (time.perf_counter() - start) / games * 1e6
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--questions", type=int, default=500000)
+    parser.add_argument("--games", type=int, default=10000)
+    parser.add_argument("--per-game", type=int, default=10, help="questions per game")
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    bank = QuestionBank(records=synthetic_records(args.questions))
+    print(f"loaded {len(bank)} questions in {time.perf_counter() - start:.2f}s")
+
+    seen = [f"q{i}" for i in range(0, args.questions, args.questions // 50 or 1)]
+    cases = [
+        ("any", "", "", ()),
+        ("category", "science", "", ()),
+        ("category+difficulty", "science", "hard", ()),
+        ("category+difficulty, 50 excluded", "science", "hard", seen),
+    ]
+    linear_games = max(1, args.games // 1000)
+    questions = bank.questions  # decoded once; the linear scan reads them all
+    print(f"{'filter':34} {'indexed us/game':>16} {'linear us/game':>16}")
+    for label, category, difficulty, exclude in cases:
+        indexed = per_game_us(
+            lambda: bank.sample(args.per_game, category, difficulty, exclude), args.games)
+        linear = per_game_us(
+            lambda: linear_pick(questions, args.per_game, category, difficulty), linear_games)
+        print(f"{label:34} {indexed:16.1f} {linear:16.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,350 @@
+"""Browser-path latency: the in-process gateway against a proxy hop.
+
+Starts run_server.py and calls it three ways: native gRPC (the floor),
+gRPC-Web and WebSocket through the server's own --gateway-port, and the
+same through a separate proxy process that turns each call into a gRPC
+call to the server, as grpcwebproxy and Envoy do. The proxy is this
+repo's gateway serving forwarding handlers, so the two browser paths
+differ only by the extra process and hop.
+
+Each mode seats a room of --players through the path under test, keeps
+a StreamLeaderboard open on it, and has every player answer correctly
+in turn followed by a GetLeaderboard. "stream delta" is the time from
+sending an answer to its leaderboard delta arriving on the stream, so a
+buffering path shows up there. Then --sessions single-player games are
+played over PlaySession (a WebSocket for the browser paths) and "session
+answer" times each answer to its result. Every delta and result is
+checked against the answers sent.
+
+Run from backend/:  python -m benchmarks.gateway_latency --players 200
+"""
+import argparse
+import asyncio
+import base64
+import os
+import statistics
+import struct
+import subprocess
+import sys
+import time
+
+import grpc
+
+from benchmarks.runtime_modes import _wait_ready
+from generated import game_pb2
+from game.gateway import SERVICE_PATH, Gateway, _ws_read, frame, parse_frames
+from game.questions import QuestionBank
+
+_TRAILER = 0x80
+
+
+class NativeTransport:
+    def __init__(self, target):
+        self.channel = grpc.aio.insecure_channel(target)
+
+    async def unary(self, method, request):
+        return await self.channel.unary_unary(SERVICE_PATH + method)(request.SerializeToString())
+
+    async def stream(self, method, request):
+        async for message in self.channel.unary_stream(SERVICE_PATH + method)(request.SerializeToString()):
+            yield message
+
+    async def session(self, method):
+        outgoing = asyncio.Queue()
+
+        async def requests():
+            while (message := await outgoing.get()) is not None:
+                yield message
+
+        async def events():
+            call = self.channel.stream_stream(SERVICE_PATH + method)(requests())
+            try:
+                async for message in call:
+                    yield message
+            finally:
+                call.cancel()
+
+        return outgoing, events()
+
+    async def close(self):
+        await self.channel.close()
+
+
+class WebTransport:
+    """gRPC-Web over one kept-alive HTTP/1.1 connection; streams and
+    sessions open their own."""
+
+    def __init__(self, host, port, text=False):
+        self.host, self.port = host, port
+        self.content_type = b"application/grpc-web-text" if text else b"application/grpc-web+proto"
+        self.text = text
+        self._connection = None
+
+    def _request(self, method, request):
+        body = frame(request.SerializeToString())
+        if self.text:
+            body = base64.b64encode(body)
+        return (b"POST " + (SERVICE_PATH + method).encode() + b" HTTP/1.1\r\nHost: gateway\r\n"
+                b"Content-Type: " + self.content_type + b"\r\nX-Grpc-Web: 1\r\n"
+                b"Content-Length: %d\r\n\r\n" % len(body) + body)
+
+    def _messages(self, data):
+        if self.text:
+            data = base64.b64decode(data)
+        messages = []
+        for flag, payload in parse_frames(data):
+            if flag & _TRAILER:
+                if b"grpc-status:0\r\n" not in payload:
+                    raise RuntimeError(payload.decode())
+            else:
+                messages.append(payload)
+        return messages
+
+    async def unary(self, method, request):
+        if self._connection is None:
+            self._connection = await asyncio.open_connection(self.host, self.port)
+        reader, writer = self._connection
+        writer.write(self._request(method, request))
+        headers = await _response_head(reader)
+        return self._messages(await reader.readexactly(int(headers["content-length"])))[0]
+
+    async def stream(self, method, request):
+        reader, writer = await asyncio.open_connection(self.host, self.port)
+        try:
+            writer.write(self._request(method, request))
+            await _response_head(reader)
+            while size := int(await reader.readline(), 16):
+                data = await reader.readexactly(size)
+                await reader.readexactly(2)
+                for message in self._messages(data):
+                    yield message
+        finally:
+            writer.close()
+
+    async def session(self, method):
+        reader, writer = await asyncio.open_connection(self.host, self.port)
+        key = base64.b64encode(os.urandom(16))
+        writer.write(b"GET " + (SERVICE_PATH + method).encode() + b" HTTP/1.1\r\nHost: gateway\r\n"
+                     b"Upgrade: websocket\r\nConnection: Upgrade\r\nSec-WebSocket-Version: 13\r\n"
+                     b"Sec-WebSocket-Key: " + key + b"\r\n\r\n")
+        await _response_head(reader)
+        outgoing = asyncio.Queue()
+
+        async def send():
+            while (message := await outgoing.get()) is not None:
+                _ws_send(writer, frame(message))
+            _ws_send(writer, frame(b"", _TRAILER))
+
+        async def events():
+            sender = asyncio.create_task(send())
+            try:
+                while True:
+                    opcode, payload = await _ws_read(reader)
+                    if opcode == 0x8:
+                        return
+                    for flag, message in parse_frames(payload):
+                        if flag & _TRAILER:
+                            if b"grpc-status:0\r\n" not in message:
+                                raise RuntimeError(message.decode())
+                            return
+                        yield message
+            finally:
+                sender.cancel()
+                writer.close()
+
+        return outgoing, events()
+
+    async def close(self):
+        if self._connection is not None:
+            self._connection[1].close()
+
+
+async def _response_head(reader):
+    status = await reader.readline()
+    if b" 200 " not in status and b" 101 " not in status:
+        raise RuntimeError(status.decode())
+    headers = {}
+    while (line := await reader.readline()) not in (b"\r\n", b""):
+        name, _, value = line.decode("latin-1").partition(":")
+        headers[name.strip().lower()] = value.strip()
+    return headers
+
+
+def _ws_send(writer, payload):
+    # Client frames are masked, as browsers send them.
+    mask = os.urandom(4)
+    length = len(payload)
+    key = int.from_bytes((mask * (length // 4 + 1))[:length], "big")
+    masked = (int.from_bytes(payload, "big") ^ key).to_bytes(length, "big")
+    if length < 126:
+        head = struct.pack(">BB", 0x82, 0x80 | length)
+    else:
+        head = struct.pack(">BBH", 0x82, 0x80 | 126, length)
+    writer.write(head + mask + masked)
+
+
+async def measure(transport, bank, args):
+    latencies = {name: [] for name in
+                 ("JoinGame", "SubmitAnswer", "GetLeaderboard", "stream delta", "session answer")}
+
+    async def timed(name, call):
+        start = time.perf_counter()
+        result = await call
+        latencies[name].append(time.perf_counter() - start)
+        return result
+
+    join = game_pb2.JoinResponse.FromString
+    first = join(await timed("JoinGame", transport.unary("JoinGame", game_pb2.JoinRequest(player_name="p0"))))
+    seats = [first] + [
+        join(await timed("JoinGame", transport.unary(
+            "JoinGame", game_pb2.JoinRequest(player_name=f"p{i}", game_id=first.game_id))))
+        for i in range(1, args.players)
+    ]
+    question = game_pb2.QuestionCard.FromString(await transport.unary(
+        "GetNextQuestion", game_pb2.GameRequest(game_id=first.game_id, player_id=first.player_id)))
+    correct = bank.get_question_by_id(question.question_id).correct_option
+
+    updates = transport.stream("StreamLeaderboard", game_pb2.GameId(game_id=first.game_id))
+    await anext(updates)  # the full board
+    for index, seat in enumerate(seats):
+        start = time.perf_counter()
+        result = game_pb2.AnswerResult.FromString(await timed("SubmitAnswer", transport.unary(
+            "SubmitAnswer", game_pb2.AnswerRequest(game_id=first.game_id, player_id=seat.player_id,
+                                                   question_id=question.question_id, selected_option=correct))))
+        assert result.correct, "a correct answer was graded wrong"
+        delta = game_pb2.LeaderboardUpdate.FromString(await anext(updates))
+        latencies["stream delta"].append(time.perf_counter() - start)
+        assert [c.player_index for c in delta.changes] == [index], "the delta is not for the answer sent"
+        board = game_pb2.Leaderboard.FromString(await timed("GetLeaderboard", transport.unary(
+            "GetLeaderboard", game_pb2.LeaderboardRequest(game_id=first.game_id, player_id=seat.player_id,
+                                                          limit=10))))
+        assert board.player_entry.score == result.points_awarded
+    await updates.aclose()
+
+    for i in range(args.sessions):
+        seat = join(await transport.unary("JoinGame", game_pb2.JoinRequest(player_name=f"s{i}")))
+        outgoing, events = await transport.session("PlaySession")
+        outgoing.put_nowait(game_pb2.SessionRequest(join=game_pb2.GameRequest(
+            game_id=seat.game_id, player_id=seat.player_id)).SerializeToString())
+        sent = None
+        async for message in events:
+            event = game_pb2.SessionEvent.FromString(message)
+            kind = event.WhichOneof("event")
+            if kind == "question":
+                sent = time.perf_counter()
+                outgoing.put_nowait(game_pb2.SessionRequest(answer=game_pb2.AnswerRequest(
+                    player_id=seat.player_id, question_id=event.question.question_id,
+                    selected_option=bank.get_question_by_id(event.question.question_id).correct_option,
+                )).SerializeToString())
+            elif kind == "answer_result":
+                latencies["session answer"].append(time.perf_counter() - sent)
+                assert event.answer_result.correct
+            elif kind == "round" and event.round.game_over:
+                break
+        outgoing.put_nowait(None)
+        await events.aclose()
+    return latencies
+
+
+def proxy_handlers(channel):
+    """Handlers that forward each call to a gRPC server as raw bytes."""
+    service = game_pb2.DESCRIPTOR.services_by_name["GameService"]
+    handlers = {}
+
+    def forward(multicallable, streaming):
+        async def unary(request, context):
+            try:
+                return await multicallable(request)
+            except grpc.aio.AioRpcError as error:
+                context.set_code(error.code())
+                context.set_details(error.details())
+                return b""
+
+        async def stream(request, context):
+            try:
+                async for response in multicallable(request):
+                    yield response
+            except grpc.aio.AioRpcError as error:
+                context.set_code(error.code())
+                context.set_details(error.details())
+        return stream if streaming else unary
+
+    for method in service.methods:
+        path = SERVICE_PATH + method.name
+        if method.client_streaming:
+            handlers[method.name] = grpc.stream_stream_rpc_method_handler(
+                forward(channel.stream_stream(path), True))
+        elif method.server_streaming:
+            handlers[method.name] = grpc.unary_stream_rpc_method_handler(forward(channel.unary_stream(path), True))
+        else:
+            handlers[method.name] = grpc.unary_unary_rpc_method_handler(forward(channel.unary_unary(path), False))
+    return handlers
+
+
+async def run_proxy(port, target):
+    channel = grpc.aio.insecure_channel(target)
+    gateway = Gateway(proxy_handlers(channel))
+    server = await gateway.start(port, host="127.0.0.1")
+    await server.serve_forever()
+
+
+async def check_text_mode(host, port):
+    """One call in the base64 format the frontend's generated client uses."""
+    transport = WebTransport(host, port, text=True)
+    joined = game_pb2.JoinResponse.FromString(
+        await transport.unary("JoinGame", game_pb2.JoinRequest(player_name="text")))
+    await transport.close()
+    assert joined.player_id
+
+
+async def run_mode(mode, ports, args):
+    bank = QuestionBank()
+    host = "127.0.0.1"
+    if mode == "native gRPC":
+        transport = NativeTransport(f"{host}:{ports['grpc']}")
+    else:
+        transport = WebTransport(host, ports["gateway"] if mode == "gateway" else ports["proxy"])
+        await check_text_mode(host, transport.port)
+    try:
+        return await measure(transport, bank, args)
+    finally:
+        await transport.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--players", type=int, default=200)
+    parser.add_argument("--sessions", type=int, default=50)
+    parser.add_argument("--port", type=int, default=50177, help="gRPC port; the next two are the gateway and proxy")
+    parser.add_argument("--proxy-child", nargs=2, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+    if args.proxy_child:
+        asyncio.run(run_proxy(int(args.proxy_child[0]), args.proxy_child[1]))
+        return
+
+    ports = {"grpc": args.port, "gateway": args.port + 1, "proxy": args.port + 2}
+    processes = [subprocess.Popen(
+        [sys.executable, "run_server.py", "--port", str(ports["grpc"]), "--metrics-port", "0",
+         "--gateway-port", str(ports["gateway"])], stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)]
+    processes.append(subprocess.Popen(
+        [sys.executable, "-m", "benchmarks.gateway_latency", "--proxy-child", str(ports["proxy"]),
+         f"127.0.0.1:{ports['grpc']}"], stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL))
+    try:
+        asyncio.run(_wait_ready(f"127.0.0.1:{ports['grpc']}"))
+        time.sleep(1)  # the proxy process starts alongside
+        print(f"{args.players} players in one room, {args.sessions} PlaySession games; latency in ms")
+        print(f"{'path':12} {'rpc':15} {'p50':>7} {'p99':>7}")
+        for mode in ("native gRPC", "gateway", "proxied"):
+            for name, samples in asyncio.run(run_mode(mode, ports, args)).items():
+                samples.sort()
+                print(f"{mode:12} {name:15} {statistics.median(samples) * 1e3:7.3f} "
+                      f"{samples[int(len(samples) * 0.99)] * 1e3:7.3f}")
+        print("  checks: every answer graded, every delta received unbuffered, text format decodes")
+    finally:
+        for process in processes:
+            process.terminate()
+            process.wait()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,88 @@
+"""Cost of a room's end-of-round GetLeaderboard refreshes.
+
+Every player in one room refreshes the leaderboard at the same moment,
+three ways: each call rebuilding the board (the old handler), through the
+per-version page cache, and sending the version already held so the
+reply is not_modified. The handler is called directly, so only the
+service's own work is measured. That a burst builds the page once and
+cached replies match rebuilt ones is covered by tests/test_leaderboard.py.
+
+Run from backend/:  python -m benchmarks.leaderboard_cache --players 500
+"""
+import argparse
+import asyncio
+import time
+
+from generated import game_pb2
+from game.game_logic import GameServiceImpl
+
+
+async def run(args):
+    service = GameServiceImpl()
+    first = await service.JoinGame(game_pb2.JoinRequest(player_name="p0"), None)
+    game = service.games[first.game_id]
+    seats = [first] + [
+        await service.JoinGame(game_pb2.JoinRequest(player_name=f"p{i}", game_id=first.game_id), None)
+        for i in range(1, args.players)
+    ]
+    for seat in seats[::3]:
+        await service.SubmitAnswer(game_pb2.AnswerRequest(
+            game_id=game.game_id, player_id=seat.player_id,
+            selected_option=game.question(0).correct_option), None)
+
+    requests = [game_pb2.LeaderboardRequest(game_id=game.game_id, player_id=seat.player_id, limit=args.limit)
+                for seat in seats]
+    version = game.leaderboard_hub.sequence
+
+    def rebuild(request):
+        # What GetLeaderboard did before pages were cached.
+        leaderboard = service._build_leaderboard(game, offset=0, limit=request.limit)
+        leaderboard.player_entry.CopyFrom(service._leaderboard_entry(game, game.players[request.player_id]))
+        return leaderboard.SerializeToString()
+
+    async def burst(call):
+        start = time.perf_counter()
+        for _ in range(args.bursts):
+            game.leaderboard_cache = None  # each burst follows a score change
+            for request in requests:
+                await call(request)
+        return (time.perf_counter() - start) / args.bursts
+
+    async def rebuilt(request):
+        return rebuild(request)
+
+    async def cached(request):
+        return await service.GetLeaderboard(request, None)
+
+    async def not_modified(request):
+        request.known_version = version
+        reply = await service.GetLeaderboard(request, None)
+        request.known_version = 0
+        return reply
+
+    timings = {"rebuild every call": await burst(rebuilt)}
+    timings["per-version cache"] = await burst(cached)
+    timings["not_modified"] = await burst(not_modified)
+
+    sizes = {
+        "rebuild every call": len(rebuild(requests[0])),
+        "per-version cache": len(await cached(requests[0])),
+        "not_modified": (await not_modified(requests[0])).ByteSize(),
+    }
+    print(f"{args.players} players refreshing a top-{args.limit or 'all'} board at once")
+    print(f"{'mode':20} {'burst ms':>9} {'us/call':>8} {'reply bytes':>12}")
+    for mode, seconds in timings.items():
+        print(f"{mode:20} {seconds * 1e3:9.2f} {seconds / len(requests) * 1e6:8.2f} {sizes[mode]:12}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--players", type=int, default=500)
+    parser.add_argument("--limit", type=int, default=0, help="entries per page; 0 for the whole board")
+    parser.add_argument("--bursts", type=int, default=5)
+    args = parser.parse_args()
+    asyncio.run(run(args))
+
+
+if __name__ == "__main__":
+    main()
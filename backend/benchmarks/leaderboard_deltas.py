@@ -0,0 +1,95 @@
+"""Bytes sent by StreamLeaderboard with deltas, against full boards.
+
+Fills one room, attaches --listeners StreamLeaderboard streams and plays
+every round with each player answering separately. Each listener keeps a
+LeaderboardReplica built from what it receives. One listener stops
+reading for a while so it falls behind and has to be resynced. The
+full-board figure is what the same updates would cost if each carried
+the whole Leaderboard. That the replicas stay correct is covered by
+tests/test_leaderboard.py.
+
+Run from backend/:  python -m benchmarks.leaderboard_deltas --players 500 --listeners 200
+"""
+import argparse
+import asyncio
+import random
+
+from generated import game_pb2
+from game.game_logic import GameServiceImpl
+from game.leaderboard import LeaderboardReplica
+
+
+async def listen(service, game_id, stats, stall=None, resume=None):
+    board = LeaderboardReplica()
+    async for update in service.StreamLeaderboard(game_pb2.GameId(game_id=game_id), None):
+        if isinstance(update, bytes):
+            stats["bytes"] += len(update)
+            update = game_pb2.LeaderboardUpdate.FromString(update)
+        else:
+            stats["bytes"] += update.ByteSize()
+            stats["full"] += 1
+        board.apply(update)
+        if stall is not None and board.sequence >= stall:
+            stall = None
+            await resume.wait()
+        if board.game_over:
+            return board
+
+
+async def run(args):
+    service = GameServiceImpl()
+    first = await service.JoinGame(game_pb2.JoinRequest(player_name="p0"), None)
+    game = service.games[first.game_id]
+    seats = [first] + [
+        await service.JoinGame(game_pb2.JoinRequest(player_name=f"p{i}", game_id=first.game_id), None)
+        for i in range(1, args.players)
+    ]
+
+    full_bytes = published = 0
+    hub = game.leaderboard_hub
+    publish = hub.publish
+
+    def counting_publish(update):
+        nonlocal full_bytes, published
+        full_bytes += service._full_leaderboard_update(game).ByteSize() * len(hub)
+        published += 1
+        publish(update)
+
+    hub.publish = counting_publish
+
+    stats = [{"bytes": 0, "full": 0} for _ in range(args.listeners)]
+    resume = asyncio.Event()
+    listeners = [asyncio.create_task(listen(service, game.game_id, s, stall=hub.sequence + 5, resume=resume))
+                 for s in stats[:1]]
+    listeners += [asyncio.create_task(listen(service, game.game_id, s)) for s in stats[1:]]
+    await asyncio.sleep(0)
+
+    for round_index in range(game.total_rounds):
+        question = game.question(round_index)
+        for seat in random.sample(seats, len(seats)):
+            await service.SubmitAnswer(game_pb2.AnswerRequest(
+                game_id=game.game_id, player_id=seat.player_id,
+                selected_option=random.choice(question.options)), None)
+        if round_index == 0:
+            resume.set()
+    await asyncio.gather(*listeners)
+
+    delta_bytes = sum(s["bytes"] for s in stats)
+    print(f"{args.players} players, {args.listeners} listeners, {published} updates")
+    print(f"  full boards  : {full_bytes / 1e6:10.2f} MB")
+    print(f"  deltas       : {delta_bytes / 1e6:10.2f} MB  ({full_bytes / delta_bytes:.0f}x less)")
+    print(f"  resyncs      : {sum(s['full'] for s in stats) - len(stats)} (stalled listener)")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--players", type=int, default=500)
+    parser.add_argument("--listeners", type=int, default=200)
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args()
+    random.seed(args.seed)
+    asyncio.run(run(args))
+
+
+if __name__ == "__main__":
+    main()
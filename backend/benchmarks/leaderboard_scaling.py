@@ -0,0 +1,71 @@
+"""Ranked leaderboard cost as rooms grow.
+
+Fills a RankedLeaderboard with --sizes players each, plays a few rounds
+so scores spread, then times score updates, single-player rank lookups
+and 20-entry pages at random offsets. Updates are also timed on one flat
+sorted list of packed keys, the layout the board used before, whose
+insert and delete move every key after the position and so grow with the
+room. tests/test_leaderboard.py checks the board against a full sort.
+
+Run from backend/:  python -m benchmarks.leaderboard_scaling --sizes 1000 100000 1000000
+"""
+import argparse
+import bisect
+import random
+import time
+
+from game.leaderboard import RankedLeaderboard, _pack
+
+
+def played(size, rounds, rng):
+    board = RankedLeaderboard()
+    for _ in range(size):
+        board.add()
+    for _ in range(rounds):
+        for index in range(size):
+            if rng.random() < 0.5:
+                board.update(index, board.score(index) + 10)
+    return board
+
+
+def per_call(fn, items):
+    start = time.perf_counter()
+    for item in items:
+        fn(item)
+    return (time.perf_counter() - start) / len(items) * 1e6
+
+
+def run(args):
+    print(f"{'players':>9} {'update us':>10} {'flat list us':>13} {'rank us':>8} {'page us':>8} {'bytes/player':>13}")
+    for size in args.sizes:
+        rng = random.Random(size)
+        board = played(size, args.rounds, rng)
+        picks = [rng.randrange(size) for _ in range(args.samples)]
+        update = per_call(lambda index: board.update(index, board.score(index) + 10), picks)
+        rank = per_call(board.rank, picks)
+        page = per_call(lambda offset: list(board.page(offset, 20)), picks[:args.samples // 10])
+
+        flat = sorted(_pack(board.score(index), index) for index in range(size))
+        scores = list(board.scores)
+
+        def flat_update(index):
+            del flat[bisect.bisect_left(flat, _pack(scores[index], index))]
+            scores[index] += 10
+            bisect.insort(flat, _pack(scores[index], index))
+
+        flat_time = per_call(flat_update, picks)
+        print(f"{size:>9} {update:>10.2f} {flat_time:>13.2f} {rank:>8.2f} {page:>8.2f} "
+              f"{board.__sizeof__() / size:>13.1f}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[100, 1000, 10000, 100000, 1000000])
+    parser.add_argument("--rounds", type=int, default=3, help="rounds played before timing")
+    parser.add_argument("--samples", type=int, default=50000)
+    args = parser.parse_args()
+    run(args)
+
+
+if __name__ == "__main__":
+    main()
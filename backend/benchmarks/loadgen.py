@@ -0,0 +1,299 @@
+"""Open-loop load generator for a running game server.
+
+Simulated users arrive at a scheduled rate, independent of how fast the
+server answers. Each arrival is picked from a weighted mix:
+
+  join      joins a fresh game and leaves
+  answer    joins a shared game and plays it over PlaySession, answering
+            every question after a think time
+  spectate  polls GetLeaderboard for a game in progress until it ends
+
+Answer players fill games of --players-per-game. Rates follow --stage
+DURATION:RATE (hold) or DURATION:FROM-TO (linear ramp), in arrivals per
+second, run back to back. The report gives p50/p95/p99 latency,
+throughput and errors per RPC, and --json writes it for comparing runs.
+
+Run from backend/ against a server:
+  python -m benchmarks.loadgen --stage 10:0-200 --stage 30:200 --json run.json
+"""
+import argparse
+import asyncio
+import json
+import math
+import random
+import sys
+import time
+from collections import defaultdict
+
+import grpc
+
+from generated import game_pb2, game_pb2_grpc
+
+# One connection per channel, so a sharded server sees the load spread
+# over its workers.
+_CHANNEL_OPTIONS = [("grpc.use_local_subchannel_pool", 1)]
+
+
+def parse_stage(text):
+    duration, _, rate = text.partition(":")
+    start, _, end = rate.partition("-")
+    return float(duration), float(start), float(end or start)
+
+
+def parse_mix(text):
+    mix = {}
+    for part in text.split(","):
+        kind, _, weight = part.partition("=")
+        if kind not in ("join", "answer", "spectate"):
+            raise argparse.ArgumentTypeError(f"unknown mix entry {kind!r}")
+        mix[kind] = float(weight)
+    return mix
+
+
+def arrival_times(stages, poisson=True):
+    """Offsets in seconds from the start of the run, one per arrival."""
+    offset = 0.0
+    for duration, start, end in stages:
+        t = 0.0
+        while True:
+            rate = start + (end - start) * t / duration
+            if rate <= 0:
+                # Nothing arrives at zero rate; step forward a little.
+                t += 0.01
+            else:
+                t += random.expovariate(rate) if poisson else 1.0 / rate
+            if t >= duration:
+                break
+            yield offset + t
+        offset += duration
+
+
+class Recorder:
+    def __init__(self):
+        self.latencies = defaultdict(list)  # rpc -> seconds
+        self.errors = defaultdict(lambda: defaultdict(int))  # rpc -> status -> count
+
+    async def call(self, rpc, awaitable):
+        start = time.perf_counter()
+        try:
+            result = await awaitable
+        except grpc.aio.AioRpcError as e:
+            self.errors[rpc][e.code().name] += 1
+            raise
+        self.latencies[rpc].append(time.perf_counter() - start)
+        return result
+
+    def observe(self, rpc, seconds):
+        self.latencies[rpc].append(seconds)
+
+    def report(self, elapsed):
+        rpcs = {}
+        for rpc in sorted(set(self.latencies) | set(self.errors)):
+            samples = sorted(self.latencies.get(rpc, ()))
+            errors = dict(self.errors.get(rpc, {}))
+            total = len(samples) + sum(errors.values())
+            rpcs[rpc] = {
+                "count": len(samples),
+                "errors": errors,
+                "error_rate": sum(errors.values()) / total if total else 0.0,
+                "throughput": len(samples) / elapsed if elapsed else 0.0,
+                "p50_ms": _percentile(samples, 50),
+                "p95_ms": _percentile(samples, 95),
+                "p99_ms": _percentile(samples, 99),
+                "max_ms": samples[-1] * 1e3 if samples else 0.0,
+            }
+        return rpcs
+
+
+def _percentile(samples, p):
+    if not samples:
+        return 0.0
+    return samples[min(len(samples) - 1, math.ceil(p / 100 * len(samples)) - 1)] * 1e3
+
+
+class LoadGenerator:
+    def __init__(self, target, channels=8, players_per_game=4, think_time=1.0, question_count=5):
+        self.target = target
+        self.players_per_game = players_per_game
+        self.think_time = think_time
+        self.question_count = question_count
+        self.recorder = Recorder()
+        self.arrivals = defaultdict(int)
+        self.live_games = []  # ids of games being played, for spectators
+        self._channels = [grpc.aio.insecure_channel(target, options=_CHANNEL_OPTIONS) for _ in range(channels)]
+        self._stubs = [game_pb2_grpc.GameServiceStub(channel) for channel in self._channels]
+        self._filling = None  # [future game id, seats taken] of the game being filled
+
+    def stub(self):
+        return random.choice(self._stubs)
+
+    def think(self):
+        return random.uniform(0.5, 1.5) * self.think_time
+
+    async def close(self):
+        for channel in self._channels:
+            await channel.close()
+
+    async def join(self):
+        await self.recorder.call("JoinGame", self.stub().JoinGame(
+            game_pb2.JoinRequest(player_name="load-join", question_count=self.question_count)))
+
+    async def answer(self):
+        stub = self.stub()
+        game, creator = self._seat()
+        game_id = None
+        if not creator:
+            game_id = await asyncio.shield(game)
+            if game_id is None:
+                return  # the player creating the game failed to join
+        try:
+            joined = await self.recorder.call("JoinGame", stub.JoinGame(
+                game_pb2.JoinRequest(player_name="load-player", game_id=game_id, question_count=self.question_count)))
+        except grpc.aio.AioRpcError:
+            if creator:
+                game.set_result(None)
+            return
+        if creator:
+            game.set_result(joined.game_id)
+            self.live_games.append(joined.game_id)
+
+        answers = asyncio.Queue()
+
+        async def requests():
+            yield game_pb2.SessionRequest(
+                join=game_pb2.GameRequest(game_id=joined.game_id, player_id=joined.player_id))
+            while (answer := await answers.get()) is not None:
+                yield game_pb2.SessionRequest(answer=answer)
+
+        started = time.perf_counter()
+        sent_at = None
+        try:
+            async for event in stub.PlaySession(requests()):
+                kind = event.WhichOneof("event")
+                if kind == "question":
+                    if started is not None:
+                        self.recorder.observe("PlaySession.first_question", time.perf_counter() - started)
+                        started = None
+                    await asyncio.sleep(self.think())
+                    sent_at = time.perf_counter()
+                    answers.put_nowait(game_pb2.AnswerRequest(selected_option=random.choice(event.question.options)))
+                elif kind == "answer_result" and sent_at is not None:
+                    self.recorder.observe("PlaySession.answer", time.perf_counter() - sent_at)
+                    sent_at = None
+                elif kind == "round" and event.round.game_over:
+                    break
+        except grpc.aio.AioRpcError as e:
+            self.recorder.errors["PlaySession"][e.code().name] += 1
+        finally:
+            answers.put_nowait(None)
+            if joined.game_id in self.live_games:
+                self.live_games.remove(joined.game_id)
+
+    def _seat(self):
+        """Return the future id of the game to join, and whether this
+        player is the one creating it."""
+        if self._filling is None or self._filling[1] >= self.players_per_game:
+            self._filling = [asyncio.get_running_loop().create_future(), 1]
+            return self._filling[0], True
+        self._filling[1] += 1
+        return self._filling[0], False
+
+    async def spectate(self):
+        if not self.live_games:
+            return
+        game_id = random.choice(self.live_games)
+        stub = self.stub()
+        version = 0
+        while game_id in self.live_games:
+            try:
+                # Refreshes send the version held and get not_modified back
+                # while the board is unchanged.
+                board = await self.recorder.call("GetLeaderboard", stub.GetLeaderboard(
+                    game_pb2.LeaderboardRequest(game_id=game_id, limit=10, known_version=version)))
+            except grpc.aio.AioRpcError:
+                return
+            version = board.version
+            await asyncio.sleep(self.think())
+
+    async def run(self, stages, mix, poisson=True, drain=30.0):
+        kinds = list(mix)
+        weights = [mix[kind] for kind in kinds]
+        tasks = set()
+        start = time.perf_counter()
+        for offset in arrival_times(stages, poisson):
+            delay = start + offset - time.perf_counter()
+            if delay > 0:
+                await asyncio.sleep(delay)
+            kind = random.choices(kinds, weights)[0]
+            self.arrivals[kind] += 1
+            task = asyncio.create_task(getattr(self, kind)())
+            tasks.add(task)
+            task.add_done_callback(tasks.discard)
+        arrivals_done = time.perf_counter() - start
+
+        if tasks:
+            _, pending = await asyncio.wait(tasks, timeout=drain)
+            for task in pending:
+                task.cancel()
+        return arrivals_done, time.perf_counter() - start
+
+
+async def main_async(args):
+    generator = LoadGenerator(args.target, args.channels, args.players_per_game, args.think, args.questions)
+    try:
+        arrivals_done, elapsed = await generator.run(args.stage, args.mix, args.arrival == "poisson", args.drain)
+    finally:
+        await generator.close()
+
+    report = {
+        "started_at": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+        "config": {
+            "target": args.target,
+            "stages": [{"seconds": d, "from_rate": a, "to_rate": b} for d, a, b in args.stage],
+            "mix": args.mix,
+            "arrival": args.arrival,
+            "players_per_game": args.players_per_game,
+            "think_seconds": args.think,
+            "questions": args.questions,
+            "channels": args.channels,
+        },
+        "arrivals": dict(generator.arrivals),
+        "arrival_seconds": arrivals_done,
+        "elapsed_seconds": elapsed,
+        "rpcs": generator.recorder.report(elapsed),
+    }
+
+    print(f"{sum(generator.arrivals.values())} arrivals {dict(generator.arrivals)} in {elapsed:.1f}s")
+    print(f"{'rpc':28} {'count':>8} {'rps':>8} {'err%':>6} {'p50 ms':>8} {'p95 ms':>8} {'p99 ms':>8}")
+    for rpc, stats in report["rpcs"].items():
+        print(f"{rpc:28} {stats['count']:8} {stats['throughput']:8.1f} {stats['error_rate'] * 100:6.2f} "
+              f"{stats['p50_ms']:8.2f} {stats['p95_ms']:8.2f} {stats['p99_ms']:8.2f}")
+
+    if args.json == "-":
+        json.dump(report, sys.stdout, indent=2)
+        print()
+    elif args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--target", default="localhost:50055")
+    parser.add_argument("--stage", type=parse_stage, action="append",
+                        help="DURATION:RATE or DURATION:FROM-TO arrivals/s; repeat for a schedule")
+    parser.add_argument("--mix", type=parse_mix, default=parse_mix("join=1,answer=8,spectate=1"))
+    parser.add_argument("--arrival", choices=("poisson", "uniform"), default="poisson")
+    parser.add_argument("--players-per-game", type=int, default=4)
+    parser.add_argument("--questions", type=int, default=5, help="questions per game")
+    parser.add_argument("--think", type=float, default=1.0, help="mean seconds before each answer or poll")
+    parser.add_argument("--channels", type=int, default=8)
+    parser.add_argument("--drain", type=float, default=60.0, help="seconds to let sessions finish after arrivals stop")
+    parser.add_argument("--json", metavar="PATH", help="write the report as JSON ('-' for stdout)")
+    args = parser.parse_args()
+    args.stage = args.stage or [parse_stage("10:0-50"), parse_stage("20:50")]
+    asyncio.run(main_async(args))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,102 @@
+"""Cost of metrics recording relative to RPC latency.
+
+Separate servers differ by more than the 2% budget from run to run, so
+the cost is measured directly instead: the GetLeaderboard handler is timed
+bare and through MetricsInterceptor, and the extra time per call is set
+against the end-to-end latency of the same RPC on a local server.
+
+Run from backend/:  python -m benchmarks.metrics_overhead
+"""
+import argparse
+import asyncio
+import statistics
+import time
+
+import grpc
+
+from generated import game_pb2, game_pb2_grpc
+from game.game_logic import GameServiceImpl
+from game.metrics import Metrics, MetricsInterceptor
+from game.server import add_game_service
+
+METHOD = "/game.GameService/GetLeaderboard"
+
+
+class _Context:
+    # Just enough of a ServicerContext for a successful call.
+    def code(self):
+        return None
+
+
+async def rpc_latency(calls):
+    server = grpc.aio.server()
+    service = GameServiceImpl()
+    add_game_service(service, server)
+    port = server.add_insecure_port("127.0.0.1:0")
+    await server.start()
+    async with grpc.aio.insecure_channel(f"127.0.0.1:{port}") as channel:
+        stub = game_pb2_grpc.GameServiceStub(channel)
+        joined = await stub.JoinGame(game_pb2.JoinRequest(player_name="bench"))
+        request = game_pb2.LeaderboardRequest(game_id=joined.game_id, player_id=joined.player_id)
+        samples = []
+        for _ in range(calls):
+            start = time.perf_counter()
+            await stub.GetLeaderboard(request)
+            samples.append(time.perf_counter() - start)
+    await server.stop(None)
+    return statistics.median(samples)
+
+
+async def handler_cost(calls, rounds):
+    service = GameServiceImpl()
+    joined = await service.JoinGame(game_pb2.JoinRequest(player_name="bench"), None)
+    request = game_pb2.LeaderboardRequest(game_id=joined.game_id, player_id=joined.player_id)
+    context = _Context()
+
+    bare = grpc.unary_unary_rpc_method_handler(service.GetLeaderboard)
+    interceptor = MetricsInterceptor(Metrics())
+    details = grpc.HandlerCallDetails()
+    details.method = METHOD
+
+    async def continuation(_):
+        return bare
+
+    async def intercepted():
+        handler = await interceptor.intercept_service(continuation, details)
+        await handler.unary_unary(request, context)
+
+    async def direct():
+        await bare.unary_unary(request, context)
+
+    samples = {"bare": [], "metrics": []}
+    runs = (("bare", direct), ("metrics", intercepted))
+    for _ in range(rounds):
+        for label, run in runs:
+            start = time.perf_counter()
+            for _ in range(calls):
+                await run()
+            samples[label].append((time.perf_counter() - start) / calls)
+    return {label: statistics.median(values) for label, values in samples.items()}
+
+
+async def main_async(args):
+    latency = await rpc_latency(args.rpc_calls)
+    costs = await handler_cost(args.calls, args.rounds)
+    extra = costs["metrics"] - costs["bare"]
+    print(f"GetLeaderboard end to end : {latency * 1e6:8.1f} us (median of {args.rpc_calls})")
+    print(f"  handler alone           : {costs['bare'] * 1e6:8.2f} us/call")
+    print(f"  added by metrics        : {extra * 1e6:+8.2f} us/call")
+    print(f"  share of RPC latency    : {extra / latency:8.2%}  (budget 2%)")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rpc-calls", type=int, default=5000)
+    parser.add_argument("--calls", type=int, default=20000, help="direct handler calls per round")
+    parser.add_argument("--rounds", type=int, default=10)
+    args = parser.parse_args()
+    asyncio.run(main_async(args))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,129 @@
+"""Question egress with full cards against cached-bank references.
+
+Plays --games games of --players in-process on a synthetic bank of
+--questions questions worded like the real ones. In every game half the
+players watch their session with no bank cache, receiving full question
+cards, and half hold the bank's version and receive references. The
+report gives question bytes per player per game for each, and what
+fetching the bank once costs a client with GetQuestionBank, plain and
+with the per-message gzip gRPC negotiates, so the number of games that
+pays for the fetch can be read off. That references resolve, via the
+client's QuestionCache, to the full cards is covered by
+tests/test_questions.py.
+
+Run from backend/:  python -m benchmarks.question_egress --games 1000 --players 20
+"""
+import argparse
+import asyncio
+import random
+import zlib
+
+from generated import game_pb2
+from game.game_logic import GameServiceImpl
+from game.questions import QuestionBank
+
+WORDS = ("which", "planet", "river", "capital", "largest", "first", "element", "year", "country", "ocean",
+         "famous", "painter", "invented", "language", "mountain", "city", "known", "as", "the", "of", "is",
+         "what", "who", "in", "was", "most", "spoken", "symbol", "chemical", "author")
+
+
+def worded_records(count, seed=1):
+    rng = random.Random(seed)
+    for i in range(count):
+        options = [" ".join(rng.choices(WORDS, k=rng.randint(1, 3))).title() for _ in range(4)]
+        yield {
+            "question_id": f"q{i}",
+            "question_text": " ".join(rng.choices(WORDS, k=rng.randint(6, 14))).capitalize() + "?",
+            "options": options,
+            "correct_option": options[0],
+            "explanation": " ".join(rng.choices(WORDS, k=10)),
+            "category": ("science", "geography", "history", "arts")[i % 4],
+            "difficulty": ("easy", "medium", "hard")[i % 3],
+        }
+
+
+class _BankStub:
+    """Calls GetQuestionBank in-process and counts the bytes it sends."""
+
+    def __init__(self, service):
+        self.service = service
+        self.sizes = []
+
+    async def GetQuestionBank(self, request, timeout=None):
+        async for chunk in self.service.GetQuestionBank(request, None):
+            self.sizes.append(len(chunk) if isinstance(chunk, bytes) else chunk.ByteSize())
+            yield chunk if not isinstance(chunk, bytes) else game_pb2.QuestionBankChunk.FromString(chunk)
+
+
+async def watch(service, seat, bank_version, received):
+    request = game_pb2.GameRequest(game_id=seat.game_id, player_id=seat.player_id, bank_version=bank_version)
+    async for event in service.WatchSession(request, None):
+        if isinstance(event, bytes):
+            size, event = len(event), game_pb2.SessionEvent.FromString(event)
+        else:
+            size = event.ByteSize()
+        if event.WhichOneof("event") == "question":
+            received.append((size, event.question))
+        elif event.round.game_over:
+            return
+
+
+async def run(args):
+    service = GameServiceImpl()
+    service.question_bank = QuestionBank(records=worded_records(args.questions))
+    bank = service.question_bank
+
+    stub = _BankStub(service)
+    async for _ in stub.GetQuestionBank(game_pb2.QuestionBankRequest()):
+        pass
+    bank_bytes = sum(stub.sizes)
+    chunks = [chunk for chunk in bank.chunks()]
+    gzip_bytes = sum(len(zlib.compress(chunk, wbits=31)) for chunk in chunks)
+
+    full, referenced = [], []
+    for _ in range(args.games):
+        first = await service.JoinGame(game_pb2.JoinRequest(player_name="p0", question_count=args.rounds), None)
+        game = service.games[first.game_id]
+        seats = [first] + [
+            await service.JoinGame(game_pb2.JoinRequest(player_name=f"p{i}", game_id=game.game_id), None)
+            for i in range(1, args.players)
+        ]
+        cards = [[] for _ in seats]
+        watchers = [asyncio.create_task(watch(service, seat, bank.version if i % 2 else 0, cards[i]))
+                    for i, seat in enumerate(seats)]
+        await asyncio.sleep(0)
+        for round_index in range(game.total_rounds):
+            for seat in seats:
+                await service.SubmitAnswer(game_pb2.AnswerRequest(
+                    game_id=game.game_id, player_id=seat.player_id,
+                    selected_option=game.question(round_index).correct_option), None)
+            await asyncio.sleep(0)
+        await asyncio.gather(*watchers)
+
+        for i, received in enumerate(cards):
+            (referenced if i % 2 else full).append(sum(size for size, _ in received))
+
+    per_game_full = sum(full) / len(full)
+    per_game_ref = sum(referenced) / len(referenced)
+    saved = per_game_full - per_game_ref
+    print(f"{args.questions}-question bank, {args.games} games x {args.players} players, "
+          f"{game.total_rounds} rounds")
+    print(f"  full cards     : {per_game_full:9.0f} bytes per player per game")
+    print(f"  references     : {per_game_ref:9.0f} bytes per player per game ({per_game_full / per_game_ref:.1f}x less)")
+    print(f"  bank fetch     : {bank_bytes:9d} bytes, {gzip_bytes} with gzip ({bank_bytes / gzip_bytes:.1f}x), "
+          f"{len(chunks)} messages")
+    print(f"  pays off after : {bank_bytes / saved:.0f} games plain, {gzip_bytes / saved:.0f} with gzip")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--questions", type=int, default=2000)
+    parser.add_argument("--games", type=int, default=1000)
+    parser.add_argument("--players", type=int, default=20)
+    parser.add_argument("--rounds", type=int, default=10)
+    args = parser.parse_args()
+    asyncio.run(run(args))
+
+
+if __name__ == "__main__":
+    main()
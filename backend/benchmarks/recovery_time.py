@@ -0,0 +1,93 @@
+"""Restart time with the event log, before and after a snapshot.
+
+Plays --history games to completion and reaps them, then leaves --games
+games live mid-round. A fresh GameServiceImpl is then started on the
+same log directory twice: once replaying the whole log, and once after
+a snapshot plus a short tail. That both restore the games they
+replaced is covered by tests/test_eventlog.py.
+
+Run from backend/:  python -m benchmarks.recovery_time --games 10000
+"""
+import argparse
+import asyncio
+import os
+import tempfile
+import time
+
+from generated import game_pb2
+from game.eventlog import EventLogStore
+from game.game_logic import GameServiceImpl
+from game.lifecycle import GameLifecycle
+
+
+async def seat(service, players):
+    joined = await service.JoinGame(game_pb2.JoinRequest(player_name="p0"), None)
+    seats = [joined]
+    for p in range(1, players):
+        seats.append(await service.JoinGame(game_pb2.JoinRequest(player_name=f"p{p}", game_id=joined.game_id), None))
+    return seats
+
+
+async def answer(service, seats, count):
+    await asyncio.gather(*(
+        service.SubmitAnswer(game_pb2.AnswerRequest(game_id=s.game_id, player_id=s.player_id, selected_option="x"), None)
+        for s in seats[:count]))
+
+
+def restart(directory):
+    start = time.perf_counter()
+    service = GameServiceImpl(store=EventLogStore(directory), lifecycle=GameLifecycle(max_live_games=None))
+    return service, time.perf_counter() - start
+
+
+def log_size(directory):
+    return sum(os.path.getsize(os.path.join(directory, name)) for name in os.listdir(directory))
+
+
+async def run(args, directory):
+    store = EventLogStore(directory, snapshot_interval=float("inf"), snapshot_records=float("inf"))
+    lifecycle = GameLifecycle(max_live_games=None)
+    service = GameServiceImpl(store=store, lifecycle=lifecycle)
+
+    for _ in range(args.history):
+        seats = await seat(service, args.players)
+        for _ in range(service.games[seats[0].game_id].total_rounds):
+            await answer(service, seats, args.players)
+    service._reap_expired(time.monotonic() + lifecycle.idle_ttl + 1)
+
+    live = [await seat(service, args.players) for _ in range(args.games)]
+    for seats in live:
+        await answer(service, seats, args.players)  # round 0 done
+        await answer(service, seats, args.players // 2)  # round 1 half answered
+    await store.flush()
+    print(f"{args.history} finished games reaped, {len(service.games)} live games x {args.players} players")
+
+    _, seconds = restart(directory)
+    print(f"  full log replay      : {seconds * 1e3:8.1f} ms  ({log_size(directory) / 1e6:.1f} MB on disk)")
+
+    await store.snapshot()
+    for seats in live[:len(live) // 10]:
+        await answer(service, seats[args.players // 2:], args.players)  # a tail after the snapshot
+    await store.flush()
+
+    _, seconds = restart(directory)
+    print(f"  snapshot + tail      : {seconds * 1e3:8.1f} ms  ({log_size(directory) / 1e6:.1f} MB on disk)")
+
+    start = time.perf_counter()
+    GameServiceImpl(lifecycle=GameLifecycle(max_live_games=None))
+    print(f"  empty start for scale: {(time.perf_counter() - start) * 1e3:8.1f} ms")
+    await store.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--games", type=int, default=10000, help="live games at restart")
+    parser.add_argument("--players", type=int, default=4, help="players per game")
+    parser.add_argument("--history", type=int, default=20000, help="games finished and reaped before")
+    args = parser.parse_args()
+    with tempfile.TemporaryDirectory() as directory:
+        asyncio.run(run(args, directory))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,473 @@
+"""Replay a recorded traffic trace against this build.
+
+Reads a trace written by run_server.py --record PATH, one record at a
+time, and re-drives it against a GameServiceImpl served in this process
+(or against --target, a server started separately) at --speed times the
+recorded pace, or as fast as possible with --speed 0. Calls keep their
+recorded order and spacing; streams stay open as long as they did, or
+run to their natural end if the server ended them.
+
+Games and players get new ids on replay. Each recorded JoinGame reply
+(and matched EnqueueForMatch update) is paired with the replayed one,
+and later requests naming the recorded ids wait for, and are sent with,
+the new ones. However fast the replay runs, an answer keeps its recorded
+place in its game: it waits for every join recorded for the game before
+it, then for its round. Replayed games draw their own questions, so
+rounds are matched by position: an answer naming a recorded game's k-th
+question, or a player's k-th answer where it names none, waits until the
+replayed game has shown its k-th question and is sent with that one.
+Answers for rounds the replayed game never reaches are not sent, and
+session messages stop once the server has ended the session.
+
+The report gives throughput and p50/p95/p99 latency per RPC: the call
+itself for unary RPCs, the first message for server streams, and answer
+to result for PlaySession; then errors by status code. Throughput is
+over the time until the last call finished.
+
+Run from backend/:  python -m benchmarks.replay data/trace.bin --speed 10
+"""
+import argparse
+import asyncio
+import collections
+import time
+
+import grpc
+
+from game.client import QuestionCache
+from game.game_logic import GameServiceImpl
+from game.recording import CALL, END, MESSAGE, METHOD, MINTED_IDS, RESULT, method_number, read_trace
+from game.runtime import Runtime
+from game.server import add_game_service
+from generated import game_pb2, game_pb2_grpc
+
+_ID_FIELDS = ("game_id", "player_id")
+_ANSWERS = ("SubmitAnswer", "PlaySession")  # methods that send answers
+_QUESTIONS = ("GetNextQuestion", "WatchSession", "PlaySession")  # and that show questions
+
+
+class _Method:
+    __slots__ = ("name", "request_type", "minted", "client_streaming", "server_streaming", "call")
+
+    def __init__(self, path, channel):
+        self.name = path.rpartition("/")[2]
+        method = game_pb2.DESCRIPTOR.services_by_name["GameService"].methods_by_name[self.name]
+        self.request_type = getattr(game_pb2, method.input_type.name)
+        self.minted = MINTED_IDS.get(self.name)
+        self.client_streaming = method.client_streaming
+        self.server_streaming = method.server_streaming
+        factory = {
+            (False, False): channel.unary_unary,
+            (False, True): channel.unary_stream,
+            (True, True): channel.stream_stream,
+        }[(self.client_streaming, self.server_streaming)]
+        self.call = factory(path, request_serializer=self.request_type.SerializeToString,
+                            response_deserializer=getattr(game_pb2, method.output_type.name).FromString)
+
+
+class _Call:
+    """A replayed call: its outgoing messages, and the recorded and
+    replayed replies that hand out ids, waiting to be paired."""
+
+    __slots__ = ("method", "game", "player", "requests", "recorded", "replayed", "finished", "ended", "task")
+
+    def __init__(self, method, game="", player=""):
+        self.method = method
+        self.game = game  # recorded game and player ids the call is about
+        self.player = player
+        self.requests = asyncio.Queue() if method.client_streaming else None
+        self.recorded = collections.deque()
+        self.replayed = collections.deque()
+        self.finished = False
+        self.ended = False  # the server has ended, or is ending, the stream
+        self.task = None
+
+
+class _Game:
+    """What the replay knows of one recorded game: the joins recorded for
+    it so far and its questions in round order.
+
+    Recorded question ids get a round as answers first name them; answers
+    that name none are for their player's next round. Each round's
+    replayed question id is known once a replayed reply shows it, and
+    rounds past the end of the replayed game resolve to None. Answers to
+    a game no recorded call had asked questions of yet have no round to
+    wait for.
+    """
+
+    __slots__ = ("joins", "watched", "questions", "answers", "rounds", "seen", "over")
+
+    def __init__(self):
+        self.joins = []  # tasks of the JoinGame calls recorded for the game
+        self.watched = False  # a call that shows questions was recorded
+        self.questions = {}  # recorded question id -> round
+        self.answers = collections.Counter()  # recorded player id -> answers so far
+        self.rounds = []  # round -> future of the replayed question id
+        self.seen = set()  # replayed question ids shown so far
+        self.over = False
+
+    def _round(self, index):
+        while len(self.rounds) <= index:
+            future = asyncio.get_running_loop().create_future()
+            if self.over:
+                future.set_result(None)
+            self.rounds.append(future)
+        return self.rounds[index]
+
+    def answer(self, player_id, question_id):
+        """The joins an answer must follow and the future of its round's
+        replayed question id, or None; worked out in trace order."""
+        if not self.watched:
+            return tuple(self.joins), None
+        index = self.answers[player_id]
+        self.answers[player_id] += 1
+        if question_id:
+            index = self.questions.setdefault(question_id, len(self.questions))
+        return tuple(self.joins), self._round(index)
+
+    def shown(self, replayed_id):
+        if replayed_id and replayed_id not in self.seen and not self.over:
+            self.seen.add(replayed_id)
+            future = self._round(len(self.seen) - 1)
+            if not future.done():
+                future.set_result(replayed_id)
+
+    def ended(self):
+        self.over = True
+        for future in self.rounds:
+            if not future.done():
+                future.set_result(None)
+
+
+class Replay:
+    def __init__(self, channel, speed=1.0, concurrency=1000):
+        self.channel = channel
+        self.speed = speed
+        self.methods = {}  # method number in the trace -> _Method
+        self.calls = {}  # call number in the trace -> _Call still expecting records
+        self.ids = {}  # recorded id -> future of the replayed id
+        self.games = collections.defaultdict(_Game)  # recorded game id -> _Game
+        self.bank = QuestionCache()
+        self.latencies = collections.defaultdict(list)
+        self.errors = collections.Counter()
+        self.calls_made = 0
+        self.stream_messages = 0
+        self.recorded_seconds = 0.0
+        self.skipped = 0  # answers for rounds the replayed game never had
+        self.unfinished = 0  # streams still open after the drain
+        self._slots = asyncio.Semaphore(concurrency)  # unary calls in flight
+        self._tasks = set()
+        self._finished_at = 0.0
+        self._draining = False
+
+    async def run(self, path, drain=10.0):
+        # Questions sent by reference are resolved against the bank.
+        await self.bank.refresh(game_pb2_grpc.GameServiceStub(self.channel))
+        loop = asyncio.get_running_loop()
+        start = loop.time()
+        for kind, number, at, payload in read_trace(path):
+            self.recorded_seconds = at
+            if self.speed:
+                delay = start + at / self.speed - loop.time()
+                if delay > 0:
+                    await asyncio.sleep(delay)
+            if kind == METHOD:
+                self.methods[number] = _Method(payload.decode("utf-8"), self.channel)
+            elif kind == CALL:
+                await self._start(number, payload)
+            elif kind == MESSAGE:
+                self._message(number, payload)
+            elif kind == RESULT:
+                self._recorded_result(number, payload)
+            elif kind == END:
+                self._end(number, payload == b"\1")
+        read_at = loop.time()
+        # Streams the server ended on its own get a while to get there.
+        if self._tasks:
+            _, pending = await asyncio.wait(set(self._tasks), timeout=drain)
+            self._draining = True
+            self.unfinished = len(pending)
+            for task in pending:
+                task.cancel()
+            await asyncio.gather(*pending, return_exceptions=True)
+        return max(read_at, self._finished_at) - start
+
+    async def _start(self, number, payload):
+        method_index, request = method_number(payload)
+        method = self.methods[method_index]
+        if method.client_streaming:
+            call = self.calls[number] = _Call(method)
+            behavior = self._session(call)
+        else:
+            request = method.request_type.FromString(request)
+            call = _Call(method, getattr(request, "game_id", ""), getattr(request, "player_id", ""))
+            if method.server_streaming:
+                self.calls[number] = call
+                behavior = self._stream(call, request)
+            else:
+                await self._slots.acquire()
+                if method.minted is not None:
+                    self.calls[number] = call
+                behavior = self._unary(call, request, self._gate(call, request))
+        call.task = asyncio.create_task(self._finish(call, behavior))
+        self._tasks.add(call.task)
+        call.task.add_done_callback(self._tasks.discard)
+        if method.name == "JoinGame" and call.game:
+            self.games[call.game].joins.append(call.task)
+        elif method.name in _QUESTIONS and call.game:
+            self.games[call.game].watched = True
+        self.calls_made += 1
+
+    def _message(self, number, payload):
+        call = self.calls.get(number)
+        if call is None:
+            return
+        message = call.method.request_type.FromString(payload)
+        gate = None
+        if message.WhichOneof("payload") == "join":
+            call.game = message.join.game_id
+            call.player = message.join.player_id
+            self.games[call.game].watched = True
+        elif message.WhichOneof("payload") == "answer":
+            gate = self._gate(call, message.answer)
+        call.requests.put_nowait((message, gate))
+
+    def _gate(self, call, request):
+        """What an answer waits for before it is sent, so it reaches the
+        replayed game in the order it reached the recorded one, however
+        fast the replay runs: every join recorded for the game before it,
+        then the replayed game showing the answer's round."""
+        if call.method.name not in _ANSWERS or not call.game:
+            return None
+        return self.games[call.game].answer(request.player_id or call.player, request.question_id)
+
+    async def _pass(self, gate):
+        """Wait out an answer's gate; returns the replayed question id to
+        send, "" to send it without one, or None if the replayed game is
+        over and the answer is not sent."""
+        joins, question = gate
+        if joins:
+            await asyncio.wait(joins)
+        if question is None:
+            return ""
+        replayed = await question
+        if replayed is None:
+            self.skipped += 1
+        return replayed
+
+    def _shown(self, call, card):
+        question_id = card.question_id
+        if not question_id and card.bank_version == self.bank.version:
+            question_id = self.bank.questions[card.bank_index].question_id
+        self.games[call.game].shown(question_id)
+
+    def _round(self, call, transition):
+        if transition.game_over:
+            call.ended = True  # the server ends sessions after game over
+            self.games[call.game].ended()
+
+    async def _finish(self, call, behavior):
+        try:
+            await behavior
+        except grpc.aio.AioRpcError as error:
+            self.errors[error.code().name] += 1
+        finally:
+            if call.requests is None and not call.method.server_streaming:
+                self._slots.release()
+            call.finished = True
+            self._pair(call)
+            if not self._draining:
+                self._finished_at = asyncio.get_running_loop().time()
+
+    async def _remap(self, message):
+        """Swap recorded game and player ids for replayed ones, waiting for
+        the calls that hand them out."""
+        for field, value in message.ListFields():
+            if field.type == field.TYPE_MESSAGE:
+                if field.label != field.LABEL_REPEATED:
+                    await self._remap(value)
+            elif field.name in _ID_FIELDS:
+                replayed = self.ids.get(value)
+                if replayed is not None:
+                    setattr(message, field.name, await replayed)
+        return message
+
+    def _recorded_result(self, number, payload):
+        call = self.calls.get(number)
+        if call is None:
+            return
+        response = call.method.minted.FromString(payload)
+        loop = asyncio.get_running_loop()
+        for name in _ID_FIELDS:
+            recorded = getattr(response, name)
+            if recorded and recorded not in self.ids:
+                self.ids[recorded] = loop.create_future()
+        call.recorded.append(response)
+        if not call.method.server_streaming:
+            del self.calls[number]  # a unary call has one reply
+        self._pair(call)
+
+    def _replayed_result(self, call, response):
+        if call.method.minted is not None and response.player_id:
+            call.replayed.append(response)
+            self._pair(call)
+
+    def _pair(self, call):
+        while call.recorded and (call.replayed or call.finished):
+            recorded = call.recorded.popleft()
+            # A reply the replay never got maps ids onto themselves, so
+            # calls waiting on them go ahead and fail rather than hang.
+            replayed = call.replayed.popleft() if call.replayed else recorded
+            for name in _ID_FIELDS:
+                future = self.ids.get(getattr(recorded, name))
+                if future is not None and not future.done():
+                    future.set_result(getattr(replayed, name))
+
+    def _end(self, number, cancelled):
+        call = self.calls.pop(number, None)
+        if call is None:
+            return
+        if cancelled:
+            call.task.cancel()
+        elif call.requests is not None:
+            call.requests.put_nowait((None, None))  # half-close; the server ends the stream
+
+    async def _unary(self, call, request, gate):
+        request = await self._remap(request)
+        if gate is not None:
+            question = await self._pass(gate)
+            if question is None:
+                return
+            request.question_id = question
+        start = time.perf_counter()
+        response = await call.method.call(request)
+        self.latencies[call.method.name].append(time.perf_counter() - start)
+        if isinstance(response, game_pb2.QuestionCard):
+            if response.question_id or response.bank_version:
+                self._shown(call, response)
+            else:
+                self.games[call.game].ended()  # an empty card: the game is over
+        self._replayed_result(call, response)
+
+    async def _stream(self, call, request):
+        request = await self._remap(request)
+        start = time.perf_counter()
+        stream = call.method.call(request)
+        first = True
+        try:
+            async for response in stream:
+                if first:
+                    self.latencies[call.method.name + " first"].append(time.perf_counter() - start)
+                    first = False
+                self.stream_messages += 1
+                if isinstance(response, game_pb2.SessionEvent):
+                    kind = response.WhichOneof("event")
+                    if kind == "question":
+                        self._shown(call, response.question)
+                    elif kind == "round":
+                        self._round(call, response.round)
+                self._replayed_result(call, response)
+        except asyncio.CancelledError:
+            pass  # the recorded client cancelled here too
+        finally:
+            stream.cancel()
+
+    async def _session(self, call):
+        # Written from a task of its own that stops once the server has
+        # ended the session, rather than from a request iterator gRPC
+        # would go on draining into a closed call.
+        answered = collections.deque()
+        stream = call.method.call()
+        writer = asyncio.create_task(self._write_session(call, stream, answered))
+        try:
+            async for event in stream:
+                self.stream_messages += 1
+                kind = event.WhichOneof("event")
+                if kind == "question":
+                    self._shown(call, event.question)
+                elif kind == "answer_result" and answered:
+                    self.latencies[call.method.name + " answer"].append(time.perf_counter() - answered.popleft())
+                elif kind == "round":
+                    self._round(call, event.round)
+        except asyncio.CancelledError:
+            pass
+        finally:
+            call.ended = True
+            writer.cancel()
+            stream.cancel()
+
+    async def _write_session(self, call, stream, answered):
+        try:
+            while True:
+                message, gate = await call.requests.get()
+                if message is None:
+                    if not call.ended:
+                        await stream.done_writing()
+                    return
+                message = await self._remap(message)
+                if gate is not None:
+                    question = await self._pass(gate)
+                    if question is None:
+                        continue
+                    message.answer.question_id = question
+                if call.ended:
+                    return
+                if message.WhichOneof("payload") == "answer":
+                    answered.append(time.perf_counter())
+                await stream.write(message)
+        except (grpc.aio.AioRpcError, asyncio.InvalidStateError):
+            pass  # the call failed; its status is reported where it is read
+
+
+def _percentile(samples, fraction):
+    return samples[min(int(len(samples) * fraction), len(samples) - 1)]
+
+
+async def run(args):
+    server = None
+    target = args.target
+    if target is None:
+        service = GameServiceImpl()
+        server = Runtime().server()
+        add_game_service(service, server)
+        target = f"127.0.0.1:{server.add_insecure_port('127.0.0.1:0')}"
+        service.start()
+        await server.start()
+    async with grpc.aio.insecure_channel(target) as channel:
+        replay = Replay(channel, args.speed, args.concurrency)
+        seconds = await replay.run(args.trace, args.drain)
+    if server is not None:
+        await server.stop(0)
+
+    pace = f"{args.speed:g}x" if args.speed else "as fast as possible"
+    print(f"{args.trace}: {replay.calls_made} calls over {replay.recorded_seconds:.1f}s recorded, "
+          f"replayed {pace} in {seconds:.1f}s against {args.target or 'a local GameServiceImpl'}")
+    print(f"  throughput: {replay.calls_made / seconds:.0f} calls/s, "
+          f"{replay.stream_messages / seconds:.0f} stream messages/s")
+    print(f"  {'rpc':26} {'samples':>8} {'p50 ms':>8} {'p95 ms':>8} {'p99 ms':>8}")
+    for name, samples in sorted(replay.latencies.items()):
+        samples.sort()
+        print(f"  {name:26} {len(samples):8d} {_percentile(samples, 0.5) * 1e3:8.2f} "
+              f"{_percentile(samples, 0.95) * 1e3:8.2f} {_percentile(samples, 0.99) * 1e3:8.2f}")
+    errors = ", ".join(f"{code} {count}" for code, count in replay.errors.most_common()) or "none"
+    print(f"  errors: {errors}")
+    if replay.skipped:
+        print(f"  {replay.skipped} answers not sent: their replayed game ended before their round")
+    if replay.unfinished:
+        print(f"  {replay.unfinished} streams were still open {args.drain:g}s after the trace ended "
+              "and were cancelled")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("trace", help="trace written by run_server.py --record")
+    parser.add_argument("--speed", type=float, default=1.0, help="times the recorded pace; 0 for as fast as possible")
+    parser.add_argument("--target", help="host:port of a running server instead of one in this process")
+    parser.add_argument("--concurrency", type=int, default=1000, help="unary calls in flight at most")
+    parser.add_argument("--drain", type=float, default=10.0,
+                        help="seconds to let streams the server ended in the recording finish")
+    args = parser.parse_args()
+    asyncio.run(run(args))
+
+
+if __name__ == "__main__":
+    main()
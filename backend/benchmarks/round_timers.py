@@ -0,0 +1,66 @@
+"""Round timer cost on the shared timer wheel as the number of games grows.
+
+Arms one round timer per game with a 5-15 second limit, then steps the
+wheel tick by tick until all have fired. A tick's cost should stay flat as
+games are added, and firing a round should cost the same per game; one
+scan over every game's deadline is shown for contrast.
+
+Run from backend/:  python -m benchmarks.round_timers --games 1000 10000 100000
+"""
+import argparse
+import gc
+import random
+import statistics
+import time
+
+from game.timers import TimerWheel
+
+
+def measure(games, tick):
+    wheel = TimerWheel(tick=tick, now=0.0)
+    delays = [random.uniform(5.0, 15.0) for _ in range(games)]
+
+    start = time.perf_counter()
+    for game, delay in enumerate(delays):
+        wheel.schedule(delay, game, now=0.0)
+    schedule_us = (time.perf_counter() - start) / games * 1e6
+
+    gc.collect()
+    ticks = int(16.0 / tick)
+    fired = 0
+    idle = []
+    start = time.perf_counter()
+    for step in range(1, ticks + 1):
+        before = time.perf_counter()
+        expired = wheel.advance(step * tick)
+        if not expired:
+            idle.append(time.perf_counter() - before)
+        fired += len(expired)
+    fired_us = (time.perf_counter() - start) / games * 1e6
+    assert fired == games and wheel.pending == 0
+
+    # The alternative to a wheel: look at every deadline each tick.
+    start = time.perf_counter()
+    now = 5.0
+    due = [game for game, delay in enumerate(delays) if delay <= now]
+    scan_us = (time.perf_counter() - start) * 1e6
+    del due
+
+    idle_us = statistics.median(idle) * 1e6 if idle else 0.0
+    return schedule_us, fired_us, idle_us, scan_us
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--games", type=int, nargs="+", default=[1000, 10000, 100000])
+    parser.add_argument("--tick", type=float, default=0.1)
+    args = parser.parse_args()
+
+    print(f"{'games':>8} {'arm us':>8} {'us/fired':>9} {'idle tick us':>13} {'full scan us':>13}")
+    for games in args.games:
+        schedule_us, fired_us, idle_us, scan_us = measure(games, args.tick)
+        print(f"{games:8} {schedule_us:8.2f} {fired_us:9.2f} {idle_us:13.2f} {scan_us:13.1f}")
+
+
+if __name__ == "__main__":
+    main()
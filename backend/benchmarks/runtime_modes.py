@@ -0,0 +1,105 @@
+"""JoinGame and SubmitAnswer under the default and tuned runtimes.
+
+Starts run_server.py once per mode and drives it with concurrent
+single-player games: a JoinGame, then a SubmitAnswer per question. The
+report gives throughput and p50/p99 latency of each RPC per mode.
+
+Run from backend/:  python -m benchmarks.runtime_modes
+"""
+import argparse
+import asyncio
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+import grpc
+
+from generated import game_pb2, game_pb2_grpc
+from game import runtime
+
+MODES = {
+    "default": ["--loop", "asyncio"],
+    "tuned": ["--loop", "auto", "--max-streams", "1024", "--optimization-target", "throughput"],
+}
+
+_CHANNEL_OPTIONS = [("grpc.use_local_subchannel_pool", 1)]
+
+
+async def _wait_ready(target, timeout=30.0):
+    deadline = time.monotonic() + timeout
+    async with grpc.aio.insecure_channel(target) as channel:
+        stub = game_pb2_grpc.GameServiceStub(channel)
+        while True:
+            try:
+                await stub.GetShardMap(game_pb2.ShardMapRequest(), timeout=1)
+                return
+            except grpc.aio.AioRpcError:
+                if time.monotonic() > deadline:
+                    raise
+                await asyncio.sleep(0.2)
+
+
+async def drive(target, seconds, concurrency, channels):
+    latencies = {"JoinGame": [], "SubmitAnswer": []}
+    deadline = time.perf_counter() + seconds
+    pool = [grpc.aio.insecure_channel(target, options=_CHANNEL_OPTIONS) for _ in range(channels)]
+    stubs = [game_pb2_grpc.GameServiceStub(channel) for channel in pool]
+
+    async def play(stub):
+        while time.perf_counter() < deadline:
+            start = time.perf_counter()
+            joined = await stub.JoinGame(game_pb2.JoinRequest(player_name="bench"))
+            latencies["JoinGame"].append(time.perf_counter() - start)
+            for _ in range(3):
+                start = time.perf_counter()
+                await stub.SubmitAnswer(game_pb2.AnswerRequest(
+                    game_id=joined.game_id, player_id=joined.player_id, selected_option="x"))
+                latencies["SubmitAnswer"].append(time.perf_counter() - start)
+
+    try:
+        await asyncio.gather(*(play(stubs[i % channels]) for i in range(concurrency)))
+    finally:
+        for channel in pool:
+            await channel.close()
+    return latencies
+
+
+def run_mode(flags, port, seconds, concurrency, channels):
+    server = subprocess.Popen(
+        [sys.executable, "run_server.py", "--port", str(port), "--metrics-port", "0", *flags],
+        stdout=subprocess.DEVNULL
+    )
+    try:
+        target = f"127.0.0.1:{port}"
+        asyncio.run(_wait_ready(target))
+        return asyncio.run(drive(target, seconds, concurrency, channels))
+    finally:
+        server.terminate()
+        server.wait()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--modes", nargs="+", choices=list(MODES), default=list(MODES))
+    parser.add_argument("--port", type=int, default=50175)
+    parser.add_argument("--seconds", type=float, default=5.0)
+    parser.add_argument("--concurrency", type=int, default=64, help="games played at once")
+    parser.add_argument("--channels", type=int, default=4)
+    args = parser.parse_args()
+
+    print(f"{os.cpu_count()} cores, {args.concurrency} concurrent games, uvloop "
+          f"{'installed' if runtime.uvloop else 'not installed'}")
+    print(f"{'mode':8} {'rpc':13} {'rpc/s':>9} {'p50 ms':>8} {'p99 ms':>8}")
+    for mode in args.modes:
+        latencies = run_mode(MODES[mode], args.port, args.seconds, args.concurrency, args.channels)
+        for rpc, samples in latencies.items():
+            samples.sort()
+            p99 = samples[int(len(samples) * 0.99)] if samples else 0.0
+            print(f"{mode:8} {rpc:13} {len(samples) / args.seconds:9.0f} "
+                  f"{statistics.median(samples) * 1e3:8.2f} {p99 * 1e3:8.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,142 @@
+"""Throughput of the sharded server as worker processes are added.
+
+Starts run_server.py --shards N for each N, drives it from several client
+processes that play single-player games over unary RPCs, then checks that
+every game lives on exactly the worker the shard map names.
+
+Run from backend/:  python -m benchmarks.shard_scaling --shards 1 2 4 8
+"""
+import argparse
+import asyncio
+import multiprocessing
+import os
+import subprocess
+import sys
+import time
+
+import grpc
+
+from generated import game_pb2, game_pb2_grpc
+from game.server import shard_addresses
+from game.sharding import FORWARDED_HEADER
+
+# A channel per game loop, each on its own connection, so the kernel spreads
+# them over the workers sharing the public port.
+_CHANNEL_OPTIONS = [("grpc.use_local_subchannel_pool", 1)]
+
+
+async def _play(target, seconds, concurrency):
+    deadline = time.perf_counter() + seconds
+    calls = 0
+    game_ids = []
+
+    async def loop():
+        nonlocal calls
+        async with grpc.aio.insecure_channel(target, options=_CHANNEL_OPTIONS) as channel:
+            stub = game_pb2_grpc.GameServiceStub(channel)
+            while time.perf_counter() < deadline:
+                joined = await stub.JoinGame(game_pb2.JoinRequest(player_name="bench", question_count=3))
+                calls += 1
+                for _ in range(3):
+                    await stub.SubmitAnswer(game_pb2.AnswerRequest(
+                        game_id=joined.game_id, player_id=joined.player_id, selected_option="x"))
+                    calls += 1
+                game_ids.append(joined.game_id)
+
+    await asyncio.gather(*(loop() for _ in range(concurrency)))
+    return calls, game_ids
+
+
+def _client(target, seconds, concurrency, results):
+    results.put(asyncio.run(_play(target, seconds, concurrency)))
+
+
+async def _wait_ready(addresses, timeout=30.0):
+    deadline = time.monotonic() + timeout
+    for address in addresses:
+        async with grpc.aio.insecure_channel(address) as channel:
+            stub = game_pb2_grpc.GameServiceStub(channel)
+            while True:
+                try:
+                    await stub.GetShardMap(game_pb2.ShardMapRequest(), timeout=1)
+                    break
+                except grpc.aio.AioRpcError:
+                    if time.monotonic() > deadline:
+                        raise
+                    await asyncio.sleep(0.2)
+
+
+async def _check_ownership(target, addresses, game_ids):
+    """Each game must be found on its owner and on no other worker."""
+    async with grpc.aio.insecure_channel(target) as channel:
+        stub = game_pb2_grpc.GameServiceStub(channel)
+        owners = [(await stub.GetShardMap(game_pb2.ShardMapRequest(game_id=game_id))).owner_shard_id
+                  for game_id in game_ids]
+
+    # The forwarded header makes each worker answer from its own state.
+    metadata = ((FORWARDED_HEADER, "bench"),)
+    for shard, address in enumerate(addresses):
+        async with grpc.aio.insecure_channel(address) as channel:
+            stub = game_pb2_grpc.GameServiceStub(channel)
+            for game_id, owner in zip(game_ids, owners):
+                try:
+                    await stub.GetLeaderboard(game_pb2.LeaderboardRequest(game_id=game_id), metadata=metadata)
+                    found = True
+                except grpc.aio.AioRpcError as e:
+                    if e.code() != grpc.StatusCode.NOT_FOUND:
+                        raise
+                    found = False
+                if found != (shard == owner):
+                    raise AssertionError(f"game {game_id} owned by shard {owner} but found={found} on shard {shard}")
+    return len(set(owners))
+
+
+def run(shards, port, clients, concurrency, seconds):
+    addresses = shard_addresses(shards, port)
+    server = subprocess.Popen(
+        [sys.executable, "run_server.py", "--shards", str(shards), "--port", str(port)],
+        stdout=subprocess.DEVNULL
+    )
+    try:
+        target = f"127.0.0.1:{port}"
+        asyncio.run(_wait_ready([target] + (addresses if shards > 1 else [])))
+
+        context = multiprocessing.get_context("spawn")
+        results = context.Queue()
+        workers = [context.Process(target=_client, args=(target, seconds, concurrency, results))
+                   for _ in range(clients)]
+        for worker in workers:
+            worker.start()
+        outcomes = [results.get() for _ in workers]
+        for worker in workers:
+            worker.join()
+
+        calls = sum(c for c, _ in outcomes)
+        sample = [game_id for _, ids in outcomes for game_id in ids[:25]]
+        used = asyncio.run(_check_ownership(target, addresses, sample)) if shards > 1 else 1
+        return calls / seconds, used
+    finally:
+        server.terminate()
+        server.wait()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--shards", type=int, nargs="+", default=[1, 2, 4])
+    parser.add_argument("--port", type=int, default=50155)
+    parser.add_argument("--clients", type=int, default=os.cpu_count() or 1, help="client processes")
+    parser.add_argument("--concurrency", type=int, default=16, help="game loops per client process")
+    parser.add_argument("--seconds", type=float, default=5.0)
+    args = parser.parse_args()
+
+    print(f"{os.cpu_count()} cores, {args.clients} client processes x {args.concurrency} loops")
+    print(f"{'shards':>6} {'rpc/s':>10} {'speedup':>8} {'owners hit':>11}")
+    baseline = None
+    for shards in args.shards:
+        rate, used = run(shards, args.port, args.clients, args.concurrency, args.seconds)
+        baseline = baseline or rate
+        print(f"{shards:6} {rate:10.0f} {rate / baseline:8.2f} {used:11}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,78 @@
+"""Per-player memory of game state: the old nested dicts versus game.state.
+
+Run from backend/:  python -m benchmarks.state_memory --games 1000 --players 20
+"""
+import argparse
+import gc
+import tracemalloc
+import uuid
+from array import array
+
+from game.state import Game
+
+QUESTIONS = [{"question_id": f"q{i}"} for i in range(10)]
+
+
+def build_dict_games(player_ids, players_per_game):
+    # The layout GameServiceImpl used before game.state: a dict per player
+    # with an unused answers set, and a set of UUIDs per answered question.
+    games = {}
+    for start in range(0, len(player_ids), players_per_game):
+        members = player_ids[start:start + players_per_game]
+        games[str(start)] = {
+            "players": {pid: {"name": f"player-{i}", "score": 10 * i, "answers": set()}
+                        for i, pid in enumerate(members)},
+            "questions": QUESTIONS,
+            "current_question_index": 3,
+            "answered_players": {q["question_id"]: set(members) for q in QUESTIONS[:3]},
+            "completed": False,
+        }
+    return games
+
+
+def build_slotted_games(player_ids, players_per_game):
+    games = {}
+    for start in range(0, len(player_ids), players_per_game):
+        game = games[str(start)] = Game(str(start), QUESTIONS, array("i", range(len(QUESTIONS))))
+        for i, pid in enumerate(player_ids[start:start + players_per_game]):
+            slot = game.add_player(pid, f"player-{i}")
+            game.ranking.update(slot.index, 10 * i)
+        for _ in range(3):
+            game.next_round()
+        for slot in game.slots:
+            game.mark_answered(slot)
+    return games
+
+
+def measure(builder, player_ids, players_per_game):
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+    games = builder(player_ids, players_per_game)
+    after = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+    total = sum(stat.size_diff for stat in after.compare_to(before, "filename"))
+    del games
+    return total / len(player_ids)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--games", type=int, default=1000)
+    parser.add_argument("--players", type=int, default=20, help="players per game")
+    args = parser.parse_args()
+
+    # Player ids are allocated up front so both layouts share the same strings
+    # and only the per-game structures are measured.
+    player_ids = [str(uuid.uuid4()) for _ in range(args.games * args.players)]
+    dict_bytes = measure(build_dict_games, player_ids, args.players)
+    slotted_bytes = measure(build_slotted_games, player_ids, args.players)
+
+    print(f"{len(player_ids)} players in {args.games} games")
+    print(f"  nested dicts : {dict_bytes:8.1f} bytes/player")
+    print(f"  game.state   : {slotted_bytes:8.1f} bytes/player")
+    print(f"  saving       : {1 - slotted_bytes / dict_bytes:8.1%}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,72 @@
+"""Answers per second with no store, a synchronous SQLite store and write-behind.
+
+Calls the servicer directly so only the service and its store are
+measured, not the transport.
+
+Run from backend/:  python -m benchmarks.store_throughput --games 200 --players 20
+"""
+import argparse
+import asyncio
+import os
+import tempfile
+import time
+
+from generated import game_pb2
+from game.game_logic import GameServiceImpl
+from game.store import MemoryGameStore, SQLiteGameStore
+
+
+async def run(store, games, players, rounds):
+    service = GameServiceImpl(store=store)
+    flusher = asyncio.create_task(store.run())
+
+    seats = []
+    for g in range(games):
+        joined = await service.JoinGame(game_pb2.JoinRequest(player_name="p0", question_count=rounds), None)
+        seats.append((joined.game_id, joined.player_id))
+        for p in range(1, players):
+            seats.append((joined.game_id, (await service.JoinGame(
+                game_pb2.JoinRequest(player_name=f"p{p}", game_id=joined.game_id), None)).player_id))
+    rounds = service.games[seats[0][0]].total_rounds
+    requests = [game_pb2.AnswerRequest(game_id=game_id, player_id=player_id, selected_option="x")
+                for game_id, player_id in seats]
+
+    start = time.perf_counter()
+    for _ in range(rounds):
+        for request in requests:
+            await service.SubmitAnswer(request, None)
+            # A serving loop yields between requests; let the flusher run.
+            await asyncio.sleep(0)
+    elapsed = time.perf_counter() - start
+
+    start = time.perf_counter()
+    flusher.cancel()
+    await store.close()
+    drain = time.perf_counter() - start
+    return len(requests) * rounds, elapsed, drain
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--games", type=int, default=200)
+    parser.add_argument("--players", type=int, default=20, help="players per game")
+    parser.add_argument("--rounds", type=int, default=3)
+    parser.add_argument("--flush-interval", type=float, default=0.05)
+    parser.add_argument("--flush-size", type=int, default=1000)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        modes = [
+            ("off", lambda: MemoryGameStore()),
+            ("sqlite sync", lambda: SQLiteGameStore(os.path.join(tmp, "sync.db"), write_behind=False)),
+            ("sqlite write-behind", lambda: SQLiteGameStore(
+                os.path.join(tmp, "behind.db"), args.flush_interval, args.flush_size)),
+        ]
+        print(f"{'store':20} {'answers/s':>10} {'us/answer':>10} {'final flush ms':>15}")
+        for label, make_store in modes:
+            answers, elapsed, drain = asyncio.run(run(make_store(), args.games, args.players, args.rounds))
+            print(f"{label:20} {answers / elapsed:10.0f} {elapsed / answers * 1e6:10.1f} {drain * 1e3:15.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,125 @@
+"""Tournament leaderboard across thousands of games.
+
+Seats --games games of --players in one tournament in-process and plays
+--rounds rounds, every player answering each round, while --listeners
+streams follow StreamTournamentLeaderboard. The report gives what keeping
+the tournament's top 100 current cost per scoring batch, next to
+rebuilding it the old way by concatenating every room and sorting, and
+how many updates the throttled streams received against how often the
+board changed. That the board equals the rebuilt one and the streams
+are throttled is covered by tests/test_tournament.py.
+
+Run from backend/:  python -m benchmarks.tournament --games 5000 --players 20
+"""
+import argparse
+import asyncio
+import random
+import statistics
+import time
+
+from benchmarks.question_egress import worded_records
+from generated import game_pb2
+from game.game_logic import GameServiceImpl
+from game.questions import QuestionBank
+from game.tournament import MIN_UPDATE_INTERVAL
+
+TOURNAMENT = "cup"
+
+
+def rebuilt_board(service, size):
+    """The top of the tournament from every room's scores, concatenated and sorted."""
+    rows = [(-score, ordinal, index, game.game_id)
+            for ordinal, game in enumerate(service.games.values())
+            for index, score in enumerate(game.scores)]
+    rows.sort()
+    return [(game_id, index, -negated) for negated, _, index, game_id in rows[:size]]
+
+
+async def listen(service, limit, received):
+    request = game_pb2.TournamentRequest(tournament_id=TOURNAMENT, limit=limit)
+    loop = asyncio.get_running_loop()
+    async for data in service.StreamTournamentLeaderboard(request, None):
+        received.append((loop.time(), game_pb2.TournamentLeaderboard.FromString(data)))
+
+
+async def run(args):
+    service = GameServiceImpl()
+    service.question_bank = QuestionBank(records=worded_records(max(args.rounds, 10)))
+    rng = random.Random(7)
+
+    start = time.perf_counter()
+    seats = []
+    for room in range(args.games):
+        first = await service.JoinGame(game_pb2.JoinRequest(
+            player_name=f"r{room}p0", question_count=args.rounds, tournament_id=TOURNAMENT), None)
+        seats.append(first)
+        for i in range(1, args.players):
+            seats.append(await service.JoinGame(
+                game_pb2.JoinRequest(player_name=f"r{room}p{i}", game_id=first.game_id), None))
+    seat_seconds = time.perf_counter() - start
+    tournament = service.tournaments[TOURNAMENT]
+
+    batches = []
+    update = tournament.update
+
+    def timed_update(game, indices):
+        began = time.perf_counter()
+        changed = update(game, indices)
+        batches.append(time.perf_counter() - began)
+        return changed
+
+    tournament.update = timed_update
+    streams = [[] for _ in range(args.listeners)]
+    listeners = [asyncio.create_task(listen(service, args.limit, received)) for received in streams]
+    await asyncio.sleep(0)
+
+    first_version = tournament.version
+    start = time.perf_counter()
+    for _ in range(args.rounds):
+        answers = []
+        for seat in seats:
+            game = service.games[seat.game_id]
+            question = game.question(game.current_question_index)
+            option = question.correct_option if rng.random() < 0.5 else ""
+            answers.append(service.SubmitAnswer(game_pb2.AnswerRequest(
+                game_id=seat.game_id, player_id=seat.player_id, selected_option=option), None))
+        await asyncio.gather(*answers)
+    play_seconds = time.perf_counter() - start
+    versions = tournament.version - first_version
+    await asyncio.sleep(MIN_UPDATE_INTERVAL * 1.5)  # the last throttled update
+    for listener in listeners:
+        listener.cancel()
+
+    rebuild_times = []
+    for _ in range(5):
+        began = time.perf_counter()
+        rebuilt_board(service, tournament.board_size)
+        rebuild_times.append(time.perf_counter() - began)
+    rebuild = statistics.median(rebuild_times)
+
+
+    batches.sort()
+    updates = statistics.mean(len(received) for received in streams)
+    print(f"{args.games} games x {args.players} players ({len(seats)} players), {args.rounds} rounds, "
+          f"board of {tournament.board_size}")
+    print(f"  seating         : {seat_seconds:.1f}s; play: {play_seconds:.1f}s for {len(seats) * args.rounds} answers")
+    print(f"  incremental     : {len(batches)} scoring batches, p50 {statistics.median(batches) * 1e6:.1f}us "
+          f"p99 {batches[int(len(batches) * 0.99)] * 1e6:.1f}us, {sum(batches):.2f}s in all")
+    print(f"  rebuild + sort  : {rebuild * 1e3:.1f}ms per rebuild, {rebuild * len(batches):.0f}s if done per batch")
+    print(f"  streams         : {args.listeners} listeners, {updates:.0f} updates each for {versions} board versions "
+          f"(one per {MIN_UPDATE_INTERVAL}s at most)")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--games", type=int, default=5000)
+    parser.add_argument("--players", type=int, default=20)
+    parser.add_argument("--rounds", type=int, default=5)
+    parser.add_argument("--listeners", type=int, default=100)
+    parser.add_argument("--limit", type=int, default=10, help="entries each listener asks for")
+    args = parser.parse_args()
+    asyncio.run(run(args))
+
+
+if __name__ == "__main__":
+    main()
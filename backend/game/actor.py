@@ -0,0 +1,47 @@
+import asyncio
+
+
+class GameActor:
+    """The single writer for one game's state.
+
+    Messages are appended to a mailbox and drained in batches by one
+    consumer, so changes to a game are applied strictly one at a time and
+    in arrival order while other games' actors run in between. The
+    consumer is a loop callback scheduled only while mail is waiting, not
+    a task per game, so an idle game costs one empty list. The handler is
+    called with the game and every message queued since the last drain;
+    it must not await.
+    """
+
+    __slots__ = ("game", "handler", "max_batch", "batches", "_mailbox", "_scheduled", "_loop")
+
+    def __init__(self, game, handler, max_batch=4096):
+        self.game = game
+        self.handler = handler  # handler(game, messages)
+        self.max_batch = max_batch
+        self.batches = 0
+        self._mailbox = []
+        self._scheduled = False
+        self._loop = None
+
+    def __len__(self):
+        return len(self._mailbox)
+
+    def tell(self, message):
+        self._mailbox.append(message)
+        if not self._scheduled:
+            self._scheduled = True
+            if self._loop is None:
+                self._loop = asyncio.get_running_loop()
+            self._loop.call_soon(self._drain)
+
+    def _drain(self):
+        batch = self._mailbox
+        if len(batch) > self.max_batch:
+            batch, self._mailbox = batch[:self.max_batch], batch[self.max_batch:]
+            self._loop.call_soon(self._drain)  # let other games run first
+        else:
+            self._mailbox = []
+            self._scheduled = False
+        self.batches += 1
+        self.handler(self.game, batch)
@@ -0,0 +1,283 @@
+"""Admission control: stream caps, rate limits and overload shedding.
+
+Everything here runs before a handler does, so a rejected call costs a
+few dictionary lookups. Rejections are RESOURCE_EXHAUSTED with a
+`retry-after-ms` trailer saying when the call is worth retrying.
+"""
+import asyncio
+import time
+
+import grpc
+
+from game.interceptor import WrappingInterceptor
+from generated import game_pb2
+
+RETRY_AFTER_HEADER = "retry-after-ms"
+
+# Request fields naming the caller's player and game, by method.
+_PLAYER_KEYS = {
+    "GetNextQuestion": lambda request: request.player_id,
+    "SubmitAnswer": lambda request: request.player_id,
+    "GetLeaderboard": lambda request: request.player_id,
+    "WatchSession": lambda request: request.player_id,
+    "PlaySession": lambda request: request.join.player_id,
+}
+_GAME_KEYS = {
+    "JoinGame": lambda request: request.game_id,
+    "GetNextQuestion": lambda request: request.game_id,
+    "SubmitAnswer": lambda request: request.game_id,
+    "GetLeaderboard": lambda request: request.game_id,
+    "StreamLeaderboard": lambda request: request.game_id,
+    "WatchSession": lambda request: request.game_id,
+    "PlaySession": lambda request: request.join.game_id,
+}
+_JOINS = frozenset(("JoinGame", "EnqueueForMatch"))
+# Calls that move running games along are never shed; everything else
+# (new players, new streams, leaderboard reads) waits out an overload.
+_ESSENTIAL = frozenset(("SubmitAnswer", "GetNextQuestion"))
+
+
+class RateLimiter:
+    """Token buckets sharing one rate and burst, keyed by player or game
+    id. A bucket idle long enough to have refilled is dropped on prune()."""
+
+    def __init__(self, rate, burst=None):
+        self.rate = rate
+        self.burst = burst or max(1.0, rate)
+        self._buckets = {}  # key -> [tokens, last refill]
+
+    def __len__(self):
+        return len(self._buckets)
+
+    def acquire(self, key, now):
+        """Take a token; returns 0.0, or the seconds until one is free."""
+        bucket = self._buckets.get(key)
+        if bucket is None:
+            self._buckets[key] = [self.burst - 1, now]
+            return 0.0
+        tokens = min(self.burst, bucket[0] + (now - bucket[1]) * self.rate)
+        bucket[1] = now
+        if tokens >= 1:
+            bucket[0] = tokens - 1
+            return 0.0
+        bucket[0] = tokens
+        return (1 - tokens) / self.rate
+
+    def prune(self, now):
+        idle = self.burst / self.rate
+        for key in [key for key, (_, updated) in self._buckets.items() if now - updated >= idle]:
+            del self._buckets[key]
+
+
+def _client(context):
+    """The caller's host, from a peer like ipv4:10.0.0.7:51234; every
+    connection from one machine shares it."""
+    peer = context.peer() if context is not None else ""
+    return peer.rpartition(":")[0] or peer
+
+
+class AdmissionControl(WrappingInterceptor):
+    """Decides which calls a worker takes on.
+
+    max_streams caps concurrent server-streaming calls. player_rate and
+    game_rate are calls per second allowed per player id and per game id,
+    with bursts of twice that; join_rate limits JoinGame and
+    EnqueueForMatch per client host, so a reconnect storm from one
+    machine cannot use up everyone's joins. Answers sent on a PlaySession
+    count against the player's rate; one over it is not graded, and the
+    session gets an AnswerResult with retry_after_ms instead. With
+    max_loop_lag (seconds), calls other than SubmitAnswer and
+    GetNextQuestion are shed while the event loop is running that far
+    behind. None turns a limit off.
+
+    Install it like MetricsInterceptor; start() runs the loop-lag probe.
+    """
+
+    def __init__(self, max_streams=None, player_rate=None, game_rate=None, join_rate=None, max_loop_lag=None,
+                 probe_interval=0.05):
+        super().__init__()
+        self.max_streams = max_streams
+        self.players = RateLimiter(player_rate, 2 * player_rate) if player_rate else None
+        self.games = RateLimiter(game_rate, 2 * game_rate) if game_rate else None
+        self.joins = RateLimiter(join_rate, 2 * join_rate) if join_rate else None
+        self.max_loop_lag = max_loop_lag
+        self.probe_interval = probe_interval
+        self.loop_lag = 0.0
+        self.open_streams = 0
+        self.rejected = {"streams": 0, "rate_limited": 0, "overloaded": 0}
+        self.answers_refused = 0
+        self._probe = None
+
+    def start(self):
+        if self._probe is None:
+            self._probe = asyncio.get_running_loop().create_task(self._probe_loop())
+
+    def stop(self):
+        if self._probe is not None:
+            self._probe.cancel()
+            self._probe = None
+
+    async def _probe_loop(self):
+        # Lag is how late a timer fires. The busiest recent sample is kept
+        # and decays, so one quiet tick does not end shedding mid-burst.
+        interval = self.probe_interval
+        loop = asyncio.get_running_loop()
+        next_prune = loop.time() + 10.0
+        while True:
+            start = loop.time()
+            await asyncio.sleep(interval)
+            now = loop.time()
+            self.loop_lag = max(now - start - interval, self.loop_lag * 0.5)
+            if now >= next_prune:
+                next_prune = now + 10.0
+                clock = time.monotonic()
+                for limiter in (self.players, self.games, self.joins):
+                    if limiter is not None:
+                        limiter.prune(clock)
+
+    def register_metrics(self, metrics):
+        metrics.gauge("game_event_loop_lag_seconds", "How late the event loop ran its last timers.",
+                      lambda: self.loop_lag)
+        metrics.gauge("game_admitted_streams", "Streaming calls currently admitted.", lambda: self.open_streams)
+        for reason, help_text in (("streams", "Streaming calls refused at the stream cap."),
+                                  ("rate_limited", "Calls refused by a player, game or join rate limit."),
+                                  ("overloaded", "Calls shed while the event loop lagged.")):
+            metrics.counter(f"game_rejected_{reason}_total", help_text, lambda reason=reason: self.rejected[reason])
+        metrics.counter("game_session_answers_refused_total", "PlaySession answers over the player's rate.",
+                        lambda: self.answers_refused)
+
+    def wrap(self, method, handler):
+        """A copy of a method handler that admits calls before running them."""
+        name = method.rpartition("/")[2]
+        if handler.unary_unary:
+            return handler._replace(unary_unary=self._unary(name, handler.unary_unary))
+        if handler.unary_stream:
+            return handler._replace(unary_stream=self._stream(name, handler.unary_stream))
+        if handler.stream_stream:
+            return handler._replace(stream_stream=self._session(name, handler.stream_stream))
+        return handler
+
+    def _refusal(self, name, request, context):
+        """(reason, details, retry after seconds) if the call is refused."""
+        if self.max_loop_lag is not None and self.loop_lag > self.max_loop_lag and name not in _ESSENTIAL:
+            return "overloaded", "Server is overloaded", self.loop_lag
+        now = time.monotonic()
+        if self.joins is not None and name in _JOINS:
+            wait = self.joins.acquire(_client(context), now)
+            if wait:
+                return "rate_limited", "Too many joins", wait
+        if self.players is not None and name in _PLAYER_KEYS:
+            player_id = _PLAYER_KEYS[name](request)
+            wait = self.players.acquire(player_id, now) if player_id else 0.0
+            if wait:
+                return "rate_limited", "Too many calls for this player", wait
+        if self.games is not None and name in _GAME_KEYS:
+            game_id = _GAME_KEYS[name](request)
+            wait = self.games.acquire(game_id, now) if game_id else 0.0
+            if wait:
+                return "rate_limited", "Too many calls for this game", wait
+        return None
+
+    def _reject(self, context, reason, details, retry_after):
+        self.rejected[reason] += 1
+        retry_ms = max(1, round(retry_after * 1000))
+        context.set_code(grpc.StatusCode.RESOURCE_EXHAUSTED)
+        context.set_details(f"{details}, retry in {retry_ms} ms")
+        context.set_trailing_metadata(((RETRY_AFTER_HEADER, str(retry_ms)),))
+
+    def _unary(self, name, behavior):
+        async def admitted(request, context):
+            refusal = self._refusal(name, request, context)
+            if refusal is not None:
+                self._reject(context, *refusal)
+                return b""  # an empty message of any type
+            return await behavior(request, context)
+        return admitted
+
+    def _open_stream(self, name, request, context):
+        if self.max_streams is not None and self.open_streams >= self.max_streams:
+            self._reject(context, "streams", "Too many open streams", 1.0)
+            return False
+        refusal = self._refusal(name, request, context)
+        if refusal is not None:
+            self._reject(context, *refusal)
+            return False
+        self.open_streams += 1
+        return True
+
+    def _stream(self, name, behavior):
+        async def admitted(request, context):
+            if not self._open_stream(name, request, context):
+                return
+            try:
+                async for response in behavior(request, context):
+                    yield response
+            finally:
+                self.open_streams -= 1
+        return admitted
+
+    def _session(self, name, behavior):
+        async def admitted(request_iterator, context):
+            # The join names the player, so it is read here and handed on.
+            first = await anext(request_iterator, None)
+            if first is None or not self._open_stream(name, first, context):
+                return
+            player_id = _PLAYER_KEYS[name](first)
+            refused = asyncio.Queue() if self.players is not None else None
+
+            async def requests():
+                yield first
+                async for message in request_iterator:
+                    if refused is not None and message.WhichOneof("payload") == "answer":
+                        wait = self.players.acquire(player_id, time.monotonic())
+                        if wait:
+                            # Not passed on, so never graded; the player
+                            # hears when to send it again.
+                            self.answers_refused += 1
+                            refused.put_nowait(_refused_answer(wait))
+                            continue
+                    yield message
+
+            try:
+                events = behavior(requests(), context)
+                if refused is not None:
+                    events = _merged(events, refused)
+                async for response in events:
+                    yield response
+            finally:
+                self.open_streams -= 1
+        return admitted
+
+
+def _refused_answer(retry_after):
+    retry_ms = max(1, round(retry_after * 1000))
+    return game_pb2.SessionEvent(answer_result=game_pb2.AnswerResult(
+        explanation=f"Too many answers, retry in {retry_ms} ms", retry_after_ms=retry_ms))
+
+
+_END = object()
+
+
+async def _merged(events, extra):
+    """Yield from the async iterator events, and from the queue extra as
+    items arrive, until events ends."""
+    next_event = asyncio.ensure_future(anext(events, _END))
+    next_extra = asyncio.ensure_future(extra.get())
+    try:
+        while True:
+            await asyncio.wait((next_event, next_extra), return_when=asyncio.FIRST_COMPLETED)
+            if next_extra.done():
+                yield next_extra.result()
+                next_extra = asyncio.ensure_future(extra.get())
+            if next_event.done():
+                event = next_event.result()
+                if event is _END:
+                    return
+                yield event
+                next_event = asyncio.ensure_future(anext(events, _END))
+    finally:
+        next_extra.cancel()
+        next_event.cancel()
+        # The generator cannot be closed while the task is still inside it.
+        await asyncio.gather(next_event, return_exceptions=True)
+        await events.aclose()
@@ -0,0 +1,225 @@
+"""Compiled question bank: an indexed binary file read through mmap.
+
+Layout, little-endian; every section starts on an 8-byte boundary:
+
+  header    magic (ending in the format version), question count, then
+            (offset, length) of each section below
+  meta      JSON: category and difficulty names, the content version,
+            and where each (category, difficulty) pool sits in the pools
+            section
+  pools     int32 question indices per filter pool, "" matching anything
+  id_hashes uint64 hashes of the question ids, sorted
+  id_index  uint32 question index for each hash, same order
+  offsets   uint64 start of each record, plus one past the end
+  records   per question: category id u16, difficulty id u16, correct
+            option u8, option count u8, then the id, text, explanation
+            and options as u32-length-prefixed UTF-8
+
+Nothing is decoded up front: pools and the id index are memoryviews over
+the mapping, and a record is decoded when its question is first used.
+Every process that maps the file shares the same page-cache copy.
+
+Build step, from backend/:  python -m game.bankfile data/questions.json
+"""
+import argparse
+import hashlib
+import json
+import mmap
+import os
+import struct
+import sys
+from array import array
+from bisect import bisect_left
+
+MAGIC = b"QBANK\x00\x00\x01"
+SECTIONS = ("meta", "pools", "id_hashes", "id_index", "offsets", "records")
+_HEADER = struct.Struct("<8sI" + "QQ" * len(SECTIONS))
+_RECORD = struct.Struct("<HHBB")
+_LENGTH = struct.Struct("<I")
+ANY = ""
+
+
+def id_hash(question_id):
+    return int.from_bytes(hashlib.blake2b(question_id.encode("utf-8"), digest_size=8).digest(), "little")
+
+
+def _text(value):
+    data = value.encode("utf-8")
+    return _LENGTH.pack(len(data)) + data
+
+
+def compile_records(records, default_category="general", default_difficulty="medium"):
+    """Encode question dicts (the questions.json shape) as a bank file."""
+    categories, difficulties = {}, {}
+    pools = {}
+    hashes = []
+    offsets = array("Q")
+    body = bytearray()
+    count = 0
+    for index, data in enumerate(records):
+        count += 1
+        options = list(data["options"])
+        category = data.get("category", default_category).lower()
+        difficulty = data.get("difficulty", default_difficulty).lower()
+        category_id = categories.setdefault(category, len(categories))
+        difficulty_id = difficulties.setdefault(difficulty, len(difficulties))
+        for key in ((category, difficulty), (category, ANY), (ANY, difficulty), (ANY, ANY)):
+            pools.setdefault(key, array("i")).append(index)
+        hashes.append((id_hash(data["question_id"]), index))
+
+        offsets.append(len(body))
+        body += _RECORD.pack(category_id, difficulty_id, options.index(data["correct_option"]), len(options))
+        body += _text(data["question_id"]) + _text(data["question_text"]) + _text(data.get("explanation", ""))
+        for option in options:
+            body += _text(option)
+    offsets.append(len(body))
+
+    pool_bytes = bytearray()
+    pool_table = []
+    for (category, difficulty), indices in pools.items():
+        pool_table.append([category, difficulty, len(pool_bytes) // 4, len(indices)])
+        pool_bytes += indices.tobytes()
+    hashes.sort()
+    version = content_version(body, categories, difficulties)
+    meta = json.dumps({
+        "count": count,
+        "version": version,
+        "categories": list(categories),
+        "difficulties": list(difficulties),
+        "pools": pool_table,
+    }).encode("utf-8")
+
+    sections = [
+        meta,
+        bytes(pool_bytes),
+        array("Q", (h for h, _ in hashes)).tobytes(),
+        array("I", (i for _, i in hashes)).tobytes(),
+        offsets.tobytes(),
+        bytes(body),
+    ]
+    table = []
+    position = _align(_HEADER.size)
+    for section in sections:
+        table += [position, len(section)]
+        position = _align(position + len(section))
+    out = bytearray(_HEADER.pack(MAGIC, count, *table))
+    for section in sections:
+        out += b"\0" * (_align(len(out)) - len(out))
+        out += section
+    return bytes(out)
+
+
+def content_version(records, categories, difficulties):
+    """A nonzero hash of the bank's content. It fits in 53 bits so that
+    JavaScript clients can hold it as a plain number."""
+    digest = hashlib.blake2b(records, digest_size=8)
+    digest.update(json.dumps([list(categories), list(difficulties)]).encode("utf-8"))
+    return int.from_bytes(digest.digest(), "little") & ((1 << 53) - 1) or 1
+
+
+def _align(n):
+    return (n + 7) & ~7
+
+
+def compile_bank(json_path, bank_path=None):
+    """Compile a questions.json file; the output is swapped in atomically
+    so workers starting at the same time never see a partial file."""
+    bank_path = bank_path or compiled_path(json_path)
+    with open(json_path, "r", encoding="utf-8") as f:
+        data = compile_records(json.load(f))
+    tmp = f"{bank_path}.{os.getpid()}.tmp"
+    with open(tmp, "wb") as f:
+        f.write(data)
+    os.replace(tmp, bank_path)
+    return bank_path
+
+
+def compiled_path(json_path):
+    root, _ = os.path.splitext(json_path)
+    return root + ".bank"
+
+
+def is_stale(json_path, bank_path):
+    return not os.path.exists(bank_path) or os.path.getmtime(bank_path) < os.path.getmtime(json_path)
+
+
+class BankFile:
+    """Read access to a compiled bank held in a buffer or mapped file."""
+
+    def __init__(self, buffer):
+        self._buffer = buffer
+        view = memoryview(buffer)
+        magic, count, *table = _HEADER.unpack_from(view, 0)
+        if magic != MAGIC:
+            raise ValueError("not a compiled question bank")
+        sections = {name: view[table[2 * i]:table[2 * i] + table[2 * i + 1]] for i, name in enumerate(SECTIONS)}
+        meta = json.loads(bytes(sections["meta"]))
+        self.count = count
+        self.categories = meta["categories"]
+        self.difficulties = meta["difficulties"]
+        pools = sections["pools"].cast("i")
+        self._pools = {(category, difficulty): pools[start:start + length]
+                       for category, difficulty, start, length in meta["pools"]}
+        self._id_hashes = sections["id_hashes"].cast("Q")
+        self._id_index = sections["id_index"].cast("I")
+        self._offsets = sections["offsets"].cast("Q")
+        self._records = sections["records"]
+        # Files compiled before versions were recorded get theirs on open.
+        self.version = meta.get("version") or content_version(
+            self._records, self.categories, self.difficulties)
+
+    @classmethod
+    def open(cls, path):
+        with open(path, "rb") as f:
+            return cls(mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ))
+
+    def __len__(self):
+        return self.count
+
+    def pool(self, category, difficulty):
+        """Indices of the questions matching both filters ("" for any)."""
+        return self._pools.get((category, difficulty))
+
+    def index_candidates(self, question_id):
+        """Indices whose id hashes like question_id; callers confirm the id."""
+        h = id_hash(question_id)
+        position = bisect_left(self._id_hashes, h)
+        while position < len(self._id_hashes) and self._id_hashes[position] == h:
+            yield self._id_index[position]
+            position += 1
+
+    def record(self, index):
+        """Decode one question into the questions.json shape."""
+        records = self._records
+        offset = self._offsets[index]
+        category_id, difficulty_id, correct, option_count = _RECORD.unpack_from(records, offset)
+        offset += _RECORD.size
+        fields = []
+        for _ in range(3 + option_count):
+            (size,) = _LENGTH.unpack_from(records, offset)
+            offset += _LENGTH.size
+            fields.append(str(records[offset:offset + size], "utf-8"))
+            offset += size
+        options = fields[3:]
+        return {
+            "question_id": fields[0],
+            "question_text": fields[1],
+            "explanation": fields[2],
+            "options": options,
+            "correct_option": options[correct],
+            "category": self.categories[category_id],
+            "difficulty": self.difficulties[difficulty_id],
+        }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compile a questions JSON file into a mapped question bank.")
+    parser.add_argument("source", help="questions JSON file")
+    parser.add_argument("-o", "--output", help="bank file to write (default: SOURCE with .bank)")
+    args = parser.parse_args()
+    path = compile_bank(args.source, args.output)
+    print(f"wrote {path} ({os.path.getsize(path)} bytes)", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,320 @@
+import asyncio
+import itertools
+import json
+
+import grpc
+
+from generated import game_pb2, game_pb2_grpc
+from game.leaderboard import LeaderboardReplica
+
+# Reads are safe to repeat; calls that change a game are not retried, as
+# a retry after a lost reply would submit twice.
+_RETRIED_METHODS = ("GetNextQuestion", "GetLeaderboard", "GetShardMap")
+
+
+def retry_service_config(attempts=4, initial_backoff=0.1, max_backoff=2.0):
+    """Service config retrying read-only calls that fail UNAVAILABLE."""
+    return json.dumps({
+        "methodConfig": [{
+            "name": [{"service": "game.GameService", "method": method} for method in _RETRIED_METHODS],
+            "retryPolicy": {
+                "maxAttempts": attempts,
+                "initialBackoff": f"{initial_backoff}s",
+                "maxBackoff": f"{max_backoff}s",
+                "backoffMultiplier": 2,
+                "retryableStatusCodes": ["UNAVAILABLE"],
+            },
+        }],
+    })
+
+
+def retry_after(error):
+    """Seconds a RESOURCE_EXHAUSTED call asks to wait before retrying, or None."""
+    for key, value in error.trailing_metadata() or ():
+        if key == "retry-after-ms":
+            return int(value) / 1000
+    return None
+
+
+async def call_admitted(method, request, timeout, retries):
+    """Call a unary method, waiting out up to `retries` admission refusals
+    (RESOURCE_EXHAUSTED with a retry hint). A refused call never ran, so
+    retrying it is safe even for answers."""
+    while True:
+        try:
+            return await method(request, timeout=timeout)
+        except grpc.aio.AioRpcError as error:
+            wait = retry_after(error) if error.code() == grpc.StatusCode.RESOURCE_EXHAUSTED else None
+            if wait is None or retries <= 0:
+                raise
+            retries -= 1
+            await asyncio.sleep(wait)
+
+
+class ChannelPool:
+    """A few HTTP/2 connections shared by any number of players.
+
+    Each channel is its own connection and multiplexes every call made on
+    it, so thousands of players cost a handful of handshakes. Stubs are
+    handed out round-robin. Keepalive pings detect dead connections while
+    idle, and read-only calls are retried on UNAVAILABLE.
+    """
+
+    def __init__(self, target, size=4, keepalive_seconds=30.0, retry_attempts=4, options=()):
+        self.target = target
+        self.size = size
+        channel_options = [
+            # Separate subchannels, so the pool really opens `size` connections.
+            ("grpc.use_local_subchannel_pool", 1),
+            ("grpc.keepalive_time_ms", int(keepalive_seconds * 1000)),
+            ("grpc.keepalive_timeout_ms", 10_000),
+            ("grpc.keepalive_permit_without_calls", 1),
+            ("grpc.http2.max_pings_without_data", 0),
+            ("grpc.enable_retries", 1),
+            ("grpc.service_config", retry_service_config(retry_attempts)),
+            *options,
+        ]
+        self._channels = [grpc.aio.insecure_channel(target, options=channel_options) for _ in range(size)]
+        self._stubs = [game_pb2_grpc.GameServiceStub(channel) for channel in self._channels]
+        self._next = itertools.cycle(self._stubs)
+
+    def stub(self):
+        return next(self._next)
+
+    async def close(self):
+        await asyncio.gather(*(channel.close() for channel in self._channels))
+
+
+class QuestionCache:
+    """A client-side copy of the question bank.
+
+    Once loaded, its version is sent with question requests and the
+    server answers with references (bank version and index) that
+    resolve() turns back into full cards.
+    """
+
+    def __init__(self):
+        self.version = 0
+        self.questions = []  # BankQuestion by bank index
+
+    async def refresh(self, stub, timeout=None):
+        """Fetch the bank unless the copy held is current; True if it changed."""
+        version, questions = 0, []
+        async for chunk in stub.GetQuestionBank(game_pb2.QuestionBankRequest(known_version=self.version),
+                                                timeout=timeout):
+            if chunk.not_modified:
+                return False
+            version = chunk.version
+            questions.extend(chunk.questions)
+        self.version, self.questions = version, questions
+        return True
+
+    def resolve(self, card):
+        if not card.bank_version:
+            return card
+        if card.bank_version != self.version:
+            raise LookupError(f"question bank {card.bank_version} is not the one cached ({self.version})")
+        question = self.questions[card.bank_index]
+        return game_pb2.QuestionCard(question_id=question.question_id, question_text=question.question_text,
+                                     options=question.options, time_limit_seconds=card.time_limit_seconds)
+
+
+class GameClient:
+    """High-level async client for bots, load drivers and tools.
+
+    Every call gets a deadline of `deadline` seconds unless one is given.
+    Calls refused by the server's admission control are retried up to
+    `admission_retries` times after the wait the server asks for.
+    Players joined through one client share its channel pool; each player
+    keeps to one channel so its calls stay ordered on one connection.
+    After load_questions() players receive questions by reference and
+    resolve them from the client's QuestionCache.
+    """
+
+    def __init__(self, target="localhost:50055", channels=4, deadline=5.0, keepalive_seconds=30.0,
+                 retry_attempts=4, pool=None, admission_retries=3):
+        self.pool = pool or ChannelPool(target, channels, keepalive_seconds, retry_attempts)
+        self.deadline = deadline
+        self.admission_retries = admission_retries
+        self.questions = None  # QuestionCache once loaded
+
+    @property
+    def bank_version(self):
+        return self.questions.version if self.questions is not None else 0
+
+    async def load_questions(self, timeout=None):
+        """Fetch the question bank, or refresh the copy already held."""
+        if self.questions is None:
+            self.questions = QuestionCache()
+        await self.questions.refresh(self.pool.stub(), timeout)
+        return self.questions
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        await self.close()
+
+    async def close(self):
+        await self.pool.close()
+
+    async def _call(self, method, request, timeout=None):
+        return await call_admitted(method, request, timeout or self.deadline, self.admission_retries)
+
+    async def join(self, name, game_id="", category="", difficulty="", question_count=0,
+                   exclude_question_ids=(), tournament_id="", timeout=None):
+        stub = self.pool.stub()
+        joined = await self._call(stub.JoinGame, game_pb2.JoinRequest(
+            player_name=name, game_id=game_id, category=category, difficulty=difficulty,
+            question_count=question_count, exclude_question_ids=exclude_question_ids,
+            tournament_id=tournament_id,
+        ), timeout)
+        return Player(self, stub, name, joined.game_id, joined.player_id)
+
+    async def leaderboard(self, game_id, limit=0, offset=0, known_version=0, timeout=None):
+        return await self._call(self.pool.stub().GetLeaderboard, game_pb2.LeaderboardRequest(
+            game_id=game_id, limit=limit, offset=offset, known_version=known_version,
+        ), timeout)
+
+    async def tournament_leaderboard(self, tournament_id, limit=0, interval=0.0):
+        """Yield the tournament's TournamentLeaderboard as it changes, at
+        most once per interval seconds (or the server's minimum)."""
+        stream = self.pool.stub().StreamTournamentLeaderboard(game_pb2.TournamentRequest(
+            tournament_id=tournament_id, limit=limit, interval_ms=round(interval * 1000)))
+        try:
+            async for board in stream:
+                yield board
+        finally:
+            stream.cancel()
+
+
+class Player:
+    """One seated player: answers, sessions and leaderboard reads."""
+
+    def __init__(self, client, stub, name, game_id, player_id):
+        self.client = client
+        self.name = name
+        self.game_id = game_id
+        self.player_id = player_id
+        self._stub = stub
+        self._board = None  # last Leaderboard fetched, for not_modified refreshes
+
+    def _resolve(self, card):
+        return self.client.questions.resolve(card) if card.bank_version else card
+
+    async def next_question(self, timeout=None):
+        return self._resolve(await self.client._call(self._stub.GetNextQuestion, game_pb2.GameRequest(
+            game_id=self.game_id, player_id=self.player_id, bank_version=self.client.bank_version,
+        ), timeout))
+
+    async def answer(self, selected_option, question_id="", timeout=None):
+        return await self.client._call(self._stub.SubmitAnswer, game_pb2.AnswerRequest(
+            game_id=self.game_id, player_id=self.player_id, question_id=question_id,
+            selected_option=selected_option,
+        ), timeout)
+
+    async def leaderboard(self, limit=0, timeout=None):
+        """The current board; unchanged boards are answered not_modified
+        and the copy already held is returned."""
+        known = self._board.version if self._board is not None else 0
+        board = await self.client._call(self._stub.GetLeaderboard, game_pb2.LeaderboardRequest(
+            game_id=self.game_id, player_id=self.player_id, limit=limit, known_version=known,
+        ), timeout)
+        if not board.not_modified:
+            self._board = board
+        return self._board
+
+    async def leaderboard_updates(self):
+        """Yield a LeaderboardReplica after every StreamLeaderboard update,
+        reopening the stream when a delta is missed, until game over."""
+        board = LeaderboardReplica()
+        resync = True
+        while resync:
+            resync = False
+            async for update in self._stub.StreamLeaderboard(game_pb2.GameId(game_id=self.game_id)):
+                if not board.apply(update):
+                    resync = True
+                    break
+                yield board
+                if board.game_over:
+                    return
+
+    def session(self):
+        return Session(self)
+
+    async def play(self, choose):
+        """Play the game to the end over one session; choose(question)
+        returns the option to answer, or a coroutine that does. Returns
+        the answer results in order. An answer admission control refused
+        is sent again after the wait it asks for, up to the client's
+        admission_retries times, unless a new question came first."""
+        results = []
+        loop = asyncio.get_running_loop()
+        answered = None  # (option, question_id, retries left) for the current question
+
+        def resend(pending):
+            if answered is pending:
+                session.answer(pending[0], pending[1])
+
+        async with self.session() as session:
+            async for event in session:
+                kind = event.WhichOneof("event")
+                if kind == "question":
+                    answered = None
+                    option = choose(event.question)
+                    if asyncio.iscoroutine(option):
+                        option = await option
+                    session.answer(option, event.question.question_id)
+                    answered = (option, event.question.question_id, self.client.admission_retries)
+                elif kind == "answer_result":
+                    result = event.answer_result
+                    if result.retry_after_ms and answered is not None and answered[2] > 0:
+                        option, question_id, retries = answered
+                        answered = (option, question_id, retries - 1)
+                        loop.call_later(result.retry_after_ms / 1000, resend, answered)
+                        continue
+                    results.append(result)
+        return results
+
+
+class Session:
+    """A PlaySession stream: iterate for events, answer() to reply.
+
+    Iteration ends after the game-over round transition.
+    """
+
+    def __init__(self, player):
+        self.player = player
+        self._answers = asyncio.Queue()
+        self._call = None
+
+    async def __aenter__(self):
+        self._call = self.player._stub.PlaySession(self._requests())
+        return self
+
+    async def __aexit__(self, *exc):
+        self.close()
+
+    async def _requests(self):
+        yield game_pb2.SessionRequest(join=game_pb2.GameRequest(
+            game_id=self.player.game_id, player_id=self.player.player_id,
+            bank_version=self.player.client.bank_version))
+        while (answer := await self._answers.get()) is not None:
+            yield game_pb2.SessionRequest(answer=answer)
+
+    def answer(self, selected_option, question_id=""):
+        self._answers.put_nowait(game_pb2.AnswerRequest(
+            player_id=self.player.player_id, question_id=question_id, selected_option=selected_option))
+
+    async def __aiter__(self):
+        async for event in self._call:
+            if event.WhichOneof("event") == "question" and event.question.bank_version:
+                event.question.CopyFrom(self.player._resolve(event.question))
+            yield event
+            if event.WhichOneof("event") == "round" and event.round.game_over:
+                break
+
+    def close(self):
+        self._answers.put_nowait(None)
+        if self._call is not None:
+            self._call.cancel()
@@ -0,0 +1,275 @@
+import asyncio
+import os
+import struct
+import time
+import zlib
+from array import array
+
+from game.state import Game
+from game.store import GameStore
+
+# Record types. Every record is <length:u32><crc32:u32><type:u8> then the
+# payload; strings are <length:u32> then UTF-8.
+CREATE = 1  # game_id, question ids joined by ","
+JOIN = 2  # game_id, player_id, name; the player index is the join order
+ANSWER = 3  # game_id, player index u32, round i32, score i32
+ROUND = 4  # game_id, round u32, completed u8
+REMOVE = 5  # game_id
+
+_HEADER = struct.Struct("<IIB")
+_ANSWER = struct.Struct("<Iii")
+_ROUND = struct.Struct("<IB")
+_SNAPSHOT_MAGIC = b"GSNAP1"
+_COVERS = struct.Struct("<Q")
+
+
+def _string(text):
+    data = text.encode("utf-8")
+    return len(data).to_bytes(4, "little") + data
+
+
+def _record(kind, payload):
+    return _HEADER.pack(len(payload), zlib.crc32(payload), kind) + payload
+
+
+def _read_string(data, offset):
+    size = int.from_bytes(data[offset:offset + 4], "little")
+    offset += 4
+    return str(data[offset:offset + size], "utf-8"), offset + size
+
+
+def read_records(data):
+    """Yield (type, payload) from a log or snapshot body, stopping at the
+    first torn or corrupt record (the tail of a crash)."""
+    offset = 0
+    end = len(data)
+    while offset + _HEADER.size <= end:
+        size, crc, kind = _HEADER.unpack_from(data, offset)
+        start = offset + _HEADER.size
+        payload = data[start:start + size]
+        if len(payload) < size or zlib.crc32(payload) != crc:
+            return
+        yield kind, payload
+        offset = start + size
+
+
+class EventLogStore(GameStore):
+    """Append-only binary log of game changes with periodic snapshots.
+
+    Every join, answer, round advance and completion is encoded as one
+    small record and buffered; run() appends the buffer to the current
+    log segment every flush_interval seconds on a worker thread, so
+    answers never wait on the disk. A crash loses at most the last
+    unflushed buffer.
+
+    Every snapshot_interval seconds, or sooner once snapshot_records
+    records have been logged, the live games are written as a compacted
+    snapshot that replaces the segments before it. Recovery loads the
+    snapshot and replays only the segments written since, so restart
+    time is bounded by the snapshot interval rather than the history.
+    """
+
+    def __init__(self, directory="data/events", flush_interval=0.05, snapshot_interval=30.0,
+                 snapshot_records=200_000, fsync=False):
+        self.directory = directory
+        self.flush_interval = flush_interval
+        self.snapshot_interval = snapshot_interval
+        self.snapshot_records = snapshot_records
+        self.fsync = fsync
+        self.flushes = 0
+        self.snapshots = 0
+        self.bytes_written = 0
+        self.records_since_snapshot = 0
+        self.games = {}  # game_id -> Game, the live games a snapshot covers
+        os.makedirs(directory, exist_ok=True)
+        self._buffer = bytearray()
+        self._segment = None  # number of the segment being appended to
+        self._file = None
+        self._snapshot_at = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    def _segment_path(self, number):
+        return os.path.join(self.directory, f"log-{number:08d}.bin")
+
+    def _segments(self):
+        numbers = []
+        for name in os.listdir(self.directory):
+            if name.startswith("log-") and name.endswith(".bin"):
+                numbers.append(int(name[4:-4]))
+        return sorted(numbers)
+
+    @property
+    def _snapshot_path(self):
+        return os.path.join(self.directory, "snapshot.bin")
+
+    def load_games(self, bank):
+        covers = -1
+        games = {}
+        data = self._read_snapshot()
+        if data is not None:
+            (covers,) = _COVERS.unpack_from(data, len(_SNAPSHOT_MAGIC))
+            self._replay(memoryview(data)[len(_SNAPSHOT_MAGIC) + _COVERS.size:], games, bank)
+        tail = 0
+        for number in self._segments():
+            if number > covers:
+                with open(self._segment_path(number), "rb") as f:
+                    tail += self._replay(f.read(), games, bank)
+        # The replayed tail is not in the snapshot yet.
+        self.records_since_snapshot = tail
+        self.games = dict(games)
+        return games
+
+    def _read_snapshot(self, header_only=False):
+        if not os.path.exists(self._snapshot_path):
+            return None
+        with open(self._snapshot_path, "rb") as f:
+            data = f.read(len(_SNAPSHOT_MAGIC) + _COVERS.size) if header_only else f.read()
+        return data if data.startswith(_SNAPSHOT_MAGIC) else None
+
+    def _replay(self, data, games, bank):
+        """Apply records to games; returns how many were read."""
+        count = 0
+        for kind, payload in read_records(data):
+            count += 1
+            game_id, offset = _read_string(payload, 0)
+            if kind == CREATE:
+                question_ids, _ = _read_string(payload, offset)
+                questions = [bank.get_question_by_id(qid) for qid in question_ids.split(",") if qid]
+                games[game_id] = Game(game_id, bank, array("i", (q.index for q in questions if q is not None)))
+                continue
+            game = games.get(game_id)
+            if game is None:
+                continue
+            if kind == JOIN:
+                player_id, offset = _read_string(payload, offset)
+                name, _ = _read_string(payload, offset)
+                game.add_player(player_id, name)
+            elif kind == ANSWER:
+                index, round_index, score = _ANSWER.unpack_from(payload, offset)
+                if index < len(game.slots):
+                    game.ranking.update(index, score)
+                    if round_index == game.current_question_index:
+                        game.mark_answered(game.slots[index])
+            elif kind == ROUND:
+                round_index, completed = _ROUND.unpack_from(payload, offset)
+                while game.current_question_index < round_index:
+                    game.next_round()
+                game.completed = bool(completed)
+            elif kind == REMOVE:
+                games.pop(game_id)
+        return count
+
+    def _open_segment(self, number):
+        self._segment = number
+        self._file = open(self._segment_path(number), "ab")
+
+    def _ensure_segment(self):
+        # Never append after a possibly torn tail: each run starts a fresh
+        # segment numbered after everything on disk, snapshot included.
+        if self._file is None:
+            header = self._read_snapshot(header_only=True)
+            covers = _COVERS.unpack_from(header, len(_SNAPSHOT_MAGIC))[0] if header else -1
+            self._open_segment(max(self._segments() + [covers]) + 1)
+
+    def _append(self, kind, payload):
+        self._buffer += _record(kind, payload)
+        self.records_since_snapshot += 1
+
+    def game_created(self, game):
+        self.games[game.game_id] = game
+        question_ids = ",".join(game.question(i).question_id for i in range(game.total_rounds))
+        self._append(CREATE, _string(game.game_id) + _string(question_ids))
+
+    def player_joined(self, game, slot):
+        self._append(JOIN, _string(game.game_id) + _string(slot.player_id) + _string(slot.name))
+
+    def answer_recorded(self, game, slot, selected_option, correct):
+        self._append(ANSWER, _string(game.game_id) + _ANSWER.pack(
+            slot.index, game.current_question_index, game.scores[slot.index]))
+
+    def round_advanced(self, game):
+        self._append(ROUND, _string(game.game_id) + _ROUND.pack(game.current_question_index, game.completed))
+
+    def game_removed(self, game_id):
+        self.games.pop(game_id, None)
+        self._append(REMOVE, _string(game_id))
+
+    async def run(self):
+        while True:
+            await asyncio.sleep(self.flush_interval)
+            await self.flush()
+            if self.records_since_snapshot and (
+                    self.records_since_snapshot >= self.snapshot_records
+                    or time.monotonic() - self._snapshot_at >= self.snapshot_interval):
+                await self.snapshot()
+
+    async def flush(self):
+        async with self._lock:
+            if not self._buffer:
+                return
+            data, self._buffer = self._buffer, bytearray()
+            self._ensure_segment()
+            await asyncio.to_thread(self._write, self._file, data)
+            self.flushes += 1
+            self.bytes_written += len(data)
+
+    def _write(self, file, data):
+        file.write(data)
+        file.flush()
+        if self.fsync:
+            os.fsync(file.fileno())
+
+    async def snapshot(self):
+        """Write the live games as one compacted file and drop the log
+        segments it covers."""
+        async with self._lock:
+            # Encoding reads the games, so it happens on the loop, at a
+            # point between records; everything logged before it goes to
+            # the segments the snapshot covers.
+            body = self._encode_snapshot()
+            data, self._buffer = self._buffer, bytearray()
+            self._ensure_segment()
+            covers, old = self._segment, self._file
+            self._open_segment(covers + 1)
+            self.records_since_snapshot = 0
+            self._snapshot_at = time.monotonic()
+            await asyncio.to_thread(self._write_snapshot, old, data, covers, body)
+            self.snapshots += 1
+            self.bytes_written += len(data) + sum(map(len, body))
+
+    def _encode_snapshot(self):
+        parts = [_SNAPSHOT_MAGIC, b""]
+        for game in self.games.values():
+            game_id = _string(game.game_id)
+            question_ids = ",".join(game.question(i).question_id for i in range(game.total_rounds))
+            parts.append(_record(CREATE, game_id + _string(question_ids)))
+            for slot in game.slots:
+                parts.append(_record(JOIN, game_id + _string(slot.player_id) + _string(slot.name)))
+            if game.current_question_index or game.completed:
+                parts.append(_record(ROUND, game_id + _ROUND.pack(game.current_question_index, game.completed)))
+            scores = game.scores
+            for slot in game.slots:
+                answered = game.has_answered(slot)
+                if answered or scores[slot.index]:
+                    round_index = game.current_question_index if answered else -1
+                    parts.append(_record(ANSWER, game_id + _ANSWER.pack(slot.index, round_index, scores[slot.index])))
+        return parts
+
+    def _write_snapshot(self, old, data, covers, parts):
+        self._write(old, data)
+        old.close()
+        parts[1] = _COVERS.pack(covers)
+        tmp = self._snapshot_path + ".tmp"
+        with open(tmp, "wb") as f:
+            f.write(b"".join(parts))
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp, self._snapshot_path)
+        for number in self._segments():
+            if number <= covers:
+                os.remove(self._segment_path(number))
+
+    async def close(self):
+        await self.flush()
+        if self._file is not None:
+            await asyncio.to_thread(self._file.close)
@@ -0,0 +1,82 @@
+import asyncio
+
+
+class Subscription:
+    """One listener's mailbox of encoded leaderboard deltas.
+
+    Deltas only make sense in order, so they queue rather than overwrite.
+    A reader that falls more than max_pending behind drops its queue and
+    is told to resync, which sends it one full leaderboard instead.
+    """
+
+    __slots__ = ("_pending", "_final", "_stale", "_ready", "max_pending")
+
+    def __init__(self, max_pending=64):
+        self._pending = []
+        self._final = False
+        self._stale = False
+        self._ready = asyncio.Event()
+        self.max_pending = max_pending
+
+    def offer(self, data, final):
+        self._final = self._final or final
+        if self._stale:
+            return
+        if len(self._pending) >= self.max_pending:
+            self._pending.clear()
+            self._stale = True
+        else:
+            self._pending.append(data)
+        self._ready.set()
+
+    async def get(self):
+        """Wait for updates and return (encoded deltas, is_final), or
+        (None, is_final) when the reader must be resynced."""
+        await self._ready.wait()
+        self._ready.clear()
+        if self._stale:
+            self._stale = False
+            return None, self._final
+        pending, self._pending = self._pending, []
+        return pending, self._final
+
+
+class LeaderboardHub:
+    """Fans out one game's leaderboard deltas to all of its subscribers.
+
+    Each delta is serialized once and the same bytes are handed to every
+    subscriber, so publishing costs one encode plus a list append per
+    listener no matter how slow any of them is. sequence is the version
+    of the board the last delta brought listeners to.
+    """
+
+    def __init__(self):
+        self._subscribers = set()
+        self.sequence = 0
+
+    def __len__(self):
+        return len(self._subscribers)
+
+    def subscribe(self):
+        """Start receiving the deltas after the current sequence."""
+        subscription = Subscription()
+        self._subscribers.add(subscription)
+        return subscription
+
+    def unsubscribe(self, subscription):
+        self._subscribers.discard(subscription)
+
+    def publish(self, update):
+        """Send a delta tagged with the hub's current sequence."""
+        data = update.SerializeToString()
+        for subscription in self._subscribers:
+            subscription.offer(data, update.game_over)
+
+
+def pre_encoded(serializer):
+    """Wrap a response serializer so handlers may return already-encoded bytes."""
+    def serialize(message):
+        if isinstance(message, bytes):
+            return message
+        return serializer(message)
+    return serialize
@@ -1,37 +1,131 @@
 import asyncio
+import time
 import uuid
 from generated import game_pb2, game_pb2_grpc
-from game.questions import QuestionBank
+from game.questions import Question, QuestionBank, DEFAULT_QUESTIONS_PER_GAME
+from game.state import Game
+from game.matchmaker import Matchmaker
+from game.lifecycle import GameLifecycle
+from game.store import MemoryGameStore
+from game.timers import RoundScheduler
+from game.actor import GameActor
+from game.tournament import Tournament, MIN_UPDATE_INTERVAL
 import grpc
 
+_GAME_ENDED = game_pb2.AnswerResult(correct=False, points_awarded=0, explanation="Game has ended.")
+_ALREADY_ANSWERED = game_pb2.AnswerResult(correct=False, points_awarded=0, explanation="Already answered.")
+_ROUND_CLOSED = game_pb2.AnswerResult(correct=False, points_awarded=0, explanation="Round has closed.")
+_ANSWER_FAILED = game_pb2.AnswerResult(correct=False, points_awarded=0, explanation="Answer could not be recorded.")
+
+_MAX_NAME_LENGTH = 64  # characters in a player name
+_CACHED_PAGES = 8  # leaderboard pages kept per game and version
+_COMPRESS_MIN_BYTES = 4096  # replies at least this large are sent gzip-compressed
+
+# Game actor messages.
+_ANSWER = 0  # (_ANSWER, player_id, selected_option, question_id, reply); reply(AnswerResult or exception)
+_TIMEOUT = 1  # (_TIMEOUT, round_index)
+
 class GameServiceImpl(game_pb2_grpc.GameServiceServicer):
-    def __init__(self):
+    def __init__(self, matchmaker=None, lifecycle=None, router=None, store=None, rounds=None):
         self.games = {}  # game_id -> game state
         self.players = {}  # player_id -> player name
         self.player_game_map = {}  # player_id -> game_id
         self.question_bank = QuestionBank()
         self.leaderboard_streams = {}  # game_id -> list of contexts
+        self.tournaments = {}  # tournament_id -> Tournament
+        self.matchmaker = matchmaker or Matchmaker()
+        self.lifecycle = lifecycle or GameLifecycle()
+        self.router = router  # ShardRouter when running sharded
+        self.store = store or MemoryGameStore()
+        self.rounds = rounds or RoundScheduler()
+        self.leaderboard_builds = 0
+        self._tasks = []
+        self._restore_games()
+
+    def start(self):
+        """Start background work; call from inside the server's event loop."""
+        self._tasks.append(asyncio.create_task(self._run_matchmaker()))
+        self._tasks.append(asyncio.create_task(self._run_reaper()))
+        self._tasks.append(asyncio.create_task(self._run_round_timers()))
+        self._tasks.append(asyncio.create_task(self.store.run()))
+
+    def register_metrics(self, metrics):
+        """Gauges over the service's state; computed only when scraped."""
+        games = self.games
+        metrics.gauge("game_live_games", "Games not yet completed or reaped.", lambda: self.lifecycle.live_games)
+        metrics.gauge("game_games", "Games held in memory, including completed ones.", lambda: len(games))
+        metrics.gauge("game_players", "Players seated in games held in memory.",
+                      lambda: sum(len(game.slots) for game in games.values()))
+        metrics.gauge("game_session_listeners", "Open PlaySession and WatchSession streams.",
+                      lambda: sum(len(game.session_listeners) for game in games.values()))
+        metrics.gauge("game_session_queue_depth", "Events waiting to be sent on session streams.",
+                      lambda: sum(queue.qsize() for game in games.values() for queue in game.session_listeners))
+        metrics.gauge("game_leaderboard_listeners", "Open StreamLeaderboard subscriptions.",
+                      lambda: sum(len(game.leaderboard_hub) for game in games.values()))
+        metrics.gauge("game_matchmaking_waiting", "Players waiting in the matchmaking pool.",
+                      lambda: self.matchmaker.waiting)
+        metrics.gauge("game_round_timers", "Round timers armed on the timer wheel.",
+                      lambda: self.rounds.wheel.pending)
+        metrics.counter("game_rounds_timed_out_total", "Rounds closed by their time limit.",
+                        lambda: self.rounds.rounds_timed_out)
+        metrics.gauge("game_actor_mailbox_depth", "Messages waiting in game actor mailboxes.",
+                      lambda: sum(len(game.actor) for game in games.values()))
+        metrics.gauge("game_tournaments", "Tournaments with games still held in memory.",
+                      lambda: len(self.tournaments))
+        metrics.counter("game_leaderboard_builds_total", "GetLeaderboard pages built; the rest came from cache.",
+                        lambda: self.leaderboard_builds)
+        metrics.counter("game_games_reaped_total", "Games evicted by the reaper.",
+                        lambda: self.lifecycle.games_reaped)
+        metrics.counter("game_players_reaped_total", "Players seated in games evicted by the reaper.",
+                        lambda: self.lifecycle.players_reaped)
+        metrics.counter("game_reclaimed_bytes_total", "Estimated bytes of game state freed by the reaper.",
+                        lambda: self.lifecycle.bytes_reclaimed)
+        if self.router is not None:
+            metrics.counter("game_shard_forwarded_total", "Calls forwarded to the worker owning their game.",
+                            lambda: self.router.forwarded)
+
+    def _restore_games(self):
+        # Versions handed out before the restart must not be reused, or a
+        # client could be told its stale board is current.
+        epoch = time.time_ns() // 1_000_000
+        for game_id, game in self.store.load_games(self.question_bank).items():
+            self.games[game_id] = game
+            game.actor = GameActor(game, self._apply_batch)
+            game.leaderboard_hub.sequence = epoch
+            self.lifecycle.created(game_id, game)
+            if game.completed:
+                self.lifecycle.completed(game)
 
     async def JoinGame(self, request, context):
-        player_id = str(uuid.uuid4())
-        game_id = request.game_id or str(uuid.uuid4())  # new if not provided
+        game_id = request.game_id or self._new_game_id()  # new if not provided
         player_name = request.player_name
+        if len(player_name) > _MAX_NAME_LENGTH:
+            context.set_code(grpc.StatusCode.INVALID_ARGUMENT)
+            context.set_details(f"player_name must be at most {_MAX_NAME_LENGTH} characters")
+            return game_pb2.JoinResponse()
 
-        if game_id not in self.games:
-            self.games[game_id] = {
-                "players": {player_id: {"name": player_name, "score": 0, "answers": set()}},
-                "questions": self.question_bank.get_all_questions(),
-                "current_question_index": 0,
-                "answered_players": {},  # Track answers per question
-                "leaderboard_listeners": [],
-                "completed": False,
-            }
-        else:
-            self.games[game_id]["players"][player_id] = {
-                "name": player_name,
-                "score": 0,
-                "answers": set()
-            }
+        game = self.games.get(game_id)
+        if game is None:
+            if not self.lifecycle.can_admit():
+                context.set_code(grpc.StatusCode.RESOURCE_EXHAUSTED)
+                context.set_details("Server is at its live game limit, try again later")
+                return game_pb2.JoinResponse()
+            if request.question_count < 0:
+                context.set_code(grpc.StatusCode.INVALID_ARGUMENT)
+                context.set_details("question_count must not be negative")
+                return game_pb2.JoinResponse()
+            question_indices = self.question_bank.sample(
+                request.question_count or DEFAULT_QUESTIONS_PER_GAME,
+                category=request.category,
+                difficulty=request.difficulty,
+                exclude_ids=request.exclude_question_ids
+            )
+            if not question_indices:
+                context.set_code(grpc.StatusCode.INVALID_ARGUMENT)
+                context.set_details("No questions match the requested category and difficulty")
+                return game_pb2.JoinResponse()
+            game = self._create_game(game_id, question_indices, request.tournament_id)
+        player_id = self._add_player(game, player_name)
 
         return game_pb2.JoinResponse(
             player_id=player_id,
@@ -39,6 +133,115 @@ class GameServiceImpl(game_pb2_grpc.GameServiceServicer):
             message=f"{player_name} joined game {game_id}"
         )
 
+    def _new_game_id(self):
+        # Sharded workers only create games they own.
+        return self.router.new_game_id() if self.router else str(uuid.uuid4())
+
+    def _create_game(self, game_id, question_indices=None, tournament_id=""):
+        if question_indices is None:
+            question_indices = self.question_bank.sample()
+        game = self.games[game_id] = Game(game_id, self.question_bank, question_indices)
+        game.actor = GameActor(game, self._apply_batch)
+        if tournament_id:
+            tournament = self.tournaments.get(tournament_id)
+            if tournament is None:
+                tournament = self.tournaments[tournament_id] = Tournament(tournament_id)
+            tournament.add_game(game)
+            game.tournament = tournament
+        self.lifecycle.created(game_id, game)
+        self.store.game_created(game)
+        return game
+
+    def _add_player(self, game, player_name):
+        player_id = str(uuid.uuid4())
+        slot = game.add_player(player_id, player_name)
+        self.lifecycle.touch(game)
+        self._publish_leaderboard_changes(game, (slot.index,), new_players=True)
+        if game.tournament is not None:
+            game.tournament.player_joined(game, slot.index)
+        self.store.player_joined(game, slot)
+        return player_id
+
+    async def EnqueueForMatch(self, request, context):
+        if len(request.player_name) > _MAX_NAME_LENGTH:
+            context.set_code(grpc.StatusCode.INVALID_ARGUMENT)
+            context.set_details(f"player_name must be at most {_MAX_NAME_LENGTH} characters")
+            return
+        ticket = self.matchmaker.enqueue(
+            request.player_name,
+            room_size=request.room_size,
+            skill=request.skill,
+            region=request.region
+        )
+        if ticket is None:
+            context.set_code(grpc.StatusCode.INVALID_ARGUMENT)
+            context.set_details(f"Room size {request.room_size} is not offered")
+            return
+
+        try:
+            yield game_pb2.MatchUpdate(matched=False, players_waiting=self.matchmaker.waiting_in(ticket))
+            game_id, player_id = await ticket.assignment
+            yield game_pb2.MatchUpdate(matched=True, player_id=player_id, game_id=game_id)
+        finally:
+            self.matchmaker.cancel(ticket)
+
+    async def _run_matchmaker(self):
+        while True:
+            await asyncio.sleep(self.matchmaker.tick_interval)
+            budget = None
+            if self.lifecycle.max_live_games is not None:
+                budget = max(self.lifecycle.max_live_games - self.lifecycle.live_games, 0)
+            for tickets in self.matchmaker.form_rooms(limit=budget):
+                game_id = self._new_game_id()
+                game = self._create_game(game_id)
+                for ticket in tickets:
+                    ticket.assignment.set_result((game_id, self._add_player(game, ticket.player_name)))
+
+    async def _run_reaper(self):
+        while True:
+            await asyncio.sleep(self.lifecycle.sweep_interval)
+            try:
+                self._reap_expired(time.monotonic())
+            except Exception as error:
+                # A failed sweep must not stop every later one.
+                asyncio.get_running_loop().call_exception_handler(
+                    {"message": "Reaping expired games failed", "exception": error})
+
+    async def _run_round_timers(self):
+        # One shared wheel for every game's round clock.
+        while True:
+            await asyncio.sleep(self.rounds.tick)
+            for game in self.rounds.due():
+                game.actor.tell((_TIMEOUT, game.current_question_index))
+
+    def _reap_expired(self, now):
+        for game_id in self.lifecycle.expired(self.games, now):
+            game = self.games.pop(game_id, None)
+            if game is None:
+                continue
+            self.rounds.cancel(game)
+            self.store.game_removed(game_id)
+            for player_id in game.players:
+                self.players.pop(player_id, None)
+                self.player_game_map.pop(player_id, None)
+            if game.tournament is not None:
+                self._leave_tournament(game)
+
+            # Let any stream still attached to an abandoned game finish.
+            if not game.completed:
+                game.completed = True
+                self._push_session_event(game, game_pb2.SessionEvent(round=self._round_transition(game)))
+                self._broadcast_final_leaderboard(game)
+            self.lifecycle.reaped(game)
+
+
+    def _leave_tournament(self, game):
+        # A tournament lasts as long as any of its games is held.
+        tournament = game.tournament
+        tournament.remove_game(game.game_id)
+        if not tournament.live_games:
+            del self.tournaments[tournament.tournament_id]
+            tournament.close()
 
     async def GetNextQuestion(self, request, context):
         game_id = request.game_id
@@ -49,115 +252,232 @@ class GameServiceImpl(game_pb2_grpc.GameServiceServicer):
             context.set_details("Game or player not found")
             return game_pb2.QuestionCard()
 
-        if game["completed"]:
+        if game.completed:
             return game_pb2.QuestionCard()
 
-        questions = game["questions"]
-        current_index = game["current_question_index"]
-        players = game["players"]
-        total_players = len(players)
+        current_index = game.current_question_index
 
         # If no more questions, return empty
-        if current_index >= len(questions):
+        if current_index >= game.total_rounds:
             context.set_code(grpc.StatusCode.NOT_FOUND)
             context.set_details("No more questions")
             return game_pb2.QuestionCard()
 
-        current_question = questions[current_index]
-        question_id = current_question["question_id"]
-
-        # Wait until all players have answered the current question before advancing
-        answered_players = game["answered_players"].get(question_id, set())
+        # Rounds only advance inside the game's actor, once the last answer
+        # is in or the round times out; this just reads the current one.
+        self._start_round_clock(game)
+        return game.question(current_index).card_bytes_for(request.bank_version)
 
-        if len(answered_players) < total_players:
-            # Still waiting for others to answer
-            return game_pb2.QuestionCard(
-                question_id=question_id,
-                question_text=current_question["question_text"],
-                options=current_question["options"]
-            )
-        else:
-            # All players answered — advance to next question
-            game["current_question_index"] += 1
-            if game["current_question_index"] >= len(questions):
-                return game_pb2.Question()  # Game over
-
-            next_question = questions[game["current_question_index"]]
-            return game_pb2.QuestionCard(
-                question_id=next_question["question_id"],
-                question_text=next_question["question_text"],
-                options=next_question["options"]
-            )
-
-    async def StartGame(self, request, context):
+    async def SubmitAnswer(self, request, context):
         game_id = request.game_id
         player_id = request.player_id
 
         game = self.games.get(game_id)
-        if not game:
+        if not game or player_id not in game.players:
             context.set_code(grpc.StatusCode.NOT_FOUND)
-            context.set_details("Game not found.")
-            return
+            context.set_details("Game or player not found")
+            return game_pb2.AnswerResult()
 
-        questions = game["questions"]
-        for q in questions:
-            print(f"Sending question to player {player_id}: {q["question_text"]}")
-            await context.write(
-                game_pb2.QuestionCard(
-                    question_id=q["question_id"],
-                    question_text=q["question_text"],
-                    options=q["options"],
-                    time_limit_seconds=10
-                )
-            )
-            # await asyncio.sleep(10)  # Simulate 10 sec wait
+        reply = asyncio.get_running_loop().create_future()
+
+        def settle(outcome):
+            if reply.done():  # the caller went away
+                return
+            if isinstance(outcome, Exception):
+                reply.set_exception(outcome)
+            else:
+                reply.set_result(outcome)
+
+        game.actor.tell((_ANSWER, player_id, request.selected_option, request.question_id, settle))
+        try:
+            return await reply
+        except Exception:
+            context.set_code(grpc.StatusCode.INTERNAL)
+            context.set_details("Answer could not be recorded")
+            return game_pb2.AnswerResult()
 
-    async def SubmitAnswer(self, request, context):
-        game_id = request.game_id
-        player_id = request.player_id
-        selected_option = request.selected_option
+    async def PlaySession(self, request_iterator, context):
+        first = await anext(request_iterator, None)
+        if first is None or first.WhichOneof("payload") != "join":
+            context.set_code(grpc.StatusCode.INVALID_ARGUMENT)
+            context.set_details("First session message must be a join")
+            return
 
+        game_id = first.join.game_id
+        player_id = first.join.player_id
         game = self.games.get(game_id)
-        if not game or player_id not in game["players"]:
+        if not game or player_id not in game.players:
             context.set_code(grpc.StatusCode.NOT_FOUND)
             context.set_details("Game or player not found")
-            return game_pb2.AnswerResult()
+            return
 
-        current_index = game["current_question_index"]
-        if current_index >= len(game["questions"]):
-            return game_pb2.AnswerResult(correct=False, points_awarded=0, explanation="Game has ended.")
+        queue = asyncio.Queue()
 
-        question = game["questions"][current_index]
-        question_id = question["question_id"]
-        correct_option = question["correct_option"]
-        explanation = question.get("explanation", "")
+        async def read_answers():
+            # Answers arrive on the same stream; the actor replies to this
+            # player before pushing any round transition the answer triggers.
+            def reply(outcome):
+                if isinstance(outcome, Exception):
+                    outcome = _ANSWER_FAILED
+                queue.put_nowait(game_pb2.SessionEvent(answer_result=outcome))
+
+            async for message in request_iterator:
+                if message.WhichOneof("payload") != "answer":
+                    continue
+                answer = message.answer
+                if answer.player_id and answer.player_id != player_id:
+                    continue
+                game.actor.tell((_ANSWER, player_id, answer.selected_option, answer.question_id, reply))
+
+        reader = asyncio.create_task(read_answers())
+        try:
+            async for event in self._session_events(game, queue, first.join.bank_version):
+                yield event
+        finally:
+            reader.cancel()
+
+    async def WatchSession(self, request, context):
+        game = self.games.get(request.game_id)
+        if not game or request.player_id not in game.players:
+            context.set_code(grpc.StatusCode.NOT_FOUND)
+            context.set_details("Game or player not found")
+            return
 
-        # Ensure answered_players structure exists
-        if question_id not in game["answered_players"]:
-            game["answered_players"][question_id] = set()
+        async for event in self._session_events(game, asyncio.Queue(), request.bank_version):
+            yield event
+
+    async def _session_events(self, game, queue, bank_version=0):
+        """Yield the current question, then every pushed event until game
+        over. Questions go by reference to clients caching bank_version."""
+        if game.completed:
+            yield game_pb2.SessionEvent(round=self._round_transition(game))
+            return
+
+        game.session_listeners.append(queue)
+        self._start_round_clock(game)
+        try:
+            yield game.question(game.current_question_index).event_bytes_for(bank_version)
+            while True:
+                # Questions are pushed as the Question, encoded per session;
+                # only messages can carry the final round transition.
+                event = await queue.get()
+                if isinstance(event, Question):
+                    event = event.event_bytes_for(bank_version)
+                yield event
+                if isinstance(event, game_pb2.SessionEvent) and event.round.game_over:
+                    break
+        finally:
+            game.session_listeners.remove(queue)
+
+    def _apply_batch(self, game, batch):
+        """Apply a game's queued answers and timeouts; runs in its actor.
+
+        Answers are graded in arrival order and each reply is sent as soon
+        as it is graded. The round advances at most once per batch, after
+        the last answer that completed it or a timeout for that round;
+        anything queued behind it in the same batch is for a round that has
+        closed. An answer that fails to apply is reported and its reply gets
+        the error; the rest of the batch is still applied.
+        """
+        advance = timed_out = False
+        scored = []
+        for message in batch:
+            if message[0] == _ANSWER:
+                _, player_id, selected_option, question_id, reply = message
+                if advance or game.completed:
+                    reply(_GAME_ENDED if game.completed else _ROUND_CLOSED)
+                    continue
+                try:
+                    result, advance = self._record_answer(game, player_id, selected_option, question_id)
+                    if result.points_awarded:
+                        scored.append(game.players[player_id].index)
+                except Exception as error:
+                    asyncio.get_running_loop().call_exception_handler(
+                        {"message": f"Applying an answer in game {game.game_id} failed", "exception": error})
+                    reply(error)
+                    continue
+                reply(result)
+            elif not advance and not game.completed and message[1] == game.current_question_index:
+                advance = timed_out = True
+        if scored:
+            # One leaderboard delta for the whole batch.
+            self._publish_leaderboard_changes(game, scored)
+            if game.tournament is not None:
+                game.tournament.update(game, scored)
+        if advance:
+            self._advance_round(game, timed_out)
+
+    def _record_answer(self, game, player_id, selected_option, question_id=""):
+        """Grade an answer for the current question.
+
+        Returns the AnswerResult and whether every player has now answered,
+        in which case the caller must advance the round. An answer naming a
+        question other than the current one is for a round that has closed.
+        """
+        current_index = game.current_question_index
+        if current_index >= game.total_rounds:
+            return _GAME_ENDED, False
+        if question_id and question_id != game.question(current_index).question_id:
+            return _ROUND_CLOSED, False
 
         # Prevent duplicate answers
-        if player_id in game["answered_players"][question_id]:
-            return game_pb2.AnswerResult(correct=False, points_awarded=0, explanation="Already answered.")
+        slot = game.players[player_id]
+        if game.has_answered(slot):
+            return _ALREADY_ANSWERED, False
 
         # Record the player's answer
-        game["answered_players"][question_id].add(player_id)
-
-        correct = selected_option == correct_option
-        points = 10 if correct else 0
-        game["players"][player_id]["score"] += points
+        game.mark_answered(slot)
+        self.lifecycle.touch(game)
 
-        # Optionally send updated leaderboard here
-        # await self._notify_leaderboard_update(game)
+        result = game.question(current_index).grade(selected_option)
+        if result.points_awarded:
+            game.ranking.update(slot.index, game.scores[slot.index] + result.points_awarded)
+        self.store.answer_recorded(game, slot, selected_option, result.correct)
 
         # If all players have answered this question
-        if len(game["answered_players"][question_id]) == len(game["players"]):
-            game["current_question_index"] += 1
-            if game["current_question_index"] >= len(game["questions"]):
-                game["completed"] = True
-                await self._broadcast_final_leaderboard(game)
+        return result, game.all_answered()
+
+    def _start_round_clock(self, game):
+        # A round's clock starts when its question is first served; later
+        # rounds are armed as soon as they begin.
+        if game.round_timer is None and not game.completed:
+            self.rounds.arm(game, game.question(game.current_question_index).time_limit_seconds)
+
+    def _advance_round(self, game, timed_out=False):
+        """Move to the next question and push the transition to open sessions.
+
+        Rounds end when every player has answered or, with timed_out, when
+        the round scheduler closes them; players who did not answer score
+        nothing for that question.
+        """
+        game.next_round()
+        if game.current_question_index >= game.total_rounds:
+            game.completed = True
+            self.lifecycle.completed(game)
+            self.rounds.cancel(game)
+        else:
+            self.rounds.arm(game, game.question(game.current_question_index).time_limit_seconds)
+        self.store.round_advanced(game)
 
-        return game_pb2.AnswerResult(correct=correct, points_awarded=points, explanation=explanation)
+        self._push_session_event(game, game_pb2.SessionEvent(round=self._round_transition(game, timed_out)))
+        if game.completed:
+            self._broadcast_final_leaderboard(game)
+        else:
+            self._push_session_event(game, game.question(game.current_question_index))
+
+    def _push_session_event(self, game, event):
+        for queue in game.session_listeners:
+            queue.put_nowait(event)
+
+    def _round_transition(self, game, timed_out=False):
+        next_round = game.current_question_index
+        return game_pb2.RoundTransition(
+            completed_round=next_round - 1,
+            next_round=next_round,
+            total_rounds=game.total_rounds,
+            game_over=game.completed,
+            timed_out=timed_out
+        )
 
 
 
@@ -169,83 +489,162 @@ class GameServiceImpl(game_pb2_grpc.GameServiceServicer):
             context.set_details("Game not found.")
             return game_pb2.Leaderboard()
 
-        entries = self._generate_leaderboard_entries(game)
-        return game_pb2.Leaderboard(entries=entries)
+        version = game.leaderboard_hub.sequence
+        if request.known_version and request.known_version == version:
+            return game_pb2.Leaderboard(version=version, not_modified=True)
+
+        page = self._leaderboard_page(game, version, max(request.offset, 0), max(request.limit, 0))
+        slot = game.players.get(request.player_id)
+        if slot is not None:
+            # Encoded messages concatenate, so the player's entry is
+            # appended to the shared page rather than rebuilding it.
+            page += game_pb2.Leaderboard(player_entry=self._leaderboard_entry(game, slot)).SerializeToString()
+        if len(page) >= _COMPRESS_MIN_BYTES:
+            _compress(context)
+        return page
+
+    def _leaderboard_page(self, game, version, offset, limit):
+        """The encoded page at this board version, built once and shared
+        by every caller until a score or the player list changes."""
+        cache = game.leaderboard_cache
+        if cache is None or cache[0] != version:
+            cache = game.leaderboard_cache = (version, {})
+        pages = cache[1]
+        page = pages.get((offset, limit))
+        if page is None:
+            if len(pages) >= _CACHED_PAGES:
+                pages.clear()
+            leaderboard = self._build_leaderboard(game, offset, limit)
+            leaderboard.version = version
+            page = pages[offset, limit] = leaderboard.SerializeToString()
+            self.leaderboard_builds += 1
+        return page
+
+    async def GetQuestionBank(self, request, context):
+        bank = self.question_bank
+        if request.known_version and request.known_version == bank.version:
+            yield game_pb2.QuestionBankChunk(version=bank.version, total_questions=len(bank), not_modified=True)
+            return
+        _compress(context)
+        for chunk in bank.chunks(request.offset, request.limit, request.chunk_size):
+            yield chunk
 
     async def StreamLeaderboard(self, request, context):
         game = self.games.get(request.game_id)
         if not game:
             return
 
-        queue = asyncio.Queue()
-        game["leaderboard_listeners"].append(queue)
-
-        while True:
-            update = await queue.get()
-            yield update
-            if update.game_over:
-                break
-
-
-    async def _notify_leaderboard_update(self, game):
-        if not game:
+        # The full board first, then deltas from the same sequence on.
+        # Deltas arrive already serialized and shared by every listener;
+        # leaving the stream (or being cancelled on disconnect) unsubscribes.
+        hub = game.leaderboard_hub
+        subscription = hub.subscribe()
+        try:
+            yield self._full_leaderboard_update(game)
+            if game.completed:
+                return
+            while True:
+                updates, game_over = await subscription.get()
+                if updates is None:
+                    # Fell too far behind; start again from the current board.
+                    yield self._full_leaderboard_update(game)
+                else:
+                    for update in updates:
+                        yield update
+                if game_over:
+                    break
+        finally:
+            hub.unsubscribe(subscription)
+
+    async def StreamTournamentLeaderboard(self, request, context):
+        tournament = self.tournaments.get(request.tournament_id)
+        if tournament is None:
+            context.set_code(grpc.StatusCode.NOT_FOUND)
+            context.set_details("Tournament not found")
             return
 
-        update = game_pb2.LeaderboardUpdate(
-            leaderboard=game_pb2.Leaderboard(
-                entries=self._generate_leaderboard_entries(game)
-            ),
-            game_over=game.get("completed", False)
-        )
-
-        for queue in game["leaderboard_listeners"]:
-            await queue.put(update)
-
-    def _generate_leaderboard_entries(self, game):
-        players = game["players"]
-
-        # Sort players by score descending
-        sorted_players = sorted(
-            players.items(),
-            key=lambda item: item[1]["score"],
-            reverse=True
+        # However fast scores change, a listener gets the latest board at
+        # most once per interval; versions in between are skipped, not queued.
+        interval = max(request.interval_ms / 1000, MIN_UPDATE_INTERVAL)
+        limit = max(request.limit, 0)
+        loop = asyncio.get_running_loop()
+        while not tournament.closed:
+            version = tournament.version
+            yield tournament.encoded(limit)
+            sent = loop.time()
+            while tournament.version == version:
+                # Shielded: a listener leaving must not cancel the others' wait.
+                await asyncio.shield(tournament.changed())
+            await asyncio.sleep(sent + interval - loop.time())
+
+    def _full_leaderboard_update(self, game):
+        leaderboard = self._build_leaderboard(game)
+        leaderboard.version = game.leaderboard_hub.sequence
+        return game_pb2.LeaderboardUpdate(
+            leaderboard=leaderboard,
+            game_over=game.completed,
+            sequence=leaderboard.version,
+            total_players=leaderboard.total_players
         )
 
-        entries = []
-        for rank, (player_id, player_data) in enumerate(sorted_players, start=1):
-            entries.append(
-                game_pb2.LeaderboardEntry(
-                    player_id=player_id,
-                    player_name=player_data["name"],
-                    score=player_data["score"],
-                    rank=rank
-                )
+    def _publish_leaderboard_changes(self, game, indices, new_players=False, game_over=False):
+        """Bump the board's sequence and send listeners the new score and
+        rank of each player in indices; players ranked between a mover's
+        old and new place shift by one and are left for clients to infer."""
+        hub = game.leaderboard_hub
+        hub.sequence += 1
+        if not hub:
+            return
+        slots = game.slots
+        ranking = game.ranking
+        changes = []
+        for index in sorted(set(indices), key=ranking.rank):
+            entry = game_pb2.LeaderboardEntry(player_index=index, score=ranking.scores[index],
+                                              rank=ranking.rank(index))
+            if new_players:
+                entry.player_id = slots[index].player_id
+                entry.player_name = slots[index].name
+            changes.append(entry)
+        hub.publish(game_pb2.LeaderboardUpdate(
+            sequence=hub.sequence, changes=changes, total_players=len(slots), game_over=game_over))
+
+    def _broadcast_final_leaderboard(self, game):
+        self._publish_leaderboard_changes(game, (), game_over=True)
+
+    def _build_leaderboard(self, game, offset=0, limit=0):
+        slots = game.slots
+        entries = [
+            game_pb2.LeaderboardEntry(
+                player_id=slots[index].player_id,
+                player_name=slots[index].name,
+                score=score,
+                rank=rank,
+                player_index=index
             )
-
-        return entries
-
-    async def _broadcast_final_leaderboard(self, game):
-        update = game_pb2.LeaderboardUpdate(
-            leaderboard=self._build_leaderboard(game),
-            game_over=True
-        )
-        for queue in game["leaderboard_listeners"]:
-            await queue.put(update)
-    def _build_leaderboard(self, game):
-        sorted_players = sorted(
-            game["players"].items(),
-            key=lambda item: item[1]["score"],
-            reverse=True
+            for rank, index, score in game.ranking.page(offset, limit)
+        ]
+        return game_pb2.Leaderboard(entries=entries, total_players=len(slots))
+
+    def _leaderboard_entry(self, game, slot):
+        return game_pb2.LeaderboardEntry(
+            player_id=slot.player_id,
+            player_name=slot.name,
+            score=game.scores[slot.index],
+            rank=game.ranking.rank(slot.index),
+            player_index=slot.index
         )
 
-        entries = []
-        for rank, (player_id, info) in enumerate(sorted_players, start=1):
-            entry = game_pb2.LeaderboardEntry(
-                player_id=player_id,
-                player_name=info["name"],
-                score=info["score"],
-                rank=rank
-            )
-            entries.append(entry)
+    async def GetShardMap(self, request, context):
+        if self.router is None:
+            shard_map = game_pb2.ShardMap(shards=[game_pb2.ShardInfo(shard_id=0)])
+        else:
+            shard_map = self.router.shard_map(request.game_id)
+        shard_map.live_games = self.lifecycle.live_games
+        return shard_map
+
 
-        return game_pb2.Leaderboard(entries=entries)
+def _compress(context):
+    # Asks for gzip on this call's responses; gRPC falls back to no
+    # compression for clients that do not accept it.
+    if context is not None:
+        context.set_compression(grpc.Compression.Gzip)
@@ -0,0 +1,407 @@
+"""gRPC-Web and WebSocket gateway for browsers, served on the game loop.
+
+Browsers cannot speak gRPC's HTTP/2 framing, so their calls used to go
+through grpcwebproxy or Envoy on the way to the gRPC port. The gateway
+accepts them itself and calls the GameService handlers directly, on the
+same loop as the gRPC server.
+
+gRPC-Web, over HTTP/1.1: POST /game.GameService/<Method> with a
+length-prefixed message, as `application/grpc-web+proto` or base64
+`application/grpc-web-text`; the reply is the response messages and a
+trailer frame carrying grpc-status. Server-streaming replies are sent
+chunked, one chunk per message as soon as it is produced.
+
+WebSocket: a GET upgrade on the same path carries one call of any kind,
+PlaySession included. Both sides send binary messages holding gRPC-Web
+frames. The client half-closes by sending a trailer frame, and the
+server ends the call with its trailer frame and a close.
+
+Calls whose handler asks for compression are sent with HTTP gzip
+Content-Encoding to clients that accept it, as browsers do.
+"""
+import asyncio
+import base64
+import hashlib
+import struct
+import zlib
+from urllib.parse import quote
+
+import grpc
+
+SERVICE_PATH = "/game.GameService/"
+MAX_MESSAGE = 4 * 1024 * 1024
+_FRAME = struct.Struct(">BI")
+# A gRPC-Web body is one framed request, base64 encoded for grpc-web-text.
+_MAX_BODY = 4 * -(-(_FRAME.size + MAX_MESSAGE) // 3)
+_TRAILER = 0x80
+_WS_GUID = b"258EAFA5-E914-47DA-95CA-C5AB0DC11B85"
+_WS_BINARY, _WS_CLOSE, _WS_PING, _WS_PONG = 0x2, 0x8, 0x9, 0xA
+_MESSAGE_SAFE = "".join(chr(c) for c in range(0x20, 0x7F) if c != 0x25)
+_TIMEOUT_UNITS = {"H": 3600.0, "M": 60.0, "S": 1.0, "m": 1e-3, "u": 1e-6, "n": 1e-9}
+_CORS = (b"Access-Control-Allow-Origin: *\r\n"
+         b"Access-Control-Expose-Headers: grpc-status, grpc-message\r\n")
+_PREFLIGHT = (b"HTTP/1.1 204 No Content\r\n" + _CORS +
+              b"Access-Control-Allow-Methods: POST, OPTIONS\r\n"
+              b"Access-Control-Allow-Headers: content-type, x-grpc-web, x-user-agent, grpc-timeout\r\n"
+              b"Access-Control-Max-Age: 86400\r\n"
+              b"Content-Length: 0\r\n\r\n")
+
+
+def frame(message, flag=0):
+    return _FRAME.pack(flag, len(message)) + message
+
+
+def trailer_frame(code, details="", metadata=()):
+    trailer = f"grpc-status:{code}\r\n"
+    if details:
+        trailer += f"grpc-message:{quote(details, safe=_MESSAGE_SAFE)}\r\n"
+    for key, value in metadata:
+        trailer += f"{key}:{value}\r\n"
+    return frame(trailer.encode("ascii"), _TRAILER)
+
+
+def parse_frames(data):
+    """Yield (flag, payload) for each frame in data."""
+    view = memoryview(data)
+    offset = 0
+    while offset + _FRAME.size <= len(view):
+        flag, length = _FRAME.unpack_from(view, offset)
+        offset += _FRAME.size
+        yield flag, bytes(view[offset:offset + length])
+        offset += length
+
+
+def _chunk(data):
+    return b"%x\r\n%s\r\n" % (len(data), data)
+
+
+def _http_error(status):
+    return b"HTTP/1.1 " + status + b"\r\nContent-Length: 0\r\nConnection: close\r\n\r\n"
+
+
+def _timeout(headers):
+    value = headers.get("grpc-timeout")
+    if not value:
+        return None
+    return int(value[:-1]) * _TIMEOUT_UNITS[value[-1]]
+
+
+class GatewayContext:
+    """The parts of grpc.aio.ServicerContext the game handlers use."""
+
+    __slots__ = ("_code", "_details", "_metadata", "_trailing_metadata", "_peer", "compression")
+
+    def __init__(self, metadata=(), peer=""):
+        self._code = None
+        self._details = ""
+        self._metadata = metadata
+        self._trailing_metadata = ()
+        self._peer = peer
+        self.compression = None
+
+    def set_code(self, code):
+        self._code = code
+
+    def set_details(self, details):
+        self._details = details
+
+    def code(self):
+        return self._code
+
+    def details(self):
+        return self._details
+
+    def invocation_metadata(self):
+        return self._metadata
+
+    def peer(self):
+        return self._peer
+
+    def set_compression(self, compression):
+        self.compression = compression
+
+    def set_trailing_metadata(self, metadata):
+        self._trailing_metadata = tuple(metadata)
+
+    def failed(self):
+        return self._code is not None and self._code != grpc.StatusCode.OK
+
+    def status(self):
+        """Arguments for trailer_frame: code, details and trailing metadata."""
+        code = self._code or grpc.StatusCode.OK
+        code = code.value[0] if isinstance(code, grpc.StatusCode) else int(code)
+        return code, self._details, self._trailing_metadata
+
+
+def _peer(writer):
+    """The client's address in gRPC's peer format, e.g. ipv4:10.0.0.7:51234."""
+    address = writer.get_extra_info("peername")
+    if not address:
+        return ""
+    if len(address) == 4:
+        return f"ipv6:[{address[0]}]:{address[1]}"
+    return f"ipv4:{address[0]}:{address[1]}"
+
+
+def _fail(context, error):
+    if isinstance(error, TimeoutError):
+        context.set_code(grpc.StatusCode.DEADLINE_EXCEEDED)
+        context.set_details("Deadline Exceeded")
+    elif not context.failed():
+        context.set_code(grpc.StatusCode.UNKNOWN)
+        context.set_details(f"Exception calling application: {error}")
+
+
+class Gateway:
+    """Serves method handlers (see game.server.game_method_handlers) to
+    gRPC-Web and WebSocket clients. interceptors are the gRPC server's
+    (MetricsInterceptor, AdmissionControl), applied in the same order, so
+    gateway calls are counted and admitted like native ones."""
+
+    def __init__(self, handlers, interceptors=()):
+        self._handlers = {}
+        for name, handler in handlers.items():
+            path = SERVICE_PATH + name
+            for interceptor in reversed(interceptors):
+                handler = interceptor.wrap(path, handler)
+            self._handlers[path] = handler
+        self.connections = 0
+        self._server = None
+
+    async def start(self, port, host="0.0.0.0", reuse_port=False):
+        self._server = await asyncio.start_server(self._connection, host, port, reuse_port=reuse_port)
+        return self._server
+
+    async def close(self):
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+
+    async def _connection(self, reader, writer):
+        self.connections += 1
+        try:
+            while True:
+                head = await _read_head(reader)
+                if head is None:
+                    return
+                method, path, headers = head
+                if headers.get("upgrade", "").lower() == "websocket":
+                    await self._websocket(path, headers, reader, writer)
+                    return
+                if method == b"OPTIONS":
+                    writer.write(_PREFLIGHT)
+                    continue
+                length = headers.get("content-length", "")
+                if method != b"POST" or not length.isdecimal():
+                    writer.write(_http_error(b"400 Bad Request"))
+                    return
+                if int(length) > _MAX_BODY:
+                    writer.write(_http_error(b"413 Payload Too Large"))
+                    return
+                body = await reader.readexactly(int(length))
+                if not await self._grpc_web(path, headers, body, reader, writer):
+                    return
+                if headers.get("connection", "").lower() == "close":
+                    return
+        except (asyncio.IncompleteReadError, ConnectionError, ValueError):
+            pass
+        finally:
+            self.connections -= 1
+            writer.close()
+
+    async def _grpc_web(self, path, headers, body, reader, writer):
+        """Answer one gRPC-Web request; False if the client went away."""
+        text = headers.get("content-type", "").startswith("application/grpc-web-text")
+        encode = base64.b64encode if text else bytes
+        head = (b"HTTP/1.1 200 OK\r\nContent-Type: " +
+                (b"application/grpc-web-text+proto" if text else b"application/grpc-web+proto") + b"\r\n" + _CORS)
+        gzip_accepted = "gzip" in headers.get("accept-encoding", "")
+        context = GatewayContext(tuple(headers.items()), _peer(writer))
+        handler = self._handlers.get(path)
+        if handler is None or handler.request_streaming:
+            context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+            context.set_details("Method not found" if handler is None
+                                else "Client streaming needs the WebSocket transport")
+        else:
+            try:
+                request = _decode(handler, next(parse_frames(base64.b64decode(body) if text else body))[1])
+            except Exception:
+                context.set_code(grpc.StatusCode.INTERNAL)
+                context.set_details("Exception deserializing request!")
+
+        if not handler or context.failed() or not handler.response_streaming:
+            reply = b""
+            if not context.failed():
+                try:
+                    async with asyncio.timeout(_timeout(headers)):
+                        response = await handler.unary_unary(request, context)
+                    if not context.failed():
+                        reply = encode(frame(_encode(handler, response)))
+                except Exception as error:
+                    _fail(context, error)
+            reply += encode(trailer_frame(*context.status()))
+            if context.compression and gzip_accepted:
+                reply = zlib.compress(reply, wbits=31)
+                head += b"Content-Encoding: gzip\r\n"
+            writer.write(head + b"Content-Length: %d\r\n\r\n" % len(reply) + reply)
+            await writer.drain()
+            return True
+
+        compressor = None
+
+        def send(data):
+            # Headers wait for the first message, by when the handler has
+            # said whether it wants compression. Compressed chunks are
+            # flushed whole so each message can be read on arrival.
+            nonlocal head, compressor
+            if head is not None:
+                if context.compression and gzip_accepted:
+                    compressor = zlib.compressobj(wbits=31)
+                    head += b"Content-Encoding: gzip\r\n"
+                writer.write(head + b"Transfer-Encoding: chunked\r\n\r\n")
+                head = None
+            if compressor is not None:
+                data = compressor.compress(data) + compressor.flush(zlib.Z_SYNC_FLUSH)
+            writer.write(_chunk(data))
+
+        async def pump():
+            try:
+                async with asyncio.timeout(_timeout(headers)):
+                    async for response in handler.unary_stream(request, context):
+                        send(encode(frame(_encode(handler, response))))
+                        await writer.drain()
+            except Exception as error:
+                _fail(context, error)
+            send(encode(trailer_frame(*context.status())))
+            if compressor is not None:
+                writer.write(_chunk(compressor.flush()))
+            writer.write(b"0\r\n\r\n")
+            await writer.drain()
+
+        # Nothing more arrives on the connection while a stream is open, so
+        # a read finishing means the client has gone and the call is dropped.
+        return await _until_closed(pump(), reader.read(1))
+
+    async def _websocket(self, path, headers, reader, writer):
+        key = headers.get("sec-websocket-key", "")
+        accept = base64.b64encode(hashlib.sha1(key.encode("ascii") + _WS_GUID).digest())
+        writer.write(b"HTTP/1.1 101 Switching Protocols\r\nUpgrade: websocket\r\nConnection: Upgrade\r\n"
+                     b"Sec-WebSocket-Accept: " + accept + b"\r\n\r\n")
+        handler = self._handlers.get(path)
+        context = GatewayContext(tuple(headers.items()), _peer(writer))
+        requests = asyncio.Queue()
+
+        async def receive():
+            # Runs until the client closes; a trailer frame only ends the requests.
+            while True:
+                opcode, payload = await _ws_read(reader)
+                if opcode == _WS_CLOSE:
+                    return
+                if opcode == _WS_PING:
+                    _ws_write(writer, _WS_PONG, payload)
+                elif opcode != _WS_PONG and handler is not None:
+                    for flag, message in parse_frames(payload):
+                        requests.put_nowait(None if flag & _TRAILER else _decode(handler, message))
+
+        async def request_iterator():
+            while (request := await requests.get()) is not None:
+                yield request
+
+        async def call():
+            if handler is None:
+                context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+                context.set_details("Method not found")
+            else:
+                try:
+                    await self._websocket_call(handler, request_iterator(), context, writer)
+                except Exception as error:
+                    _fail(context, error)
+            _ws_write(writer, _WS_BINARY, trailer_frame(*context.status()))
+            _ws_write(writer, _WS_CLOSE, struct.pack(">H", 1000))
+            await writer.drain()
+
+        await _until_closed(call(), receive())
+
+    async def _websocket_call(self, handler, requests, context, writer):
+        if not handler.request_streaming:
+            requests = await anext(requests, None)
+            if requests is None:
+                return
+        if handler.unary_unary or handler.stream_unary:
+            response = await (handler.unary_unary or handler.stream_unary)(requests, context)
+            if not context.failed():
+                _ws_write(writer, _WS_BINARY, frame(_encode(handler, response)))
+            return
+        async for response in (handler.unary_stream or handler.stream_stream)(requests, context):
+            _ws_write(writer, _WS_BINARY, frame(_encode(handler, response)))
+            await writer.drain()
+
+
+def _decode(handler, message):
+    return handler.request_deserializer(message) if handler.request_deserializer else message
+
+
+def _encode(handler, response):
+    return handler.response_serializer(response) if handler.response_serializer else response
+
+
+async def _until_closed(call, watch):
+    """Run call until it finishes or watch does, cancelling the other;
+    True if call finished first."""
+    call, watch = asyncio.ensure_future(call), asyncio.ensure_future(watch)
+    try:
+        await asyncio.wait((call, watch), return_when=asyncio.FIRST_COMPLETED)
+    finally:
+        for task in (call, watch):
+            task.cancel()
+    await asyncio.gather(call, watch, return_exceptions=True)
+    return call.done() and not call.cancelled()
+
+
+async def _read_head(reader):
+    """Request method, path and lower-cased headers, or None at EOF."""
+    line = await reader.readline()
+    if not line:
+        return None
+    method, path, _ = line.split(b" ", 2)
+    headers = {}
+    while (line := await reader.readline()) not in (b"\r\n", b"\n", b""):
+        name, _, value = line.decode("latin-1").partition(":")
+        headers[name.strip().lower()] = value.strip()
+    return method, path.decode("latin-1"), headers
+
+
+async def _ws_read(reader):
+    """The next whole WebSocket message as (opcode, payload)."""
+    opcode, payload = None, b""
+    while True:
+        first, second = await reader.readexactly(2)
+        length = second & 0x7F
+        if length == 126:
+            (length,) = struct.unpack(">H", await reader.readexactly(2))
+        elif length == 127:
+            (length,) = struct.unpack(">Q", await reader.readexactly(8))
+        if len(payload) + length > MAX_MESSAGE:
+            raise ValueError("WebSocket message too large")
+        mask = await reader.readexactly(4) if second & 0x80 else None
+        data = await reader.readexactly(length)
+        if mask:
+            key = int.from_bytes((mask * (length // 4 + 1))[:length], "big")
+            data = (int.from_bytes(data, "big") ^ key).to_bytes(length, "big")
+        if first & 0x0F >= _WS_CLOSE:
+            return first & 0x0F, data  # control frames may arrive between fragments
+        opcode = opcode or first & 0x0F
+        payload += data
+        if first & 0x80:
+            return opcode, payload
+
+
+def _ws_write(writer, opcode, payload):
+    length = len(payload)
+    if length < 126:
+        head = struct.pack(">BB", 0x80 | opcode, length)
+    elif length < 1 << 16:
+        head = struct.pack(">BBH", 0x80 | opcode, 126, length)
+    else:
+        head = struct.pack(">BBQ", 0x80 | opcode, 127, length)
+    writer.write(head + payload)
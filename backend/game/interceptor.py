@@ -0,0 +1,30 @@
+import grpc
+
+
+class WrappingInterceptor(grpc.aio.ServerInterceptor):
+    """A server interceptor that swaps each method's handler for the copy
+    wrap() makes of it.
+
+    The copy is built once per method and reused while the server hands
+    out the same handler, so a call pays only for what wrap() added.
+    Subclasses implement wrap(method, handler); the gRPC-Web gateway calls
+    it directly for the calls it serves.
+    """
+
+    def __init__(self):
+        self._wrapped = {}  # method -> (original handler, wrapped handler)
+
+    async def intercept_service(self, continuation, handler_call_details):
+        handler = await continuation(handler_call_details)
+        if handler is None:
+            return None
+        method = handler_call_details.method
+        cached = self._wrapped.get(method)
+        if cached is not None and cached[0] is handler:
+            return cached[1]
+        wrapped = self.wrap(method, handler)
+        self._wrapped[method] = (handler, wrapped)
+        return wrapped
+
+    def wrap(self, method, handler):
+        raise NotImplementedError
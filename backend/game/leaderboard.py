@@ -0,0 +1,199 @@
+import bisect
+import sys
+from array import array
+
+_INDEX_BITS = 32
+_INDEX_MASK = (1 << _INDEX_BITS) - 1
+_LOAD = 512  # keys per block; a block is split when it reaches twice that
+
+
+class RankedLeaderboard:
+    """Per-game ranking that stays sorted as scores change.
+
+    Players are identified by their index in the game. They are ordered by
+    score (highest first) and ties keep join order, matching the old sort
+    over the players dict. Each position is packed into a single int,
+    (-score << 32) | index, so the board holds plain ints.
+
+    The sorted keys are split into blocks of at most 2 * _LOAD, found by
+    a binary search over each block's last key, with a Fenwick tree of
+    block lengths for positions. Updates, rank lookups and seeking to a
+    page offset are O(log n) however large the room gets; within a block
+    only a bounded memmove is paid.
+    """
+
+    def __init__(self):
+        self.scores = array("i")  # score column, by player index
+        self._blocks = []  # sorted lists of packed (-score, index), each non-empty
+        self._maxes = []  # last key of each block
+        self._tree = []  # Fenwick tree of block lengths
+        self._len = 0
+
+    def __len__(self):
+        return self._len
+
+    def __sizeof__(self):
+        return (object.__sizeof__(self) + self.scores.__sizeof__() + self._maxes.__sizeof__() +
+                self._tree.__sizeof__() + self._blocks.__sizeof__() + sum(map(sys.getsizeof, self._blocks)))
+
+    def add(self, score=0):
+        """Append a new player and return their index."""
+        index = len(self.scores)
+        self.scores.append(score)
+        self._insert(_pack(score, index))
+        return index
+
+    def update(self, index, score):
+        old_score = self.scores[index]
+        if old_score == score:
+            return
+        self._remove(_pack(old_score, index))
+        self.scores[index] = score
+        self._insert(_pack(score, index))
+
+    def rank(self, index):
+        """1-based rank of the player at index."""
+        key = _pack(self.scores[index], index)
+        block = bisect.bisect_left(self._maxes, key)
+        return self._before(block) + bisect.bisect_left(self._blocks[block], key) + 1
+
+    def score(self, index):
+        return self.scores[index]
+
+    def page(self, offset=0, limit=0):
+        """Yield (rank, index, score) for a slice of the board.
+
+        A limit of 0 returns everything from offset onwards.
+        """
+        end = min(offset + limit, self._len) if limit > 0 else self._len
+        if offset >= end:
+            return
+        block, start = self._locate(offset)
+        rank = offset + 1
+        while rank <= end:
+            for key in self._blocks[block][start:start + end - rank + 1]:
+                yield rank, key & _INDEX_MASK, -(key >> _INDEX_BITS)
+                rank += 1
+            block += 1
+            start = 0
+
+    def _insert(self, key):
+        self._len += 1
+        blocks = self._blocks
+        maxes = self._maxes
+        block = bisect.bisect_left(maxes, key)
+        if block == len(blocks):
+            if not blocks:
+                blocks.append([key])
+                maxes.append(key)
+                self._tree.append(1)
+                return
+            block -= 1
+            keys = blocks[block]
+            keys.append(key)
+            maxes[block] = key
+        else:
+            keys = blocks[block]
+            keys.insert(bisect.bisect_left(keys, key), key)
+        if len(keys) >= 2 * _LOAD:
+            blocks[block:block + 1] = [keys[:_LOAD], keys[_LOAD:]]
+            maxes.insert(block, keys[_LOAD - 1])
+            self._rebuild()
+            return
+        tree = self._tree
+        size = len(tree)
+        while block < size:
+            tree[block] += 1
+            block |= block + 1
+
+    def _remove(self, key):
+        self._len -= 1
+        block = bisect.bisect_left(self._maxes, key)
+        keys = self._blocks[block]
+        del keys[bisect.bisect_left(keys, key)]
+        if not keys:
+            del self._blocks[block], self._maxes[block]
+            self._rebuild()
+            return
+        self._maxes[block] = keys[-1]
+        tree = self._tree
+        size = len(tree)
+        while block < size:
+            tree[block] -= 1
+            block |= block + 1
+
+    def _rebuild(self):
+        # After a split or an emptied block, O(blocks); each takes _LOAD
+        # updates to come round again.
+        tree = [len(keys) for keys in self._blocks]
+        for i in range(len(tree)):
+            parent = i | (i + 1)
+            if parent < len(tree):
+                tree[parent] += tree[i]
+        self._tree = tree
+
+    def _before(self, block):
+        """Keys in the blocks before block."""
+        total = 0
+        tree = self._tree
+        while block > 0:
+            total += tree[block - 1]
+            block &= block - 1
+        return total
+
+    def _locate(self, position):
+        """(block, offset in it) of the key at position."""
+        tree = self._tree
+        block = 0
+        step = 1 << (len(tree).bit_length() - 1)
+        while step:
+            probe = block + step
+            if probe <= len(tree) and tree[probe - 1] <= position:
+                position -= tree[probe - 1]
+                block = probe
+            step >>= 1
+        return block, position
+
+
+def _pack(score, index):
+    return (-score << _INDEX_BITS) | index
+
+
+class LeaderboardReplica:
+    """A client's copy of a game's board, kept current from a
+    StreamLeaderboard stream of full updates and deltas.
+
+    apply() returns False when an update does not follow the last one
+    applied; the caller should reopen the stream to resync.
+    """
+
+    def __init__(self):
+        self.sequence = None
+        self.order = []  # player indices, best first
+        self.entries = {}  # player index -> [player_id, player_name, score]
+        self.game_over = False
+
+    def apply(self, update):
+        if update.HasField("leaderboard"):
+            self.sequence = update.sequence
+            self.order = [entry.player_index for entry in update.leaderboard.entries]
+            self.entries = {entry.player_index: [entry.player_id, entry.player_name, entry.score]
+                            for entry in update.leaderboard.entries}
+        elif self.sequence is None or update.sequence != self.sequence + 1:
+            return False
+        else:
+            self.sequence = update.sequence
+            moved = {entry.player_index for entry in update.changes}
+            self.order = [index for index in self.order if index not in moved]
+            for entry in update.changes:  # ascending rank
+                known = self.entries.get(entry.player_index)
+                if known is None:
+                    known = self.entries[entry.player_index] = [entry.player_id, entry.player_name, 0]
+                known[2] = entry.score
+                self.order.insert(entry.rank - 1, entry.player_index)
+        self.game_over = update.game_over
+        return True
+
+    def rows(self):
+        """(rank, player_id, player_name, score) in rank order."""
+        return [(rank, *self.entries[index]) for rank, index in enumerate(self.order, start=1)]
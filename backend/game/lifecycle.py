@@ -0,0 +1,105 @@
+import heapq
+import sys
+import time
+
+LOBBY = "lobby"  # created, nobody has answered yet
+RUNNING = "running"
+COMPLETED = "completed"
+EXPIRED = "expired"  # evicted; only seen by streams still holding the game
+
+
+class GameLifecycle:
+    """Tracks game states and decides when games are evicted.
+
+    Finished games are kept for completed_ttl seconds so late leaderboard
+    reads still work; games with no activity for idle_ttl seconds are
+    treated as abandoned. Deadlines live in a heap that is re-checked
+    lazily, so a sweep only looks at games that might actually be due.
+    Each game has one live heap entry, the one recorded in _queued; any
+    other entry for it is stale and skipped when it comes up.
+    """
+
+    def __init__(self, completed_ttl=120.0, idle_ttl=900.0, sweep_interval=10.0, max_live_games=10000):
+        self.completed_ttl = completed_ttl
+        self.idle_ttl = idle_ttl
+        self.sweep_interval = sweep_interval
+        self.max_live_games = max_live_games  # None disables admission control
+        self.live_games = 0
+        self.games_reaped = 0
+        self.players_reaped = 0
+        self.bytes_reclaimed = 0
+        self._deadlines = []  # heap of (deadline, game_id)
+        self._queued = {}  # game_id -> deadline of its live heap entry
+
+    def can_admit(self):
+        return self.max_live_games is None or self.live_games < self.max_live_games
+
+    def created(self, game_id, game, now=None):
+        now = now if now is not None else time.monotonic()
+        game.state = LOBBY
+        game.last_activity = now
+        game.completed_at = None
+        self.live_games += 1
+        self._schedule(game_id, self.deadline(game))
+
+    def touch(self, game, now=None):
+        game.last_activity = now if now is not None else time.monotonic()
+        if game.state == LOBBY and (game.answered or game.current_question_index):
+            game.state = RUNNING
+
+    def completed(self, game, now=None):
+        if game.state in (COMPLETED, EXPIRED):
+            return
+        game.state = COMPLETED
+        game.completed_at = now if now is not None else time.monotonic()
+        self.live_games -= 1
+        # The idle deadline already queued is usually much later.
+        self._schedule(game.game_id, self.deadline(game))
+
+    def deadline(self, game):
+        if game.completed_at is not None:
+            return game.completed_at + self.completed_ttl
+        return game.last_activity + self.idle_ttl
+
+    def _schedule(self, game_id, deadline):
+        self._queued[game_id] = deadline
+        heapq.heappush(self._deadlines, (deadline, game_id))
+
+    def expired(self, games, now=None):
+        """Pop the ids of every game whose deadline has passed, each once."""
+        now = now if now is not None else time.monotonic()
+        due = []
+        while self._deadlines and self._deadlines[0][0] <= now:
+            queued, game_id = heapq.heappop(self._deadlines)
+            if self._queued.get(game_id) != queued:
+                continue  # superseded by a later push
+            game = games.get(game_id)
+            if game is None:
+                del self._queued[game_id]
+                continue
+            deadline = self.deadline(game)
+            if deadline > now:
+                # Activity since the entry was pushed; check again later.
+                self._schedule(game_id, deadline)
+                continue
+            del self._queued[game_id]
+            due.append(game_id)
+        return due
+
+    def reaped(self, game):
+        self._queued.pop(game.game_id, None)
+        if game.state != COMPLETED:
+            self.live_games -= 1
+        game.state = EXPIRED
+        self.games_reaped += 1
+        self.players_reaped += len(game.players)
+        self.bytes_reclaimed += estimate_game_bytes(game)
+
+
+def estimate_game_bytes(game):
+    """Rough size of a game's own containers; shared questions are not counted."""
+    size = sys.getsizeof(game) + sys.getsizeof(game.players) + sys.getsizeof(game.slots)
+    for slot in game.slots:
+        size += sys.getsizeof(slot) + sys.getsizeof(slot.player_id) + sys.getsizeof(slot.name)
+    size += sys.getsizeof(game.ranking) + sys.getsizeof(game.answered) + sys.getsizeof(game.question_indices)
+    return size
@@ -0,0 +1,169 @@
+import asyncio
+import heapq
+import itertools
+import time
+from collections import deque
+
+DEFAULT_ROOM_SIZES = (2, 4, 8)
+DEFAULT_ROOM_SIZE = 4
+DEFAULT_REGIONS = ("na", "sa", "eu", "africa", "asia", "oceania")
+
+
+class Ticket:
+    """A player waiting in the matchmaking pool."""
+
+    __slots__ = ("player_name", "bucket", "enqueued_at", "assignment", "cancelled")
+
+    def __init__(self, player_name, bucket, enqueued_at):
+        self.player_name = player_name
+        self.bucket = bucket
+        self.enqueued_at = enqueued_at
+        self.assignment = asyncio.get_running_loop().create_future()  # -> (game_id, player_id)
+        self.cancelled = False
+
+
+class _Bucket:
+    """Players who would accept the same room: same size, skill band and region."""
+
+    __slots__ = ("key", "room_size", "tickets", "live", "due")
+
+    def __init__(self, key, room_size):
+        self.key = key
+        self.room_size = room_size
+        self.tickets = deque()  # FIFO; cancelled tickets are skipped when popped
+        self.live = 0
+        self.due = None  # enqueue time its max-wait heap entry is keyed on, if it has one
+
+
+class Matchmaker:
+    """Indexed wait pool that forms rooms in batches.
+
+    Waiting players are bucketed by (room size, skill band, region) and a
+    set tracks which buckets already hold a full room, so a tick only
+    touches buckets that can produce a match and never scans the whole pool.
+    Buckets that could form a smaller room sit in a heap ordered by when
+    their oldest player joined, so the max-wait pass only pops buckets
+    that are overdue. Regions outside the known set share the "any" pool.
+    Enqueue and cancel are O(1), plus a heap push when a bucket first
+    becomes able to form a room.
+    """
+
+    def __init__(self, room_sizes=DEFAULT_ROOM_SIZES, default_room_size=DEFAULT_ROOM_SIZE,
+                 skill_band_width=100, tick_interval=0.25, max_rooms_per_tick=1000,
+                 max_wait_seconds=15.0, min_room_size=2, regions=DEFAULT_REGIONS):
+        self.room_sizes = frozenset(room_sizes)
+        self.regions = frozenset(regions)
+        self.default_room_size = default_room_size
+        self.skill_band_width = skill_band_width
+        self.tick_interval = tick_interval
+        self.max_rooms_per_tick = max_rooms_per_tick
+        self.max_wait_seconds = max_wait_seconds  # None waits for a full room forever
+        self.min_room_size = min_room_size
+        self._buckets = {}  # key -> _Bucket
+        self._ready = set()  # keys of buckets with at least one full room waiting
+        self._overdue = []  # heap of (head enqueue time, sequence, _Bucket); stale entries are skipped
+        self._sequence = itertools.count()
+        self.waiting = 0
+
+    def bucket_key(self, room_size, skill, region):
+        region = region.strip().lower()
+        return (room_size, skill // self.skill_band_width, region if region in self.regions else "any")
+
+    def enqueue(self, player_name, room_size=0, skill=0, region=""):
+        """Add a player to the pool, or return None if the room size is not offered."""
+        room_size = room_size or self.default_room_size
+        if room_size not in self.room_sizes:
+            return None
+
+        key = self.bucket_key(room_size, max(skill, 0), region)
+        bucket = self._buckets.get(key)
+        if bucket is None:
+            bucket = self._buckets[key] = _Bucket(key, room_size)
+
+        ticket = Ticket(player_name, bucket, time.monotonic())
+        bucket.tickets.append(ticket)
+        bucket.live += 1
+        self.waiting += 1
+        if bucket.live >= room_size:
+            self._ready.add(key)
+        self._schedule(bucket)
+        return ticket
+
+    def cancel(self, ticket):
+        if ticket.cancelled or ticket.assignment.done():
+            return
+        ticket.cancelled = True
+        bucket = ticket.bucket
+        bucket.live -= 1
+        self.waiting -= 1
+        if bucket.live < bucket.room_size:
+            self._ready.discard(bucket.key)
+        if bucket.live == 0:
+            self._drop(bucket)
+
+    def waiting_in(self, ticket):
+        return ticket.bucket.live
+
+    def form_rooms(self, now=None, limit=None):
+        """Pop every room that can be formed this tick; returns lists of tickets.
+
+        limit caps the number of rooms below max_rooms_per_tick, e.g. when the
+        server is close to its live game cap.
+        """
+        max_rooms = self.max_rooms_per_tick if limit is None else min(limit, self.max_rooms_per_tick)
+        rooms = []
+        for key in list(self._ready):
+            bucket = self._buckets[key]
+            while bucket.live >= bucket.room_size and len(rooms) < max_rooms:
+                rooms.append(self._take(bucket, bucket.room_size))
+            if bucket.live < bucket.room_size:
+                self._ready.discard(key)
+            if len(rooms) >= max_rooms:
+                return rooms
+
+        # Buckets that will not fill up in time get a smaller room once their
+        # oldest player has waited long enough.
+        if self.max_wait_seconds is not None:
+            deadline = (now if now is not None else time.monotonic()) - self.max_wait_seconds
+            overdue = self._overdue
+            while overdue and overdue[0][0] <= deadline and len(rooms) < max_rooms:
+                bucket = heapq.heappop(overdue)[2]
+                bucket.due = None
+                if bucket.live < self.min_room_size:
+                    continue  # enqueue schedules it again once it can form a room
+                if self._head(bucket).enqueued_at <= deadline:
+                    rooms.append(self._take(bucket, min(bucket.live, bucket.room_size)))
+                self._schedule(bucket)  # keyed on its new head
+        return rooms
+
+    def _schedule(self, bucket):
+        """Give a bucket that could form a room its one max-wait heap entry.
+        The entry's time never runs ahead of the head's, since heads only
+        leave; a popped entry whose head has moved on is pushed again."""
+        if bucket.due is None and bucket.live >= self.min_room_size and self.max_wait_seconds is not None:
+            bucket.due = self._head(bucket).enqueued_at
+            heapq.heappush(self._overdue, (bucket.due, next(self._sequence), bucket))
+
+    def _head(self, bucket):
+        tickets = bucket.tickets
+        while tickets and tickets[0].cancelled:
+            tickets.popleft()
+        return tickets[0] if tickets else None
+
+    def _take(self, bucket, count):
+        taken = []
+        tickets = bucket.tickets
+        while len(taken) < count:
+            ticket = tickets.popleft()
+            if not ticket.cancelled:
+                taken.append(ticket)
+        bucket.live -= count
+        self.waiting -= count
+        if bucket.live == 0:
+            self._drop(bucket)
+        return taken
+
+    def _drop(self, bucket):
+        bucket.tickets.clear()
+        self._buckets.pop(bucket.key, None)
+        self._ready.discard(bucket.key)
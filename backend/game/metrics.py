@@ -0,0 +1,208 @@
+import asyncio
+import bisect
+import time
+
+import grpc
+
+from game.interceptor import WrappingInterceptor
+
+# Seconds; Prometheus-style upper bounds, +Inf is implied.
+LATENCY_BUCKETS = (
+    0.0001, 0.00025, 0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025,
+    0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0,
+)
+
+
+class MethodStats:
+    """Counters for one RPC method, updated in place on every call."""
+
+    __slots__ = ("method", "kind", "started", "in_flight", "codes", "bucket_counts", "latency_sum")
+
+    def __init__(self, method, kind):
+        self.method = method
+        self.kind = kind  # unary, server_stream, client_stream or bidi_stream
+        self.started = 0
+        self.in_flight = 0
+        self.codes = {}  # status code name -> handled count
+        self.bucket_counts = [0] * (len(LATENCY_BUCKETS) + 1)
+        self.latency_sum = 0.0
+
+    def finished(self, seconds, code):
+        self.in_flight -= 1
+        self.codes[code] = self.codes.get(code, 0) + 1
+        self.bucket_counts[bisect.bisect_left(LATENCY_BUCKETS, seconds)] += 1
+        self.latency_sum += seconds
+
+
+class Metrics:
+    """Per-method RPC stats plus gauges and counters read only when scraped.
+
+    Recording is a few integer updates and one bisect per call; gauges and
+    counters are callables, so they add nothing to the request path.
+    """
+
+    def __init__(self):
+        self.methods = {}  # full method name -> MethodStats
+        self._collected = []  # (name, help, type, fn) where fn returns a number
+
+    def method(self, name, kind):
+        stats = self.methods.get(name)
+        if stats is None:
+            stats = self.methods[name] = MethodStats(name, kind)
+        return stats
+
+    def gauge(self, name, help_text, fn):
+        self._collected.append((name, help_text, "gauge", fn))
+
+    def counter(self, name, help_text, fn):
+        """Like gauge, for a value that only goes up."""
+        self._collected.append((name, help_text, "counter", fn))
+
+    def render(self):
+        """The current values in Prometheus text exposition format."""
+        lines = [
+            "# HELP grpc_server_started_total RPCs started on the server.",
+            "# TYPE grpc_server_started_total counter",
+        ]
+        stats = sorted(self.methods.values(), key=lambda s: s.method)
+        for s in stats:
+            lines.append(f'grpc_server_started_total{{{_labels(s)}}} {s.started}')
+
+        lines += [
+            "# HELP grpc_server_handled_total RPCs completed on the server, by status code.",
+            "# TYPE grpc_server_handled_total counter",
+        ]
+        for s in stats:
+            for code, count in sorted(s.codes.items()):
+                lines.append(f'grpc_server_handled_total{{{_labels(s)},grpc_code="{code}"}} {count}')
+
+        lines += [
+            "# HELP grpc_server_in_flight RPCs currently being handled.",
+            "# TYPE grpc_server_in_flight gauge",
+        ]
+        for s in stats:
+            lines.append(f'grpc_server_in_flight{{{_labels(s)}}} {s.in_flight}')
+
+        lines += [
+            "# HELP grpc_server_handling_seconds Time to handle an RPC; the whole stream for streaming RPCs.",
+            "# TYPE grpc_server_handling_seconds histogram",
+        ]
+        for s in stats:
+            cumulative = 0
+            for bound, count in zip(LATENCY_BUCKETS, s.bucket_counts):
+                cumulative += count
+                lines.append(f'grpc_server_handling_seconds_bucket{{{_labels(s)},le="{bound}"}} {cumulative}')
+            cumulative += s.bucket_counts[-1]
+            lines.append(f'grpc_server_handling_seconds_bucket{{{_labels(s)},le="+Inf"}} {cumulative}')
+            lines.append(f'grpc_server_handling_seconds_sum{{{_labels(s)}}} {s.latency_sum}')
+            lines.append(f'grpc_server_handling_seconds_count{{{_labels(s)}}} {cumulative}')
+
+        for name, help_text, kind, fn in self._collected:
+            lines += [f"# HELP {name} {help_text}", f"# TYPE {name} {kind}", f"{name} {fn()}"]
+        return "\n".join(lines) + "\n"
+
+
+def _labels(stats):
+    service, _, method = stats.method.lstrip("/").rpartition("/")
+    return f'grpc_service="{service}",grpc_method="{method}",grpc_type="{stats.kind}"'
+
+
+def _status(context):
+    code = context.code()
+    if code is None:
+        return "OK"
+    return code.name if isinstance(code, grpc.StatusCode) else grpc.StatusCode(code).name
+
+
+class MetricsInterceptor(WrappingInterceptor):
+    """Times every RPC and counts its outcome in a Metrics registry.
+
+    A call pays for the wrapper and the counter updates only. The
+    handler's own serializers are kept, pre-encoded responses included.
+    """
+
+    def __init__(self, metrics):
+        super().__init__()
+        self.metrics = metrics
+
+    def wrap(self, method, handler):
+        """A copy of a method handler that times and counts its calls."""
+        if handler.unary_unary:
+            stats = self.metrics.method(method, "unary")
+            return handler._replace(unary_unary=_timed_unary(stats, handler.unary_unary))
+        if handler.unary_stream:
+            stats = self.metrics.method(method, "server_stream")
+            return handler._replace(unary_stream=_timed_stream(stats, handler.unary_stream))
+        if handler.stream_unary:
+            stats = self.metrics.method(method, "client_stream")
+            return handler._replace(stream_unary=_timed_unary(stats, handler.stream_unary))
+        stats = self.metrics.method(method, "bidi_stream")
+        return handler._replace(stream_stream=_timed_stream(stats, handler.stream_stream))
+
+
+def _timed_unary(stats, behavior):
+    async def timed(request, context):
+        stats.started += 1
+        stats.in_flight += 1
+        start = time.perf_counter()
+        code = None
+        try:
+            return await behavior(request, context)
+        except asyncio.CancelledError:
+            code = "CANCELLED"
+            raise
+        except Exception:
+            code = _status(context)
+            code = "UNKNOWN" if code == "OK" else code
+            raise
+        finally:
+            stats.finished(time.perf_counter() - start, code or _status(context))
+    return timed
+
+
+def _timed_stream(stats, behavior):
+    async def timed(request, context):
+        stats.started += 1
+        stats.in_flight += 1
+        start = time.perf_counter()
+        code = None
+        try:
+            async for response in behavior(request, context):
+                yield response
+        except (asyncio.CancelledError, GeneratorExit):
+            code = "CANCELLED"
+            raise
+        except Exception:
+            code = _status(context)
+            code = "UNKNOWN" if code == "OK" else code
+            raise
+        finally:
+            stats.finished(time.perf_counter() - start, code or _status(context))
+    return timed
+
+
+async def serve_metrics(metrics, port, host="0.0.0.0"):
+    """Serve metrics.render() over plain HTTP for Prometheus to scrape."""
+    async def handle(reader, writer):
+        try:
+            request_line = await reader.readline()
+            while (await reader.readline()) not in (b"\r\n", b"\n", b""):
+                pass  # headers are not needed
+            parts = request_line.split()
+            if len(parts) >= 2 and parts[0] == b"GET" and parts[1].split(b"?")[0] in (b"/metrics", b"/"):
+                body = metrics.render().encode("utf-8")
+                status = b"200 OK"
+            else:
+                body = b"not found\n"
+                status = b"404 Not Found"
+            writer.write(
+                b"HTTP/1.1 " + status + b"\r\n"
+                b"Content-Type: text/plain; version=0.0.4; charset=utf-8\r\n"
+                b"Content-Length: " + str(len(body)).encode() + b"\r\n"
+                b"Connection: close\r\n\r\n" + body
+            )
+            await writer.drain()
+        finally:
+            writer.close()
+
+    return await asyncio.start_server(handle, host, port)
@@ -1,20 +1,242 @@
-import json
+import functools
 import os
+import random
+from array import array
+
+from generated import game_pb2
+from game.bankfile import BankFile, compile_bank, compile_records, compiled_path, is_stale
+
+DEFAULT_TIME_LIMIT_SECONDS = 10
+DEFAULT_QUESTIONS_PER_GAME = 10
+POINTS_PER_CORRECT_ANSWER = 10
+DEFAULT_CATEGORY = "general"
+DEFAULT_DIFFICULTY = "medium"
+BANK_CHUNK_SIZE = 500
+MAX_BANK_CHUNK_SIZE = 5000
+QUESTION_CACHE_SIZE = 65536  # decoded questions, and id lookups, kept per bank
+
+
+class Question:
+    """A bank question plus the messages games send for it.
+
+    The card, its encoded bytes and both possible answer results are built
+    the first time the question is played and then shared read-only by
+    every game; nothing on the request path should mutate them. Building
+    lazily keeps loading a large bank cheap. The reference forms name the
+    question by bank_version and index, for clients caching the bank.
+    """
+
+    __slots__ = (
+        "index", "question_id", "question_text", "options", "correct_index",
+        "explanation", "category", "difficulty", "time_limit_seconds", "bank_version",
+        "_card", "_card_bytes", "_event_bytes", "_reference_bytes", "_reference_event_bytes", "_results",
+    )
+
+    def __init__(self, index, data, time_limit_seconds=DEFAULT_TIME_LIMIT_SECONDS, bank_version=0):
+        self.index = index
+        self.bank_version = bank_version
+        self.question_id = data["question_id"]
+        self.question_text = data["question_text"]
+        self.options = tuple(data["options"])
+        self.correct_index = self.options.index(data["correct_option"])
+        self.explanation = data.get("explanation", "")
+        self.category = data.get("category", DEFAULT_CATEGORY).lower()
+        self.difficulty = data.get("difficulty", DEFAULT_DIFFICULTY).lower()
+        self.time_limit_seconds = time_limit_seconds
+        self._card = None
+
+    @property
+    def correct_option(self):
+        return self.options[self.correct_index]
+
+    @property
+    def card(self):
+        if self._card is None:
+            self._build()
+        return self._card
+
+    @property
+    def card_bytes(self):
+        if self._card is None:
+            self._build()
+        return self._card_bytes
+
+    @property
+    def event_bytes(self):
+        """The card wrapped in an encoded SessionEvent."""
+        if self._card is None:
+            self._build()
+        return self._event_bytes
+
+    def card_bytes_for(self, bank_version):
+        """Encoded card for a client caching bank_version: a reference
+        when that is this question's bank, else the full card."""
+        if self._card is None:
+            self._build()
+        return self._reference_bytes if bank_version == self.bank_version else self._card_bytes
+
+    def event_bytes_for(self, bank_version):
+        if self._card is None:
+            self._build()
+        return self._reference_event_bytes if bank_version == self.bank_version else self._event_bytes
+
+    def grade(self, selected_option):
+        """Return the shared AnswerResult for a selected option."""
+        if self._card is None:
+            self._build()
+        return self._results[selected_option == self.options[self.correct_index]]
+
+    def _build(self):
+        card = game_pb2.QuestionCard(
+            question_id=self.question_id,
+            question_text=self.question_text,
+            options=self.options,
+            time_limit_seconds=self.time_limit_seconds
+        )
+        self._card_bytes = card.SerializeToString()
+        self._event_bytes = game_pb2.SessionEvent(question=card).SerializeToString()
+        reference = game_pb2.QuestionCard(
+            bank_index=self.index, bank_version=self.bank_version, time_limit_seconds=self.time_limit_seconds)
+        self._reference_bytes = reference.SerializeToString()
+        self._reference_event_bytes = game_pb2.SessionEvent(question=reference).SerializeToString()
+        self._results = (
+            game_pb2.AnswerResult(correct=False, points_awarded=0, explanation=self.explanation),
+            game_pb2.AnswerResult(correct=True, points_awarded=POINTS_PER_CORRECT_ANSWER, explanation=self.explanation),
+        )
+        self._card = card
+
+
+# Resolved from this file, so the server can start from any directory.
+DEFAULT_QUESTIONS_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+                                      "data", "questions.json")
+
 
 class QuestionBank:
-    def __init__(self, filepath="data/questions.json"):
+    """The question bank, read lazily from a compiled bank file.
+
+    filepath may be a compiled .bank file or a questions JSON file; JSON is
+    compiled next to itself on first use and whenever it changes. The
+    file is memory-mapped, so loading reads only its header and every
+    worker process shares one page-cache copy; a question is decoded
+    when it is used, and the cache_size most recently used questions and
+    id lookups are kept. records builds the same format in memory instead
+    of reading a file.
+    """
+
+    def __init__(self, filepath=DEFAULT_QUESTIONS_PATH, time_limit_seconds=DEFAULT_TIME_LIMIT_SECONDS, records=None,
+                 cache_size=QUESTION_CACHE_SIZE):
         self.filepath = filepath
-        self.questions = self._load_questions()
+        self.time_limit_seconds = time_limit_seconds
+        self._file = self._load_questions(records)
+        self._decoded = functools.lru_cache(maxsize=cache_size)(self._decode)  # index -> Question
+        self._ids = functools.lru_cache(maxsize=cache_size)(self._find)  # question_id -> index or None
+        self._chunks = {}  # start index -> encoded QuestionBankChunk of BANK_CHUNK_SIZE questions
 
-    def _load_questions(self):
+    def _load_questions(self, records=None):
+        if records is not None:
+            return BankFile(compile_records(records, DEFAULT_CATEGORY, DEFAULT_DIFFICULTY))
         if not os.path.exists(self.filepath):
             raise FileNotFoundError(f"[questions.py] Could not find questions file at {self.filepath}")
+        path = self.filepath
+        if not path.endswith(".bank"):
+            path = compiled_path(self.filepath)
+            if is_stale(self.filepath, path):
+                compile_bank(self.filepath, path)
+        return BankFile.open(path)
+
+    def __len__(self):
+        return len(self._file)
+
+    @property
+    def version(self):
+        """Content version; changes whenever the bank's questions do."""
+        return self._file.version
+
+    def __getitem__(self, index):
+        if not 0 <= index < len(self._file):
+            raise IndexError(index)
+        return self._decoded(index)
+
+    def _decode(self, index):
+        return Question(index, self._file.record(index), self.time_limit_seconds, self.version)
 
-        with open(self.filepath, "r", encoding="utf-8") as f:
-            return json.load(f)
+    @property
+    def questions(self):
+        """Every question, in bank order; decodes the whole bank."""
+        return [self[i] for i in range(len(self))]
 
     def get_all_questions(self):
         return self.questions
 
+    def index_of(self, question_id):
+        return self._ids(question_id)
+
+    def _find(self, question_id):
+        for candidate in self._file.index_candidates(question_id):
+            if self[candidate].question_id == question_id:
+                return candidate
+        return None
+
     def get_question_by_id(self, question_id):
-        return next((q for q in self.questions if q["question_id"] == question_id), None)
+        index = self.index_of(question_id)
+        return None if index is None else self[index]
+
+    def chunks(self, offset=0, limit=0, chunk_size=0):
+        """Encoded QuestionBankChunk messages covering limit questions from
+        offset (0 for the rest of the bank). Chunks of the default size are
+        kept, so repeated whole-bank fetches encode each question once;
+        records are read straight from the file without decoding the bank
+        into Question objects."""
+        total = len(self._file)
+        offset = max(offset, 0)
+        end = total if limit <= 0 else min(total, offset + limit)
+        chunk_size = min(chunk_size or BANK_CHUNK_SIZE, MAX_BANK_CHUNK_SIZE)
+        for start in range(offset, end, chunk_size):
+            stop = min(end, start + chunk_size)
+            reusable = chunk_size == BANK_CHUNK_SIZE and start % BANK_CHUNK_SIZE == 0 and \
+                stop == min(total, start + BANK_CHUNK_SIZE)
+            chunk = self._chunks.get(start) if reusable else None
+            if chunk is None:
+                chunk = self._encode_chunk(start, stop)
+                if reusable:
+                    self._chunks[start] = chunk
+            yield chunk
+
+    def _encode_chunk(self, start, stop):
+        chunk = game_pb2.QuestionBankChunk(version=self.version, total_questions=len(self._file), offset=start)
+        for index in range(start, stop):
+            record = self._file.record(index)
+            chunk.questions.add(
+                question_id=record["question_id"], question_text=record["question_text"],
+                options=record["options"], category=record["category"], difficulty=record["difficulty"])
+        return chunk.SerializeToString()
+
+    def sample(self, count=DEFAULT_QUESTIONS_PER_GAME, category="", difficulty="", exclude_ids=()):
+        """Pick up to count distinct question indices matching the filters.
+
+        Runs in O(count) expected time against the matching pool, which is
+        never copied or scanned unless exclusions leave too few candidates.
+        """
+        pool = self._file.pool(category.lower(), difficulty.lower())
+        if not pool:
+            return array("i")
+        count = max(0, min(count, len(pool)))
+        exclude = {self.index_of(qid) for qid in exclude_ids} - {None}
+        if not exclude:
+            return array("i", random.sample(pool, count))
+
+        picked = set()
+        chosen = array("i")
+        attempts = count * 8
+        while len(chosen) < count and attempts:
+            attempts -= 1
+            index = pool[random.randrange(len(pool))]
+            if index not in picked and index not in exclude:
+                picked.add(index)
+                chosen.append(index)
+
+        if len(chosen) < count:
+            # Mostly-excluded pool: fall back to filtering it once.
+            rest = [i for i in pool if i not in picked and i not in exclude]
+            chosen.extend(random.sample(rest, min(count - len(chosen), len(rest))))
+        return chosen
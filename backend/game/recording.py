@@ -0,0 +1,258 @@
+"""Traffic recording for replay against another build.
+
+A trace is a gzip stream of small records, written as calls arrive and
+read back one record at a time, so a capture of any length never has to
+fit in memory. After an 8-byte magic, every record is
+<kind:u8><call:u32><delta_us:u32><length:u32> then the payload, where
+delta_us is the time since the previous record:
+
+    METHOD  call is a method number, payload the method's full path;
+            written the first time the method is seen
+    CALL    payload is <method number:u16> then the encoded request;
+            empty for client-streaming calls, whose messages follow
+    MESSAGE payload is one encoded request message of a streaming call
+    RESULT  payload is an encoded response that handed out a game or
+            player id (JoinGame, a matched EnqueueForMatch update), so a
+            replay can map the recorded ids onto the ones it is given
+    END     a streaming call finished; payload is 1 byte, 1 if the client
+            cancelled it and 0 if the server ended it
+
+A trace written up to a crash is readable up to its last whole record.
+"""
+import asyncio
+import gzip
+import os
+import struct
+import time
+import zlib
+
+from game.interceptor import WrappingInterceptor
+from game.sharding import FORWARDED_HEADER
+from generated import game_pb2
+
+MAGIC = b"GTRACE1\n"
+METHOD = 0
+CALL = 1
+MESSAGE = 2
+RESULT = 3
+END = 4
+
+_RECORD = struct.Struct("<BIII")
+_METHOD_NUMBER = struct.Struct("<H")
+_MAX_DELTA_US = (1 << 32) - 1
+
+# Responses that hand out ids later requests use, by method name.
+MINTED_IDS = {"JoinGame": game_pb2.JoinResponse, "EnqueueForMatch": game_pb2.MatchUpdate}
+
+
+def read_trace(path):
+    """Yield (kind, call, seconds since the trace started, payload),
+    stopping quietly at a torn tail."""
+    elapsed_us = 0
+    with gzip.open(path, "rb") as trace:
+        try:
+            if trace.read(len(MAGIC)) != MAGIC:
+                raise ValueError(f"{path} is not a traffic trace")
+            while True:
+                header = trace.read(_RECORD.size)
+                if len(header) < _RECORD.size:
+                    return
+                kind, call, delta_us, size = _RECORD.unpack(header)
+                payload = trace.read(size)
+                if len(payload) < size:
+                    return
+                elapsed_us += delta_us
+                yield kind, call, elapsed_us / 1e6, payload
+        except (EOFError, zlib.error, gzip.BadGzipFile):
+            return
+
+
+def method_number(payload):
+    """Split a CALL payload into (method number, encoded request)."""
+    return _METHOD_NUMBER.unpack_from(payload)[0], payload[_METHOD_NUMBER.size:]
+
+
+class TraceWriter:
+    """Buffers trace records and appends them, compressed, to a file
+    every flush_interval seconds on a worker thread."""
+
+    def __init__(self, path, flush_interval=0.5):
+        self.path = path
+        self.flush_interval = flush_interval
+        self.records = 0
+        self.bytes_written = 0
+        self._buffer = bytearray(MAGIC)
+        self._compressor = zlib.compressobj(wbits=31)  # gzip framing
+        self._last = time.monotonic()
+        self._file = None
+        self._lock = asyncio.Lock()
+
+    def append(self, kind, call, payload=b""):
+        now = time.monotonic()
+        delta_us = min(round((now - self._last) * 1e6), _MAX_DELTA_US)
+        self._last = now
+        self._buffer += _RECORD.pack(kind, call, delta_us, len(payload))
+        self._buffer += payload
+        self.records += 1
+
+    async def run(self):
+        while True:
+            await asyncio.sleep(self.flush_interval)
+            await self.flush()
+
+    async def flush(self, final=False):
+        async with self._lock:
+            if not self._buffer and not final:
+                return
+            data, self._buffer = self._buffer, bytearray()
+            if self._file is None:
+                directory = os.path.dirname(self.path)
+                if directory:
+                    os.makedirs(directory, exist_ok=True)
+                self._file = open(self.path, "wb")
+            # A sync flush ends every write on a byte boundary, so a reader
+            # gets everything up to the last flush even if we never finish.
+            compressed = self._compressor.compress(bytes(data)) + self._compressor.flush(
+                zlib.Z_FINISH if final else zlib.Z_SYNC_FLUSH)
+            await asyncio.to_thread(self._write, compressed)
+            self.bytes_written += len(compressed)
+
+    def _write(self, data):
+        self._file.write(data)
+        self._file.flush()
+
+    async def close(self):
+        await self.flush(final=True)
+        if self._file is not None:
+            await asyncio.to_thread(self._file.close)
+
+
+class RecordingInterceptor(WrappingInterceptor):
+    """Records every call a worker receives into a trace (see the module
+    docstring). Calls forwarded from another shard were recorded where
+    they arrived and are skipped.
+
+    Install it like MetricsInterceptor, ahead of admission control so the
+    trace holds the load clients offered; start() runs the writer.
+    """
+
+    def __init__(self, path, flush_interval=0.5):
+        super().__init__()
+        self.writer = TraceWriter(path, flush_interval)
+        self._methods = {}  # method path -> number in this trace
+        self._calls = 0
+        self._task = None
+
+    def start(self):
+        if self._task is None:
+            self._task = asyncio.get_running_loop().create_task(self.writer.run())
+
+    async def close(self):
+        if self._task is not None:
+            self._task.cancel()
+            self._task = None
+        await self.writer.close()
+
+    def register_metrics(self, metrics):
+        metrics.counter("game_trace_records_total", "Records written to the traffic trace.",
+                        lambda: self.writer.records)
+        metrics.counter("game_trace_bytes_total", "Compressed bytes written to the traffic trace.",
+                        lambda: self.writer.bytes_written)
+
+    def wrap(self, method, handler):
+        """A copy of a method handler that records its calls."""
+        minted = MINTED_IDS.get(method.rpartition("/")[2])
+        if handler.unary_unary:
+            return handler._replace(unary_unary=self._unary(method, minted, handler.unary_unary))
+        if handler.unary_stream:
+            return handler._replace(unary_stream=self._stream(method, minted, handler.unary_stream))
+        if handler.stream_unary:
+            return handler._replace(stream_unary=self._client_stream(method, handler.stream_unary))
+        if handler.stream_stream:
+            return handler._replace(stream_stream=self._session(method, handler.stream_stream))
+        return handler
+
+    def _start_call(self, method, context, request=None):
+        """Record a call's start and return its number, or None if it is
+        not recorded."""
+        if context is not None and any(key == FORWARDED_HEADER for key, _ in context.invocation_metadata() or ()):
+            return None
+        number = self._methods.get(method)
+        if number is None:
+            number = self._methods[method] = len(self._methods)
+            self.writer.append(METHOD, number, method.encode("utf-8"))
+        self._calls += 1
+        payload = _METHOD_NUMBER.pack(number)
+        if request is not None:
+            payload += request.SerializeToString()
+        self.writer.append(CALL, self._calls, payload)
+        return self._calls
+
+    def _result(self, call, minted, response):
+        if isinstance(response, bytes):
+            data, response = response, minted.FromString(response)
+        else:
+            data = response.SerializeToString()
+        if response.player_id:
+            self.writer.append(RESULT, call, data)
+
+    def _unary(self, method, minted, behavior):
+        async def recorded(request, context):
+            call = self._start_call(method, context, request)
+            response = await behavior(request, context)
+            if call is not None and minted is not None and response is not None:
+                self._result(call, minted, response)
+            return response
+        return recorded
+
+    def _stream(self, method, minted, behavior):
+        async def recorded(request, context):
+            call = self._start_call(method, context, request)
+            if call is None:
+                async for response in behavior(request, context):
+                    yield response
+                return
+            cancelled = 1
+            try:
+                async for response in behavior(request, context):
+                    if minted is not None:
+                        self._result(call, minted, response)
+                    yield response
+                cancelled = 0
+            finally:
+                self.writer.append(END, call, bytes((cancelled,)))
+        return recorded
+
+    def _messages(self, call, request_iterator):
+        async def messages():
+            async for message in request_iterator:
+                self.writer.append(MESSAGE, call, message.SerializeToString())
+                yield message
+        return messages()
+
+    def _client_stream(self, method, behavior):
+        async def recorded(request_iterator, context):
+            call = self._start_call(method, context)
+            if call is None:
+                return await behavior(request_iterator, context)
+            try:
+                return await behavior(self._messages(call, request_iterator), context)
+            finally:
+                self.writer.append(END, call, b"\0")
+        return recorded
+
+    def _session(self, method, behavior):
+        async def recorded(request_iterator, context):
+            call = self._start_call(method, context)
+            if call is None:
+                async for response in behavior(request_iterator, context):
+                    yield response
+                return
+            cancelled = 1
+            try:
+                async for response in behavior(self._messages(call, request_iterator), context):
+                    yield response
+                cancelled = 0
+            finally:
+                self.writer.append(END, call, bytes((cancelled,)))
+        return recorded
@@ -0,0 +1,75 @@
+import asyncio
+from concurrent import futures
+
+import grpc
+
+try:
+    import uvloop
+except ImportError:  # optional; the stock loop is used without it
+    uvloop = None
+
+LOOPS = ("auto", "asyncio", "uvloop")
+
+
+class Runtime:
+    """Event loop, thread pool and gRPC server settings for one process.
+
+    loop is "auto" (uvloop when it is installed), "asyncio" or "uvloop".
+    Blocking work - loading the question bank, opening and restoring the
+    store, flushing it - runs on the loop's default executor, sized by
+    io_threads, so it never stalls the loop. The server settings cap how
+    much work is accepted at once: max_concurrent_rpcs across the server
+    (beyond it calls fail with RESOURCE_EXHAUSTED) and max_streams per
+    HTTP/2 connection. None leaves gRPC's defaults.
+
+    A process runs one loop and grpc.aio drives it from a single
+    completion queue; to use more cores, run more shards.
+    """
+
+    def __init__(self, loop="auto", io_threads=None, max_concurrent_rpcs=None, max_streams=None,
+                 optimization_target=None):
+        if loop not in LOOPS:
+            raise ValueError(f"loop must be one of {', '.join(LOOPS)}")
+        if loop == "uvloop" and uvloop is None:
+            raise ImportError("uvloop is not installed")
+        self.loop = loop
+        self.io_threads = io_threads
+        self.max_concurrent_rpcs = max_concurrent_rpcs
+        self.max_streams = max_streams
+        self.optimization_target = optimization_target  # "latency", "throughput" or "blend"
+
+    @property
+    def loop_name(self):
+        return "uvloop" if self.loop != "asyncio" and uvloop is not None else "asyncio"
+
+    def run(self, main):
+        """Run the coroutine to completion on a new loop, like asyncio.run."""
+        factory = uvloop.new_event_loop if self.loop_name == "uvloop" else None
+        with asyncio.Runner(loop_factory=factory) as runner:
+            return runner.run(self._with_executor(main))
+
+    async def _with_executor(self, main):
+        executor = futures.ThreadPoolExecutor(self.io_threads, thread_name_prefix="game-io")
+        asyncio.get_running_loop().set_default_executor(executor)
+        return await main
+
+    def server_options(self):
+        options = [
+            ("grpc.so_reuseport", 1),
+            # Accept the pooled client's keepalive pings on idle connections
+            # instead of answering them with a too_many_pings GOAWAY.
+            ("grpc.keepalive_permit_without_calls", 1),
+            ("grpc.http2.min_ping_interval_without_data_ms", 10_000),
+        ]
+        if self.max_streams:
+            options.append(("grpc.max_concurrent_streams", self.max_streams))
+        if self.optimization_target:
+            options.append(("grpc.optimization_target", self.optimization_target))
+        return options
+
+    def server(self, interceptors=()):
+        return grpc.aio.server(
+            interceptors=list(interceptors),
+            options=self.server_options(),
+            maximum_concurrent_rpcs=self.max_concurrent_rpcs,
+        )
@@ -1,13 +1,164 @@
 import grpc
 import asyncio
+import multiprocessing
+import os
+import signal
+import sys
 from concurrent import futures
-from generated import game_pb2_grpc
+from generated import game_pb2
 from game.game_logic import GameServiceImpl
+from game.fanout import pre_encoded
+from game.sharding import ShardRouter
+from game.store import SQLiteGameStore
+from game.eventlog import EventLogStore
+from game.metrics import Metrics, MetricsInterceptor, serve_metrics
+from game.runtime import Runtime
+from game.gateway import Gateway
+from game.recording import RecordingInterceptor
 
-async def serve() -> None:
-    server = grpc.aio.server()
-    game_pb2_grpc.add_GameServiceServicer_to_server(GameServiceImpl(), server)
-    server.add_insecure_port('0.0.0.0:50055')
-    print("🚀 gRPC Game Server running at [::]:50055")
+_HANDLER_FACTORIES = {
+    (False, False): grpc.unary_unary_rpc_method_handler,
+    (False, True): grpc.unary_stream_rpc_method_handler,
+    (True, False): grpc.stream_unary_rpc_method_handler,
+    (True, True): grpc.stream_stream_rpc_method_handler,
+}
+
+
+def game_method_handlers(servicer, router=None):
+    """GameService method handlers by method name, built like the generated
+    helper does but letting handlers return pre-encoded response bytes
+    (see game.fanout). With a ShardRouter, calls for games owned by another
+    worker are forwarded there."""
+    service = game_pb2.DESCRIPTOR.services_by_name["GameService"]
+    handlers = {}
+    for method in service.methods:
+        factory = _HANDLER_FACTORIES[(method.client_streaming, method.server_streaming)]
+        handler = getattr(servicer, method.name)
+        if router is not None:
+            handler = router.wrap(method, handler)
+        handlers[method.name] = factory(
+            handler,
+            request_deserializer=getattr(game_pb2, method.input_type.name).FromString,
+            response_serializer=pre_encoded(getattr(game_pb2, method.output_type.name).SerializeToString),
+        )
+    return handlers
+
+
+def add_game_service(servicer, server, router=None):
+    """Register GameService on a gRPC server; see game_method_handlers."""
+    handlers = game_method_handlers(servicer, router)
+    service_name = game_pb2.DESCRIPTOR.services_by_name["GameService"].full_name
+    server.add_generic_rpc_handlers((grpc.method_handlers_generic_handler(service_name, handlers),))
+    server.add_registered_method_handlers(service_name, handlers)
+
+
+async def serve(port=50055, shard_id=None, shard_addresses=None, store_path=None, metrics_port=8000,
+                runtime=None, event_log=None, gateway_port=None, admission=None, record=None) -> None:
+    """Run one server. Sharded workers also pass their shard id and every
+    worker's private address; they share the public port via SO_REUSEPORT
+    and listen on their own address for forwarded calls. With store_path
+    games are kept in SQLite, with event_log in an append-only log under
+    that directory, and restored on the next start. Prometheus
+    metrics are served on metrics_port (plus the shard id) unless it is
+    None. runtime holds the gRPC server settings. With gateway_port,
+    browsers can call the service directly over gRPC-Web or WebSocket on
+    that port (shared by sharded workers), without a proxy. admission is
+    an AdmissionControl limiting what each worker takes on. With record,
+    every call received is written to a traffic trace at that path (one
+    per shard) for benchmarks.replay."""
+    runtime = runtime or Runtime()
+    router = None
+    if shard_id is not None:
+        router = ShardRouter(shard_id, shard_addresses)
+    store = None
+    if store_path:
+        if shard_id is not None:
+            root, ext = os.path.splitext(store_path)
+            store_path = f"{root}-{shard_id}{ext}"
+        store = await asyncio.to_thread(SQLiteGameStore, store_path)
+    elif event_log:
+        if shard_id is not None:
+            event_log = os.path.join(event_log, f"shard-{shard_id}")
+        store = await asyncio.to_thread(EventLogStore, event_log)
+    metrics = Metrics()
+    interceptors = [MetricsInterceptor(metrics)]
+    recorder = None
+    if record is not None:
+        if shard_id is not None:
+            record = f"{record}.shard-{shard_id}"
+        recorder = RecordingInterceptor(record)
+        recorder.register_metrics(metrics)
+        interceptors.append(recorder)
+    if admission is not None:
+        interceptors.append(admission)
+        admission.register_metrics(metrics)
+    server = runtime.server(interceptors=interceptors)
+    # Loading the question bank and restoring stored games read files.
+    service = await asyncio.to_thread(GameServiceImpl, router=router, store=store)
+    service.register_metrics(metrics)
+    add_game_service(service, server, router)
+    service.start()
+    if admission is not None:
+        admission.start()
+    if recorder is not None:
+        recorder.start()
+    if metrics_port is not None:
+        metrics_port += shard_id or 0
+        await serve_metrics(metrics, metrics_port)
+        print(f"📈 Metrics at http://localhost:{metrics_port}/metrics")
+    if gateway_port is not None:
+        gateway = Gateway(game_method_handlers(service, router), interceptors)
+        await gateway.start(gateway_port, reuse_port=router is not None)
+        print(f"🌐 gRPC-Web gateway at http://localhost:{gateway_port}")
+    server.add_insecure_port(f'0.0.0.0:{port}')
+    if router is None:
+        print(f"🚀 gRPC Game Server running at [::]:{port}")
+    else:
+        server.add_insecure_port(shard_addresses[shard_id])
+        print(f"🚀 gRPC Game Server shard {shard_id} running at [::]:{port} (private {shard_addresses[shard_id]})")
     await server.start()
-    await server.wait_for_termination()
+    try:
+        await server.wait_for_termination()
+    finally:
+        await service.store.close()
+        if recorder is not None:
+            await recorder.close()
+
+
+def shard_addresses(shards, port=50055, host="127.0.0.1"):
+    """Private worker addresses: the ports right after the public one."""
+    return [f"{host}:{port + 1 + shard}" for shard in range(shards)]
+
+
+def _run_shard(port, shard_id, addresses, store_path, metrics_port, runtime, event_log, gateway_port, admission,
+               record):
+    runtime.run(serve(port, shard_id, addresses, store_path, metrics_port, runtime, event_log, gateway_port,
+                      admission, record))
+
+
+def serve_sharded(shards, port=50055, store_path=None, metrics_port=8000, runtime=None, event_log=None,
+                  gateway_port=None, admission=None, record=None):
+    """Start one worker process per shard and wait for them; each runs
+    its own loop with the same runtime settings, and applies the
+    admission limits to the calls it receives."""
+    addresses = shard_addresses(shards, port)
+    runtime = runtime or Runtime()
+    # spawn, not fork: gRPC does not survive being forked.
+    context = multiprocessing.get_context("spawn")
+    workers = [
+        context.Process(target=_run_shard,
+                        args=(port, shard_id, addresses, store_path, metrics_port, runtime, event_log, gateway_port,
+                              admission, record),
+                        daemon=True)
+        for shard_id in range(shards)
+    ]
+    for worker in workers:
+        worker.start()
+    # Turn SIGTERM into SystemExit so the workers are stopped with us.
+    signal.signal(signal.SIGTERM, lambda *_: sys.exit(0))
+    try:
+        for worker in workers:
+            worker.join()
+    finally:
+        for worker in workers:
+            worker.terminate()
@@ -0,0 +1,193 @@
+import bisect
+import hashlib
+import uuid
+
+import grpc
+
+from generated import game_pb2
+
+FORWARDED_HEADER = "x-game-shard-forwarded"
+
+_SERVICE_PATH = "/game.GameService/"
+
+
+def _hash(key):
+    return int.from_bytes(hashlib.md5(key.encode("utf-8")).digest()[:8], "big")
+
+
+class HashRing:
+    """Consistent hash of game ids onto shard ids.
+
+    Each shard is placed on the ring at virtual_nodes points so games spread
+    evenly, and changing the shard count only moves the games whose nearest
+    point changed hands.
+    """
+
+    def __init__(self, shard_count, virtual_nodes=64):
+        self.shard_count = shard_count
+        self.virtual_nodes = virtual_nodes
+        points = sorted(
+            (_hash(f"shard-{shard}#{replica}"), shard)
+            for shard in range(shard_count)
+            for replica in range(virtual_nodes)
+        )
+        self._points = [point for point, _ in points]
+        self._owners = [shard for _, shard in points]
+
+    def owner(self, game_id):
+        i = bisect.bisect(self._points, _hash(game_id))
+        return self._owners[i % len(self._owners)]
+
+
+# How to find the game id in each routed request. PlaySession is keyed by its
+# first (join) message. A tournament's games all live with the worker that
+# owns its id, so a join creating one, and the tournament's stream, are
+# keyed by that. RPCs not listed here are always served locally.
+_GAME_KEYS = {
+    "JoinGame": lambda request: request.game_id or request.tournament_id,
+    "GetNextQuestion": lambda request: request.game_id,
+    "SubmitAnswer": lambda request: request.game_id,
+    "GetLeaderboard": lambda request: request.game_id,
+    "StreamLeaderboard": lambda request: request.game_id,
+    "WatchSession": lambda request: request.game_id,
+    "PlaySession": lambda request: request.join.game_id,
+    "StreamTournamentLeaderboard": lambda request: request.tournament_id,
+}
+
+
+class ShardRouter:
+    """One worker's view of the shard map.
+
+    Every worker owns the games that hash to its shard id. RPCs for games
+    owned elsewhere are forwarded to the owner's private address, and the
+    owner's encoded reply is relayed unchanged. Requests that were already
+    forwarded are always served locally, so a misconfigured worker can
+    never bounce a call around the ring.
+    """
+
+    def __init__(self, shard_id, addresses, virtual_nodes=64):
+        self.shard_id = shard_id
+        self.addresses = list(addresses)  # shard id -> host:port
+        self.ring = HashRing(len(self.addresses), virtual_nodes)
+        self.forwarded = 0
+        self._channels = {}  # shard id -> channel to its private address
+        self._calls = {}  # (shard id, method name) -> multicallable
+
+    def owns(self, game_id):
+        return self.ring.owner(game_id) == self.shard_id
+
+    def new_game_id(self):
+        """A fresh game id that this worker owns."""
+        while True:
+            game_id = str(uuid.uuid4())
+            if self.owns(game_id):
+                return game_id
+
+    def shard_map(self, game_id=""):
+        return game_pb2.ShardMap(
+            shards=[game_pb2.ShardInfo(shard_id=shard, address=address)
+                    for shard, address in enumerate(self.addresses)],
+            virtual_nodes=self.ring.virtual_nodes,
+            shard_id=self.shard_id,
+            owner_shard_id=self.ring.owner(game_id) if game_id else 0
+        )
+
+    def wrap(self, method, handler):
+        """Route a servicer method by game id; unkeyed methods are returned as is."""
+        key = _GAME_KEYS.get(method.name)
+        if key is None:
+            return handler
+        if method.client_streaming:
+            return self._wrap_session(method, handler, key)
+        if method.server_streaming:
+            return self._wrap_stream(method, handler, key)
+        return self._wrap_unary(method, handler, key)
+
+    def _target(self, game_id, context):
+        # None means serve here.
+        if not game_id:
+            return None
+        if any(k == FORWARDED_HEADER for k, _ in context.invocation_metadata() or ()):
+            return None
+        owner = self.ring.owner(game_id)
+        return None if owner == self.shard_id else owner
+
+    def _stub(self, shard, method):
+        call = self._calls.get((shard, method.name))
+        if call is None:
+            channel = self._channels.get(shard)
+            if channel is None:
+                channel = self._channels[shard] = grpc.aio.insecure_channel(self.addresses[shard])
+            factory = {
+                (False, False): channel.unary_unary,
+                (False, True): channel.unary_stream,
+                (True, True): channel.stream_stream,
+            }[(method.client_streaming, method.server_streaming)]
+            # No response deserializer: the owner's bytes are passed straight
+            # back through pre_encoded.
+            call = self._calls[(shard, method.name)] = factory(
+                _SERVICE_PATH + method.name,
+                request_serializer=getattr(game_pb2, method.input_type.name).SerializeToString
+            )
+        return call
+
+    def _metadata(self):
+        return ((FORWARDED_HEADER, str(self.shard_id)),)
+
+    def _wrap_unary(self, method, handler, key):
+        async def route(request, context):
+            owner = self._target(key(request), context)
+            if owner is None:
+                return await handler(request, context)
+            self.forwarded += 1
+            try:
+                return await self._stub(owner, method)(request, metadata=self._metadata())
+            except grpc.aio.AioRpcError as e:
+                context.set_code(e.code())
+                context.set_details(e.details())
+                return b""
+        return route
+
+    def _wrap_stream(self, method, handler, key):
+        async def route(request, context):
+            owner = self._target(key(request), context)
+            if owner is None:
+                async for response in handler(request, context):
+                    yield response
+                return
+            self.forwarded += 1
+            async for response in self._relay(self._stub(owner, method)(request, metadata=self._metadata()), context):
+                yield response
+        return route
+
+    def _wrap_session(self, method, handler, key):
+        async def route(request_iterator, context):
+            # The join comes first; put it back in front of the rest of the
+            # stream for whichever worker ends up serving it.
+            first = await anext(request_iterator, None)
+
+            async def requests():
+                if first is not None:
+                    yield first
+                async for request in request_iterator:
+                    yield request
+
+            owner = self._target(key(first) if first is not None else "", context)
+            if owner is None:
+                async for response in handler(requests(), context):
+                    yield response
+                return
+            self.forwarded += 1
+            async for response in self._relay(self._stub(owner, method)(requests(), metadata=self._metadata()), context):
+                yield response
+        return route
+
+    async def _relay(self, call, context):
+        try:
+            async for response in call:
+                yield response
+        except grpc.aio.AioRpcError as e:
+            context.set_code(e.code())
+            context.set_details(e.details())
+        finally:
+            call.cancel()
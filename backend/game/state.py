@@ -0,0 +1,84 @@
+from game.leaderboard import RankedLeaderboard
+from game.fanout import LeaderboardHub
+
+
+class PlayerSlot:
+    """A player's seat in one game; their score lives in Game.scores[index]."""
+
+    __slots__ = ("player_id", "name", "index")
+
+    def __init__(self, player_id, name, index):
+        self.player_id = player_id
+        self.name = name
+        self.index = index
+
+
+class Game:
+    """Compact per-game state.
+
+    Questions are indices into the shared bank. Players get small integer
+    indices in join order; scores are an array column owned by the ranking
+    and who has answered the current round is a bitset over those indices,
+    so per-player cost is one PlayerSlot plus a few machine words rather
+    than nested dicts and sets of UUID strings.
+    """
+
+    __slots__ = (
+        "game_id", "players", "slots", "bank", "question_indices", "current_question_index",
+        "answered", "answered_count", "ranking", "leaderboard_hub",
+        "session_listeners", "completed", "state", "last_activity", "completed_at",
+        "round_timer", "actor", "leaderboard_cache", "tournament",
+    )
+
+    def __init__(self, game_id, bank, question_indices):
+        self.game_id = game_id
+        self.players = {}  # player_id -> PlayerSlot
+        self.slots = []  # player index -> PlayerSlot
+        self.bank = bank  # shared QuestionBank
+        self.question_indices = question_indices  # array of bank indices, one per round
+        self.current_question_index = 0
+        self.answered = 0  # bitset of player indices that answered this round
+        self.answered_count = 0
+        self.ranking = RankedLeaderboard()  # kept sorted as scores change
+        self.leaderboard_hub = LeaderboardHub()
+        self.session_listeners = []  # queues of SessionEvent per open session
+        self.completed = False
+        self.state = None  # set by GameLifecycle
+        self.last_activity = 0.0
+        self.completed_at = None
+        self.round_timer = None  # set by RoundScheduler while a round is running
+        self.actor = None  # GameActor that applies every change to this game
+        self.leaderboard_cache = None  # (version, {(offset, limit): encoded Leaderboard})
+        self.tournament = None  # Tournament the game belongs to, if any
+
+    @property
+    def scores(self):
+        return self.ranking.scores
+
+    @property
+    def total_rounds(self):
+        return len(self.question_indices)
+
+    def question(self, round_index):
+        return self.bank[self.question_indices[round_index]]
+
+    def add_player(self, player_id, name):
+        slot = PlayerSlot(player_id, name, self.ranking.add())
+        self.players[player_id] = slot
+        self.slots.append(slot)
+        return slot
+
+    def has_answered(self, slot):
+        return self.answered >> slot.index & 1
+
+    def mark_answered(self, slot):
+        self.answered |= 1 << slot.index
+        self.answered_count += 1
+
+    def all_answered(self):
+        return self.answered_count >= len(self.slots)
+
+    def next_round(self):
+        self.current_question_index += 1
+        self.answered = 0
+        self.answered_count = 0
@@ -0,0 +1,200 @@
+import asyncio
+import sqlite3
+from array import array
+from itertools import groupby
+from operator import itemgetter
+
+from game.state import Game
+
+
+class GameStore:
+    """Where GameServiceImpl reports state changes.
+
+    The service keeps working from its in-memory games; a store only sees
+    the mutations so it can persist them and hand the games back after a
+    restart.
+    """
+
+    def load_games(self, bank):
+        """Games saved by an earlier run, as {game_id: Game}."""
+        return {}
+
+    def game_created(self, game):
+        pass
+
+    def player_joined(self, game, slot):
+        pass
+
+    def answer_recorded(self, game, slot, selected_option, correct):
+        pass
+
+    def round_advanced(self, game):
+        pass
+
+    def game_removed(self, game_id):
+        pass
+
+    async def run(self):
+        """Background work, started alongside the service's other tasks."""
+
+    async def close(self):
+        pass
+
+
+class MemoryGameStore(GameStore):
+    """Keeps nothing: games live only in the service's own dicts."""
+
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS games (
+    game_id TEXT PRIMARY KEY,
+    question_ids TEXT NOT NULL,
+    current_round INTEGER NOT NULL DEFAULT 0,
+    completed INTEGER NOT NULL DEFAULT 0
+);
+CREATE TABLE IF NOT EXISTS players (
+    game_id TEXT NOT NULL,
+    player_index INTEGER NOT NULL,
+    player_id TEXT NOT NULL,
+    name TEXT NOT NULL,
+    score INTEGER NOT NULL DEFAULT 0,
+    PRIMARY KEY (game_id, player_index)
+);
+CREATE TABLE IF NOT EXISTS answers (
+    game_id TEXT NOT NULL,
+    round INTEGER NOT NULL,
+    player_index INTEGER NOT NULL,
+    selected_option TEXT NOT NULL,
+    correct INTEGER NOT NULL,
+    PRIMARY KEY (game_id, round, player_index)
+);
+"""
+
+_UPDATE_SCORE = "UPDATE players SET score = ? WHERE game_id = ? AND player_index = ?"
+
+
+class SQLiteGameStore(GameStore):
+    """Durable store in a SQLite file that can be inspected from outside.
+
+    With write_behind (the default) mutations are queued in order and
+    written in one transaction by run(), every flush_interval seconds or as
+    soon as flush_size are waiting, on a worker thread so answers never
+    wait on the disk. Score changes are coalesced per player between
+    flushes. A crash loses at most the last unflushed batch; close()
+    flushes what is left. Without write_behind every mutation is committed
+    before the RPC returns.
+    """
+
+    def __init__(self, path="data/games.db", flush_interval=0.05, flush_size=1000, write_behind=True):
+        self.path = path
+        self.flush_interval = flush_interval
+        self.flush_size = flush_size
+        self.write_behind = write_behind
+        self.flushes = 0
+        self.rows_written = 0
+        # Flushes run on a worker thread, one at a time.
+        self._db = sqlite3.connect(path, check_same_thread=False)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute("PRAGMA synchronous=NORMAL")
+        self._db.executescript(_SCHEMA)
+        self._pending = []  # ordered (sql, params)
+        self._scores = {}  # (game_id, player_index) -> latest score
+        self._wake = None
+        self._flush_lock = asyncio.Lock()
+
+    def load_games(self, bank):
+        games = {}
+        for game_id, question_ids, current_round, completed in self._db.execute(
+                "SELECT game_id, question_ids, current_round, completed FROM games"):
+            questions = [bank.get_question_by_id(qid) for qid in question_ids.split(",") if qid]
+            game = Game(game_id, bank, array("i", (q.index for q in questions if q is not None)))
+            game.current_question_index = current_round
+            game.completed = bool(completed)
+            games[game_id] = game
+        for game_id, player_id, name, score in self._db.execute(
+                "SELECT game_id, player_id, name, score FROM players ORDER BY game_id, player_index"):
+            game = games.get(game_id)
+            if game is not None:
+                slot = game.add_player(player_id, name)
+                game.ranking.update(slot.index, score)
+        for game_id, player_index in self._db.execute(
+                "SELECT a.game_id, a.player_index FROM answers a JOIN games g USING (game_id) "
+                "WHERE a.round = g.current_round"):
+            game = games.get(game_id)
+            if game is not None and player_index < len(game.slots):
+                game.mark_answered(game.slots[player_index])
+        return games
+
+    def game_created(self, game):
+        question_ids = ",".join(game.question(i).question_id for i in range(game.total_rounds))
+        self._write("INSERT OR REPLACE INTO games (game_id, question_ids) VALUES (?, ?)",
+                    (game.game_id, question_ids))
+
+    def player_joined(self, game, slot):
+        self._write("INSERT OR REPLACE INTO players (game_id, player_index, player_id, name, score) "
+                    "VALUES (?, ?, ?, ?, ?)",
+                    (game.game_id, slot.index, slot.player_id, slot.name, game.scores[slot.index]))
+
+    def answer_recorded(self, game, slot, selected_option, correct):
+        self._write("INSERT OR IGNORE INTO answers VALUES (?, ?, ?, ?, ?)",
+                    (game.game_id, game.current_question_index, slot.index, selected_option, int(correct)))
+        if not correct:
+            return
+        if self.write_behind:
+            self._scores[(game.game_id, slot.index)] = game.scores[slot.index]
+        else:
+            self._write(_UPDATE_SCORE, (game.scores[slot.index], game.game_id, slot.index))
+
+    def round_advanced(self, game):
+        self._write("UPDATE games SET current_round = ?, completed = ? WHERE game_id = ?",
+                    (game.current_question_index, int(game.completed), game.game_id))
+
+    def game_removed(self, game_id):
+        for table in ("answers", "players", "games"):
+            self._write(f"DELETE FROM {table} WHERE game_id = ?", (game_id,))
+
+    def _write(self, sql, params):
+        if not self.write_behind:
+            with self._db:
+                self._db.execute(sql, params)
+            self.rows_written += 1
+            return
+        self._pending.append((sql, params))
+        if self._wake is not None and len(self._pending) + len(self._scores) >= self.flush_size:
+            self._wake.set()
+
+    async def run(self):
+        if not self.write_behind:
+            return
+        self._wake = asyncio.Event()
+        while True:
+            try:
+                await asyncio.wait_for(self._wake.wait(), self.flush_interval)
+            except asyncio.TimeoutError:
+                pass
+            self._wake.clear()
+            await self.flush()
+
+    async def flush(self):
+        async with self._flush_lock:
+            if not self._pending and not self._scores:
+                return
+            batch, self._pending = self._pending, []
+            scores, self._scores = self._scores, {}
+            await asyncio.to_thread(self._commit, batch, scores)
+
+    def _commit(self, batch, scores):
+        # Queued statements go first, in order, so score updates find their
+        # player rows; runs of the same statement share one executemany.
+        with self._db:
+            for sql, group in groupby(batch, key=itemgetter(0)):
+                self._db.executemany(sql, [params for _, params in group])
+            self._db.executemany(_UPDATE_SCORE, [
+                (score, game_id, index) for (game_id, index), score in scores.items()
+            ])
+        self.flushes += 1
+        self.rows_written += len(batch) + len(scores)
+
+    async def close(self):
+        await self.flush()
+        await asyncio.to_thread(self._db.close)
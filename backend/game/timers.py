@@ -0,0 +1,139 @@
+import math
+import time
+
+
+class Timer:
+    """A scheduled payload; cancelling only flags it, the wheel drops it later."""
+
+    __slots__ = ("expires", "payload", "cancelled")
+
+    def __init__(self, expires, payload):
+        self.expires = expires  # absolute tick
+        self.payload = payload
+        self.cancelled = False
+
+
+class TimerWheel:
+    """Hierarchical timing wheel shared by every game.
+
+    Time is cut into ticks. Level 0 has one slot per tick for the next
+    `slots` ticks, and each level above covers `slots` times the span of the
+    one below. Timers further out than the top level wait in an overflow
+    list. A timer is filed at the lowest level whose current rotation still
+    contains its deadline and moves down a level each time the wheel
+    reaches its slot. Scheduling and cancelling are O(1), and a tick only
+    touches the slot that is due, so its cost does not depend on how many
+    timers are pending.
+    """
+
+    def __init__(self, tick=0.1, slots=256, levels=3, now=None):
+        self.tick = tick
+        self.slots = slots
+        self.levels = levels
+        self.pending = 0
+        self._origin = now if now is not None else time.monotonic()
+        self._current = 0  # last tick processed
+        self._spans = [slots ** level for level in range(levels + 1)]
+        self._wheels = [[[] for _ in range(slots)] for _ in range(levels)]
+        self._overflow = []
+
+    def schedule(self, delay, payload, now=None):
+        now = now if now is not None else time.monotonic()
+        expires = max(math.ceil((now + delay - self._origin) / self.tick), self._current + 1)
+        timer = Timer(expires, payload)
+        self._file(timer)
+        self.pending += 1
+        return timer
+
+    def cancel(self, timer):
+        if not timer.cancelled:
+            timer.cancelled = True
+            self.pending -= 1
+
+    def _file(self, timer):
+        spans = self._spans
+        for level in range(self.levels):
+            # Same rotation of the level above: the slot is still ahead of us.
+            if timer.expires // spans[level + 1] == self._current // spans[level + 1]:
+                self._wheels[level][timer.expires // spans[level] % self.slots].append(timer)
+                return
+        self._overflow.append(timer)
+
+    def advance(self, now=None):
+        """Process every tick up to now and return the payloads that expired."""
+        now = now if now is not None else time.monotonic()
+        target = math.floor((now - self._origin) / self.tick)
+        expired = []
+        while self._current < target:
+            self._current += 1
+            expired.extend(self._run_tick())
+        return expired
+
+    def _run_tick(self):
+        tick = self._current
+        spans = self._spans
+        # Higher levels first, so timers cascading down can land in a slot
+        # that is about to be processed.
+        if tick % spans[self.levels] == 0 and self._overflow:
+            overflow, self._overflow = self._overflow, []
+            self._cascade(overflow)
+        for level in range(self.levels - 1, 0, -1):
+            if tick % spans[level] == 0:
+                slot = self._wheels[level][tick // spans[level] % self.slots]
+                if slot:
+                    self._wheels[level][tick // spans[level] % self.slots] = []
+                    self._cascade(slot)
+
+        index = tick % self.slots
+        due, self._wheels[0][index] = self._wheels[0][index], []
+        payloads = []
+        for timer in due:
+            if not timer.cancelled:
+                timer.cancelled = True
+                self.pending -= 1
+                payloads.append(timer.payload)
+        return payloads
+
+    def _cascade(self, timers):
+        for timer in timers:
+            if not timer.cancelled:
+                self._file(timer)
+
+
+class RoundScheduler:
+    """Closes rounds whose time limit has passed.
+
+    Every game's current round holds at most one timer on a shared
+    TimerWheel; the service arms it when the round starts and the
+    scheduler reports the rounds that ran out.
+    """
+
+    def __init__(self, tick=0.1, grace_seconds=1.0, slots=256, levels=3):
+        self.grace_seconds = grace_seconds  # allowance for answers still in flight
+        self.wheel = TimerWheel(tick, slots, levels)
+        self.rounds_timed_out = 0
+
+    @property
+    def tick(self):
+        return self.wheel.tick
+
+    def arm(self, game, time_limit_seconds, now=None):
+        self.cancel(game)
+        game.round_timer = self.wheel.schedule(
+            time_limit_seconds + self.grace_seconds, (game, game.current_question_index), now)
+
+    def cancel(self, game):
+        if game.round_timer is not None:
+            self.wheel.cancel(game.round_timer)
+            game.round_timer = None
+
+    def due(self, now=None):
+        """Games whose current round has run out of time."""
+        games = []
+        for game, round_index in self.wheel.advance(now):
+            # Re-arming cancels the old timer, so this one is still current.
+            game.round_timer = None
+            if not game.completed and game.current_question_index == round_index:
+                self.rounds_timed_out += 1
+                games.append(game)
+        return games
@@ -0,0 +1,136 @@
+import asyncio
+import bisect
+
+from generated import game_pb2
+
+DEFAULT_BOARD_SIZE = 100
+MIN_UPDATE_INTERVAL = 0.5  # seconds between StreamTournamentLeaderboard updates
+
+_MEMBER_BITS = 64
+_MEMBER_MASK = (1 << _MEMBER_BITS) - 1
+_INDEX_BITS = 32
+_INDEX_MASK = (1 << _INDEX_BITS) - 1
+
+
+class Tournament:
+    """Games grouped into one event, with a board of its best players.
+
+    The board keeps the top board_size players across every game, packed
+    like RankedLeaderboard keys: (-score << 64) | (game ordinal << 32) |
+    player index, so ties go to earlier games and then to join order.
+    It is updated with just the players a batch of answers scored for,
+    never rebuilt from the rooms. Scores only rise, so a player who drops
+    off the board can only return by scoring, which updates them again;
+    everyone else is one comparison against the last place.
+    """
+
+    def __init__(self, tournament_id, board_size=DEFAULT_BOARD_SIZE):
+        self.tournament_id = tournament_id
+        self.board_size = board_size
+        self.version = 0
+        self.total_games = 0
+        self.live_games = 0  # added and not yet reaped
+        self.total_players = 0
+        self.closed = False
+        self._ordinals = {}  # game_id -> ordinal, in the order games were added
+        self._keys = []  # sorted packed keys of the players on the board
+        self._entries = {}  # member (ordinal << 32 | index) -> [key, game_id, player_id, player_name]
+        self._encoded = (None, {})  # (version, {limit: encoded TournamentLeaderboard})
+        self._changed = None  # future resolved on the next change, while anyone waits
+
+    def __len__(self):
+        return len(self._keys)
+
+    def add_game(self, game):
+        self._ordinals[game.game_id] = self.total_games
+        self.total_games += 1
+        self.live_games += 1
+        self._bump()
+
+    def remove_game(self, game_id):
+        """Forget a reaped game; its players keep their place on the board."""
+        if self._ordinals.pop(game_id, None) is not None:
+            self.live_games -= 1
+
+    def player_joined(self, game, index):
+        self.total_players += 1
+        if not self.update(game, (index,)):
+            self._bump()  # the board is unchanged but its player count is not
+
+    def update(self, game, indices):
+        """Re-place the given players of one game after their scores
+        changed; returns whether the board changed."""
+        ordinal = self._ordinals.get(game.game_id)
+        if ordinal is None:
+            return False
+        keys = self._keys
+        entries = self._entries
+        changed = False
+        for index in indices:
+            member = ordinal << _INDEX_BITS | index
+            key = (-game.scores[index] << _MEMBER_BITS) | member
+            entry = entries.get(member)
+            if entry is not None:
+                if entry[0] == key:
+                    continue
+                del keys[bisect.bisect_left(keys, entry[0])]
+                entry[0] = key
+            else:
+                if len(keys) >= self.board_size:
+                    if key > keys[-1]:
+                        continue  # below the board
+                    del entries[keys.pop() & _MEMBER_MASK]
+                slot = game.slots[index]
+                entries[member] = [key, game.game_id, slot.player_id, slot.name]
+            bisect.insort(keys, key)
+            changed = True
+        if changed:
+            self._bump()
+        return changed
+
+    def _bump(self):
+        self.version += 1
+        if self._changed is not None:
+            self._changed.set_result(None)
+            self._changed = None
+
+    def close(self):
+        """End every stream on this tournament."""
+        self.closed = True
+        self._bump()
+
+    def changed(self):
+        """A future resolved at the next change to the board, or on close."""
+        if self._changed is None:
+            self._changed = asyncio.get_running_loop().create_future()
+        return self._changed
+
+    def page(self, limit=0):
+        """Yield (rank, game_id, player_id, player_name, player_index, score), best first."""
+        keys = self._keys[:limit] if limit > 0 else self._keys
+        for rank, key in enumerate(keys, start=1):
+            member = key & _MEMBER_MASK
+            _, game_id, player_id, player_name = self._entries[member]
+            yield rank, game_id, player_id, player_name, member & _INDEX_MASK, -(key >> _MEMBER_BITS)
+
+    def encoded(self, limit=0):
+        """The board's top limit entries, encoded once per version and limit
+        and shared by every stream."""
+        version, pages = self._encoded
+        if version != self.version:
+            pages = {}
+            self._encoded = (self.version, pages)
+        data = pages.get(limit)
+        if data is None:
+            data = pages[limit] = game_pb2.TournamentLeaderboard(
+                tournament_id=self.tournament_id,
+                entries=[
+                    game_pb2.LeaderboardEntry(game_id=game_id, player_id=player_id, player_name=player_name,
+                                              player_index=index, score=score, rank=rank)
+                    for rank, game_id, player_id, player_name, index, score in self.page(limit)
+                ],
+                total_games=self.total_games,
+                total_players=self.total_players,
+                version=self.version,
+            ).SerializeToString()
+        return data
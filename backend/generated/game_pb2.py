@@ -24,7 +24,7 @@ _sym_db = _symbol_database.Default()
 
 
 
-DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n\ngame.proto\x12\x04game\"\"\n\x06Player\x12\n\n\x02id\x18\x01 \x01(\t\x12\x0c\n\x04name\x18\x02 \x01(\t\"3\n\x0bJoinRequest\x12\x13\n\x0bplayer_name\x18\x01 \x01(\t\x12\x0f\n\x07game_id\x18\x02 \x01(\t\"C\n\x0cJoinResponse\x12\x11\n\tplayer_id\x18\x01 \x01(\t\x12\x0f\n\x07game_id\x18\x02 \x01(\t\x12\x0f\n\x07message\x18\x03 \x01(\t\"1\n\x0bGameRequest\x12\x0f\n\x07game_id\x18\x01 \x01(\t\x12\x11\n\tplayer_id\x18\x02 \x01(\t\"g\n\x0cQuestionCard\x12\x13\n\x0bquestion_id\x18\x01 \x01(\t\x12\x15\n\rquestion_text\x18\x02 \x01(\t\x12\x0f\n\x07options\x18\x03 \x03(\t\x12\x1a\n\x12time_limit_seconds\x18\x04 \x01(\x05\"{\n\rAnswerRequest\x12\x0f\n\x07game_id\x18\x01 \x01(\t\x12\x11\n\tplayer_id\x18\x02 \x01(\t\x12\x13\n\x0bquestion_id\x18\x03 \x01(\t\x12\x17\n\x0fselected_option\x18\x04 \x01(\t\x12\x18\n\x10\x61nswer_timestamp\x18\x05 \x01(\x03\"L\n\x0c\x41nswerResult\x12\x0f\n\x07\x63orrect\x18\x01 \x01(\x08\x12\x16\n\x0epoints_awarded\x18\x02 \x01(\x05\x12\x13\n\x0b\x65xplanation\x18\x03 \x01(\t\"\x19\n\x06GameId\x12\x0f\n\x07game_id\x18\x01 \x01(\t\"W\n\x10LeaderboardEntry\x12\x11\n\tplayer_id\x18\x01 \x01(\t\x12\x13\n\x0bplayer_name\x18\x02 \x01(\t\x12\r\n\x05score\x18\x03 \x01(\x05\x12\x0c\n\x04rank\x18\x04 \x01(\x05\"6\n\x0bLeaderboard\x12\'\n\x07\x65ntries\x18\x01 \x03(\x0b\x32\x16.game.LeaderboardEntry\"N\n\x11LeaderboardUpdate\x12&\n\x0bleaderboard\x18\x01 \x01(\x0b\x32\x11.game.Leaderboard\x12\x11\n\tgame_over\x18\x02 \x01(\x08\x32\xa4\x02\n\x0bGameService\x12\x31\n\x08JoinGame\x12\x11.game.JoinRequest\x1a\x12.game.JoinResponse\x12\x38\n\x0fGetNextQuestion\x12\x11.game.GameRequest\x1a\x12.game.QuestionCard\x12\x37\n\x0cSubmitAnswer\x12\x13.game.AnswerRequest\x1a\x12.game.AnswerResult\x12\x31\n\x0eGetLeaderboard\x12\x0c.game.GameId\x1a\x11.game.Leaderboard\x12<\n\x11StreamLeaderboard\x12\x0c.game.GameId\x1a\x17.game.LeaderboardUpdate0\x01\x42\x08Z\x06gamepbb\x06proto3')
+DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n\ngame.proto\x12\x04game\"\"\n\x06Player\x12\n\n\x02id\x18\x01 \x01(\t\x12\x0c\n\x04name\x18\x02 \x01(\t\"\xa6\x01\n\x0bJoinRequest\x12\x13\n\x0bplayer_name\x18\x01 \x01(\t\x12\x0f\n\x07game_id\x18\x02 \x01(\t\x12\x10\n\x08\x63\x61tegory\x18\x03 \x01(\t\x12\x12\n\ndifficulty\x18\x04 \x01(\t\x12\x16\n\x0equestion_count\x18\x05 \x01(\x05\x12\x1c\n\x14\x65xclude_question_ids\x18\x06 \x03(\t\x12\x15\n\rtournament_id\x18\x07 \x01(\t\"C\n\x0cJoinResponse\x12\x11\n\tplayer_id\x18\x01 \x01(\t\x12\x0f\n\x07game_id\x18\x02 \x01(\t\x12\x0f\n\x07message\x18\x03 \x01(\t\"G\n\x0bGameRequest\x12\x0f\n\x07game_id\x18\x01 \x01(\t\x12\x11\n\tplayer_id\x18\x02 \x01(\t\x12\x14\n\x0c\x62\x61nk_version\x18\x03 \x01(\x04\"\x91\x01\n\x0cQuestionCard\x12\x13\n\x0bquestion_id\x18\x01 \x01(\t\x12\x15\n\rquestion_text\x18\x02 \x01(\t\x12\x0f\n\x07options\x18\x03 \x03(\t\x12\x1a\n\x12time_limit_seconds\x18\x04 \x01(\x05\x12\x12\n\nbank_index\x18\x05 \x01(\x05\x12\x14\n\x0c\x62\x61nk_version\x18\x06 \x01(\x04\"_\n\x13QuestionBankRequest\x12\x15\n\rknown_version\x18\x01 \x01(\x04\x12\x0e\n\x06offset\x18\x02 \x01(\x05\x12\r\n\x05limit\x18\x03 \x01(\x05\x12\x12\n\nchunk_size\x18\x04 \x01(\x05\"q\n\x0c\x42\x61nkQuestion\x12\x13\n\x0bquestion_id\x18\x01 \x01(\t\x12\x15\n\rquestion_text\x18\x02 \x01(\t\x12\x0f\n\x07options\x18\x03 \x03(\t\x12\x10\n\x08\x63\x61tegory\x18\x04 \x01(\t\x12\x12\n\ndifficulty\x18\x05 \x01(\t\"\x8a\x01\n\x11QuestionBankChunk\x12\x0f\n\x07version\x18\x01 \x01(\x04\x12\x17\n\x0ftotal_questions\x18\x02 \x01(\x05\x12\x0e\n\x06offset\x18\x03 \x01(\x05\x12%\n\tquestions\x18\x04 \x03(\x0b\x32\x12.game.BankQuestion\x12\x14\n\x0cnot_modified\x18\x05 \x01(\x08\"{\n\rAnswerRequest\x12\x0f\n\x07game_id\x18\x01 \x01(\t\x12\x11\n\tplayer_id\x18\x02 \x01(\t\x12\x13\n\x0bquestion_id\x18\x03 \x01(\t\x12\x17\n\x0fselected_option\x18\x04 \x01(\t\x12\x18\n\x10\x61nswer_timestamp\x18\x05 \x01(\x03\"d\n\x0c\x41nswerResult\x12\x0f\n\x07\x63orrect\x18\x01 \x01(\x08\x12\x16\n\x0epoints_awarded\x18\x02 \x01(\x05\x12\x13\n\x0b\x65xplanation\x18\x03 \x01(\t\x12\x16\n\x0eretry_after_ms\x18\x04 \x01(\x05\"\x19\n\x06GameId\x12\x0f\n\x07game_id\x18\x01 \x01(\t\"n\n\x12LeaderboardRequest\x12\x0f\n\x07game_id\x18\x01 \x01(\t\x12\r\n\x05limit\x18\x02 \x01(\x05\x12\x0e\n\x06offset\x18\x03 \x01(\x05\x12\x11\n\tplayer_id\x18\x04 \x01(\t\x12\x15\n\rknown_version\x18\x05 \x01(\x04\"~\n\x10LeaderboardEntry\x12\x11\n\tplayer_id\x18\x01 \x01(\t\x12\x13\n\x0bplayer_name\x18\x02 \x01(\t\x12\r\n\x05score\x18\x03 \x01(\x05\x12\x0c\n\x04rank\x18\x04 \x01(\x05\x12\x14\n\x0cplayer_index\x18\x05 \x01(\x05\x12\x0f\n\x07game_id\x18\x06 \x01(\t\"\xa2\x01\n\x0bLeaderboard\x12\'\n\x07\x65ntries\x18\x01 \x03(\x0b\x32\x16.game.LeaderboardEntry\x12\x15\n\rtotal_players\x18\x02 \x01(\x05\x12,\n\x0cplayer_entry\x18\x03 \x01(\x0b\x32\x16.game.LeaderboardEntry\x12\x0f\n\x07version\x18\x04 \x01(\x04\x12\x14\n\x0cnot_modified\x18\x05 \x01(\x08\"\xa0\x01\n\x11LeaderboardUpdate\x12&\n\x0bleaderboard\x18\x01 \x01(\x0b\x32\x11.game.Leaderboard\x12\x11\n\tgame_over\x18\x02 \x01(\x08\x12\x10\n\x08sequence\x18\x03 \x01(\x04\x12\'\n\x07\x63hanges\x18\x04 \x03(\x0b\x32\x16.game.LeaderboardEntry\x12\x15\n\rtotal_players\x18\x05 \x01(\x05\"N\n\x11TournamentRequest\x12\x15\n\rtournament_id\x18\x01 \x01(\t\x12\r\n\x05limit\x18\x02 \x01(\x05\x12\x13\n\x0binterval_ms\x18\x03 \x01(\x05\"\x94\x01\n\x15TournamentLeaderboard\x12\x15\n\rtournament_id\x18\x01 \x01(\t\x12\'\n\x07\x65ntries\x18\x02 \x03(\x0b\x32\x16.game.LeaderboardEntry\x12\x13\n\x0btotal_games\x18\x03 \x01(\x05\x12\x15\n\rtotal_players\x18\x04 \x01(\x05\x12\x0f\n\x07version\x18\x05 \x01(\x04\"e\n\x0eSessionRequest\x12!\n\x04join\x18\x01 \x01(\x0b\x32\x11.game.GameRequestH\x00\x12%\n\x06\x61nswer\x18\x02 \x01(\x0b\x32\x13.game.AnswerRequestH\x00\x42\t\n\x07payload\"z\n\x0fRoundTransition\x12\x17\n\x0f\x63ompleted_round\x18\x01 \x01(\x05\x12\x12\n\nnext_round\x18\x02 \x01(\x05\x12\x14\n\x0ctotal_rounds\x18\x03 \x01(\x05\x12\x11\n\tgame_over\x18\x04 \x01(\x08\x12\x11\n\ttimed_out\x18\x05 \x01(\x08\"\x94\x01\n\x0cSessionEvent\x12&\n\x08question\x18\x01 \x01(\x0b\x32\x12.game.QuestionCardH\x00\x12+\n\ranswer_result\x18\x02 \x01(\x0b\x32\x12.game.AnswerResultH\x00\x12&\n\x05round\x18\x03 \x01(\x0b\x32\x15.game.RoundTransitionH\x00\x42\x07\n\x05\x65vent\"U\n\x0cMatchRequest\x12\x13\n\x0bplayer_name\x18\x01 \x01(\t\x12\x11\n\troom_size\x18\x02 \x01(\x05\x12\r\n\x05skill\x18\x03 \x01(\x05\x12\x0e\n\x06region\x18\x04 \x01(\t\"[\n\x0bMatchUpdate\x12\x0f\n\x07matched\x18\x01 \x01(\x08\x12\x17\n\x0fplayers_waiting\x18\x02 \x01(\x05\x12\x11\n\tplayer_id\x18\x03 \x01(\t\x12\x0f\n\x07game_id\x18\x04 \x01(\t\"\"\n\x0fShardMapRequest\x12\x0f\n\x07game_id\x18\x01 \x01(\t\".\n\tShardInfo\x12\x10\n\x08shard_id\x18\x01 \x01(\x05\x12\x0f\n\x07\x61\x64\x64ress\x18\x02 \x01(\t\"\x80\x01\n\x08ShardMap\x12\x1f\n\x06shards\x18\x01 \x03(\x0b\x32\x0f.game.ShardInfo\x12\x15\n\rvirtual_nodes\x18\x02 \x01(\x05\x12\x10\n\x08shard_id\x18\x03 \x01(\x05\x12\x12\n\nlive_games\x18\x04 \x01(\x05\x12\x16\n\x0eowner_shard_id\x18\x05 \x01(\x05\x32\xb8\x05\n\x0bGameService\x12\x31\n\x08JoinGame\x12\x11.game.JoinRequest\x1a\x12.game.JoinResponse\x12\x38\n\x0fGetNextQuestion\x12\x11.game.GameRequest\x1a\x12.game.QuestionCard\x12\x37\n\x0cSubmitAnswer\x12\x13.game.AnswerRequest\x1a\x12.game.AnswerResult\x12=\n\x0eGetLeaderboard\x12\x18.game.LeaderboardRequest\x1a\x11.game.Leaderboard\x12<\n\x11StreamLeaderboard\x12\x0c.game.GameId\x1a\x17.game.LeaderboardUpdate0\x01\x12;\n\x0bPlaySession\x12\x14.game.SessionRequest\x1a\x12.game.SessionEvent(\x01\x30\x01\x12\x37\n\x0cWatchSession\x12\x11.game.GameRequest\x1a\x12.game.SessionEvent0\x01\x12:\n\x0f\x45nqueueForMatch\x12\x12.game.MatchRequest\x1a\x11.game.MatchUpdate0\x01\x12G\n\x0fGetQuestionBank\x12\x19.game.QuestionBankRequest\x1a\x17.game.QuestionBankChunk0\x01\x12U\n\x1bStreamTournamentLeaderboard\x12\x17.game.TournamentRequest\x1a\x1b.game.TournamentLeaderboard0\x01\x12\x34\n\x0bGetShardMap\x12\x15.game.ShardMapRequest\x1a\x0e.game.ShardMapB\x08Z\x06gamepbb\x06proto3')
 
 _globals = globals()
 _builder.BuildMessageAndEnumDescriptors(DESCRIPTOR, _globals)
@@ -34,26 +34,54 @@ if not _descriptor._USE_C_DESCRIPTORS:
   _globals['DESCRIPTOR']._serialized_options = b'Z\006gamepb'
   _globals['_PLAYER']._serialized_start=20
   _globals['_PLAYER']._serialized_end=54
-  _globals['_JOINREQUEST']._serialized_start=56
-  _globals['_JOINREQUEST']._serialized_end=107
-  _globals['_JOINRESPONSE']._serialized_start=109
-  _globals['_JOINRESPONSE']._serialized_end=176
-  _globals['_GAMEREQUEST']._serialized_start=178
-  _globals['_GAMEREQUEST']._serialized_end=227
-  _globals['_QUESTIONCARD']._serialized_start=229
-  _globals['_QUESTIONCARD']._serialized_end=332
-  _globals['_ANSWERREQUEST']._serialized_start=334
-  _globals['_ANSWERREQUEST']._serialized_end=457
-  _globals['_ANSWERRESULT']._serialized_start=459
-  _globals['_ANSWERRESULT']._serialized_end=535
-  _globals['_GAMEID']._serialized_start=537
-  _globals['_GAMEID']._serialized_end=562
-  _globals['_LEADERBOARDENTRY']._serialized_start=564
-  _globals['_LEADERBOARDENTRY']._serialized_end=651
-  _globals['_LEADERBOARD']._serialized_start=653
-  _globals['_LEADERBOARD']._serialized_end=707
-  _globals['_LEADERBOARDUPDATE']._serialized_start=709
-  _globals['_LEADERBOARDUPDATE']._serialized_end=787
-  _globals['_GAMESERVICE']._serialized_start=790
-  _globals['_GAMESERVICE']._serialized_end=1082
+  _globals['_JOINREQUEST']._serialized_start=57
+  _globals['_JOINREQUEST']._serialized_end=223
+  _globals['_JOINRESPONSE']._serialized_start=225
+  _globals['_JOINRESPONSE']._serialized_end=292
+  _globals['_GAMEREQUEST']._serialized_start=294
+  _globals['_GAMEREQUEST']._serialized_end=365
+  _globals['_QUESTIONCARD']._serialized_start=368
+  _globals['_QUESTIONCARD']._serialized_end=513
+  _globals['_QUESTIONBANKREQUEST']._serialized_start=515
+  _globals['_QUESTIONBANKREQUEST']._serialized_end=610
+  _globals['_BANKQUESTION']._serialized_start=612
+  _globals['_BANKQUESTION']._serialized_end=725
+  _globals['_QUESTIONBANKCHUNK']._serialized_start=728
+  _globals['_QUESTIONBANKCHUNK']._serialized_end=866
+  _globals['_ANSWERREQUEST']._serialized_start=868
+  _globals['_ANSWERREQUEST']._serialized_end=991
+  _globals['_ANSWERRESULT']._serialized_start=993
+  _globals['_ANSWERRESULT']._serialized_end=1093
+  _globals['_GAMEID']._serialized_start=1095
+  _globals['_GAMEID']._serialized_end=1120
+  _globals['_LEADERBOARDREQUEST']._serialized_start=1122
+  _globals['_LEADERBOARDREQUEST']._serialized_end=1232
+  _globals['_LEADERBOARDENTRY']._serialized_start=1234
+  _globals['_LEADERBOARDENTRY']._serialized_end=1360
+  _globals['_LEADERBOARD']._serialized_start=1363
+  _globals['_LEADERBOARD']._serialized_end=1525
+  _globals['_LEADERBOARDUPDATE']._serialized_start=1528
+  _globals['_LEADERBOARDUPDATE']._serialized_end=1688
+  _globals['_TOURNAMENTREQUEST']._serialized_start=1690
+  _globals['_TOURNAMENTREQUEST']._serialized_end=1768
+  _globals['_TOURNAMENTLEADERBOARD']._serialized_start=1771
+  _globals['_TOURNAMENTLEADERBOARD']._serialized_end=1919
+  _globals['_SESSIONREQUEST']._serialized_start=1921
+  _globals['_SESSIONREQUEST']._serialized_end=2022
+  _globals['_ROUNDTRANSITION']._serialized_start=2024
+  _globals['_ROUNDTRANSITION']._serialized_end=2146
+  _globals['_SESSIONEVENT']._serialized_start=2149
+  _globals['_SESSIONEVENT']._serialized_end=2297
+  _globals['_MATCHREQUEST']._serialized_start=2299
+  _globals['_MATCHREQUEST']._serialized_end=2384
+  _globals['_MATCHUPDATE']._serialized_start=2386
+  _globals['_MATCHUPDATE']._serialized_end=2477
+  _globals['_SHARDMAPREQUEST']._serialized_start=2479
+  _globals['_SHARDMAPREQUEST']._serialized_end=2513
+  _globals['_SHARDINFO']._serialized_start=2515
+  _globals['_SHARDINFO']._serialized_end=2561
+  _globals['_SHARDMAP']._serialized_start=2564
+  _globals['_SHARDMAP']._serialized_end=2692
+  _globals['_GAMESERVICE']._serialized_start=2695
+  _globals['_GAMESERVICE']._serialized_end=3391
 # @@protoc_insertion_point(module_scope)
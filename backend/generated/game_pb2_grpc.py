@@ -52,7 +52,7 @@ class GameServiceStub(object):
                 _registered_method=True)
         self.GetLeaderboard = channel.unary_unary(
                 '/game.GameService/GetLeaderboard',
-                request_serializer=game__pb2.GameId.SerializeToString,
+                request_serializer=game__pb2.LeaderboardRequest.SerializeToString,
                 response_deserializer=game__pb2.Leaderboard.FromString,
                 _registered_method=True)
         self.StreamLeaderboard = channel.unary_stream(
@@ -60,6 +60,36 @@ class GameServiceStub(object):
                 request_serializer=game__pb2.GameId.SerializeToString,
                 response_deserializer=game__pb2.LeaderboardUpdate.FromString,
                 _registered_method=True)
+        self.PlaySession = channel.stream_stream(
+                '/game.GameService/PlaySession',
+                request_serializer=game__pb2.SessionRequest.SerializeToString,
+                response_deserializer=game__pb2.SessionEvent.FromString,
+                _registered_method=True)
+        self.WatchSession = channel.unary_stream(
+                '/game.GameService/WatchSession',
+                request_serializer=game__pb2.GameRequest.SerializeToString,
+                response_deserializer=game__pb2.SessionEvent.FromString,
+                _registered_method=True)
+        self.EnqueueForMatch = channel.unary_stream(
+                '/game.GameService/EnqueueForMatch',
+                request_serializer=game__pb2.MatchRequest.SerializeToString,
+                response_deserializer=game__pb2.MatchUpdate.FromString,
+                _registered_method=True)
+        self.GetQuestionBank = channel.unary_stream(
+                '/game.GameService/GetQuestionBank',
+                request_serializer=game__pb2.QuestionBankRequest.SerializeToString,
+                response_deserializer=game__pb2.QuestionBankChunk.FromString,
+                _registered_method=True)
+        self.StreamTournamentLeaderboard = channel.unary_stream(
+                '/game.GameService/StreamTournamentLeaderboard',
+                request_serializer=game__pb2.TournamentRequest.SerializeToString,
+                response_deserializer=game__pb2.TournamentLeaderboard.FromString,
+                _registered_method=True)
+        self.GetShardMap = channel.unary_unary(
+                '/game.GameService/GetShardMap',
+                request_serializer=game__pb2.ShardMapRequest.SerializeToString,
+                response_deserializer=game__pb2.ShardMap.FromString,
+                _registered_method=True)
 
 
 class GameServiceServicer(object):
@@ -88,7 +118,7 @@ class GameServiceServicer(object):
         raise NotImplementedError('Method not implemented!')
 
     def GetLeaderboard(self, request, context):
-        """Fetch leaderboard once
+        """Fetch leaderboard once, optionally one page of it and a player's rank
         """
         context.set_code(grpc.StatusCode.UNIMPLEMENTED)
         context.set_details('Method not implemented!')
@@ -101,6 +131,53 @@ class GameServiceServicer(object):
         context.set_details('Method not implemented!')
         raise NotImplementedError('Method not implemented!')
 
+    def PlaySession(self, request_iterator, context):
+        """Play a game over one stream: the client sends a join followed by answers,
+        the server pushes questions, answer results and round transitions
+        """
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def WatchSession(self, request, context):
+        """Server-push half of PlaySession for clients without bidirectional
+        streaming (grpc-web); answers are sent with SubmitAnswer
+        """
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def EnqueueForMatch(self, request, context):
+        """Wait in the matchmaking pool; the stream ends once the player has been
+        seated in a game
+        """
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def GetQuestionBank(self, request, context):
+        """Fetch the question bank, or a range of it, to cache on the client;
+        questions are then sent by reference to clients that name its version
+        """
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def StreamTournamentLeaderboard(self, request, context):
+        """Top players across every game of a tournament: the current board,
+        then the latest one whenever it changes, at most once per interval
+        """
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def GetShardMap(self, request, context):
+        """Admin: which worker owns which games when the server runs sharded
+        """
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
 
 def add_GameServiceServicer_to_server(servicer, server):
     rpc_method_handlers = {
@@ -121,7 +198,7 @@ def add_GameServiceServicer_to_server(servicer, server):
             ),
             'GetLeaderboard': grpc.unary_unary_rpc_method_handler(
                     servicer.GetLeaderboard,
-                    request_deserializer=game__pb2.GameId.FromString,
+                    request_deserializer=game__pb2.LeaderboardRequest.FromString,
                     response_serializer=game__pb2.Leaderboard.SerializeToString,
             ),
             'StreamLeaderboard': grpc.unary_stream_rpc_method_handler(
@@ -129,6 +206,36 @@ def add_GameServiceServicer_to_server(servicer, server):
                     request_deserializer=game__pb2.GameId.FromString,
                     response_serializer=game__pb2.LeaderboardUpdate.SerializeToString,
             ),
+            'PlaySession': grpc.stream_stream_rpc_method_handler(
+                    servicer.PlaySession,
+                    request_deserializer=game__pb2.SessionRequest.FromString,
+                    response_serializer=game__pb2.SessionEvent.SerializeToString,
+            ),
+            'WatchSession': grpc.unary_stream_rpc_method_handler(
+                    servicer.WatchSession,
+                    request_deserializer=game__pb2.GameRequest.FromString,
+                    response_serializer=game__pb2.SessionEvent.SerializeToString,
+            ),
+            'EnqueueForMatch': grpc.unary_stream_rpc_method_handler(
+                    servicer.EnqueueForMatch,
+                    request_deserializer=game__pb2.MatchRequest.FromString,
+                    response_serializer=game__pb2.MatchUpdate.SerializeToString,
+            ),
+            'GetQuestionBank': grpc.unary_stream_rpc_method_handler(
+                    servicer.GetQuestionBank,
+                    request_deserializer=game__pb2.QuestionBankRequest.FromString,
+                    response_serializer=game__pb2.QuestionBankChunk.SerializeToString,
+            ),
+            'StreamTournamentLeaderboard': grpc.unary_stream_rpc_method_handler(
+                    servicer.StreamTournamentLeaderboard,
+                    request_deserializer=game__pb2.TournamentRequest.FromString,
+                    response_serializer=game__pb2.TournamentLeaderboard.SerializeToString,
+            ),
+            'GetShardMap': grpc.unary_unary_rpc_method_handler(
+                    servicer.GetShardMap,
+                    request_deserializer=game__pb2.ShardMapRequest.FromString,
+                    response_serializer=game__pb2.ShardMap.SerializeToString,
+            ),
     }
     generic_handler = grpc.method_handlers_generic_handler(
             'game.GameService', rpc_method_handlers)
@@ -237,7 +344,7 @@ class GameService(object):
             request,
             target,
             '/game.GameService/GetLeaderboard',
-            game__pb2.GameId.SerializeToString,
+            game__pb2.LeaderboardRequest.SerializeToString,
             game__pb2.Leaderboard.FromString,
             options,
             channel_credentials,
@@ -275,3 +382,165 @@ class GameService(object):
             timeout,
             metadata,
             _registered_method=True)
+
+    @staticmethod
+    def PlaySession(request_iterator,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.stream_stream(
+            request_iterator,
+            target,
+            '/game.GameService/PlaySession',
+            game__pb2.SessionRequest.SerializeToString,
+            game__pb2.SessionEvent.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
+    @staticmethod
+    def WatchSession(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_stream(
+            request,
+            target,
+            '/game.GameService/WatchSession',
+            game__pb2.GameRequest.SerializeToString,
+            game__pb2.SessionEvent.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
+    @staticmethod
+    def EnqueueForMatch(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_stream(
+            request,
+            target,
+            '/game.GameService/EnqueueForMatch',
+            game__pb2.MatchRequest.SerializeToString,
+            game__pb2.MatchUpdate.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
+    @staticmethod
+    def GetQuestionBank(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_stream(
+            request,
+            target,
+            '/game.GameService/GetQuestionBank',
+            game__pb2.QuestionBankRequest.SerializeToString,
+            game__pb2.QuestionBankChunk.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
+    @staticmethod
+    def StreamTournamentLeaderboard(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_stream(
+            request,
+            target,
+            '/game.GameService/StreamTournamentLeaderboard',
+            game__pb2.TournamentRequest.SerializeToString,
+            game__pb2.TournamentLeaderboard.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
+    @staticmethod
+    def GetShardMap(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(
+            request,
+            target,
+            '/game.GameService/GetShardMap',
+            game__pb2.ShardMapRequest.SerializeToString,
+            game__pb2.ShardMap.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
@@ -1,5 +1,53 @@
-import asyncio
-from game.server import serve
+import argparse
+from game.admission import AdmissionControl
+from game.runtime import LOOPS, Runtime
+from game.server import serve, serve_sharded
 
 if __name__ == "__main__":
-    asyncio.run(serve())
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--port", type=int, default=50055)
+    parser.add_argument("--shards", type=int, default=1,
+                        help="worker processes; each owns a consistent-hash share of the games")
+    store = parser.add_mutually_exclusive_group()
+    store.add_argument("--store", metavar="PATH",
+                       help="keep games in this SQLite file (one per shard) and restore them on start")
+    store.add_argument("--event-log", metavar="DIR",
+                       help="keep games in an append-only event log with snapshots and restore them on start")
+    parser.add_argument("--metrics-port", type=int, default=8000,
+                        help="Prometheus metrics port (one per shard, counting up); 0 turns it off")
+    parser.add_argument("--gateway-port", type=int,
+                        help="also serve gRPC-Web and WebSocket clients on this port, replacing the proxy")
+    parser.add_argument("--record", metavar="PATH",
+                        help="write every call received to a traffic trace for benchmarks.replay")
+    parser.add_argument("--loop", choices=LOOPS, default="auto",
+                        help="event loop; auto uses uvloop when it is installed")
+    parser.add_argument("--io-threads", type=int,
+                        help="threads for blocking work such as loading and persistence")
+    parser.add_argument("--max-concurrent-rpcs", type=int,
+                        help="RPCs handled at once per worker; more are rejected with RESOURCE_EXHAUSTED")
+    parser.add_argument("--max-streams", type=int, help="concurrent streams per client connection")
+    parser.add_argument("--optimization-target", choices=("latency", "throughput", "blend"))
+    admission_args = parser.add_argument_group("admission control", "limits per worker; rejected calls get "
+                                               "RESOURCE_EXHAUSTED with a retry-after-ms trailer")
+    admission_args.add_argument("--stream-limit", type=int, help="concurrent streaming calls")
+    admission_args.add_argument("--player-rate", type=float, help="calls per second per player, bursts of twice that")
+    admission_args.add_argument("--game-rate", type=float, help="calls per second per game, bursts of twice that")
+    admission_args.add_argument("--join-rate", type=float, help="JoinGame and EnqueueForMatch calls per second")
+    admission_args.add_argument("--max-loop-lag-ms", type=float,
+                                help="shed calls other than SubmitAnswer and GetNextQuestion while the loop lags this much")
+    args = parser.parse_args()
+    metrics_port = args.metrics_port or None
+    runtime = Runtime(args.loop, args.io_threads, args.max_concurrent_rpcs, args.max_streams,
+                      args.optimization_target)
+    limits = (args.stream_limit, args.player_rate, args.game_rate, args.join_rate, args.max_loop_lag_ms)
+    admission = None
+    if any(limit is not None for limit in limits):
+        admission = AdmissionControl(args.stream_limit, args.player_rate, args.game_rate, args.join_rate,
+                                     args.max_loop_lag_ms / 1000 if args.max_loop_lag_ms is not None else None)
+    if args.shards > 1:
+        serve_sharded(args.shards, args.port, args.store, metrics_port, runtime, args.event_log,
+                      args.gateway_port, admission, args.record)
+    else:
+        runtime.run(serve(args.port, store_path=args.store, metrics_port=metrics_port, runtime=runtime,
+                          event_log=args.event_log, gateway_port=args.gateway_port, admission=admission,
+                          record=args.record))
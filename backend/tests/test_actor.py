@@ -0,0 +1,136 @@
+import asyncio
+import random
+
+import grpc
+import pytest
+
+from game.game_logic import _TIMEOUT, GameServiceImpl
+from game.questions import QuestionBank
+from game.store import GameStore
+from generated import game_pb2
+
+
+class _Context:
+    def set_code(self, code):
+        raise AssertionError(f"unexpected status {code}")
+
+    def set_details(self, details):
+        pass
+
+
+class _RecordingContext:
+    code = None
+
+    def set_code(self, code):
+        self.code = code
+
+    def set_details(self, details):
+        pass
+
+
+class _FailingStore(GameStore):
+    """Fails to log answers from one player."""
+
+    def __init__(self):
+        self.player_id = None
+
+    def answer_recorded(self, game, slot, selected_option, correct):
+        if slot.player_id == self.player_id:
+            raise ValueError("cannot encode answer")
+
+
+def _records(count):
+    return [{"question_id": f"q{i}", "question_text": f"Question {i}?", "options": ["a", "b", "c", "d"],
+             "correct_option": "a", "explanation": ""} for i in range(count)]
+
+
+async def _round(service, game, player_ids, rng, duplicates, timeout):
+    """Answer one round with every player several times over, some naming
+    the round before, and maybe a timeout racing the answers; returns the
+    requests and their results."""
+    round_index = game.current_question_index
+    question = game.question(round_index)
+    previous = game.question(round_index - 1).question_id if round_index else ""
+    calls = [game_pb2.AnswerRequest(
+        game_id=game.game_id, player_id=player_id,
+        question_id=previous if previous and rng.random() < 0.1 else question.question_id,
+        selected_option=rng.choice(question.options))
+        for player_id in player_ids for _ in range(duplicates)]
+    rng.shuffle(calls)
+    context = _Context()
+    submissions = [service.SubmitAnswer(request, context) for request in calls]
+    if timeout:
+        submissions.insert(rng.randrange(len(submissions) + 1), _fire_timeout(game, round_index))
+    results = [result for result in await asyncio.gather(*submissions) if result is not None]
+    return calls, results
+
+
+async def _fire_timeout(game, round_index):
+    game.actor.tell((_TIMEOUT, round_index))
+
+
+@pytest.mark.parametrize("seed", range(4))
+def test_concurrent_answers_advance_each_round_once(seed):
+    async def run():
+        rng = random.Random(seed)
+        service = GameServiceImpl()
+        service.question_bank = QuestionBank(records=_records(10))
+        context = _Context()
+        games = []
+        for _ in range(5):
+            first = await service.JoinGame(game_pb2.JoinRequest(player_name="p0", question_count=4), context)
+            game = service.games[first.game_id]
+            player_ids = [first.player_id] + [
+                (await service.JoinGame(game_pb2.JoinRequest(player_name=f"p{i}", game_id=game.game_id),
+                                        context)).player_id
+                for i in range(1, 30)]
+            events = asyncio.Queue()
+            game.session_listeners.append(events)
+            games.append((game, player_ids, events, [0] * len(player_ids)))
+
+        for _ in range(4):
+            rounds = await asyncio.gather(*(
+                _round(service, game, player_ids, rng, duplicates=20, timeout=rng.random() < 0.5)
+                for game, player_ids, _, _ in games))
+            for (game, _, _, expected), (calls, results) in zip(games, rounds):
+                for request, result in zip(calls, results):
+                    expected[game.players[request.player_id].index] += result.points_awarded
+        return games
+
+    for game, _, events, expected in asyncio.run(run()):
+        transitions = []
+        while not events.empty():
+            event = events.get_nowait()
+            if isinstance(event, game_pb2.SessionEvent) and event.WhichOneof("event") == "round":
+                transitions.append(event.round.completed_round)
+        assert game.completed
+        assert transitions == [0, 1, 2, 3]
+        assert list(game.scores) == expected
+
+
+def test_failed_answer_does_not_strand_the_rest_of_its_batch():
+    async def run():
+        service = GameServiceImpl()
+        service.question_bank = QuestionBank(records=_records(4))
+        service.store = store = _FailingStore()
+        asyncio.get_running_loop().set_exception_handler(lambda loop, context: None)
+        first = await service.JoinGame(game_pb2.JoinRequest(player_name="p0", question_count=2), _Context())
+        game = service.games[first.game_id]
+        player_ids = [first.player_id] + [
+            (await service.JoinGame(game_pb2.JoinRequest(player_name=f"p{i}", game_id=game.game_id),
+                                    _Context())).player_id
+            for i in range(1, 4)]
+        store.player_id = player_ids[1]
+        question = game.question(0)
+        contexts = [_RecordingContext() for _ in player_ids]
+        # All four answers land in one batch; the second fails to apply.
+        results = await asyncio.wait_for(asyncio.gather(*(
+            service.SubmitAnswer(game_pb2.AnswerRequest(
+                game_id=game.game_id, player_id=player_id, question_id=question.question_id,
+                selected_option="a"), context)
+            for player_id, context in zip(player_ids, contexts))), timeout=5)
+        return results, contexts
+
+    results, contexts = asyncio.run(run())
+    assert [context.code for context in contexts] == [None, grpc.StatusCode.INTERNAL, None, None]
+    assert [result.correct for result in results] == [True, False, True, True]
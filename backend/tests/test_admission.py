@@ -0,0 +1,149 @@
+import asyncio
+
+import grpc
+
+from game.admission import AdmissionControl
+from game.client import GameClient, retry_after
+from game.game_logic import GameServiceImpl
+from game.runtime import Runtime
+from game.server import add_game_service
+from generated import game_pb2
+
+
+async def _serve(admission):
+    service = GameServiceImpl()
+    server = Runtime().server(interceptors=[admission])
+    add_game_service(service, server)
+    port = server.add_insecure_port("127.0.0.1:0")
+    service.start()
+    admission.start()
+    await server.start()
+    return server, f"127.0.0.1:{port}"
+
+
+def test_session_answers_over_the_rate_get_a_retry_hint():
+    async def run():
+        admission = AdmissionControl(player_rate=1.0)  # bursts of 2
+        server, target = await _serve(admission)
+        try:
+            async with GameClient(target) as client:
+                player = await client.join("p", question_count=1)
+                await client.join("q", player.game_id)  # keeps the round open
+                requests = asyncio.Queue()
+
+                async def messages():
+                    yield game_pb2.SessionRequest(join=game_pb2.GameRequest(
+                        game_id=player.game_id, player_id=player.player_id))
+                    while (message := await requests.get()) is not None:
+                        yield message
+
+                stream = client.pool.stub().PlaySession(messages())
+                results = []
+                async for event in stream:
+                    if event.WhichOneof("event") == "question":
+                        for _ in range(3):
+                            requests.put_nowait(game_pb2.SessionRequest(answer=game_pb2.AnswerRequest(
+                                question_id=event.question.question_id, selected_option="x")))
+                    elif event.WhichOneof("event") == "answer_result":
+                        results.append(event.answer_result)
+                        if len(results) == 3:
+                            break
+                stream.cancel()
+                requests.put_nowait(None)
+        finally:
+            admission.stop()
+            await server.stop(0)
+        return results, admission.answers_refused
+
+    results, refused = asyncio.run(run())
+    # The join took one token and the first answer the other.
+    assert refused == 2
+    graded = [result for result in results if not result.retry_after_ms]
+    hinted = [result for result in results if result.retry_after_ms]
+    assert len(graded) == 1 and len(hinted) == 2
+    assert all(0 < result.retry_after_ms <= 1000 for result in hinted)
+
+
+def test_play_resends_refused_answers():
+    async def run():
+        admission = AdmissionControl(player_rate=1.0)
+        server, target = await _serve(admission)
+        try:
+            async with GameClient(target) as client:
+                player = await client.join("p", question_count=2)
+                return await player.play(lambda question: question.options[0]), admission.answers_refused
+        finally:
+            admission.stop()
+            await server.stop(0)
+
+    results, refused = asyncio.run(run())
+    assert refused >= 1  # the second round's answer comes before a token is free
+    assert len(results) == 2 and not any(result.retry_after_ms for result in results)
+
+
+def test_abusive_client_is_throttled_while_games_play_on():
+    async def run():
+        admission = AdmissionControl(player_rate=10.0, join_rate=50.0)
+        server, target = await _serve(admission)
+        refused = []
+        served = 0
+        failures = []
+        answer_latencies = []
+        try:
+            async with GameClient(target) as client, GameClient(target, admission_retries=0) as abuser:
+                rooms = []
+                for room in range(4):
+                    first = await client.join(f"r{room}p0", question_count=2)
+                    rooms.append([first] + [await client.join(f"r{room}p{i}", first.game_id) for i in range(1, 4)])
+                poller = await abuser.join("poller")
+                stop = asyncio.Event()
+
+                async def call(coroutine):
+                    nonlocal served
+                    try:
+                        await coroutine
+                        served += 1
+                    except grpc.aio.AioRpcError as error:
+                        assert error.code() == grpc.StatusCode.RESOURCE_EXHAUSTED
+                        refused.append(retry_after(error))
+
+                async def poll():
+                    while not stop.is_set():
+                        await call(poller.next_question())
+                        await call(poller.leaderboard())
+
+                async def storm():
+                    while not stop.is_set():
+                        await call(abuser.join("storm"))
+
+                async def play(player):
+                    loop = asyncio.get_running_loop()
+                    try:
+                        async with player.session() as session:
+                            async for event in session:
+                                kind = event.WhichOneof("event")
+                                if kind == "question":
+                                    await asyncio.sleep(0.2)
+                                    sent = loop.time()
+                                    session.answer(event.question.options[0], event.question.question_id)
+                                elif kind == "answer_result":
+                                    answer_latencies.append(loop.time() - sent)
+                                    await player.leaderboard(limit=10)
+                    except grpc.aio.AioRpcError as error:
+                        failures.append(error.code().name)
+
+                abuse = [asyncio.create_task(task()) for task in (poll, poll, storm, storm)]
+                await asyncio.gather(*(play(player) for room in rooms for player in room))
+                stop.set()
+                await asyncio.gather(*abuse)
+        finally:
+            admission.stop()
+            await server.stop(0)
+        return served, refused, failures, answer_latencies
+
+    served, refused, failures, latencies = asyncio.run(run())
+    assert not failures
+    assert len(latencies) == 4 * 4 * 2  # every player answered both rounds
+    assert max(latencies) < 1.0
+    assert served and refused
+    assert all(hint is not None and hint > 0 for hint in refused)
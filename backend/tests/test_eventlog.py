@@ -0,0 +1,98 @@
+import asyncio
+import time
+
+from game.eventlog import EventLogStore
+from game.game_logic import GameServiceImpl
+from game.lifecycle import GameLifecycle
+from generated import game_pb2
+
+
+def _fingerprint(games):
+    return {
+        game_id: (game.current_question_index, game.completed, game.answered,
+                  [(slot.player_id, slot.name) for slot in game.slots], list(game.scores))
+        for game_id, game in games.items()
+    }
+
+
+async def _seat(service, players):
+    joined = await service.JoinGame(game_pb2.JoinRequest(player_name="p0"), None)
+    seats = [joined]
+    for p in range(1, players):
+        seats.append(await service.JoinGame(game_pb2.JoinRequest(player_name=f"p{p}", game_id=joined.game_id), None))
+    return seats
+
+
+async def _answer(service, seats):
+    await asyncio.gather(*(
+        service.SubmitAnswer(game_pb2.AnswerRequest(game_id=s.game_id, player_id=s.player_id, selected_option="x"), None)
+        for s in seats))
+
+
+def _restart(directory):
+    return GameServiceImpl(store=EventLogStore(directory), lifecycle=GameLifecycle(max_live_games=None))
+
+
+async def _play(directory):
+    """Finish and reap some games, then leave others mid-round; returns
+    the service, its store and the live games' seats, without closing."""
+    store = EventLogStore(directory, snapshot_interval=float("inf"), snapshot_records=float("inf"))
+    lifecycle = GameLifecycle(max_live_games=None)
+    service = GameServiceImpl(store=store, lifecycle=lifecycle)
+    for _ in range(3):
+        seats = await _seat(service, 4)
+        for _ in range(service.games[seats[0].game_id].total_rounds):
+            await _answer(service, seats)
+    service._reap_expired(time.monotonic() + lifecycle.idle_ttl + 1)
+
+    live = [await _seat(service, 4) for _ in range(5)]
+    for seats in live:
+        await _answer(service, seats)  # round 0 done
+        await _answer(service, seats[:2])  # round 1 half answered
+    await service.JoinGame(game_pb2.JoinRequest(player_name="late", game_id=live[0][0].game_id), None)
+    await store.flush()
+    return service, store, live
+
+
+def test_replay_after_crash_restores_live_games(tmp_path):
+    async def run():
+        service, store, _ = await _play(str(tmp_path))
+        # Crash: nothing is closed, and a torn record trails the log.
+        with open(store._segment_path(store._segment), "ab") as f:
+            f.write(b"\x40\x00\x00\x00torn")
+        return _fingerprint(service.games)
+
+    expected = asyncio.run(run())
+    assert len(expected) == 5
+    assert _fingerprint(_restart(str(tmp_path)).games) == expected
+
+
+def test_snapshot_plus_tail_restores_live_games(tmp_path):
+    async def run():
+        service, store, live = await _play(str(tmp_path))
+        await store.snapshot()
+        for seats in live[:2]:
+            await _answer(service, seats[2:])  # a tail after the snapshot
+        await store.flush()
+        return _fingerprint(service.games), store.snapshots
+
+    expected, snapshots = asyncio.run(run())
+    assert snapshots == 1
+    assert _fingerprint(_restart(str(tmp_path)).games) == expected
+
+
+def test_replay_keeps_answers_past_the_u16_player_index(tmp_path):
+    async def run():
+        store = EventLogStore(str(tmp_path))
+        service = GameServiceImpl(store=store, lifecycle=GameLifecycle(max_live_games=None))
+        seats = await _seat(service, 1)
+        game = service.games[seats[0].game_id]
+        for p in range(1, 70_000):
+            store.player_joined(game, game.add_player(f"id{p}", f"p{p}"))
+        slot = game.slots[-1]
+        await _answer(service, [game_pb2.JoinResponse(game_id=game.game_id, player_id=slot.player_id)])
+        await store.close()
+        return _fingerprint(service.games)
+
+    expected = asyncio.run(run())
+    assert _fingerprint(_restart(str(tmp_path)).games) == expected
@@ -0,0 +1,40 @@
+import asyncio
+
+import pytest
+
+from game.game_logic import GameServiceImpl
+from game.gateway import MAX_MESSAGE, Gateway
+from game.server import game_method_handlers
+
+_PATH = b"/game.GameService/GetLeaderboard"
+
+
+async def _status_line(port, request):
+    reader, writer = await asyncio.open_connection("127.0.0.1", port)
+    writer.write(request)
+    line = await asyncio.wait_for(reader.readline(), 5)
+    rest = await asyncio.wait_for(reader.read(), 5)  # the gateway closes the connection
+    writer.close()
+    return line, rest
+
+
+@pytest.mark.parametrize("length, status", [
+    (str(2 * MAX_MESSAGE).encode(), b"413"),
+    (b"-1", b"400"),
+    (b"ten", b"400"),
+])
+def test_gateway_refuses_bad_content_length(length, status):
+    async def run():
+        gateway = Gateway(game_method_handlers(GameServiceImpl()))
+        server = await gateway.start(0, host="127.0.0.1")
+        port = server.sockets[0].getsockname()[1]
+        try:
+            return await _status_line(port, b"POST " + _PATH + b" HTTP/1.1\r\nHost: x\r\n"
+                                      b"Content-Type: application/grpc-web+proto\r\n"
+                                      b"Content-Length: " + length + b"\r\n\r\n")
+        finally:
+            await gateway.close()
+
+    line, rest = asyncio.run(run())
+    assert line.split()[1] == status
+    assert rest.endswith(b"\r\n\r\n")
@@ -0,0 +1,179 @@
+import asyncio
+import random
+
+import pytest
+
+from game import leaderboard
+from game.fanout import Subscription
+from game.game_logic import GameServiceImpl
+from game.leaderboard import LeaderboardReplica, RankedLeaderboard
+from generated import game_pb2
+
+
+@pytest.mark.parametrize("load", [2, 8, leaderboard._LOAD])
+def test_ranking_matches_a_full_sort(monkeypatch, load):
+    monkeypatch.setattr(leaderboard, "_LOAD", load)
+    rng = random.Random(load)
+    board = RankedLeaderboard()
+    for _ in range(3000):
+        if len(board) < 5 or rng.random() < 0.2:
+            board.add(rng.choice((0, 0, 10, 20)))
+        else:
+            index = rng.randrange(len(board))
+            board.update(index, rng.choice((0, board.score(index) + 10, board.score(index) - 10)))
+
+    expected = sorted(range(len(board)), key=lambda index: (-board.score(index), index))
+    assert [index for _, index, _ in board.page()] == expected
+    assert [board.rank(index) for index in expected] == list(range(1, len(board) + 1))
+    for offset, limit in ((0, 10), (17, 25), (len(board) - 3, 10), (len(board), 5), (40, 0)):
+        page = list(board.page(offset, limit))
+        want = expected[offset:offset + limit] if limit else expected[offset:]
+        assert [index for _, index, _ in page] == want
+        assert [rank for rank, _, _ in page] == list(range(offset + 1, offset + 1 + len(want)))
+
+
+async def _listen(service, game_id, stall=None, resume=None):
+    """Follow StreamLeaderboard into a replica; returns it and how many
+    full boards arrived. With stall, stop reading at that sequence until
+    resume is set."""
+    board = LeaderboardReplica()
+    full = 0
+    async for update in service.StreamLeaderboard(game_pb2.GameId(game_id=game_id), None):
+        if isinstance(update, bytes):
+            update = game_pb2.LeaderboardUpdate.FromString(update)
+        else:
+            full += 1
+        assert board.apply(update), "gap in the delta sequence"
+        if stall is not None and board.sequence >= stall:
+            stall = None
+            await resume.wait()
+        if board.game_over:
+            return board, full
+
+
+def test_stream_deltas_keep_every_replica_current():
+    async def run():
+        rng = random.Random(1)
+        service = GameServiceImpl()
+        first = await service.JoinGame(game_pb2.JoinRequest(player_name="p0", question_count=3), None)
+        game = service.games[first.game_id]
+        seats = [first] + [
+            await service.JoinGame(game_pb2.JoinRequest(player_name=f"p{i}", game_id=first.game_id), None)
+            for i in range(1, 100)]
+        resume = asyncio.Event()
+        # One listener stops reading long enough to fall more than a
+        # subscription's max_pending updates behind.
+        stalled = asyncio.create_task(_listen(service, game.game_id, stall=game.leaderboard_hub.sequence + 1,
+                                              resume=resume))
+        listeners = [asyncio.create_task(_listen(service, game.game_id)) for _ in range(5)]
+        await asyncio.sleep(0)
+        for round_index in range(game.total_rounds):
+            question = game.question(round_index)
+            for seat in rng.sample(seats, len(seats)):
+                await service.SubmitAnswer(game_pb2.AnswerRequest(
+                    game_id=game.game_id, player_id=seat.player_id,
+                    selected_option=question.correct_option if rng.random() < 0.8 else "x"), None)
+            resume.set()
+        results = await asyncio.gather(stalled, *listeners)
+        expected = [(rank, game.slots[index].player_id, game.slots[index].name, score)
+                    for rank, index, score in game.ranking.page()]
+        return results, expected
+
+    results, expected = asyncio.run(run())
+    for board, _ in results:
+        assert board.rows() == expected
+    assert results[0][1] == 2  # the stalled listener was resynced once
+    assert all(full == 1 for _, full in results[1:])
+
+
+def test_subscription_resyncs_a_reader_past_max_pending():
+    async def run():
+        subscription = Subscription(max_pending=64)
+        for i in range(64):
+            subscription.offer(b"%d" % i, False)
+        kept = await subscription.get()
+        for i in range(65):
+            subscription.offer(b"%d" % i, False)
+        dropped = await subscription.get()
+        subscription.offer(b"next", True)
+        return kept, dropped, await subscription.get()
+
+    kept, dropped, resumed = asyncio.run(run())
+    assert kept == ([b"%d" % i for i in range(64)], False)
+    assert dropped == (None, False)
+    assert resumed == ([b"next"], True)
+
+
+def test_replica_rejects_updates_out_of_sequence():
+    entry = game_pb2.LeaderboardEntry(player_id="a", player_name="A", score=10, rank=1, player_index=0)
+    full = game_pb2.LeaderboardUpdate(sequence=4, leaderboard=game_pb2.Leaderboard(entries=[entry]))
+    replica = LeaderboardReplica()
+    assert not replica.apply(game_pb2.LeaderboardUpdate(sequence=5, changes=[entry]))  # no board yet
+    assert replica.apply(full)
+    assert not replica.apply(game_pb2.LeaderboardUpdate(sequence=6, changes=[entry]))  # 5 is missing
+    assert not replica.apply(game_pb2.LeaderboardUpdate(sequence=4, changes=[entry]))  # already applied
+    assert replica.rows() == [(1, "a", "A", 10)]
+    moved = game_pb2.LeaderboardEntry(player_id="b", player_name="B", score=20, rank=1, player_index=1)
+    assert replica.apply(game_pb2.LeaderboardUpdate(sequence=5, changes=[moved]))
+    assert replica.rows() == [(1, "b", "B", 20), (2, "a", "A", 10)]
+
+
+async def _room(players):
+    service = GameServiceImpl()
+    first = await service.JoinGame(game_pb2.JoinRequest(player_name="p0"), None)
+    seats = [first] + [
+        await service.JoinGame(game_pb2.JoinRequest(player_name=f"p{i}", game_id=first.game_id), None)
+        for i in range(1, players)]
+    return service, service.games[first.game_id], seats
+
+
+async def _score(service, game, seat):
+    await service.SubmitAnswer(game_pb2.AnswerRequest(
+        game_id=game.game_id, player_id=seat.player_id, selected_option=game.question(0).correct_option), None)
+
+
+def test_refreshes_share_one_page_per_version():
+    async def run():
+        service, game, seats = await _room(50)
+        for seat in seats[::3]:
+            await _score(service, game, seat)
+        builds = service.leaderboard_builds
+        replies = [game_pb2.Leaderboard.FromString(await service.GetLeaderboard(
+            game_pb2.LeaderboardRequest(game_id=game.game_id, player_id=seat.player_id), None)) for seat in seats]
+        built = service.leaderboard_builds - builds
+
+        expected = []
+        for seat in seats:
+            leaderboard = service._build_leaderboard(game, offset=0, limit=0)
+            leaderboard.version = game.leaderboard_hub.sequence
+            leaderboard.player_entry.CopyFrom(service._leaderboard_entry(game, game.players[seat.player_id]))
+            expected.append(leaderboard)
+
+        await _score(service, game, seats[1])  # a score change invalidates the page
+        changed = game_pb2.Leaderboard.FromString(await service.GetLeaderboard(
+            game_pb2.LeaderboardRequest(game_id=game.game_id), None))
+        scores = {entry.player_id: entry.score for entry in changed.entries}
+        return replies, expected, built, changed, service.leaderboard_builds - builds, scores[seats[1].player_id]
+
+    replies, expected, built, changed, total, rescored = asyncio.run(run())
+    assert replies == expected
+    assert built == 1
+    assert total == 2 and changed.version == replies[0].version + 1
+    assert rescored == 10
+
+
+def test_known_version_gets_not_modified():
+    async def run():
+        service, game, seats = await _room(10)
+        await _score(service, game, seats[0])
+        version = game.leaderboard_hub.sequence
+        request = game_pb2.LeaderboardRequest(game_id=game.game_id, known_version=version)
+        current = await service.GetLeaderboard(request, None)
+        await _score(service, game, seats[1])
+        stale = await service.GetLeaderboard(request, None)
+        return version, current, game_pb2.Leaderboard.FromString(stale), game.leaderboard_hub.sequence
+
+    version, current, stale, latest = asyncio.run(run())
+    assert current == game_pb2.Leaderboard(version=version, not_modified=True)
+    assert not stale.not_modified and stale.version == latest > version
+    assert [entry.score for entry in stale.entries[:2]] == [10, 10]
@@ -0,0 +1,36 @@
+from game.lifecycle import COMPLETED, GameLifecycle
+from game.state import Game
+
+
+def test_completed_game_is_reaped_after_completed_ttl():
+    lifecycle = GameLifecycle(completed_ttl=120.0, idle_ttl=900.0)
+    games = {"g": Game("g", None, [])}
+    lifecycle.created("g", games["g"], now=0.0)
+    lifecycle.completed(games["g"], now=10.0)
+    assert games["g"].state == COMPLETED
+
+    assert lifecycle.expired(games, now=129.0) == []
+    assert lifecycle.expired(games, now=130.0) == ["g"]
+
+
+def test_activity_pushes_idle_deadline_back():
+    lifecycle = GameLifecycle(idle_ttl=900.0)
+    games = {"g": Game("g", None, [])}
+    lifecycle.created("g", games["g"], now=0.0)
+    lifecycle.touch(games["g"], now=500.0)
+
+    assert lifecycle.expired(games, now=900.0) == []
+    assert lifecycle.expired(games, now=1400.0) == ["g"]
+
+
+def test_game_finishing_near_its_idle_timeout_is_reaped_once():
+    lifecycle = GameLifecycle(completed_ttl=120.0, idle_ttl=900.0)
+    games = {"g": Game("g", None, [])}
+    lifecycle.created("g", games["g"], now=0.0)
+    lifecycle.touch(games["g"], now=70.0)
+    lifecycle.completed(games["g"], now=850.0)
+
+    # The idle entry comes up at 900 and the completed one at 970.
+    assert lifecycle.expired(games, now=900.0) == []
+    assert lifecycle.expired(games, now=971.0) == ["g"]
+    assert lifecycle.expired(games, now=2000.0) == []
@@ -0,0 +1,57 @@
+import asyncio
+import time
+
+from game.matchmaker import Matchmaker
+
+
+def _run(test):
+    async def run():
+        return test()
+    return asyncio.run(run())
+
+
+def test_unknown_regions_share_one_pool():
+    def test():
+        matchmaker = Matchmaker()
+        tickets = [matchmaker.enqueue(f"p{i}", room_size=2, region=f"region-{i}") for i in range(1000)]
+        eu = matchmaker.enqueue("e", room_size=2, region=" EU ")
+        return matchmaker, tickets, eu
+
+    matchmaker, tickets, eu = _run(test)
+    assert {ticket.bucket.key for ticket in tickets} == {(2, 0, "any")}
+    assert eu.bucket.key == (2, 0, "eu")
+    assert len(matchmaker._buckets) == 2
+
+
+def test_overdue_buckets_get_smaller_rooms_in_wait_order():
+    def test():
+        matchmaker = Matchmaker(max_wait_seconds=10.0, regions=[f"r{i}" for i in range(100)])
+        start = time.monotonic()
+        # Two players in each of 100 region buckets, none of them full.
+        waiting = [[matchmaker.enqueue(f"p{i}{j}", room_size=4, region=f"r{i}") for j in range(2)]
+                   for i in range(100)]
+        early = matchmaker.form_rooms(now=start + 5.0)
+        scheduled = len(matchmaker._overdue)
+        # The first bucket's oldest player leaves and another joins.
+        matchmaker.cancel(waiting[0][0])
+        matchmaker.enqueue("late", room_size=4, region="r0")
+        late = matchmaker.form_rooms(now=start + 11.0)
+        return early, scheduled, late, matchmaker
+
+    early, scheduled, late, matchmaker = _run(test)
+    assert early == [] and scheduled == 100
+    assert [[ticket.player_name for ticket in room] for room in late] == \
+        [["p01", "late"]] + [[f"p{i}0", f"p{i}1"] for i in range(1, 100)]
+    assert matchmaker.waiting == 0 and not matchmaker._buckets and not matchmaker._overdue
+
+
+def test_full_rooms_are_formed_before_the_wait():
+    def test():
+        matchmaker = Matchmaker()
+        tickets = [matchmaker.enqueue(f"p{i}", room_size=4, skill=150) for i in range(9)]
+        rooms = matchmaker.form_rooms()
+        return tickets, rooms, matchmaker
+
+    tickets, rooms, matchmaker = _run(test)
+    assert rooms == [tickets[0:4], tickets[4:8]]
+    assert matchmaker.waiting == 1 and matchmaker.waiting_in(tickets[8]) == 1
@@ -0,0 +1,120 @@
+import asyncio
+
+import grpc
+import pytest
+
+from game.client import QuestionCache
+from game.game_logic import GameServiceImpl
+from game.questions import QuestionBank
+from generated import game_pb2
+
+
+class _Context:
+    code = None
+
+    def set_code(self, code):
+        self.code = code
+
+    def set_details(self, details):
+        self.details = details
+
+
+def test_sample_clamps_count():
+    bank = QuestionBank()
+    assert len(bank.sample(-3)) == 0
+    assert len(bank.sample(len(bank) + 5)) == len(bank)
+
+
+def test_join_rejects_negative_question_count():
+    context = _Context()
+    service = GameServiceImpl()
+    response = asyncio.run(service.JoinGame(game_pb2.JoinRequest(player_name="p", question_count=-1), context))
+    assert context.code == grpc.StatusCode.INVALID_ARGUMENT
+    assert not response.game_id and not service.games
+
+
+def test_join_rejects_overlong_player_name():
+    context = _Context()
+    service = GameServiceImpl()
+    response = asyncio.run(service.JoinGame(game_pb2.JoinRequest(player_name="p" * 65), context))
+    assert context.code == grpc.StatusCode.INVALID_ARGUMENT
+    assert not response.game_id and not service.games
+
+
+def test_decoded_questions_and_id_lookups_are_bounded():
+    records = [{"question_id": f"q{i}", "question_text": f"Question {i}?", "options": ["a", "b"],
+                "correct_option": "a", "explanation": ""} for i in range(50)]
+    bank = QuestionBank(records=records, cache_size=8)
+    assert [bank[i].question_id for i in range(50)] == [f"q{i}" for i in range(50)]
+    assert [bank.index_of(f"q{i}") for i in range(50)] == list(range(50))
+    assert bank.index_of("missing") is None
+    assert bank._decoded.cache_info().currsize == 8
+    assert bank._ids.cache_info().currsize == 8
+
+
+def _records(count):
+    return [{"question_id": f"q{i}", "question_text": f"Question {i}?", "options": ["a", "b", "c", "d"],
+             "correct_option": "a", "explanation": ""} for i in range(count)]
+
+
+class _BankStub:
+    """Calls GetQuestionBank in-process."""
+
+    def __init__(self, service):
+        self.service = service
+
+    async def GetQuestionBank(self, request, timeout=None):
+        async for chunk in self.service.GetQuestionBank(request, None):
+            yield game_pb2.QuestionBankChunk.FromString(chunk) if isinstance(chunk, bytes) else chunk
+
+
+async def _watch(service, seat, bank_version):
+    cards = []
+    request = game_pb2.GameRequest(game_id=seat.game_id, player_id=seat.player_id, bank_version=bank_version)
+    async for event in service.WatchSession(request, None):
+        if isinstance(event, bytes):
+            event = game_pb2.SessionEvent.FromString(event)
+        if event.WhichOneof("event") == "question":
+            cards.append(event.question)
+        elif event.round.game_over:
+            return cards
+
+
+def test_question_references_resolve_to_full_cards():
+    async def run():
+        service = GameServiceImpl()
+        service.question_bank = QuestionBank(records=_records(1200))  # more than one bank chunk
+        cache = QuestionCache()
+        stub = _BankStub(service)
+        fetched, refetched = await cache.refresh(stub), await cache.refresh(stub)
+
+        first = await service.JoinGame(game_pb2.JoinRequest(player_name="p0", question_count=5), None)
+        second = await service.JoinGame(game_pb2.JoinRequest(player_name="p1", game_id=first.game_id), None)
+        game = service.games[first.game_id]
+        watchers = [asyncio.create_task(_watch(service, first, 0)),
+                    asyncio.create_task(_watch(service, second, cache.version))]
+        await asyncio.sleep(0)
+        for round_index in range(game.total_rounds):
+            for seat in (first, second):
+                await service.SubmitAnswer(game_pb2.AnswerRequest(
+                    game_id=game.game_id, player_id=seat.player_id, selected_option="a"), None)
+            await asyncio.sleep(0)
+        full, referenced = await asyncio.gather(*watchers)
+        return fetched, refetched, cache, full, referenced
+
+    fetched, refetched, cache, full, referenced = asyncio.run(run())
+    assert fetched and not refetched  # an unchanged bank comes back not_modified
+    assert len(cache.questions) == 1200
+    assert len(full) == len(referenced) == 5
+    assert all(not card.bank_version for card in full)
+    assert all(card.bank_version == cache.version and not card.question_text for card in referenced)
+    assert [cache.resolve(card) for card in referenced] == full
+    assert [cache.resolve(card) for card in full] == full
+
+
+def test_reference_to_another_bank_version_is_refused():
+    cache = QuestionCache()
+    cache.version, cache.questions = 7, [game_pb2.BankQuestion(question_id="q0", question_text="Q?", options=["a"])]
+    assert cache.resolve(game_pb2.QuestionCard(bank_version=7, bank_index=0)).question_id == "q0"
+    with pytest.raises(LookupError):
+        cache.resolve(game_pb2.QuestionCard(bank_version=8, bank_index=0))
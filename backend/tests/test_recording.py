@@ -0,0 +1,42 @@
+import asyncio
+
+import grpc
+
+from game.recording import RecordingInterceptor
+
+
+async def _behavior(request, context):
+    return b""
+
+
+class _Details:
+    def __init__(self, method):
+        self.method = method
+        self.invocation_metadata = ()
+
+
+def test_handler_without_a_behavior_is_returned_unchanged(tmp_path):
+    recorder = RecordingInterceptor(str(tmp_path / "trace.gz"))
+    handler = grpc.unary_unary_rpc_method_handler(_behavior)._replace(unary_unary=None)
+    assert recorder.wrap("/game.GameService/JoinGame", handler) is handler
+
+
+def test_wrapped_handler_is_built_once_per_method(tmp_path):
+    recorder = RecordingInterceptor(str(tmp_path / "trace.gz"))
+    handler = grpc.unary_unary_rpc_method_handler(_behavior)
+    replaced = grpc.unary_unary_rpc_method_handler(_behavior)
+
+    async def run():
+        async def continuation(details):
+            return current
+
+        current = handler
+        first = await recorder.intercept_service(continuation, _Details("/game.GameService/JoinGame"))
+        again = await recorder.intercept_service(continuation, _Details("/game.GameService/JoinGame"))
+        current = replaced
+        rebuilt = await recorder.intercept_service(continuation, _Details("/game.GameService/JoinGame"))
+        return first, again, rebuilt
+
+    first, again, rebuilt = asyncio.run(run())
+    assert first is again and first is not handler
+    assert rebuilt is not first and rebuilt.unary_unary is not first.unary_unary
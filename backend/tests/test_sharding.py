@@ -0,0 +1,114 @@
+import asyncio
+import uuid
+
+import grpc
+
+from game.game_logic import GameServiceImpl
+from game.runtime import Runtime
+from game.server import add_game_service
+from game.sharding import FORWARDED_HEADER, ShardRouter
+from generated import game_pb2, game_pb2_grpc
+
+
+class _Headers(grpc.aio.ServerInterceptor):
+    """Records the method and metadata of every call a worker receives."""
+
+    def __init__(self):
+        self.calls = []
+
+    async def intercept_service(self, continuation, handler_call_details):
+        metadata = dict(handler_call_details.invocation_metadata or ())
+        self.calls.append((handler_call_details.method.rsplit("/", 1)[-1], metadata))
+        return await continuation(handler_call_details)
+
+
+async def _serve_shards(count):
+    """Start count sharded workers in this process on ephemeral ports."""
+    headers = [_Headers() for _ in range(count)]
+    servers = [Runtime().server(interceptors=[recorder]) for recorder in headers]
+    addresses = [f"127.0.0.1:{server.add_insecure_port('127.0.0.1:0')}" for server in servers]
+    services = []
+    for shard_id, server in enumerate(servers):
+        router = ShardRouter(shard_id, addresses)
+        service = GameServiceImpl(router=router)
+        add_game_service(service, server, router)
+        await server.start()
+        services.append(service)
+    return servers, services, headers, addresses
+
+
+def _owned_by(router, shard):
+    while True:
+        game_id = str(uuid.uuid4())
+        if router.ring.owner(game_id) == shard:
+            return game_id
+
+
+def _sharded(test):
+    async def run():
+        servers, services, headers, addresses = await _serve_shards(2)
+        try:
+            return await test(services, headers, addresses)
+        finally:
+            for server in servers:
+                await server.stop(0)
+    return asyncio.run(run())
+
+
+def test_workers_agree_on_the_shard_map():
+    async def test(services, headers, addresses):
+        game_ids = [str(uuid.uuid4()) for _ in range(20)]
+        maps = []
+        for address in addresses:
+            async with grpc.aio.insecure_channel(address) as channel:
+                stub = game_pb2_grpc.GameServiceStub(channel)
+                maps.append([await stub.GetShardMap(game_pb2.ShardMapRequest(game_id=game_id))
+                             for game_id in game_ids])
+        return maps, addresses
+
+    (first, second), addresses = _sharded(test)
+    assert [m.shard_id for m in first] == [0] * 20 and [m.shard_id for m in second] == [1] * 20
+    for a, b in zip(first, second):
+        assert list(a.shards) == list(b.shards)
+        assert [shard.address for shard in a.shards] == addresses
+        assert a.virtual_nodes == b.virtual_nodes
+        assert a.owner_shard_id == b.owner_shard_id
+    assert {m.owner_shard_id for m in first} == {0, 1}
+
+
+def test_calls_to_a_non_owner_are_forwarded_once():
+    async def test(services, headers, addresses):
+        game_id = _owned_by(services[0].router, 1)
+        async with grpc.aio.insecure_channel(addresses[0]) as channel:
+            stub = game_pb2_grpc.GameServiceStub(channel)
+            joined = await stub.JoinGame(game_pb2.JoinRequest(player_name="p", game_id=game_id))
+            board = await stub.GetLeaderboard(game_pb2.LeaderboardRequest(game_id=game_id))
+        assert game_id in services[1].games and game_id not in services[0].games
+        assert services[0].router.forwarded == 2 and services[1].router.forwarded == 0
+        return joined, board, headers[1].calls
+
+    joined, board, received = _sharded(test)
+    assert [(method, metadata.get(FORWARDED_HEADER)) for method, metadata in received] == \
+        [("JoinGame", "0"), ("GetLeaderboard", "0")]
+    assert board.total_players == 1 and board.entries[0].player_id == joined.player_id
+
+
+def test_forwarded_calls_are_served_where_they_land():
+    async def test(services, headers, addresses):
+        game_id = _owned_by(services[0].router, 1)
+        forwarded = ((FORWARDED_HEADER, "1"),)
+        async with grpc.aio.insecure_channel(addresses[0]) as channel:
+            stub = game_pb2_grpc.GameServiceStub(channel)
+            await stub.JoinGame(game_pb2.JoinRequest(player_name="p", game_id=game_id), metadata=forwarded)
+            try:
+                await stub.GetLeaderboard(game_pb2.LeaderboardRequest(game_id=_owned_by(services[0].router, 1)),
+                                          metadata=forwarded)
+                code = grpc.StatusCode.OK
+            except grpc.aio.AioRpcError as e:
+                code = e.code()
+        assert game_id in services[0].games and not services[1].games
+        assert services[0].router.forwarded == 0
+        assert headers[1].calls == []
+        return code
+
+    assert _sharded(test) == grpc.StatusCode.NOT_FOUND
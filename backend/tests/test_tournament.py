@@ -0,0 +1,75 @@
+import asyncio
+import random
+
+from game import game_logic
+from game.game_logic import GameServiceImpl
+from game.questions import QuestionBank
+from generated import game_pb2
+
+_INTERVAL = 0.05
+
+
+def _records(count):
+    return [{"question_id": f"q{i}", "question_text": f"Question {i}?", "options": ["a", "b", "c", "d"],
+             "correct_option": "a", "explanation": ""} for i in range(count)]
+
+
+def _rebuilt_board(service, size):
+    """The top of the tournament from every room's scores, concatenated and sorted."""
+    rows = [(-score, ordinal, index, game.game_id)
+            for ordinal, game in enumerate(service.games.values())
+            for index, score in enumerate(game.scores)]
+    rows.sort()
+    return [(game_id, index, -negated) for negated, _, index, game_id in rows[:size]]
+
+
+async def _listen(service, limit, received):
+    request = game_pb2.TournamentRequest(tournament_id="cup", limit=limit)
+    loop = asyncio.get_running_loop()
+    async for data in service.StreamTournamentLeaderboard(request, None):
+        received.append((loop.time(), game_pb2.TournamentLeaderboard.FromString(data)))
+
+
+def test_board_and_streams_follow_every_room(monkeypatch):
+    monkeypatch.setattr(game_logic, "MIN_UPDATE_INTERVAL", _INTERVAL)
+
+    async def run():
+        rng = random.Random(7)
+        service = GameServiceImpl()
+        service.question_bank = QuestionBank(records=_records(4))
+        seats = []
+        for room in range(40):
+            first = await service.JoinGame(game_pb2.JoinRequest(
+                player_name=f"r{room}p0", question_count=4, tournament_id="cup"), None)
+            seats.append(first)
+            for i in range(1, 5):
+                seats.append(await service.JoinGame(
+                    game_pb2.JoinRequest(player_name=f"r{room}p{i}", game_id=first.game_id), None))
+        tournament = service.tournaments["cup"]
+        streams = [[] for _ in range(3)]
+        listeners = [asyncio.create_task(_listen(service, 10, received)) for received in streams]
+        await asyncio.sleep(0)
+
+        for _ in range(4):
+            for seat in seats:
+                option = "a" if rng.random() < 0.5 else "b"
+                await service.SubmitAnswer(game_pb2.AnswerRequest(
+                    game_id=seat.game_id, player_id=seat.player_id, selected_option=option), None)
+                if rng.random() < 0.02:
+                    await asyncio.sleep(_INTERVAL / 4)
+        await asyncio.sleep(_INTERVAL * 1.5)  # the last throttled update
+        for listener in listeners:
+            listener.cancel()
+
+        board = [(game_id, index, score) for _, game_id, _, _, index, score in tournament.page()]
+        return board, _rebuilt_board(service, tournament.board_size), streams, len(seats)
+
+    board, expected, streams, players = asyncio.run(run())
+    assert len(board) == 100 and board == expected
+    for received in streams:
+        assert len(received) > 1
+        last = received[-1][1]
+        assert [(e.game_id, e.player_index, e.score) for e in last.entries] == expected[:10]
+        assert last.total_players == players and last.total_games == 40
+        gaps = [later - earlier for (earlier, _), (later, _) in zip(received, received[1:])]
+        assert min(gaps) >= _INTERVAL - 1e-3
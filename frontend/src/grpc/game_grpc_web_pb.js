@@ -260,16 +260,16 @@ proto.game.GameServicePromiseClient.prototype.submitAnswer =
 /**
  * @const
  * @type {!grpc.web.MethodDescriptor<
- *   !proto.game.GameId,
+ *   !proto.game.LeaderboardRequest,
  *   !proto.game.Leaderboard>}
  */
 const methodDescriptor_GameService_GetLeaderboard = new grpc.web.MethodDescriptor(
   '/game.GameService/GetLeaderboard',
   grpc.web.MethodType.UNARY,
-  proto.game.GameId,
+  proto.game.LeaderboardRequest,
   proto.game.Leaderboard,
   /**
-   * @param {!proto.game.GameId} request
+   * @param {!proto.game.LeaderboardRequest} request
    * @return {!Uint8Array}
    */
   function(request) {
@@ -280,7 +280,7 @@ const methodDescriptor_GameService_GetLeaderboard = new grpc.web.MethodDescripto
 
 
 /**
- * @param {!proto.game.GameId} request The
+ * @param {!proto.game.LeaderboardRequest} request The
  *     request proto
  * @param {?Object<string, string>} metadata User defined
  *     call metadata
@@ -301,7 +301,7 @@ proto.game.GameServiceClient.prototype.getLeaderboard =
 
 
 /**
- * @param {!proto.game.GameId} request The
+ * @param {!proto.game.LeaderboardRequest} request The
  *     request proto
  * @param {?Object<string, string>=} metadata User defined
  *     call metadata
@@ -374,5 +374,290 @@ proto.game.GameServicePromiseClient.prototype.streamLeaderboard =
 };
 
 
+/**
+ * @const
+ * @type {!grpc.web.MethodDescriptor<
+ *   !proto.game.GameRequest,
+ *   !proto.game.SessionEvent>}
+ */
+const methodDescriptor_GameService_WatchSession = new grpc.web.MethodDescriptor(
+  '/game.GameService/WatchSession',
+  grpc.web.MethodType.SERVER_STREAMING,
+  proto.game.GameRequest,
+  proto.game.SessionEvent,
+  /**
+   * @param {!proto.game.GameRequest} request
+   * @return {!Uint8Array}
+   */
+  function(request) {
+    return request.serializeBinary();
+  },
+  proto.game.SessionEvent.deserializeBinary
+);
+
+
+/**
+ * @param {!proto.game.GameRequest} request The request proto
+ * @param {?Object<string, string>=} metadata User defined
+ *     call metadata
+ * @return {!grpc.web.ClientReadableStream<!proto.game.SessionEvent>}
+ *     The XHR Node Readable Stream
+ */
+proto.game.GameServiceClient.prototype.watchSession =
+    function(request, metadata) {
+  return this.client_.serverStreaming(this.hostname_ +
+      '/game.GameService/WatchSession',
+      request,
+      metadata || {},
+      methodDescriptor_GameService_WatchSession);
+};
+
+
+/**
+ * @param {!proto.game.GameRequest} request The request proto
+ * @param {?Object<string, string>=} metadata User defined
+ *     call metadata
+ * @return {!grpc.web.ClientReadableStream<!proto.game.SessionEvent>}
+ *     The XHR Node Readable Stream
+ */
+proto.game.GameServicePromiseClient.prototype.watchSession =
+    function(request, metadata) {
+  return this.client_.serverStreaming(this.hostname_ +
+      '/game.GameService/WatchSession',
+      request,
+      metadata || {},
+      methodDescriptor_GameService_WatchSession);
+};
+
+
+/**
+ * @const
+ * @type {!grpc.web.MethodDescriptor<
+ *   !proto.game.MatchRequest,
+ *   !proto.game.MatchUpdate>}
+ */
+const methodDescriptor_GameService_EnqueueForMatch = new grpc.web.MethodDescriptor(
+  '/game.GameService/EnqueueForMatch',
+  grpc.web.MethodType.SERVER_STREAMING,
+  proto.game.MatchRequest,
+  proto.game.MatchUpdate,
+  /**
+   * @param {!proto.game.MatchRequest} request
+   * @return {!Uint8Array}
+   */
+  function(request) {
+    return request.serializeBinary();
+  },
+  proto.game.MatchUpdate.deserializeBinary
+);
+
+
+/**
+ * @param {!proto.game.MatchRequest} request The request proto
+ * @param {?Object<string, string>=} metadata User defined
+ *     call metadata
+ * @return {!grpc.web.ClientReadableStream<!proto.game.MatchUpdate>}
+ *     The XHR Node Readable Stream
+ */
+proto.game.GameServiceClient.prototype.enqueueForMatch =
+    function(request, metadata) {
+  return this.client_.serverStreaming(this.hostname_ +
+      '/game.GameService/EnqueueForMatch',
+      request,
+      metadata || {},
+      methodDescriptor_GameService_EnqueueForMatch);
+};
+
+
+/**
+ * @param {!proto.game.MatchRequest} request The request proto
+ * @param {?Object<string, string>=} metadata User defined
+ *     call metadata
+ * @return {!grpc.web.ClientReadableStream<!proto.game.MatchUpdate>}
+ *     The XHR Node Readable Stream
+ */
+proto.game.GameServicePromiseClient.prototype.enqueueForMatch =
+    function(request, metadata) {
+  return this.client_.serverStreaming(this.hostname_ +
+      '/game.GameService/EnqueueForMatch',
+      request,
+      metadata || {},
+      methodDescriptor_GameService_EnqueueForMatch);
+};
+
+
+/**
+ * @const
+ * @type {!grpc.web.MethodDescriptor<
+ *   !proto.game.QuestionBankRequest,
+ *   !proto.game.QuestionBankChunk>}
+ */
+const methodDescriptor_GameService_GetQuestionBank = new grpc.web.MethodDescriptor(
+  '/game.GameService/GetQuestionBank',
+  grpc.web.MethodType.SERVER_STREAMING,
+  proto.game.QuestionBankRequest,
+  proto.game.QuestionBankChunk,
+  /**
+   * @param {!proto.game.QuestionBankRequest} request
+   * @return {!Uint8Array}
+   */
+  function(request) {
+    return request.serializeBinary();
+  },
+  proto.game.QuestionBankChunk.deserializeBinary
+);
+
+
+/**
+ * @param {!proto.game.QuestionBankRequest} request The request proto
+ * @param {?Object<string, string>=} metadata User defined
+ *     call metadata
+ * @return {!grpc.web.ClientReadableStream<!proto.game.QuestionBankChunk>}
+ *     The XHR Node Readable Stream
+ */
+proto.game.GameServiceClient.prototype.getQuestionBank =
+    function(request, metadata) {
+  return this.client_.serverStreaming(this.hostname_ +
+      '/game.GameService/GetQuestionBank',
+      request,
+      metadata || {},
+      methodDescriptor_GameService_GetQuestionBank);
+};
+
+
+/**
+ * @param {!proto.game.QuestionBankRequest} request The request proto
+ * @param {?Object<string, string>=} metadata User defined
+ *     call metadata
+ * @return {!grpc.web.ClientReadableStream<!proto.game.QuestionBankChunk>}
+ *     The XHR Node Readable Stream
+ */
+proto.game.GameServicePromiseClient.prototype.getQuestionBank =
+    function(request, metadata) {
+  return this.client_.serverStreaming(this.hostname_ +
+      '/game.GameService/GetQuestionBank',
+      request,
+      metadata || {},
+      methodDescriptor_GameService_GetQuestionBank);
+};
+
+
+/**
+ * @const
+ * @type {!grpc.web.MethodDescriptor<
+ *   !proto.game.TournamentRequest,
+ *   !proto.game.TournamentLeaderboard>}
+ */
+const methodDescriptor_GameService_StreamTournamentLeaderboard = new grpc.web.MethodDescriptor(
+  '/game.GameService/StreamTournamentLeaderboard',
+  grpc.web.MethodType.SERVER_STREAMING,
+  proto.game.TournamentRequest,
+  proto.game.TournamentLeaderboard,
+  /**
+   * @param {!proto.game.TournamentRequest} request
+   * @return {!Uint8Array}
+   */
+  function(request) {
+    return request.serializeBinary();
+  },
+  proto.game.TournamentLeaderboard.deserializeBinary
+);
+
+
+/**
+ * @param {!proto.game.TournamentRequest} request The request proto
+ * @param {?Object<string, string>=} metadata User defined
+ *     call metadata
+ * @return {!grpc.web.ClientReadableStream<!proto.game.TournamentLeaderboard>}
+ *     The XHR Node Readable Stream
+ */
+proto.game.GameServiceClient.prototype.streamTournamentLeaderboard =
+    function(request, metadata) {
+  return this.client_.serverStreaming(this.hostname_ +
+      '/game.GameService/StreamTournamentLeaderboard',
+      request,
+      metadata || {},
+      methodDescriptor_GameService_StreamTournamentLeaderboard);
+};
+
+
+/**
+ * @param {!proto.game.TournamentRequest} request The request proto
+ * @param {?Object<string, string>=} metadata User defined
+ *     call metadata
+ * @return {!grpc.web.ClientReadableStream<!proto.game.TournamentLeaderboard>}
+ *     The XHR Node Readable Stream
+ */
+proto.game.GameServicePromiseClient.prototype.streamTournamentLeaderboard =
+    function(request, metadata) {
+  return this.client_.serverStreaming(this.hostname_ +
+      '/game.GameService/StreamTournamentLeaderboard',
+      request,
+      metadata || {},
+      methodDescriptor_GameService_StreamTournamentLeaderboard);
+};
+
+
+/**
+ * @const
+ * @type {!grpc.web.MethodDescriptor<
+ *   !proto.game.ShardMapRequest,
+ *   !proto.game.ShardMap>}
+ */
+const methodDescriptor_GameService_GetShardMap = new grpc.web.MethodDescriptor(
+  '/game.GameService/GetShardMap',
+  grpc.web.MethodType.UNARY,
+  proto.game.ShardMapRequest,
+  proto.game.ShardMap,
+  /**
+   * @param {!proto.game.ShardMapRequest} request
+   * @return {!Uint8Array}
+   */
+  function(request) {
+    return request.serializeBinary();
+  },
+  proto.game.ShardMap.deserializeBinary
+);
+
+
+/**
+ * @param {!proto.game.ShardMapRequest} request The
+ *     request proto
+ * @param {?Object<string, string>} metadata User defined
+ *     call metadata
+ * @param {function(?grpc.web.RpcError, ?proto.game.ShardMap)}
+ *     callback The callback function(error, response)
+ * @return {!grpc.web.ClientReadableStream<!proto.game.ShardMap>|undefined}
+ *     The XHR Node Readable Stream
+ */
+proto.game.GameServiceClient.prototype.getShardMap =
+    function(request, metadata, callback) {
+  return this.client_.rpcCall(this.hostname_ +
+      '/game.GameService/GetShardMap',
+      request,
+      metadata || {},
+      methodDescriptor_GameService_GetShardMap,
+      callback);
+};
+
+
+/**
+ * @param {!proto.game.ShardMapRequest} request The
+ *     request proto
+ * @param {?Object<string, string>=} metadata User defined
+ *     call metadata
+ * @return {!Promise<!proto.game.ShardMap>}
+ *     Promise that resolves to the response
+ */
+proto.game.GameServicePromiseClient.prototype.getShardMap =
+    function(request, metadata) {
+  return this.client_.unaryCall(this.hostname_ +
+      '/game.GameService/GetShardMap',
+      request,
+      metadata || {},
+      methodDescriptor_GameService_GetShardMap);
+};
+
+
 module.exports = proto.game;
 
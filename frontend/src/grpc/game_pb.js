@@ -23,15 +23,31 @@ var global =
 
 goog.exportSymbol('proto.game.AnswerRequest', null, global);
 goog.exportSymbol('proto.game.AnswerResult', null, global);
+goog.exportSymbol('proto.game.BankQuestion', null, global);
 goog.exportSymbol('proto.game.GameId', null, global);
 goog.exportSymbol('proto.game.GameRequest', null, global);
 goog.exportSymbol('proto.game.JoinRequest', null, global);
 goog.exportSymbol('proto.game.JoinResponse', null, global);
 goog.exportSymbol('proto.game.Leaderboard', null, global);
 goog.exportSymbol('proto.game.LeaderboardEntry', null, global);
+goog.exportSymbol('proto.game.LeaderboardRequest', null, global);
 goog.exportSymbol('proto.game.LeaderboardUpdate', null, global);
+goog.exportSymbol('proto.game.MatchRequest', null, global);
+goog.exportSymbol('proto.game.MatchUpdate', null, global);
 goog.exportSymbol('proto.game.Player', null, global);
+goog.exportSymbol('proto.game.QuestionBankChunk', null, global);
+goog.exportSymbol('proto.game.QuestionBankRequest', null, global);
 goog.exportSymbol('proto.game.QuestionCard', null, global);
+goog.exportSymbol('proto.game.RoundTransition', null, global);
+goog.exportSymbol('proto.game.SessionEvent', null, global);
+goog.exportSymbol('proto.game.SessionEvent.EventCase', null, global);
+goog.exportSymbol('proto.game.SessionRequest', null, global);
+goog.exportSymbol('proto.game.SessionRequest.PayloadCase', null, global);
+goog.exportSymbol('proto.game.ShardInfo', null, global);
+goog.exportSymbol('proto.game.ShardMap', null, global);
+goog.exportSymbol('proto.game.ShardMapRequest', null, global);
+goog.exportSymbol('proto.game.TournamentLeaderboard', null, global);
+goog.exportSymbol('proto.game.TournamentRequest', null, global);
 /**
  * Generated by JsPbCodeGenerator.
  * @param {Array=} opt_data Optional initial data array, typically from a
@@ -64,7 +80,7 @@ if (goog.DEBUG && !COMPILED) {
  * @constructor
  */
 proto.game.JoinRequest = function(opt_data) {
-  jspb.Message.initialize(this, opt_data, 0, -1, null, null);
+  jspb.Message.initialize(this, opt_data, 0, -1, proto.game.JoinRequest.repeatedFields_, null);
 };
 goog.inherits(proto.game.JoinRequest, jspb.Message);
 if (goog.DEBUG && !COMPILED) {
@@ -137,6 +153,69 @@ if (goog.DEBUG && !COMPILED) {
    */
   proto.game.QuestionCard.displayName = 'proto.game.QuestionCard';
 }
+/**
+ * Generated by JsPbCodeGenerator.
+ * @param {Array=} opt_data Optional initial data array, typically from a
+ * server response, or constructed directly in Javascript. The array is used
+ * in place and becomes part of the constructed object. It is not cloned.
+ * If no data is provided, the constructed object will be empty, but still
+ * valid.
+ * @extends {jspb.Message}
+ * @constructor
+ */
+proto.game.QuestionBankRequest = function(opt_data) {
+  jspb.Message.initialize(this, opt_data, 0, -1, null, null);
+};
+goog.inherits(proto.game.QuestionBankRequest, jspb.Message);
+if (goog.DEBUG && !COMPILED) {
+  /**
+   * @public
+   * @override
+   */
+  proto.game.QuestionBankRequest.displayName = 'proto.game.QuestionBankRequest';
+}
+/**
+ * Generated by JsPbCodeGenerator.
+ * @param {Array=} opt_data Optional initial data array, typically from a
+ * server response, or constructed directly in Javascript. The array is used
+ * in place and becomes part of the constructed object. It is not cloned.
+ * If no data is provided, the constructed object will be empty, but still
+ * valid.
+ * @extends {jspb.Message}
+ * @constructor
+ */
+proto.game.BankQuestion = function(opt_data) {
+  jspb.Message.initialize(this, opt_data, 0, -1, proto.game.BankQuestion.repeatedFields_, null);
+};
+goog.inherits(proto.game.BankQuestion, jspb.Message);
+if (goog.DEBUG && !COMPILED) {
+  /**
+   * @public
+   * @override
+   */
+  proto.game.BankQuestion.displayName = 'proto.game.BankQuestion';
+}
+/**
+ * Generated by JsPbCodeGenerator.
+ * @param {Array=} opt_data Optional initial data array, typically from a
+ * server response, or constructed directly in Javascript. The array is used
+ * in place and becomes part of the constructed object. It is not cloned.
+ * If no data is provided, the constructed object will be empty, but still
+ * valid.
+ * @extends {jspb.Message}
+ * @constructor
+ */
+proto.game.QuestionBankChunk = function(opt_data) {
+  jspb.Message.initialize(this, opt_data, 0, -1, proto.game.QuestionBankChunk.repeatedFields_, null);
+};
+goog.inherits(proto.game.QuestionBankChunk, jspb.Message);
+if (goog.DEBUG && !COMPILED) {
+  /**
+   * @public
+   * @override
+   */
+  proto.game.QuestionBankChunk.displayName = 'proto.game.QuestionBankChunk';
+}
 /**
  * Generated by JsPbCodeGenerator.
  * @param {Array=} opt_data Optional initial data array, typically from a
@@ -200,6 +279,27 @@ if (goog.DEBUG && !COMPILED) {
    */
   proto.game.GameId.displayName = 'proto.game.GameId';
 }
+/**
+ * Generated by JsPbCodeGenerator.
+ * @param {Array=} opt_data Optional initial data array, typically from a
+ * server response, or constructed directly in Javascript. The array is used
+ * in place and becomes part of the constructed object. It is not cloned.
+ * If no data is provided, the constructed object will be empty, but still
+ * valid.
+ * @extends {jspb.Message}
+ * @constructor
+ */
+proto.game.LeaderboardRequest = function(opt_data) {
+  jspb.Message.initialize(this, opt_data, 0, -1, null, null);
+};
+goog.inherits(proto.game.LeaderboardRequest, jspb.Message);
+if (goog.DEBUG && !COMPILED) {
+  /**
+   * @public
+   * @override
+   */
+  proto.game.LeaderboardRequest.displayName = 'proto.game.LeaderboardRequest';
+}
 /**
  * Generated by JsPbCodeGenerator.
  * @param {Array=} opt_data Optional initial data array, typically from a
@@ -253,7 +353,7 @@ if (goog.DEBUG && !COMPILED) {
  * @constructor
  */
 proto.game.LeaderboardUpdate = function(opt_data) {
-  jspb.Message.initialize(this, opt_data, 0, -1, null, null);
+  jspb.Message.initialize(this, opt_data, 0, -1, proto.game.LeaderboardUpdate.repeatedFields_, null);
 };
 goog.inherits(proto.game.LeaderboardUpdate, jspb.Message);
 if (goog.DEBUG && !COMPILED) {
@@ -263,6 +363,216 @@ if (goog.DEBUG && !COMPILED) {
    */
   proto.game.LeaderboardUpdate.displayName = 'proto.game.LeaderboardUpdate';
 }
+/**
+ * Generated by JsPbCodeGenerator.
+ * @param {Array=} opt_data Optional initial data array, typically from a
+ * server response, or constructed directly in Javascript. The array is used
+ * in place and becomes part of the constructed object. It is not cloned.
+ * If no data is provided, the constructed object will be empty, but still
+ * valid.
+ * @extends {jspb.Message}
+ * @constructor
+ */
+proto.game.TournamentRequest = function(opt_data) {
+  jspb.Message.initialize(this, opt_data, 0, -1, null, null);
+};
+goog.inherits(proto.game.TournamentRequest, jspb.Message);
+if (goog.DEBUG && !COMPILED) {
+  /**
+   * @public
+   * @override
+   */
+  proto.game.TournamentRequest.displayName = 'proto.game.TournamentRequest';
+}
+/**
+ * Generated by JsPbCodeGenerator.
+ * @param {Array=} opt_data Optional initial data array, typically from a
+ * server response, or constructed directly in Javascript. The array is used
+ * in place and becomes part of the constructed object. It is not cloned.
+ * If no data is provided, the constructed object will be empty, but still
+ * valid.
+ * @extends {jspb.Message}
+ * @constructor
+ */
+proto.game.TournamentLeaderboard = function(opt_data) {
+  jspb.Message.initialize(this, opt_data, 0, -1, proto.game.TournamentLeaderboard.repeatedFields_, null);
+};
+goog.inherits(proto.game.TournamentLeaderboard, jspb.Message);
+if (goog.DEBUG && !COMPILED) {
+  /**
+   * @public
+   * @override
+   */
+  proto.game.TournamentLeaderboard.displayName = 'proto.game.TournamentLeaderboard';
+}
+/**
+ * Generated by JsPbCodeGenerator.
+ * @param {Array=} opt_data Optional initial data array, typically from a
+ * server response, or constructed directly in Javascript. The array is used
+ * in place and becomes part of the constructed object. It is not cloned.
+ * If no data is provided, the constructed object will be empty, but still
+ * valid.
+ * @extends {jspb.Message}
+ * @constructor
+ */
+proto.game.SessionRequest = function(opt_data) {
+  jspb.Message.initialize(this, opt_data, 0, -1, null, proto.game.SessionRequest.oneofGroups_);
+};
+goog.inherits(proto.game.SessionRequest, jspb.Message);
+if (goog.DEBUG && !COMPILED) {
+  /**
+   * @public
+   * @override
+   */
+  proto.game.SessionRequest.displayName = 'proto.game.SessionRequest';
+}
+/**
+ * Generated by JsPbCodeGenerator.
+ * @param {Array=} opt_data Optional initial data array, typically from a
+ * server response, or constructed directly in Javascript. The array is used
+ * in place and becomes part of the constructed object. It is not cloned.
+ * If no data is provided, the constructed object will be empty, but still
+ * valid.
+ * @extends {jspb.Message}
+ * @constructor
+ */
+proto.game.RoundTransition = function(opt_data) {
+  jspb.Message.initialize(this, opt_data, 0, -1, null, null);
+};
+goog.inherits(proto.game.RoundTransition, jspb.Message);
+if (goog.DEBUG && !COMPILED) {
+  /**
+   * @public
+   * @override
+   */
+  proto.game.RoundTransition.displayName = 'proto.game.RoundTransition';
+}
+/**
+ * Generated by JsPbCodeGenerator.
+ * @param {Array=} opt_data Optional initial data array, typically from a
+ * server response, or constructed directly in Javascript. The array is used
+ * in place and becomes part of the constructed object. It is not cloned.
+ * If no data is provided, the constructed object will be empty, but still
+ * valid.
+ * @extends {jspb.Message}
+ * @constructor
+ */
+proto.game.SessionEvent = function(opt_data) {
+  jspb.Message.initialize(this, opt_data, 0, -1, null, proto.game.SessionEvent.oneofGroups_);
+};
+goog.inherits(proto.game.SessionEvent, jspb.Message);
+if (goog.DEBUG && !COMPILED) {
+  /**
+   * @public
+   * @override
+   */
+  proto.game.SessionEvent.displayName = 'proto.game.SessionEvent';
+}
+/**
+ * Generated by JsPbCodeGenerator.
+ * @param {Array=} opt_data Optional initial data array, typically from a
+ * server response, or constructed directly in Javascript. The array is used
+ * in place and becomes part of the constructed object. It is not cloned.
+ * If no data is provided, the constructed object will be empty, but still
+ * valid.
+ * @extends {jspb.Message}
+ * @constructor
+ */
+proto.game.MatchRequest = function(opt_data) {
+  jspb.Message.initialize(this, opt_data, 0, -1, null, null);
+};
+goog.inherits(proto.game.MatchRequest, jspb.Message);
+if (goog.DEBUG && !COMPILED) {
+  /**
+   * @public
+   * @override
+   */
+  proto.game.MatchRequest.displayName = 'proto.game.MatchRequest';
+}
+/**
+ * Generated by JsPbCodeGenerator.
+ * @param {Array=} opt_data Optional initial data array, typically from a
+ * server response, or constructed directly in Javascript. The array is used
+ * in place and becomes part of the constructed object. It is not cloned.
+ * If no data is provided, the constructed object will be empty, but still
+ * valid.
+ * @extends {jspb.Message}
+ * @constructor
+ */
+proto.game.MatchUpdate = function(opt_data) {
+  jspb.Message.initialize(this, opt_data, 0, -1, null, null);
+};
+goog.inherits(proto.game.MatchUpdate, jspb.Message);
+if (goog.DEBUG && !COMPILED) {
+  /**
+   * @public
+   * @override
+   */
+  proto.game.MatchUpdate.displayName = 'proto.game.MatchUpdate';
+}
+/**
+ * Generated by JsPbCodeGenerator.
+ * @param {Array=} opt_data Optional initial data array, typically from a
+ * server response, or constructed directly in Javascript. The array is used
+ * in place and becomes part of the constructed object. It is not cloned.
+ * If no data is provided, the constructed object will be empty, but still
+ * valid.
+ * @extends {jspb.Message}
+ * @constructor
+ */
+proto.game.ShardMapRequest = function(opt_data) {
+  jspb.Message.initialize(this, opt_data, 0, -1, null, null);
+};
+goog.inherits(proto.game.ShardMapRequest, jspb.Message);
+if (goog.DEBUG && !COMPILED) {
+  /**
+   * @public
+   * @override
+   */
+  proto.game.ShardMapRequest.displayName = 'proto.game.ShardMapRequest';
+}
+/**
+ * Generated by JsPbCodeGenerator.
+ * @param {Array=} opt_data Optional initial data array, typically from a
+ * server response, or constructed directly in Javascript. The array is used
+ * in place and becomes part of the constructed object. It is not cloned.
+ * If no data is provided, the constructed object will be empty, but still
+ * valid.
+ * @extends {jspb.Message}
+ * @constructor
+ */
+proto.game.ShardInfo = function(opt_data) {
+  jspb.Message.initialize(this, opt_data, 0, -1, null, null);
+};
+goog.inherits(proto.game.ShardInfo, jspb.Message);
+if (goog.DEBUG && !COMPILED) {
+  /**
+   * @public
+   * @override
+   */
+  proto.game.ShardInfo.displayName = 'proto.game.ShardInfo';
+}
+/**
+ * Generated by JsPbCodeGenerator.
+ * @param {Array=} opt_data Optional initial data array, typically from a
+ * server response, or constructed directly in Javascript. The array is used
+ * in place and becomes part of the constructed object. It is not cloned.
+ * If no data is provided, the constructed object will be empty, but still
+ * valid.
+ * @extends {jspb.Message}
+ * @constructor
+ */
+proto.game.ShardMap = function(opt_data) {
+  jspb.Message.initialize(this, opt_data, 0, -1, proto.game.ShardMap.repeatedFields_, null);
+};
+goog.inherits(proto.game.ShardMap, jspb.Message);
+if (goog.DEBUG && !COMPILED) {
+  /**
+   * @public
+   * @override
+   */
+  proto.game.ShardMap.displayName = 'proto.game.ShardMap';
+}
 
 
 
@@ -424,6 +734,13 @@ proto.game.Player.prototype.setName = function(value) {
 
 
 
+/**
+ * List of repeated fields within this message type.
+ * @private {!Array<number>}
+ * @const
+ */
+proto.game.JoinRequest.repeatedFields_ = [6];
+
 
 
 if (jspb.Message.GENERATE_TO_OBJECT) {
@@ -456,7 +773,12 @@ proto.game.JoinRequest.prototype.toObject = function(opt_includeInstance) {
 proto.game.JoinRequest.toObject = function(includeInstance, msg) {
   var f, obj = {
 playerName: jspb.Message.getFieldWithDefault(msg, 1, ""),
-gameId: jspb.Message.getFieldWithDefault(msg, 2, "")
+gameId: jspb.Message.getFieldWithDefault(msg, 2, ""),
+category: jspb.Message.getFieldWithDefault(msg, 3, ""),
+difficulty: jspb.Message.getFieldWithDefault(msg, 4, ""),
+questionCount: jspb.Message.getFieldWithDefault(msg, 5, 0),
+excludeQuestionIdsList: (f = jspb.Message.getRepeatedField(msg, 6)) == null ? undefined : f,
+tournamentId: jspb.Message.getFieldWithDefault(msg, 7, "")
   };
 
   if (includeInstance) {
@@ -501,7 +823,27 @@ proto.game.JoinRequest.deserializeBinaryFromReader = function(msg, reader) {
       var value = /** @type {string} */ (reader.readString());
       msg.setGameId(value);
       break;
-    default:
+    case 3:
+      var value = /** @type {string} */ (reader.readString());
+      msg.setCategory(value);
+      break;
+    case 4:
+      var value = /** @type {string} */ (reader.readString());
+      msg.setDifficulty(value);
+      break;
+    case 5:
+      var value = /** @type {number} */ (reader.readInt32());
+      msg.setQuestionCount(value);
+      break;
+    case 6:
+      var value = /** @type {string} */ (reader.readString());
+      msg.addExcludeQuestionIds(value);
+      break;
+    case 7:
+      var value = /** @type {string} */ (reader.readString());
+      msg.setTournamentId(value);
+      break;
+    default:
       reader.skipField();
       break;
     }
@@ -544,6 +886,41 @@ proto.game.JoinRequest.serializeBinaryToWriter = function(message, writer) {
       f
     );
   }
+  f = message.getCategory();
+  if (f.length > 0) {
+    writer.writeString(
+      3,
+      f
+    );
+  }
+  f = message.getDifficulty();
+  if (f.length > 0) {
+    writer.writeString(
+      4,
+      f
+    );
+  }
+  f = message.getQuestionCount();
+  if (f !== 0) {
+    writer.writeInt32(
+      5,
+      f
+    );
+  }
+  f = message.getExcludeQuestionIdsList();
+  if (f.length > 0) {
+    writer.writeRepeatedString(
+      6,
+      f
+    );
+  }
+  f = message.getTournamentId();
+  if (f.length > 0) {
+    writer.writeString(
+      7,
+      f
+    );
+  }
 };
 
 
@@ -583,6 +960,115 @@ proto.game.JoinRequest.prototype.setGameId = function(value) {
 };
 
 
+/**
+ * optional string category = 3;
+ * @return {string}
+ */
+proto.game.JoinRequest.prototype.getCategory = function() {
+  return /** @type {string} */ (jspb.Message.getFieldWithDefault(this, 3, ""));
+};
+
+
+/**
+ * @param {string} value
+ * @return {!proto.game.JoinRequest} returns this
+ */
+proto.game.JoinRequest.prototype.setCategory = function(value) {
+  return jspb.Message.setProto3StringField(this, 3, value);
+};
+
+
+/**
+ * optional string difficulty = 4;
+ * @return {string}
+ */
+proto.game.JoinRequest.prototype.getDifficulty = function() {
+  return /** @type {string} */ (jspb.Message.getFieldWithDefault(this, 4, ""));
+};
+
+
+/**
+ * @param {string} value
+ * @return {!proto.game.JoinRequest} returns this
+ */
+proto.game.JoinRequest.prototype.setDifficulty = function(value) {
+  return jspb.Message.setProto3StringField(this, 4, value);
+};
+
+
+/**
+ * optional int32 question_count = 5;
+ * @return {number}
+ */
+proto.game.JoinRequest.prototype.getQuestionCount = function() {
+  return /** @type {number} */ (jspb.Message.getFieldWithDefault(this, 5, 0));
+};
+
+
+/**
+ * @param {number} value
+ * @return {!proto.game.JoinRequest} returns this
+ */
+proto.game.JoinRequest.prototype.setQuestionCount = function(value) {
+  return jspb.Message.setProto3IntField(this, 5, value);
+};
+
+
+/**
+ * repeated string exclude_question_ids = 6;
+ * @return {!Array<string>}
+ */
+proto.game.JoinRequest.prototype.getExcludeQuestionIdsList = function() {
+  return /** @type {!Array<string>} */ (jspb.Message.getRepeatedField(this, 6));
+};
+
+
+/**
+ * @param {!Array<string>} value
+ * @return {!proto.game.JoinRequest} returns this
+ */
+proto.game.JoinRequest.prototype.setExcludeQuestionIdsList = function(value) {
+  return jspb.Message.setField(this, 6, value || []);
+};
+
+
+/**
+ * @param {string} value
+ * @param {number=} opt_index
+ * @return {!proto.game.JoinRequest} returns this
+ */
+proto.game.JoinRequest.prototype.addExcludeQuestionIds = function(value, opt_index) {
+  return jspb.Message.addToRepeatedField(this, 6, value, opt_index);
+};
+
+
+/**
+ * Clears the list making it empty but non-null.
+ * @return {!proto.game.JoinRequest} returns this
+ */
+proto.game.JoinRequest.prototype.clearExcludeQuestionIdsList = function() {
+  return this.setExcludeQuestionIdsList([]);
+};
+
+
+/**
+ * optional string tournament_id = 7;
+ * @return {string}
+ */
+proto.game.JoinRequest.prototype.getTournamentId = function() {
+  return /** @type {string} */ (jspb.Message.getFieldWithDefault(this, 7, ""));
+};
+
+
+/**
+ * @param {string} value
+ * @return {!proto.game.JoinRequest} returns this
+ */
+proto.game.JoinRequest.prototype.setTournamentId = function(value) {
+  return jspb.Message.setProto3StringField(this, 7, value);
+};
+
+
 
 
 
@@ -806,7 +1292,8 @@ proto.game.GameRequest.prototype.toObject = function(opt_includeInstance) {
 proto.game.GameRequest.toObject = function(includeInstance, msg) {
   var f, obj = {
 gameId: jspb.Message.getFieldWithDefault(msg, 1, ""),
-playerId: jspb.Message.getFieldWithDefault(msg, 2, "")
+playerId: jspb.Message.getFieldWithDefault(msg, 2, ""),
+bankVersion: jspb.Message.getFieldWithDefault(msg, 3, 0)
   };
 
   if (includeInstance) {
@@ -851,6 +1338,10 @@ proto.game.GameRequest.deserializeBinaryFromReader = function(msg, reader) {
       var value = /** @type {string} */ (reader.readString());
       msg.setPlayerId(value);
       break;
+    case 3:
+      var value = /** @type {number} */ (reader.readUint64());
+      msg.setBankVersion(value);
+      break;
     default:
       reader.skipField();
       break;
@@ -894,6 +1385,13 @@ proto.game.GameRequest.serializeBinaryToWriter = function(message, writer) {
       f
     );
   }
+  f = message.getBankVersion();
+  if (f !== 0) {
+    writer.writeUint64(
+      3,
+      f
+    );
+  }
 };
 
 
@@ -933,6 +1431,24 @@ proto.game.GameRequest.prototype.setPlayerId = function(value) {
 };
 
 
+/**
+ * optional uint64 bank_version = 3;
+ * @return {number}
+ */
+proto.game.GameRequest.prototype.getBankVersion = function() {
+  return /** @type {number} */ (jspb.Message.getFieldWithDefault(this, 3, 0));
+};
+
+
+/**
+ * @param {number} value
+ * @return {!proto.game.GameRequest} returns this
+ */
+proto.game.GameRequest.prototype.setBankVersion = function(value) {
+  return jspb.Message.setProto3IntField(this, 3, value);
+};
+
+
 
 /**
  * List of repeated fields within this message type.
@@ -975,7 +1491,9 @@ proto.game.QuestionCard.toObject = function(includeInstance, msg) {
 questionId: jspb.Message.getFieldWithDefault(msg, 1, ""),
 questionText: jspb.Message.getFieldWithDefault(msg, 2, ""),
 optionsList: (f = jspb.Message.getRepeatedField(msg, 3)) == null ? undefined : f,
-timeLimitSeconds: jspb.Message.getFieldWithDefault(msg, 4, 0)
+timeLimitSeconds: jspb.Message.getFieldWithDefault(msg, 4, 0),
+bankIndex: jspb.Message.getFieldWithDefault(msg, 5, 0),
+bankVersion: jspb.Message.getFieldWithDefault(msg, 6, 0)
   };
 
   if (includeInstance) {
@@ -1028,6 +1546,14 @@ proto.game.QuestionCard.deserializeBinaryFromReader = function(msg, reader) {
       var value = /** @type {number} */ (reader.readInt32());
       msg.setTimeLimitSeconds(value);
       break;
+    case 5:
+      var value = /** @type {number} */ (reader.readInt32());
+      msg.setBankIndex(value);
+      break;
+    case 6:
+      var value = /** @type {number} */ (reader.readUint64());
+      msg.setBankVersion(value);
+      break;
     default:
       reader.skipField();
       break;
@@ -1085,6 +1611,20 @@ proto.game.QuestionCard.serializeBinaryToWriter = function(message, writer) {
       f
     );
   }
+  f = message.getBankIndex();
+  if (f !== 0) {
+    writer.writeInt32(
+      5,
+      f
+    );
+  }
+  f = message.getBankVersion();
+  if (f !== 0) {
+    writer.writeUint64(
+      6,
+      f
+    );
+  }
 };
 
 
@@ -1179,6 +1719,42 @@ proto.game.QuestionCard.prototype.setTimeLimitSeconds = function(value) {
 };
 
 
+/**
+ * optional int32 bank_index = 5;
+ * @return {number}
+ */
+proto.game.QuestionCard.prototype.getBankIndex = function() {
+  return /** @type {number} */ (jspb.Message.getFieldWithDefault(this, 5, 0));
+};
+
+
+/**
+ * @param {number} value
+ * @return {!proto.game.QuestionCard} returns this
+ */
+proto.game.QuestionCard.prototype.setBankIndex = function(value) {
+  return jspb.Message.setProto3IntField(this, 5, value);
+};
+
+
+/**
+ * optional uint64 bank_version = 6;
+ * @return {number}
+ */
+proto.game.QuestionCard.prototype.getBankVersion = function() {
+  return /** @type {number} */ (jspb.Message.getFieldWithDefault(this, 6, 0));
+};
+
+
+/**
+ * @param {number} value
+ * @return {!proto.game.QuestionCard} returns this
+ */
+proto.game.QuestionCard.prototype.setBankVersion = function(value) {
+  return jspb.Message.setProto3IntField(this, 6, value);
+};
+
+
 
 
 
@@ -1195,8 +1771,8 @@ if (jspb.Message.GENERATE_TO_OBJECT) {
  *     http://goto/soy-param-migration
  * @return {!Object}
  */
-proto.game.AnswerRequest.prototype.toObject = function(opt_includeInstance) {
-  return proto.game.AnswerRequest.toObject(opt_includeInstance, this);
+proto.game.QuestionBankRequest.prototype.toObject = function(opt_includeInstance) {
+  return proto.game.QuestionBankRequest.toObject(opt_includeInstance, this);
 };
 
 
@@ -1205,17 +1781,16 @@ proto.game.AnswerRequest.prototype.toObject = function(opt_includeInstance) {
  * @param {boolean|undefined} includeInstance Deprecated. Whether to include
  *     the JSPB instance for transitional soy proto support:
  *     http://goto/soy-param-migration
- * @param {!proto.game.AnswerRequest} msg The msg instance to transform.
+ * @param {!proto.game.QuestionBankRequest} msg The msg instance to transform.
  * @return {!Object}
  * @suppress {unusedLocalVariables} f is only used for nested messages
  */
-proto.game.AnswerRequest.toObject = function(includeInstance, msg) {
+proto.game.QuestionBankRequest.toObject = function(includeInstance, msg) {
   var f, obj = {
-gameId: jspb.Message.getFieldWithDefault(msg, 1, ""),
-playerId: jspb.Message.getFieldWithDefault(msg, 2, ""),
-questionId: jspb.Message.getFieldWithDefault(msg, 3, ""),
-selectedOption: jspb.Message.getFieldWithDefault(msg, 4, ""),
-answerTimestamp: jspb.Message.getFieldWithDefault(msg, 5, 0)
+knownVersion: jspb.Message.getFieldWithDefault(msg, 1, 0),
+offset: jspb.Message.getFieldWithDefault(msg, 2, 0),
+limit: jspb.Message.getFieldWithDefault(msg, 3, 0),
+chunkSize: jspb.Message.getFieldWithDefault(msg, 4, 0)
   };
 
   if (includeInstance) {
@@ -1229,23 +1804,23 @@ answerTimestamp: jspb.Message.getFieldWithDefault(msg, 5, 0)
 /**
  * Deserializes binary data (in protobuf wire format).
  * @param {jspb.ByteSource} bytes The bytes to deserialize.
- * @return {!proto.game.AnswerRequest}
+ * @return {!proto.game.QuestionBankRequest}
  */
-proto.game.AnswerRequest.deserializeBinary = function(bytes) {
+proto.game.QuestionBankRequest.deserializeBinary = function(bytes) {
   var reader = new jspb.BinaryReader(bytes);
-  var msg = new proto.game.AnswerRequest;
-  return proto.game.AnswerRequest.deserializeBinaryFromReader(msg, reader);
+  var msg = new proto.game.QuestionBankRequest;
+  return proto.game.QuestionBankRequest.deserializeBinaryFromReader(msg, reader);
 };
 
 
 /**
  * Deserializes binary data (in protobuf wire format) from the
  * given reader into the given message object.
- * @param {!proto.game.AnswerRequest} msg The message object to deserialize into.
+ * @param {!proto.game.QuestionBankRequest} msg The message object to deserialize into.
  * @param {!jspb.BinaryReader} reader The BinaryReader to use.
- * @return {!proto.game.AnswerRequest}
+ * @return {!proto.game.QuestionBankRequest}
  */
-proto.game.AnswerRequest.deserializeBinaryFromReader = function(msg, reader) {
+proto.game.QuestionBankRequest.deserializeBinaryFromReader = function(msg, reader) {
   while (reader.nextField()) {
     if (reader.isEndGroup()) {
       break;
@@ -1253,24 +1828,20 @@ proto.game.AnswerRequest.deserializeBinaryFromReader = function(msg, reader) {
     var field = reader.getFieldNumber();
     switch (field) {
     case 1:
-      var value = /** @type {string} */ (reader.readString());
-      msg.setGameId(value);
+      var value = /** @type {number} */ (reader.readUint64());
+      msg.setKnownVersion(value);
       break;
     case 2:
-      var value = /** @type {string} */ (reader.readString());
-      msg.setPlayerId(value);
+      var value = /** @type {number} */ (reader.readInt32());
+      msg.setOffset(value);
       break;
     case 3:
-      var value = /** @type {string} */ (reader.readString());
-      msg.setQuestionId(value);
+      var value = /** @type {number} */ (reader.readInt32());
+      msg.setLimit(value);
       break;
     case 4:
-      var value = /** @type {string} */ (reader.readString());
-      msg.setSelectedOption(value);
-      break;
-    case 5:
-      var value = /** @type {number} */ (reader.readInt64());
-      msg.setAnswerTimestamp(value);
+      var value = /** @type {number} */ (reader.readInt32());
+      msg.setChunkSize(value);
       break;
     default:
       reader.skipField();
@@ -1285,9 +1856,9 @@ proto.game.AnswerRequest.deserializeBinaryFromReader = function(msg, reader) {
  * Serializes the message to binary data (in protobuf wire format).
  * @return {!Uint8Array}
  */
-proto.game.AnswerRequest.prototype.serializeBinary = function() {
+proto.game.QuestionBankRequest.prototype.serializeBinary = function() {
   var writer = new jspb.BinaryWriter();
-  proto.game.AnswerRequest.serializeBinaryToWriter(this, writer);
+  proto.game.QuestionBankRequest.serializeBinaryToWriter(this, writer);
   return writer.getResultBuffer();
 };
 
@@ -1295,44 +1866,37 @@ proto.game.AnswerRequest.prototype.serializeBinary = function() {
 /**
  * Serializes the given message to binary data (in protobuf wire
  * format), writing to the given BinaryWriter.
- * @param {!proto.game.AnswerRequest} message
+ * @param {!proto.game.QuestionBankRequest} message
  * @param {!jspb.BinaryWriter} writer
  * @suppress {unusedLocalVariables} f is only used for nested messages
  */
-proto.game.AnswerRequest.serializeBinaryToWriter = function(message, writer) {
+proto.game.QuestionBankRequest.serializeBinaryToWriter = function(message, writer) {
   var f = undefined;
-  f = message.getGameId();
-  if (f.length > 0) {
-    writer.writeString(
+  f = message.getKnownVersion();
+  if (f !== 0) {
+    writer.writeUint64(
       1,
       f
     );
   }
-  f = message.getPlayerId();
-  if (f.length > 0) {
-    writer.writeString(
+  f = message.getOffset();
+  if (f !== 0) {
+    writer.writeInt32(
       2,
       f
     );
   }
-  f = message.getQuestionId();
-  if (f.length > 0) {
-    writer.writeString(
+  f = message.getLimit();
+  if (f !== 0) {
+    writer.writeInt32(
       3,
       f
     );
   }
-  f = message.getSelectedOption();
-  if (f.length > 0) {
-    writer.writeString(
-      4,
-      f
-    );
-  }
-  f = message.getAnswerTimestamp();
+  f = message.getChunkSize();
   if (f !== 0) {
-    writer.writeInt64(
-      5,
+    writer.writeInt32(
+      4,
       f
     );
   }
@@ -1340,95 +1904,84 @@ proto.game.AnswerRequest.serializeBinaryToWriter = function(message, writer) {
 
 
 /**
- * optional string game_id = 1;
- * @return {string}
+ * optional uint64 known_version = 1;
+ * @return {number}
  */
-proto.game.AnswerRequest.prototype.getGameId = function() {
-  return /** @type {string} */ (jspb.Message.getFieldWithDefault(this, 1, ""));
+proto.game.QuestionBankRequest.prototype.getKnownVersion = function() {
+  return /** @type {number} */ (jspb.Message.getFieldWithDefault(this, 1, 0));
 };
 
 
 /**
- * @param {string} value
- * @return {!proto.game.AnswerRequest} returns this
+ * @param {number} value
+ * @return {!proto.game.QuestionBankRequest} returns this
  */
-proto.game.AnswerRequest.prototype.setGameId = function(value) {
-  return jspb.Message.setProto3StringField(this, 1, value);
+proto.game.QuestionBankRequest.prototype.setKnownVersion = function(value) {
+  return jspb.Message.setProto3IntField(this, 1, value);
 };
 
 
 /**
- * optional string player_id = 2;
- * @return {string}
+ * optional int32 offset = 2;
+ * @return {number}
  */
-proto.game.AnswerRequest.prototype.getPlayerId = function() {
-  return /** @type {string} */ (jspb.Message.getFieldWithDefault(this, 2, ""));
+proto.game.QuestionBankRequest.prototype.getOffset = function() {
+  return /** @type {number} */ (jspb.Message.getFieldWithDefault(this, 2, 0));
 };
 
 
 /**
- * @param {string} value
- * @return {!proto.game.AnswerRequest} returns this
+ * @param {number} value
+ * @return {!proto.game.QuestionBankRequest} returns this
  */
-proto.game.AnswerRequest.prototype.setPlayerId = function(value) {
-  return jspb.Message.setProto3StringField(this, 2, value);
+proto.game.QuestionBankRequest.prototype.setOffset = function(value) {
+  return jspb.Message.setProto3IntField(this, 2, value);
 };
 
 
 /**
- * optional string question_id = 3;
- * @return {string}
+ * optional int32 limit = 3;
+ * @return {number}
  */
-proto.game.AnswerRequest.prototype.getQuestionId = function() {
-  return /** @type {string} */ (jspb.Message.getFieldWithDefault(this, 3, ""));
+proto.game.QuestionBankRequest.prototype.getLimit = function() {
+  return /** @type {number} */ (jspb.Message.getFieldWithDefault(this, 3, 0));
 };
 
 
 /**
- * @param {string} value
- * @return {!proto.game.AnswerRequest} returns this
+ * @param {number} value
+ * @return {!proto.game.QuestionBankRequest} returns this
  */
-proto.game.AnswerRequest.prototype.setQuestionId = function(value) {
-  return jspb.Message.setProto3StringField(this, 3, value);
+proto.game.QuestionBankRequest.prototype.setLimit = function(value) {
+  return jspb.Message.setProto3IntField(this, 3, value);
 };
 
 
 /**
- * optional string selected_option = 4;
- * @return {string}
+ * optional int32 chunk_size = 4;
+ * @return {number}
  */
-proto.game.AnswerRequest.prototype.getSelectedOption = function() {
-  return /** @type {string} */ (jspb.Message.getFieldWithDefault(this, 4, ""));
+proto.game.QuestionBankRequest.prototype.getChunkSize = function() {
+  return /** @type {number} */ (jspb.Message.getFieldWithDefault(this, 4, 0));
 };
 
 
 /**
- * @param {string} value
- * @return {!proto.game.AnswerRequest} returns this
+ * @param {number} value
+ * @return {!proto.game.QuestionBankRequest} returns this
  */
-proto.game.AnswerRequest.prototype.setSelectedOption = function(value) {
-  return jspb.Message.setProto3StringField(this, 4, value);
+proto.game.QuestionBankRequest.prototype.setChunkSize = function(value) {
+  return jspb.Message.setProto3IntField(this, 4, value);
 };
 
 
-/**
- * optional int64 answer_timestamp = 5;
- * @return {number}
- */
-proto.game.AnswerRequest.prototype.getAnswerTimestamp = function() {
-  return /** @type {number} */ (jspb.Message.getFieldWithDefault(this, 5, 0));
-};
-
 
 /**
- * @param {number} value
- * @return {!proto.game.AnswerRequest} returns this
+ * List of repeated fields within this message type.
+ * @private {!Array<number>}
+ * @const
  */
-proto.game.AnswerRequest.prototype.setAnswerTimestamp = function(value) {
-  return jspb.Message.setProto3IntField(this, 5, value);
-};
-
-
+proto.game.BankQuestion.repeatedFields_ = [3];
 
 
 
@@ -1445,8 +1998,8 @@ if (jspb.Message.GENERATE_TO_OBJECT) {
  *     http://goto/soy-param-migration
  * @return {!Object}
  */
-proto.game.AnswerResult.prototype.toObject = function(opt_includeInstance) {
-  return proto.game.AnswerResult.toObject(opt_includeInstance, this);
+proto.game.BankQuestion.prototype.toObject = function(opt_includeInstance) {
+  return proto.game.BankQuestion.toObject(opt_includeInstance, this);
 };
 
 
@@ -1455,15 +2008,17 @@ proto.game.AnswerResult.prototype.toObject = function(opt_includeInstance) {
  * @param {boolean|undefined} includeInstance Deprecated. Whether to include
  *     the JSPB instance for transitional soy proto support:
  *     http://goto/soy-param-migration
- * @param {!proto.game.AnswerResult} msg The msg instance to transform.
+ * @param {!proto.game.BankQuestion} msg The msg instance to transform.
  * @return {!Object}
  * @suppress {unusedLocalVariables} f is only used for nested messages
  */
-proto.game.AnswerResult.toObject = function(includeInstance, msg) {
+proto.game.BankQuestion.toObject = function(includeInstance, msg) {
   var f, obj = {
-correct: jspb.Message.getBooleanFieldWithDefault(msg, 1, false),
-pointsAwarded: jspb.Message.getFieldWithDefault(msg, 2, 0),
-explanation: jspb.Message.getFieldWithDefault(msg, 3, "")
+questionId: jspb.Message.getFieldWithDefault(msg, 1, ""),
+questionText: jspb.Message.getFieldWithDefault(msg, 2, ""),
+optionsList: (f = jspb.Message.getRepeatedField(msg, 3)) == null ? undefined : f,
+category: jspb.Message.getFieldWithDefault(msg, 4, ""),
+difficulty: jspb.Message.getFieldWithDefault(msg, 5, "")
   };
 
   if (includeInstance) {
@@ -1477,23 +2032,23 @@ explanation: jspb.Message.getFieldWithDefault(msg, 3, "")
 /**
  * Deserializes binary data (in protobuf wire format).
  * @param {jspb.ByteSource} bytes The bytes to deserialize.
- * @return {!proto.game.AnswerResult}
+ * @return {!proto.game.BankQuestion}
  */
-proto.game.AnswerResult.deserializeBinary = function(bytes) {
+proto.game.BankQuestion.deserializeBinary = function(bytes) {
   var reader = new jspb.BinaryReader(bytes);
-  var msg = new proto.game.AnswerResult;
-  return proto.game.AnswerResult.deserializeBinaryFromReader(msg, reader);
+  var msg = new proto.game.BankQuestion;
+  return proto.game.BankQuestion.deserializeBinaryFromReader(msg, reader);
 };
 
 
 /**
  * Deserializes binary data (in protobuf wire format) from the
  * given reader into the given message object.
- * @param {!proto.game.AnswerResult} msg The message object to deserialize into.
+ * @param {!proto.game.BankQuestion} msg The message object to deserialize into.
  * @param {!jspb.BinaryReader} reader The BinaryReader to use.
- * @return {!proto.game.AnswerResult}
+ * @return {!proto.game.BankQuestion}
  */
-proto.game.AnswerResult.deserializeBinaryFromReader = function(msg, reader) {
+proto.game.BankQuestion.deserializeBinaryFromReader = function(msg, reader) {
   while (reader.nextField()) {
     if (reader.isEndGroup()) {
       break;
@@ -1501,16 +2056,24 @@ proto.game.AnswerResult.deserializeBinaryFromReader = function(msg, reader) {
     var field = reader.getFieldNumber();
     switch (field) {
     case 1:
-      var value = /** @type {boolean} */ (reader.readBool());
-      msg.setCorrect(value);
+      var value = /** @type {string} */ (reader.readString());
+      msg.setQuestionId(value);
       break;
     case 2:
-      var value = /** @type {number} */ (reader.readInt32());
-      msg.setPointsAwarded(value);
+      var value = /** @type {string} */ (reader.readString());
+      msg.setQuestionText(value);
       break;
     case 3:
       var value = /** @type {string} */ (reader.readString());
-      msg.setExplanation(value);
+      msg.addOptions(value);
+      break;
+    case 4:
+      var value = /** @type {string} */ (reader.readString());
+      msg.setCategory(value);
+      break;
+    case 5:
+      var value = /** @type {string} */ (reader.readString());
+      msg.setDifficulty(value);
       break;
     default:
       reader.skipField();
@@ -1525,9 +2088,9 @@ proto.game.AnswerResult.deserializeBinaryFromReader = function(msg, reader) {
  * Serializes the message to binary data (in protobuf wire format).
  * @return {!Uint8Array}
  */
-proto.game.AnswerResult.prototype.serializeBinary = function() {
+proto.game.BankQuestion.prototype.serializeBinary = function() {
   var writer = new jspb.BinaryWriter();
-  proto.game.AnswerResult.serializeBinaryToWriter(this, writer);
+  proto.game.BankQuestion.serializeBinaryToWriter(this, writer);
   return writer.getResultBuffer();
 };
 
@@ -1535,91 +2098,167 @@ proto.game.AnswerResult.prototype.serializeBinary = function() {
 /**
  * Serializes the given message to binary data (in protobuf wire
  * format), writing to the given BinaryWriter.
- * @param {!proto.game.AnswerResult} message
+ * @param {!proto.game.BankQuestion} message
  * @param {!jspb.BinaryWriter} writer
  * @suppress {unusedLocalVariables} f is only used for nested messages
  */
-proto.game.AnswerResult.serializeBinaryToWriter = function(message, writer) {
+proto.game.BankQuestion.serializeBinaryToWriter = function(message, writer) {
   var f = undefined;
-  f = message.getCorrect();
-  if (f) {
-    writer.writeBool(
+  f = message.getQuestionId();
+  if (f.length > 0) {
+    writer.writeString(
       1,
       f
     );
   }
-  f = message.getPointsAwarded();
-  if (f !== 0) {
-    writer.writeInt32(
+  f = message.getQuestionText();
+  if (f.length > 0) {
+    writer.writeString(
       2,
       f
     );
   }
-  f = message.getExplanation();
+  f = message.getOptionsList();
   if (f.length > 0) {
-    writer.writeString(
+    writer.writeRepeatedString(
       3,
       f
     );
   }
+  f = message.getCategory();
+  if (f.length > 0) {
+    writer.writeString(
+      4,
+      f
+    );
+  }
+  f = message.getDifficulty();
+  if (f.length > 0) {
+    writer.writeString(
+      5,
+      f
+    );
+  }
 };
 
 
 /**
- * optional bool correct = 1;
- * @return {boolean}
+ * optional string question_id = 1;
+ * @return {string}
  */
-proto.game.AnswerResult.prototype.getCorrect = function() {
-  return /** @type {boolean} */ (jspb.Message.getBooleanFieldWithDefault(this, 1, false));
+proto.game.BankQuestion.prototype.getQuestionId = function() {
+  return /** @type {string} */ (jspb.Message.getFieldWithDefault(this, 1, ""));
 };
 
 
 /**
- * @param {boolean} value
- * @return {!proto.game.AnswerResult} returns this
+ * @param {string} value
+ * @return {!proto.game.BankQuestion} returns this
  */
-proto.game.AnswerResult.prototype.setCorrect = function(value) {
-  return jspb.Message.setProto3BooleanField(this, 1, value);
+proto.game.BankQuestion.prototype.setQuestionId = function(value) {
+  return jspb.Message.setProto3StringField(this, 1, value);
 };
 
 
 /**
- * optional int32 points_awarded = 2;
- * @return {number}
+ * optional string question_text = 2;
+ * @return {string}
  */
-proto.game.AnswerResult.prototype.getPointsAwarded = function() {
-  return /** @type {number} */ (jspb.Message.getFieldWithDefault(this, 2, 0));
+proto.game.BankQuestion.prototype.getQuestionText = function() {
+  return /** @type {string} */ (jspb.Message.getFieldWithDefault(this, 2, ""));
 };
 
 
 /**
- * @param {number} value
- * @return {!proto.game.AnswerResult} returns this
+ * @param {string} value
+ * @return {!proto.game.BankQuestion} returns this
  */
-proto.game.AnswerResult.prototype.setPointsAwarded = function(value) {
-  return jspb.Message.setProto3IntField(this, 2, value);
+proto.game.BankQuestion.prototype.setQuestionText = function(value) {
+  return jspb.Message.setProto3StringField(this, 2, value);
 };
 
 
 /**
- * optional string explanation = 3;
+ * repeated string options = 3;
+ * @return {!Array<string>}
+ */
+proto.game.BankQuestion.prototype.getOptionsList = function() {
+  return /** @type {!Array<string>} */ (jspb.Message.getRepeatedField(this, 3));
+};
+
+
+/**
+ * @param {!Array<string>} value
+ * @return {!proto.game.BankQuestion} returns this
+ */
+proto.game.BankQuestion.prototype.setOptionsList = function(value) {
+  return jspb.Message.setField(this, 3, value || []);
+};
+
+
+/**
+ * @param {string} value
+ * @param {number=} opt_index
+ * @return {!proto.game.BankQuestion} returns this
+ */
+proto.game.BankQuestion.prototype.addOptions = function(value, opt_index) {
+  return jspb.Message.addToRepeatedField(this, 3, value, opt_index);
+};
+
+
+/**
+ * Clears the list making it empty but non-null.
+ * @return {!proto.game.BankQuestion} returns this
+ */
+proto.game.BankQuestion.prototype.clearOptionsList = function() {
+  return this.setOptionsList([]);
+};
+
+
+/**
+ * optional string category = 4;
  * @return {string}
  */
-proto.game.AnswerResult.prototype.getExplanation = function() {
-  return /** @type {string} */ (jspb.Message.getFieldWithDefault(this, 3, ""));
+proto.game.BankQuestion.prototype.getCategory = function() {
+  return /** @type {string} */ (jspb.Message.getFieldWithDefault(this, 4, ""));
 };
 
 
 /**
  * @param {string} value
- * @return {!proto.game.AnswerResult} returns this
+ * @return {!proto.game.BankQuestion} returns this
  */
-proto.game.AnswerResult.prototype.setExplanation = function(value) {
-  return jspb.Message.setProto3StringField(this, 3, value);
+proto.game.BankQuestion.prototype.setCategory = function(value) {
+  return jspb.Message.setProto3StringField(this, 4, value);
+};
+
+
+/**
+ * optional string difficulty = 5;
+ * @return {string}
+ */
+proto.game.BankQuestion.prototype.getDifficulty = function() {
+  return /** @type {string} */ (jspb.Message.getFieldWithDefault(this, 5, ""));
+};
+
+
+/**
+ * @param {string} value
+ * @return {!proto.game.BankQuestion} returns this
+ */
+proto.game.BankQuestion.prototype.setDifficulty = function(value) {
+  return jspb.Message.setProto3StringField(this, 5, value);
 };
 
 
 
+/**
+ * List of repeated fields within this message type.
+ * @private {!Array<number>}
+ * @const
+ */
+proto.game.QuestionBankChunk.repeatedFields_ = [4];
+
 
 
 if (jspb.Message.GENERATE_TO_OBJECT) {
@@ -1635,8 +2274,8 @@ if (jspb.Message.GENERATE_TO_OBJECT) {
  *     http://goto/soy-param-migration
  * @return {!Object}
  */
-proto.game.GameId.prototype.toObject = function(opt_includeInstance) {
-  return proto.game.GameId.toObject(opt_includeInstance, this);
+proto.game.QuestionBankChunk.prototype.toObject = function(opt_includeInstance) {
+  return proto.game.QuestionBankChunk.toObject(opt_includeInstance, this);
 };
 
 
@@ -1645,13 +2284,18 @@ proto.game.GameId.prototype.toObject = function(opt_includeInstance) {
  * @param {boolean|undefined} includeInstance Deprecated. Whether to include
  *     the JSPB instance for transitional soy proto support:
  *     http://goto/soy-param-migration
- * @param {!proto.game.GameId} msg The msg instance to transform.
+ * @param {!proto.game.QuestionBankChunk} msg The msg instance to transform.
  * @return {!Object}
  * @suppress {unusedLocalVariables} f is only used for nested messages
  */
-proto.game.GameId.toObject = function(includeInstance, msg) {
+proto.game.QuestionBankChunk.toObject = function(includeInstance, msg) {
   var f, obj = {
-gameId: jspb.Message.getFieldWithDefault(msg, 1, "")
+version: jspb.Message.getFieldWithDefault(msg, 1, 0),
+totalQuestions: jspb.Message.getFieldWithDefault(msg, 2, 0),
+offset: jspb.Message.getFieldWithDefault(msg, 3, 0),
+questionsList: jspb.Message.toObjectList(msg.getQuestionsList(),
+    proto.game.BankQuestion.toObject, includeInstance),
+notModified: jspb.Message.getBooleanFieldWithDefault(msg, 5, false)
   };
 
   if (includeInstance) {
@@ -1665,23 +2309,23 @@ gameId: jspb.Message.getFieldWithDefault(msg, 1, "")
 /**
  * Deserializes binary data (in protobuf wire format).
  * @param {jspb.ByteSource} bytes The bytes to deserialize.
- * @return {!proto.game.GameId}
+ * @return {!proto.game.QuestionBankChunk}
  */
-proto.game.GameId.deserializeBinary = function(bytes) {
+proto.game.QuestionBankChunk.deserializeBinary = function(bytes) {
   var reader = new jspb.BinaryReader(bytes);
-  var msg = new proto.game.GameId;
-  return proto.game.GameId.deserializeBinaryFromReader(msg, reader);
+  var msg = new proto.game.QuestionBankChunk;
+  return proto.game.QuestionBankChunk.deserializeBinaryFromReader(msg, reader);
 };
 
 
 /**
  * Deserializes binary data (in protobuf wire format) from the
  * given reader into the given message object.
- * @param {!proto.game.GameId} msg The message object to deserialize into.
+ * @param {!proto.game.QuestionBankChunk} msg The message object to deserialize into.
  * @param {!jspb.BinaryReader} reader The BinaryReader to use.
- * @return {!proto.game.GameId}
+ * @return {!proto.game.QuestionBankChunk}
  */
-proto.game.GameId.deserializeBinaryFromReader = function(msg, reader) {
+proto.game.QuestionBankChunk.deserializeBinaryFromReader = function(msg, reader) {
   while (reader.nextField()) {
     if (reader.isEndGroup()) {
       break;
@@ -1689,8 +2333,25 @@ proto.game.GameId.deserializeBinaryFromReader = function(msg, reader) {
     var field = reader.getFieldNumber();
     switch (field) {
     case 1:
-      var value = /** @type {string} */ (reader.readString());
-      msg.setGameId(value);
+      var value = /** @type {number} */ (reader.readUint64());
+      msg.setVersion(value);
+      break;
+    case 2:
+      var value = /** @type {number} */ (reader.readInt32());
+      msg.setTotalQuestions(value);
+      break;
+    case 3:
+      var value = /** @type {number} */ (reader.readInt32());
+      msg.setOffset(value);
+      break;
+    case 4:
+      var value = new proto.game.BankQuestion;
+      reader.readMessage(value,proto.game.BankQuestion.deserializeBinaryFromReader);
+      msg.addQuestions(value);
+      break;
+    case 5:
+      var value = /** @type {boolean} */ (reader.readBool());
+      msg.setNotModified(value);
       break;
     default:
       reader.skipField();
@@ -1705,9 +2366,9 @@ proto.game.GameId.deserializeBinaryFromReader = function(msg, reader) {
  * Serializes the message to binary data (in protobuf wire format).
  * @return {!Uint8Array}
  */
-proto.game.GameId.prototype.serializeBinary = function() {
+proto.game.QuestionBankChunk.prototype.serializeBinary = function() {
   var writer = new jspb.BinaryWriter();
-  proto.game.GameId.serializeBinaryToWriter(this, writer);
+  proto.game.QuestionBankChunk.serializeBinaryToWriter(this, writer);
   return writer.getResultBuffer();
 };
 
@@ -1715,37 +2376,158 @@ proto.game.GameId.prototype.serializeBinary = function() {
 /**
  * Serializes the given message to binary data (in protobuf wire
  * format), writing to the given BinaryWriter.
- * @param {!proto.game.GameId} message
+ * @param {!proto.game.QuestionBankChunk} message
  * @param {!jspb.BinaryWriter} writer
  * @suppress {unusedLocalVariables} f is only used for nested messages
  */
-proto.game.GameId.serializeBinaryToWriter = function(message, writer) {
+proto.game.QuestionBankChunk.serializeBinaryToWriter = function(message, writer) {
   var f = undefined;
-  f = message.getGameId();
-  if (f.length > 0) {
-    writer.writeString(
+  f = message.getVersion();
+  if (f !== 0) {
+    writer.writeUint64(
       1,
       f
     );
   }
-};
-
-
-/**
- * optional string game_id = 1;
- * @return {string}
- */
-proto.game.GameId.prototype.getGameId = function() {
-  return /** @type {string} */ (jspb.Message.getFieldWithDefault(this, 1, ""));
-};
-
-
-/**
- * @param {string} value
- * @return {!proto.game.GameId} returns this
+  f = message.getTotalQuestions();
+  if (f !== 0) {
+    writer.writeInt32(
+      2,
+      f
+    );
+  }
+  f = message.getOffset();
+  if (f !== 0) {
+    writer.writeInt32(
+      3,
+      f
+    );
+  }
+  f = message.getQuestionsList();
+  if (f.length > 0) {
+    writer.writeRepeatedMessage(
+      4,
+      f,
+      proto.game.BankQuestion.serializeBinaryToWriter
+    );
+  }
+  f = message.getNotModified();
+  if (f) {
+    writer.writeBool(
+      5,
+      f
+    );
+  }
+};
+
+
+/**
+ * optional uint64 version = 1;
+ * @return {number}
  */
-proto.game.GameId.prototype.setGameId = function(value) {
-  return jspb.Message.setProto3StringField(this, 1, value);
+proto.game.QuestionBankChunk.prototype.getVersion = function() {
+  return /** @type {number} */ (jspb.Message.getFieldWithDefault(this, 1, 0));
+};
+
+
+/**
+ * @param {number} value
+ * @return {!proto.game.QuestionBankChunk} returns this
+ */
+proto.game.QuestionBankChunk.prototype.setVersion = function(value) {
+  return jspb.Message.setProto3IntField(this, 1, value);
+};
+
+
+/**
+ * optional int32 total_questions = 2;
+ * @return {number}
+ */
+proto.game.QuestionBankChunk.prototype.getTotalQuestions = function() {
+  return /** @type {number} */ (jspb.Message.getFieldWithDefault(this, 2, 0));
+};
+
+
+/**
+ * @param {number} value
+ * @return {!proto.game.QuestionBankChunk} returns this
+ */
+proto.game.QuestionBankChunk.prototype.setTotalQuestions = function(value) {
+  return jspb.Message.setProto3IntField(this, 2, value);
+};
+
+
+/**
+ * optional int32 offset = 3;
+ * @return {number}
+ */
+proto.game.QuestionBankChunk.prototype.getOffset = function() {
+  return /** @type {number} */ (jspb.Message.getFieldWithDefault(this, 3, 0));
+};
+
+
+/**
+ * @param {number} value
+ * @return {!proto.game.QuestionBankChunk} returns this
+ */
+proto.game.QuestionBankChunk.prototype.setOffset = function(value) {
+  return jspb.Message.setProto3IntField(this, 3, value);
+};
+
+
+/**
+ * repeated BankQuestion questions = 4;
+ * @return {!Array<!proto.game.BankQuestion>}
+ */
+proto.game.QuestionBankChunk.prototype.getQuestionsList = function() {
+  return /** @type{!Array<!proto.game.BankQuestion>} */ (
+    jspb.Message.getRepeatedWrapperField(this, proto.game.BankQuestion, 4));
+};
+
+
+/**
+ * @param {!Array<!proto.game.BankQuestion>} value
+ * @return {!proto.game.QuestionBankChunk} returns this
+*/
+proto.game.QuestionBankChunk.prototype.setQuestionsList = function(value) {
+  return jspb.Message.setRepeatedWrapperField(this, 4, value);
+};
+
+
+/**
+ * @param {!proto.game.BankQuestion=} opt_value
+ * @param {number=} opt_index
+ * @return {!proto.game.BankQuestion}
+ */
+proto.game.QuestionBankChunk.prototype.addQuestions = function(opt_value, opt_index) {
+  return jspb.Message.addToRepeatedWrapperField(this, 4, opt_value, proto.game.BankQuestion, opt_index);
+};
+
+
+/**
+ * Clears the list making it empty but non-null.
+ * @return {!proto.game.QuestionBankChunk} returns this
+ */
+proto.game.QuestionBankChunk.prototype.clearQuestionsList = function() {
+  return this.setQuestionsList([]);
+};
+
+
+/**
+ * optional bool not_modified = 5;
+ * @return {boolean}
+ */
+proto.game.QuestionBankChunk.prototype.getNotModified = function() {
+  return /** @type {boolean} */ (jspb.Message.getBooleanFieldWithDefault(this, 5, false));
+};
+
+
+/**
+ * @param {boolean} value
+ * @return {!proto.game.QuestionBankChunk} returns this
+ */
+proto.game.QuestionBankChunk.prototype.setNotModified = function(value) {
+  return jspb.Message.setProto3BooleanField(this, 5, value);
 };
 
 
@@ -1765,8 +2547,8 @@ if (jspb.Message.GENERATE_TO_OBJECT) {
  *     http://goto/soy-param-migration
  * @return {!Object}
  */
-proto.game.LeaderboardEntry.prototype.toObject = function(opt_includeInstance) {
-  return proto.game.LeaderboardEntry.toObject(opt_includeInstance, this);
+proto.game.AnswerRequest.prototype.toObject = function(opt_includeInstance) {
+  return proto.game.AnswerRequest.toObject(opt_includeInstance, this);
 };
 
 
@@ -1775,16 +2557,17 @@ proto.game.LeaderboardEntry.prototype.toObject = function(opt_includeInstance) {
  * @param {boolean|undefined} includeInstance Deprecated. Whether to include
  *     the JSPB instance for transitional soy proto support:
  *     http://goto/soy-param-migration
- * @param {!proto.game.LeaderboardEntry} msg The msg instance to transform.
+ * @param {!proto.game.AnswerRequest} msg The msg instance to transform.
  * @return {!Object}
  * @suppress {unusedLocalVariables} f is only used for nested messages
  */
-proto.game.LeaderboardEntry.toObject = function(includeInstance, msg) {
+proto.game.AnswerRequest.toObject = function(includeInstance, msg) {
   var f, obj = {
-playerId: jspb.Message.getFieldWithDefault(msg, 1, ""),
-playerName: jspb.Message.getFieldWithDefault(msg, 2, ""),
-score: jspb.Message.getFieldWithDefault(msg, 3, 0),
-rank: jspb.Message.getFieldWithDefault(msg, 4, 0)
+gameId: jspb.Message.getFieldWithDefault(msg, 1, ""),
+playerId: jspb.Message.getFieldWithDefault(msg, 2, ""),
+questionId: jspb.Message.getFieldWithDefault(msg, 3, ""),
+selectedOption: jspb.Message.getFieldWithDefault(msg, 4, ""),
+answerTimestamp: jspb.Message.getFieldWithDefault(msg, 5, 0)
   };
 
   if (includeInstance) {
@@ -1798,23 +2581,23 @@ rank: jspb.Message.getFieldWithDefault(msg, 4, 0)
 /**
  * Deserializes binary data (in protobuf wire format).
  * @param {jspb.ByteSource} bytes The bytes to deserialize.
- * @return {!proto.game.LeaderboardEntry}
+ * @return {!proto.game.AnswerRequest}
  */
-proto.game.LeaderboardEntry.deserializeBinary = function(bytes) {
+proto.game.AnswerRequest.deserializeBinary = function(bytes) {
   var reader = new jspb.BinaryReader(bytes);
-  var msg = new proto.game.LeaderboardEntry;
-  return proto.game.LeaderboardEntry.deserializeBinaryFromReader(msg, reader);
+  var msg = new proto.game.AnswerRequest;
+  return proto.game.AnswerRequest.deserializeBinaryFromReader(msg, reader);
 };
 
 
 /**
  * Deserializes binary data (in protobuf wire format) from the
  * given reader into the given message object.
- * @param {!proto.game.LeaderboardEntry} msg The message object to deserialize into.
+ * @param {!proto.game.AnswerRequest} msg The message object to deserialize into.
  * @param {!jspb.BinaryReader} reader The BinaryReader to use.
- * @return {!proto.game.LeaderboardEntry}
+ * @return {!proto.game.AnswerRequest}
  */
-proto.game.LeaderboardEntry.deserializeBinaryFromReader = function(msg, reader) {
+proto.game.AnswerRequest.deserializeBinaryFromReader = function(msg, reader) {
   while (reader.nextField()) {
     if (reader.isEndGroup()) {
       break;
@@ -1823,19 +2606,23 @@ proto.game.LeaderboardEntry.deserializeBinaryFromReader = function(msg, reader)
     switch (field) {
     case 1:
       var value = /** @type {string} */ (reader.readString());
-      msg.setPlayerId(value);
+      msg.setGameId(value);
       break;
     case 2:
       var value = /** @type {string} */ (reader.readString());
-      msg.setPlayerName(value);
+      msg.setPlayerId(value);
       break;
     case 3:
-      var value = /** @type {number} */ (reader.readInt32());
-      msg.setScore(value);
+      var value = /** @type {string} */ (reader.readString());
+      msg.setQuestionId(value);
       break;
     case 4:
-      var value = /** @type {number} */ (reader.readInt32());
-      msg.setRank(value);
+      var value = /** @type {string} */ (reader.readString());
+      msg.setSelectedOption(value);
+      break;
+    case 5:
+      var value = /** @type {number} */ (reader.readInt64());
+      msg.setAnswerTimestamp(value);
       break;
     default:
       reader.skipField();
@@ -1850,9 +2637,9 @@ proto.game.LeaderboardEntry.deserializeBinaryFromReader = function(msg, reader)
  * Serializes the message to binary data (in protobuf wire format).
  * @return {!Uint8Array}
  */
-proto.game.LeaderboardEntry.prototype.serializeBinary = function() {
+proto.game.AnswerRequest.prototype.serializeBinary = function() {
   var writer = new jspb.BinaryWriter();
-  proto.game.LeaderboardEntry.serializeBinaryToWriter(this, writer);
+  proto.game.AnswerRequest.serializeBinaryToWriter(this, writer);
   return writer.getResultBuffer();
 };
 
@@ -1860,123 +2647,3421 @@ proto.game.LeaderboardEntry.prototype.serializeBinary = function() {
 /**
  * Serializes the given message to binary data (in protobuf wire
  * format), writing to the given BinaryWriter.
- * @param {!proto.game.LeaderboardEntry} message
+ * @param {!proto.game.AnswerRequest} message
  * @param {!jspb.BinaryWriter} writer
  * @suppress {unusedLocalVariables} f is only used for nested messages
  */
-proto.game.LeaderboardEntry.serializeBinaryToWriter = function(message, writer) {
+proto.game.AnswerRequest.serializeBinaryToWriter = function(message, writer) {
   var f = undefined;
-  f = message.getPlayerId();
+  f = message.getGameId();
   if (f.length > 0) {
     writer.writeString(
       1,
       f
     );
   }
-  f = message.getPlayerName();
+  f = message.getPlayerId();
   if (f.length > 0) {
     writer.writeString(
       2,
       f
     );
   }
-  f = message.getScore();
-  if (f !== 0) {
-    writer.writeInt32(
+  f = message.getQuestionId();
+  if (f.length > 0) {
+    writer.writeString(
       3,
       f
     );
   }
-  f = message.getRank();
-  if (f !== 0) {
-    writer.writeInt32(
+  f = message.getSelectedOption();
+  if (f.length > 0) {
+    writer.writeString(
       4,
       f
     );
   }
+  f = message.getAnswerTimestamp();
+  if (f !== 0) {
+    writer.writeInt64(
+      5,
+      f
+    );
+  }
 };
 
 
 /**
- * optional string player_id = 1;
+ * optional string game_id = 1;
  * @return {string}
  */
-proto.game.LeaderboardEntry.prototype.getPlayerId = function() {
+proto.game.AnswerRequest.prototype.getGameId = function() {
   return /** @type {string} */ (jspb.Message.getFieldWithDefault(this, 1, ""));
 };
 
 
 /**
  * @param {string} value
- * @return {!proto.game.LeaderboardEntry} returns this
+ * @return {!proto.game.AnswerRequest} returns this
  */
-proto.game.LeaderboardEntry.prototype.setPlayerId = function(value) {
+proto.game.AnswerRequest.prototype.setGameId = function(value) {
   return jspb.Message.setProto3StringField(this, 1, value);
 };
 
 
 /**
- * optional string player_name = 2;
+ * optional string player_id = 2;
  * @return {string}
  */
-proto.game.LeaderboardEntry.prototype.getPlayerName = function() {
+proto.game.AnswerRequest.prototype.getPlayerId = function() {
   return /** @type {string} */ (jspb.Message.getFieldWithDefault(this, 2, ""));
 };
 
 
 /**
  * @param {string} value
- * @return {!proto.game.LeaderboardEntry} returns this
+ * @return {!proto.game.AnswerRequest} returns this
  */
-proto.game.LeaderboardEntry.prototype.setPlayerName = function(value) {
+proto.game.AnswerRequest.prototype.setPlayerId = function(value) {
   return jspb.Message.setProto3StringField(this, 2, value);
 };
 
 
 /**
- * optional int32 score = 3;
- * @return {number}
+ * optional string question_id = 3;
+ * @return {string}
+ */
+proto.game.AnswerRequest.prototype.getQuestionId = function() {
+  return /** @type {string} */ (jspb.Message.getFieldWithDefault(this, 3, ""));
+};
+
+
+/**
+ * @param {string} value
+ * @return {!proto.game.AnswerRequest} returns this
+ */
+proto.game.AnswerRequest.prototype.setQuestionId = function(value) {
+  return jspb.Message.setProto3StringField(this, 3, value);
+};
+
+
+/**
+ * optional string selected_option = 4;
+ * @return {string}
+ */
+proto.game.AnswerRequest.prototype.getSelectedOption = function() {
+  return /** @type {string} */ (jspb.Message.getFieldWithDefault(this, 4, ""));
+};
+
+
+/**
+ * @param {string} value
+ * @return {!proto.game.AnswerRequest} returns this
+ */
+proto.game.AnswerRequest.prototype.setSelectedOption = function(value) {
+  return jspb.Message.setProto3StringField(this, 4, value);
+};
+
+
+/**
+ * optional int64 answer_timestamp = 5;
+ * @return {number}
+ */
+proto.game.AnswerRequest.prototype.getAnswerTimestamp = function() {
+  return /** @type {number} */ (jspb.Message.getFieldWithDefault(this, 5, 0));
+};
+
+
+/**
+ * @param {number} value
+ * @return {!proto.game.AnswerRequest} returns this
+ */
+proto.game.AnswerRequest.prototype.setAnswerTimestamp = function(value) {
+  return jspb.Message.setProto3IntField(this, 5, value);
+};
+
+
+
+
+
+if (jspb.Message.GENERATE_TO_OBJECT) {
+/**
+ * Creates an object representation of this proto.
+ * Field names that are reserved in JavaScript and will be renamed to pb_name.
+ * Optional fields that are not set will be set to undefined.
+ * To access a reserved field use, foo.pb_<name>, eg, foo.pb_default.
+ * For the list of reserved names please see:
+ *     net/proto2/compiler/js/internal/generator.cc#kKeyword.
+ * @param {boolean=} opt_includeInstance Deprecated. whether to include the
+ *     JSPB instance for transitional soy proto support:
+ *     http://goto/soy-param-migration
+ * @return {!Object}
+ */
+proto.game.AnswerResult.prototype.toObject = function(opt_includeInstance) {
+  return proto.game.AnswerResult.toObject(opt_includeInstance, this);
+};
+
+
+/**
+ * Static version of the {@see toObject} method.
+ * @param {boolean|undefined} includeInstance Deprecated. Whether to include
+ *     the JSPB instance for transitional soy proto support:
+ *     http://goto/soy-param-migration
+ * @param {!proto.game.AnswerResult} msg The msg instance to transform.
+ * @return {!Object}
+ * @suppress {unusedLocalVariables} f is only used for nested messages
+ */
+proto.game.AnswerResult.toObject = function(includeInstance, msg) {
+  var f, obj = {
+correct: jspb.Message.getBooleanFieldWithDefault(msg, 1, false),
+pointsAwarded: jspb.Message.getFieldWithDefault(msg, 2, 0),
+explanation: jspb.Message.getFieldWithDefault(msg, 3, ""),
+retryAfterMs: jspb.Message.getFieldWithDefault(msg, 4, 0)
+  };
+
+  if (includeInstance) {
+    obj.$jspbMessageInstance = msg;
+  }
+  return obj;
+};
+}
+
+
+/**
+ * Deserializes binary data (in protobuf wire format).
+ * @param {jspb.ByteSource} bytes The bytes to deserialize.
+ * @return {!proto.game.AnswerResult}
+ */
+proto.game.AnswerResult.deserializeBinary = function(bytes) {
+  var reader = new jspb.BinaryReader(bytes);
+  var msg = new proto.game.AnswerResult;
+  return proto.game.AnswerResult.deserializeBinaryFromReader(msg, reader);
+};
+
+
+/**
+ * Deserializes binary data (in protobuf wire format) from the
+ * given reader into the given message object.
+ * @param {!proto.game.AnswerResult} msg The message object to deserialize into.
+ * @param {!jspb.BinaryReader} reader The BinaryReader to use.
+ * @return {!proto.game.AnswerResult}
+ */
+proto.game.AnswerResult.deserializeBinaryFromReader = function(msg, reader) {
+  while (reader.nextField()) {
+    if (reader.isEndGroup()) {
+      break;
+    }
+    var field = reader.getFieldNumber();
+    switch (field) {
+    case 1:
+      var value = /** @type {boolean} */ (reader.readBool());
+      msg.setCorrect(value);
+      break;
+    case 2:
+      var value = /** @type {number} */ (reader.readInt32());
+      msg.setPointsAwarded(value);
+      break;
+    case 3:
+      var value = /** @type {string} */ (reader.readString());
+      msg.setExplanation(value);
+      break;
+    case 4:
+      var value = /** @type {number} */ (reader.readInt32());
+      msg.setRetryAfterMs(value);
+      break;
+    default:
+      reader.skipField();
+      break;
+    }
+  }
+  return msg;
+};
+
+
+/**
+ * Serializes the message to binary data (in protobuf wire format).
+ * @return {!Uint8Array}
+ */
+proto.game.AnswerResult.prototype.serializeBinary = function() {
+  var writer = new jspb.BinaryWriter();
+  proto.game.AnswerResult.serializeBinaryToWriter(this, writer);
+  return writer.getResultBuffer();
+};
+
+
+/**
+ * Serializes the given message to binary data (in protobuf wire
+ * format), writing to the given BinaryWriter.
+ * @param {!proto.game.AnswerResult} message
+ * @param {!jspb.BinaryWriter} writer
+ * @suppress {unusedLocalVariables} f is only used for nested messages
+ */
+proto.game.AnswerResult.serializeBinaryToWriter = function(message, writer) {
+  var f = undefined;
+  f = message.getCorrect();
+  if (f) {
+    writer.writeBool(
+      1,
+      f
+    );
+  }
+  f = message.getPointsAwarded();
+  if (f !== 0) {
+    writer.writeInt32(
+      2,
+      f
+    );
+  }
+  f = message.getExplanation();
+  if (f.length > 0) {
+    writer.writeString(
+      3,
+      f
+    );
+  }
+  f = message.getRetryAfterMs();
+  if (f !== 0) {
+    writer.writeInt32(
+      4,
+      f
+    );
+  }
+};
+
+
+/**
+ * optional bool correct = 1;
+ * @return {boolean}
+ */
+proto.game.AnswerResult.prototype.getCorrect = function() {
+  return /** @type {boolean} */ (jspb.Message.getBooleanFieldWithDefault(this, 1, false));
+};
+
+
+/**
+ * @param {boolean} value
+ * @return {!proto.game.AnswerResult} returns this
+ */
+proto.game.AnswerResult.prototype.setCorrect = function(value) {
+  return jspb.Message.setProto3BooleanField(this, 1, value);
+};
+
+
+/**
+ * optional int32 points_awarded = 2;
+ * @return {number}
+ */
+proto.game.AnswerResult.prototype.getPointsAwarded = function() {
+  return /** @type {number} */ (jspb.Message.getFieldWithDefault(this, 2, 0));
+};
+
+
+/**
+ * @param {number} value
+ * @return {!proto.game.AnswerResult} returns this
+ */
+proto.game.AnswerResult.prototype.setPointsAwarded = function(value) {
+  return jspb.Message.setProto3IntField(this, 2, value);
+};
+
+
+/**
+ * optional string explanation = 3;
+ * @return {string}
+ */
+proto.game.AnswerResult.prototype.getExplanation = function() {
+  return /** @type {string} */ (jspb.Message.getFieldWithDefault(this, 3, ""));
+};
+
+
+/**
+ * @param {string} value
+ * @return {!proto.game.AnswerResult} returns this
+ */
+proto.game.AnswerResult.prototype.setExplanation = function(value) {
+  return jspb.Message.setProto3StringField(this, 3, value);
+};
+
+
+/**
+ * optional int32 retry_after_ms = 4;
+ * @return {number}
+ */
+proto.game.AnswerResult.prototype.getRetryAfterMs = function() {
+  return /** @type {number} */ (jspb.Message.getFieldWithDefault(this, 4, 0));
+};
+
+
+/**
+ * @param {number} value
+ * @return {!proto.game.AnswerResult} returns this
+ */
+proto.game.AnswerResult.prototype.setRetryAfterMs = function(value) {
+  return jspb.Message.setProto3IntField(this, 4, value);
+};
+
+
+
+
+
+if (jspb.Message.GENERATE_TO_OBJECT) {
+/**
+ * Creates an object representation of this proto.
+ * Field names that are reserved in JavaScript and will be renamed to pb_name.
+ * Optional fields that are not set will be set to undefined.
+ * To access a reserved field use, foo.pb_<name>, eg, foo.pb_default.
+ * For the list of reserved names please see:
+ *     net/proto2/compiler/js/internal/generator.cc#kKeyword.
+ * @param {boolean=} opt_includeInstance Deprecated. whether to include the
+ *     JSPB instance for transitional soy proto support:
+ *     http://goto/soy-param-migration
+ * @return {!Object}
+ */
+proto.game.GameId.prototype.toObject = function(opt_includeInstance) {
+  return proto.game.GameId.toObject(opt_includeInstance, this);
+};
+
+
+/**
+ * Static version of the {@see toObject} method.
+ * @param {boolean|undefined} includeInstance Deprecated. Whether to include
+ *     the JSPB instance for transitional soy proto support:
+ *     http://goto/soy-param-migration
+ * @param {!proto.game.GameId} msg The msg instance to transform.
+ * @return {!Object}
+ * @suppress {unusedLocalVariables} f is only used for nested messages
+ */
+proto.game.GameId.toObject = function(includeInstance, msg) {
+  var f, obj = {
+gameId: jspb.Message.getFieldWithDefault(msg, 1, "")
+  };
+
+  if (includeInstance) {
+    obj.$jspbMessageInstance = msg;
+  }
+  return obj;
+};
+}
+
+
+/**
+ * Deserializes binary data (in protobuf wire format).
+ * @param {jspb.ByteSource} bytes The bytes to deserialize.
+ * @return {!proto.game.GameId}
+ */
+proto.game.GameId.deserializeBinary = function(bytes) {
+  var reader = new jspb.BinaryReader(bytes);
+  var msg = new proto.game.GameId;
+  return proto.game.GameId.deserializeBinaryFromReader(msg, reader);
+};
+
+
+/**
+ * Deserializes binary data (in protobuf wire format) from the
+ * given reader into the given message object.
+ * @param {!proto.game.GameId} msg The message object to deserialize into.
+ * @param {!jspb.BinaryReader} reader The BinaryReader to use.
+ * @return {!proto.game.GameId}
+ */
+proto.game.GameId.deserializeBinaryFromReader = function(msg, reader) {
+  while (reader.nextField()) {
+    if (reader.isEndGroup()) {
+      break;
+    }
+    var field = reader.getFieldNumber();
+    switch (field) {
+    case 1:
+      var value = /** @type {string} */ (reader.readString());
+      msg.setGameId(value);
+      break;
+    default:
+      reader.skipField();
+      break;
+    }
+  }
+  return msg;
+};
+
+
+/**
+ * Serializes the message to binary data (in protobuf wire format).
+ * @return {!Uint8Array}
+ */
+proto.game.GameId.prototype.serializeBinary = function() {
+  var writer = new jspb.BinaryWriter();
+  proto.game.GameId.serializeBinaryToWriter(this, writer);
+  return writer.getResultBuffer();
+};
+
+
+/**
+ * Serializes the given message to binary data (in protobuf wire
+ * format), writing to the given BinaryWriter.
+ * @param {!proto.game.GameId} message
+ * @param {!jspb.BinaryWriter} writer
+ * @suppress {unusedLocalVariables} f is only used for nested messages
+ */
+proto.game.GameId.serializeBinaryToWriter = function(message, writer) {
+  var f = undefined;
+  f = message.getGameId();
+  if (f.length > 0) {
+    writer.writeString(
+      1,
+      f
+    );
+  }
+};
+
+
+/**
+ * optional string game_id = 1;
+ * @return {string}
+ */
+proto.game.GameId.prototype.getGameId = function() {
+  return /** @type {string} */ (jspb.Message.getFieldWithDefault(this, 1, ""));
+};
+
+
+/**
+ * @param {string} value
+ * @return {!proto.game.GameId} returns this
+ */
+proto.game.GameId.prototype.setGameId = function(value) {
+  return jspb.Message.setProto3StringField(this, 1, value);
+};
+
+
+
+
+
+if (jspb.Message.GENERATE_TO_OBJECT) {
+/**
+ * Creates an object representation of this proto.
+ * Field names that are reserved in JavaScript and will be renamed to pb_name.
+ * Optional fields that are not set will be set to undefined.
+ * To access a reserved field use, foo.pb_<name>, eg, foo.pb_default.
+ * For the list of reserved names please see:
+ *     net/proto2/compiler/js/internal/generator.cc#kKeyword.
+ * @param {boolean=} opt_includeInstance Deprecated. whether to include the
+ *     JSPB instance for transitional soy proto support:
+ *     http://goto/soy-param-migration
+ * @return {!Object}
+ */
+proto.game.LeaderboardRequest.prototype.toObject = function(opt_includeInstance) {
+  return proto.game.LeaderboardRequest.toObject(opt_includeInstance, this);
+};
+
+
+/**
+ * Static version of the {@see toObject} method.
+ * @param {boolean|undefined} includeInstance Deprecated. Whether to include
+ *     the JSPB instance for transitional soy proto support:
+ *     http://goto/soy-param-migration
+ * @param {!proto.game.LeaderboardRequest} msg The msg instance to transform.
+ * @return {!Object}
+ * @suppress {unusedLocalVariables} f is only used for nested messages
+ */
+proto.game.LeaderboardRequest.toObject = function(includeInstance, msg) {
+  var f, obj = {
+gameId: jspb.Message.getFieldWithDefault(msg, 1, ""),
+limit: jspb.Message.getFieldWithDefault(msg, 2, 0),
+offset: jspb.Message.getFieldWithDefault(msg, 3, 0),
+playerId: jspb.Message.getFieldWithDefault(msg, 4, ""),
+knownVersion: jspb.Message.getFieldWithDefault(msg, 5, 0)
+  };
+
+  if (includeInstance) {
+    obj.$jspbMessageInstance = msg;
+  }
+  return obj;
+};
+}
+
+
+/**
+ * Deserializes binary data (in protobuf wire format).
+ * @param {jspb.ByteSource} bytes The bytes to deserialize.
+ * @return {!proto.game.LeaderboardRequest}
+ */
+proto.game.LeaderboardRequest.deserializeBinary = function(bytes) {
+  var reader = new jspb.BinaryReader(bytes);
+  var msg = new proto.game.LeaderboardRequest;
+  return proto.game.LeaderboardRequest.deserializeBinaryFromReader(msg, reader);
+};
+
+
+/**
+ * Deserializes binary data (in protobuf wire format) from the
+ * given reader into the given message object.
+ * @param {!proto.game.LeaderboardRequest} msg The message object to deserialize into.
+ * @param {!jspb.BinaryReader} reader The BinaryReader to use.
+ * @return {!proto.game.LeaderboardRequest}
+ */
+proto.game.LeaderboardRequest.deserializeBinaryFromReader = function(msg, reader) {
+  while (reader.nextField()) {
+    if (reader.isEndGroup()) {
+      break;
+    }
+    var field = reader.getFieldNumber();
+    switch (field) {
+    case 1:
+      var value = /** @type {string} */ (reader.readString());
+      msg.setGameId(value);
+      break;
+    case 2:
+      var value = /** @type {number} */ (reader.readInt32());
+      msg.setLimit(value);
+      break;
+    case 3:
+      var value = /** @type {number} */ (reader.readInt32());
+      msg.setOffset(value);
+      break;
+    case 4:
+      var value = /** @type {string} */ (reader.readString());
+      msg.setPlayerId(value);
+      break;
+    case 5:
+      var value = /** @type {number} */ (reader.readUint64());
+      msg.setKnownVersion(value);
+      break;
+    default:
+      reader.skipField();
+      break;
+    }
+  }
+  return msg;
+};
+
+
+/**
+ * Serializes the message to binary data (in protobuf wire format).
+ * @return {!Uint8Array}
+ */
+proto.game.LeaderboardRequest.prototype.serializeBinary = function() {
+  var writer = new jspb.BinaryWriter();
+  proto.game.LeaderboardRequest.serializeBinaryToWriter(this, writer);
+  return writer.getResultBuffer();
+};
+
+
+/**
+ * Serializes the given message to binary data (in protobuf wire
+ * format), writing to the given BinaryWriter.
+ * @param {!proto.game.LeaderboardRequest} message
+ * @param {!jspb.BinaryWriter} writer
+ * @suppress {unusedLocalVariables} f is only used for nested messages
+ */
+proto.game.LeaderboardRequest.serializeBinaryToWriter = function(message, writer) {
+  var f = undefined;
+  f = message.getGameId();
+  if (f.length > 0) {
+    writer.writeString(
+      1,
+      f
+    );
+  }
+  f = message.getLimit();
+  if (f !== 0) {
+    writer.writeInt32(
+      2,
+      f
+    );
+  }
+  f = message.getOffset();
+  if (f !== 0) {
+    writer.writeInt32(
+      3,
+      f
+    );
+  }
+  f = message.getPlayerId();
+  if (f.length > 0) {
+    writer.writeString(
+      4,
+      f
+    );
+  }
+  f = message.getKnownVersion();
+  if (f !== 0) {
+    writer.writeUint64(
+      5,
+      f
+    );
+  }
+};
+
+
+/**
+ * optional string game_id = 1;
+ * @return {string}
+ */
+proto.game.LeaderboardRequest.prototype.getGameId = function() {
+  return /** @type {string} */ (jspb.Message.getFieldWithDefault(this, 1, ""));
+};
+
+
+/**
+ * @param {string} value
+ * @return {!proto.game.LeaderboardRequest} returns this
+ */
+proto.game.LeaderboardRequest.prototype.setGameId = function(value) {
+  return jspb.Message.setProto3StringField(this, 1, value);
+};
+
+
+/**
+ * optional int32 limit = 2;
+ * @return {number}
+ */
+proto.game.LeaderboardRequest.prototype.getLimit = function() {
+  return /** @type {number} */ (jspb.Message.getFieldWithDefault(this, 2, 0));
+};
+
+
+/**
+ * @param {number} value
+ * @return {!proto.game.LeaderboardRequest} returns this
+ */
+proto.game.LeaderboardRequest.prototype.setLimit = function(value) {
+  return jspb.Message.setProto3IntField(this, 2, value);
+};
+
+
+/**
+ * optional int32 offset = 3;
+ * @return {number}
+ */
+proto.game.LeaderboardRequest.prototype.getOffset = function() {
+  return /** @type {number} */ (jspb.Message.getFieldWithDefault(this, 3, 0));
+};
+
+
+/**
+ * @param {number} value
+ * @return {!proto.game.LeaderboardRequest} returns this
+ */
+proto.game.LeaderboardRequest.prototype.setOffset = function(value) {
+  return jspb.Message.setProto3IntField(this, 3, value);
+};
+
+
+/**
+ * optional string player_id = 4;
+ * @return {string}
+ */
+proto.game.LeaderboardRequest.prototype.getPlayerId = function() {
+  return /** @type {string} */ (jspb.Message.getFieldWithDefault(this, 4, ""));
+};
+
+
+/**
+ * @param {string} value
+ * @return {!proto.game.LeaderboardRequest} returns this
+ */
+proto.game.LeaderboardRequest.prototype.setPlayerId = function(value) {
+  return jspb.Message.setProto3StringField(this, 4, value);
+};
+
+
+/**
+ * optional uint64 known_version = 5;
+ * @return {number}
+ */
+proto.game.LeaderboardRequest.prototype.getKnownVersion = function() {
+  return /** @type {number} */ (jspb.Message.getFieldWithDefault(this, 5, 0));
+};
+
+
+/**
+ * @param {number} value
+ * @return {!proto.game.LeaderboardRequest} returns this
+ */
+proto.game.LeaderboardRequest.prototype.setKnownVersion = function(value) {
+  return jspb.Message.setProto3IntField(this, 5, value);
+};
+
+
+
+
+
+if (jspb.Message.GENERATE_TO_OBJECT) {
+/**
+ * Creates an object representation of this proto.
+ * Field names that are reserved in JavaScript and will be renamed to pb_name.
+ * Optional fields that are not set will be set to undefined.
+ * To access a reserved field use, foo.pb_<name>, eg, foo.pb_default.
+ * For the list of reserved names please see:
+ *     net/proto2/compiler/js/internal/generator.cc#kKeyword.
+ * @param {boolean=} opt_includeInstance Deprecated. whether to include the
+ *     JSPB instance for transitional soy proto support:
+ *     http://goto/soy-param-migration
+ * @return {!Object}
+ */
+proto.game.LeaderboardEntry.prototype.toObject = function(opt_includeInstance) {
+  return proto.game.LeaderboardEntry.toObject(opt_includeInstance, this);
+};
+
+
+/**
+ * Static version of the {@see toObject} method.
+ * @param {boolean|undefined} includeInstance Deprecated. Whether to include
+ *     the JSPB instance for transitional soy proto support:
+ *     http://goto/soy-param-migration
+ * @param {!proto.game.LeaderboardEntry} msg The msg instance to transform.
+ * @return {!Object}
+ * @suppress {unusedLocalVariables} f is only used for nested messages
+ */
+proto.game.LeaderboardEntry.toObject = function(includeInstance, msg) {
+  var f, obj = {
+playerId: jspb.Message.getFieldWithDefault(msg, 1, ""),
+playerName: jspb.Message.getFieldWithDefault(msg, 2, ""),
+score: jspb.Message.getFieldWithDefault(msg, 3, 0),
+rank: jspb.Message.getFieldWithDefault(msg, 4, 0),
+playerIndex: jspb.Message.getFieldWithDefault(msg, 5, 0),
+gameId: jspb.Message.getFieldWithDefault(msg, 6, "")
+  };
+
+  if (includeInstance) {
+    obj.$jspbMessageInstance = msg;
+  }
+  return obj;
+};
+}
+
+
+/**
+ * Deserializes binary data (in protobuf wire format).
+ * @param {jspb.ByteSource} bytes The bytes to deserialize.
+ * @return {!proto.game.LeaderboardEntry}
+ */
+proto.game.LeaderboardEntry.deserializeBinary = function(bytes) {
+  var reader = new jspb.BinaryReader(bytes);
+  var msg = new proto.game.LeaderboardEntry;
+  return proto.game.LeaderboardEntry.deserializeBinaryFromReader(msg, reader);
+};
+
+
+/**
+ * Deserializes binary data (in protobuf wire format) from the
+ * given reader into the given message object.
+ * @param {!proto.game.LeaderboardEntry} msg The message object to deserialize into.
+ * @param {!jspb.BinaryReader} reader The BinaryReader to use.
+ * @return {!proto.game.LeaderboardEntry}
+ */
+proto.game.LeaderboardEntry.deserializeBinaryFromReader = function(msg, reader) {
+  while (reader.nextField()) {
+    if (reader.isEndGroup()) {
+      break;
+    }
+    var field = reader.getFieldNumber();
+    switch (field) {
+    case 1:
+      var value = /** @type {string} */ (reader.readString());
+      msg.setPlayerId(value);
+      break;
+    case 2:
+      var value = /** @type {string} */ (reader.readString());
+      msg.setPlayerName(value);
+      break;
+    case 3:
+      var value = /** @type {number} */ (reader.readInt32());
+      msg.setScore(value);
+      break;
+    case 4:
+      var value = /** @type {number} */ (reader.readInt32());
+      msg.setRank(value);
+      break;
+    case 5:
+      var value = /** @type {number} */ (reader.readInt32());
+      msg.setPlayerIndex(value);
+      break;
+    case 6:
+      var value = /** @type {string} */ (reader.readString());
+      msg.setGameId(value);
+      break;
+    default:
+      reader.skipField();
+      break;
+    }
+  }
+  return msg;
+};
+
+
+/**
+ * Serializes the message to binary data (in protobuf wire format).
+ * @return {!Uint8Array}
+ */
+proto.game.LeaderboardEntry.prototype.serializeBinary = function() {
+  var writer = new jspb.BinaryWriter();
+  proto.game.LeaderboardEntry.serializeBinaryToWriter(this, writer);
+  return writer.getResultBuffer();
+};
+
+
+/**
+ * Serializes the given message to binary data (in protobuf wire
+ * format), writing to the given BinaryWriter.
+ * @param {!proto.game.LeaderboardEntry} message
+ * @param {!jspb.BinaryWriter} writer
+ * @suppress {unusedLocalVariables} f is only used for nested messages
+ */
+proto.game.LeaderboardEntry.serializeBinaryToWriter = function(message, writer) {
+  var f = undefined;
+  f = message.getPlayerId();
+  if (f.length > 0) {
+    writer.writeString(
+      1,
+      f
+    );
+  }
+  f = message.getPlayerName();
+  if (f.length > 0) {
+    writer.writeString(
+      2,
+      f
+    );
+  }
+  f = message.getScore();
+  if (f !== 0) {
+    writer.writeInt32(
+      3,
+      f
+    );
+  }
+  f = message.getRank();
+  if (f !== 0) {
+    writer.writeInt32(
+      4,
+      f
+    );
+  }
+  f = message.getPlayerIndex();
+  if (f !== 0) {
+    writer.writeInt32(
+      5,
+      f
+    );
+  }
+  f = message.getGameId();
+  if (f.length > 0) {
+    writer.writeString(
+      6,
+      f
+    );
+  }
+};
+
+
+/**
+ * optional string player_id = 1;
+ * @return {string}
+ */
+proto.game.LeaderboardEntry.prototype.getPlayerId = function() {
+  return /** @type {string} */ (jspb.Message.getFieldWithDefault(this, 1, ""));
+};
+
+
+/**
+ * @param {string} value
+ * @return {!proto.game.LeaderboardEntry} returns this
+ */
+proto.game.LeaderboardEntry.prototype.setPlayerId = function(value) {
+  return jspb.Message.setProto3StringField(this, 1, value);
+};
+
+
+/**
+ * optional string player_name = 2;
+ * @return {string}
+ */
+proto.game.LeaderboardEntry.prototype.getPlayerName = function() {
+  return /** @type {string} */ (jspb.Message.getFieldWithDefault(this, 2, ""));
+};
+
+
+/**
+ * @param {string} value
+ * @return {!proto.game.LeaderboardEntry} returns this
+ */
+proto.game.LeaderboardEntry.prototype.setPlayerName = function(value) {
+  return jspb.Message.setProto3StringField(this, 2, value);
+};
+
+
+/**
+ * optional int32 score = 3;
+ * @return {number}
+ */
+proto.game.LeaderboardEntry.prototype.getScore = function() {
+  return /** @type {number} */ (jspb.Message.getFieldWithDefault(this, 3, 0));
+};
+
+
+/**
+ * @param {number} value
+ * @return {!proto.game.LeaderboardEntry} returns this
+ */
+proto.game.LeaderboardEntry.prototype.setScore = function(value) {
+  return jspb.Message.setProto3IntField(this, 3, value);
+};
+
+
+/**
+ * optional int32 rank = 4;
+ * @return {number}
+ */
+proto.game.LeaderboardEntry.prototype.getRank = function() {
+  return /** @type {number} */ (jspb.Message.getFieldWithDefault(this, 4, 0));
+};
+
+
+/**
+ * @param {number} value
+ * @return {!proto.game.LeaderboardEntry} returns this
+ */
+proto.game.LeaderboardEntry.prototype.setRank = function(value) {
+  return jspb.Message.setProto3IntField(this, 4, value);
+};
+
+
+/**
+ * optional int32 player_index = 5;
+ * @return {number}
+ */
+proto.game.LeaderboardEntry.prototype.getPlayerIndex = function() {
+  return /** @type {number} */ (jspb.Message.getFieldWithDefault(this, 5, 0));
+};
+
+
+/**
+ * @param {number} value
+ * @return {!proto.game.LeaderboardEntry} returns this
+ */
+proto.game.LeaderboardEntry.prototype.setPlayerIndex = function(value) {
+  return jspb.Message.setProto3IntField(this, 5, value);
+};
+
+
+/**
+ * optional string game_id = 6;
+ * @return {string}
+ */
+proto.game.LeaderboardEntry.prototype.getGameId = function() {
+  return /** @type {string} */ (jspb.Message.getFieldWithDefault(this, 6, ""));
+};
+
+
+/**
+ * @param {string} value
+ * @return {!proto.game.LeaderboardEntry} returns this
+ */
+proto.game.LeaderboardEntry.prototype.setGameId = function(value) {
+  return jspb.Message.setProto3StringField(this, 6, value);
+};
+
+
+
+/**
+ * List of repeated fields within this message type.
+ * @private {!Array<number>}
+ * @const
+ */
+proto.game.Leaderboard.repeatedFields_ = [1];
+
+
+
+if (jspb.Message.GENERATE_TO_OBJECT) {
+/**
+ * Creates an object representation of this proto.
+ * Field names that are reserved in JavaScript and will be renamed to pb_name.
+ * Optional fields that are not set will be set to undefined.
+ * To access a reserved field use, foo.pb_<name>, eg, foo.pb_default.
+ * For the list of reserved names please see:
+ *     net/proto2/compiler/js/internal/generator.cc#kKeyword.
+ * @param {boolean=} opt_includeInstance Deprecated. whether to include the
+ *     JSPB instance for transitional soy proto support:
+ *     http://goto/soy-param-migration
+ * @return {!Object}
+ */
+proto.game.Leaderboard.prototype.toObject = function(opt_includeInstance) {
+  return proto.game.Leaderboard.toObject(opt_includeInstance, this);
+};
+
+
+/**
+ * Static version of the {@see toObject} method.
+ * @param {boolean|undefined} includeInstance Deprecated. Whether to include
+ *     the JSPB instance for transitional soy proto support:
+ *     http://goto/soy-param-migration
+ * @param {!proto.game.Leaderboard} msg The msg instance to transform.
+ * @return {!Object}
+ * @suppress {unusedLocalVariables} f is only used for nested messages
+ */
+proto.game.Leaderboard.toObject = function(includeInstance, msg) {
+  var f, obj = {
+entriesList: jspb.Message.toObjectList(msg.getEntriesList(),
+    proto.game.LeaderboardEntry.toObject, includeInstance),
+totalPlayers: jspb.Message.getFieldWithDefault(msg, 2, 0),
+playerEntry: (f = msg.getPlayerEntry()) && proto.game.LeaderboardEntry.toObject(includeInstance, f),
+version: jspb.Message.getFieldWithDefault(msg, 4, 0),
+notModified: jspb.Message.getBooleanFieldWithDefault(msg, 5, false)
+  };
+
+  if (includeInstance) {
+    obj.$jspbMessageInstance = msg;
+  }
+  return obj;
+};
+}
+
+
+/**
+ * Deserializes binary data (in protobuf wire format).
+ * @param {jspb.ByteSource} bytes The bytes to deserialize.
+ * @return {!proto.game.Leaderboard}
+ */
+proto.game.Leaderboard.deserializeBinary = function(bytes) {
+  var reader = new jspb.BinaryReader(bytes);
+  var msg = new proto.game.Leaderboard;
+  return proto.game.Leaderboard.deserializeBinaryFromReader(msg, reader);
+};
+
+
+/**
+ * Deserializes binary data (in protobuf wire format) from the
+ * given reader into the given message object.
+ * @param {!proto.game.Leaderboard} msg The message object to deserialize into.
+ * @param {!jspb.BinaryReader} reader The BinaryReader to use.
+ * @return {!proto.game.Leaderboard}
+ */
+proto.game.Leaderboard.deserializeBinaryFromReader = function(msg, reader) {
+  while (reader.nextField()) {
+    if (reader.isEndGroup()) {
+      break;
+    }
+    var field = reader.getFieldNumber();
+    switch (field) {
+    case 1:
+      var value = new proto.game.LeaderboardEntry;
+      reader.readMessage(value,proto.game.LeaderboardEntry.deserializeBinaryFromReader);
+      msg.addEntries(value);
+      break;
+    case 2:
+      var value = /** @type {number} */ (reader.readInt32());
+      msg.setTotalPlayers(value);
+      break;
+    case 3:
+      var value = new proto.game.LeaderboardEntry;
+      reader.readMessage(value,proto.game.LeaderboardEntry.deserializeBinaryFromReader);
+      msg.setPlayerEntry(value);
+      break;
+    case 4:
+      var value = /** @type {number} */ (reader.readUint64());
+      msg.setVersion(value);
+      break;
+    case 5:
+      var value = /** @type {boolean} */ (reader.readBool());
+      msg.setNotModified(value);
+      break;
+    default:
+      reader.skipField();
+      break;
+    }
+  }
+  return msg;
+};
+
+
+/**
+ * Serializes the message to binary data (in protobuf wire format).
+ * @return {!Uint8Array}
+ */
+proto.game.Leaderboard.prototype.serializeBinary = function() {
+  var writer = new jspb.BinaryWriter();
+  proto.game.Leaderboard.serializeBinaryToWriter(this, writer);
+  return writer.getResultBuffer();
+};
+
+
+/**
+ * Serializes the given message to binary data (in protobuf wire
+ * format), writing to the given BinaryWriter.
+ * @param {!proto.game.Leaderboard} message
+ * @param {!jspb.BinaryWriter} writer
+ * @suppress {unusedLocalVariables} f is only used for nested messages
+ */
+proto.game.Leaderboard.serializeBinaryToWriter = function(message, writer) {
+  var f = undefined;
+  f = message.getEntriesList();
+  if (f.length > 0) {
+    writer.writeRepeatedMessage(
+      1,
+      f,
+      proto.game.LeaderboardEntry.serializeBinaryToWriter
+    );
+  }
+  f = message.getTotalPlayers();
+  if (f !== 0) {
+    writer.writeInt32(
+      2,
+      f
+    );
+  }
+  f = message.getPlayerEntry();
+  if (f != null) {
+    writer.writeMessage(
+      3,
+      f,
+      proto.game.LeaderboardEntry.serializeBinaryToWriter
+    );
+  }
+  f = message.getVersion();
+  if (f !== 0) {
+    writer.writeUint64(
+      4,
+      f
+    );
+  }
+  f = message.getNotModified();
+  if (f) {
+    writer.writeBool(
+      5,
+      f
+    );
+  }
+};
+
+
+/**
+ * repeated LeaderboardEntry entries = 1;
+ * @return {!Array<!proto.game.LeaderboardEntry>}
+ */
+proto.game.Leaderboard.prototype.getEntriesList = function() {
+  return /** @type{!Array<!proto.game.LeaderboardEntry>} */ (
+    jspb.Message.getRepeatedWrapperField(this, proto.game.LeaderboardEntry, 1));
+};
+
+
+/**
+ * @param {!Array<!proto.game.LeaderboardEntry>} value
+ * @return {!proto.game.Leaderboard} returns this
+*/
+proto.game.Leaderboard.prototype.setEntriesList = function(value) {
+  return jspb.Message.setRepeatedWrapperField(this, 1, value);
+};
+
+
+/**
+ * @param {!proto.game.LeaderboardEntry=} opt_value
+ * @param {number=} opt_index
+ * @return {!proto.game.LeaderboardEntry}
+ */
+proto.game.Leaderboard.prototype.addEntries = function(opt_value, opt_index) {
+  return jspb.Message.addToRepeatedWrapperField(this, 1, opt_value, proto.game.LeaderboardEntry, opt_index);
+};
+
+
+/**
+ * Clears the list making it empty but non-null.
+ * @return {!proto.game.Leaderboard} returns this
+ */
+proto.game.Leaderboard.prototype.clearEntriesList = function() {
+  return this.setEntriesList([]);
+};
+
+
+/**
+ * optional int32 total_players = 2;
+ * @return {number}
+ */
+proto.game.Leaderboard.prototype.getTotalPlayers = function() {
+  return /** @type {number} */ (jspb.Message.getFieldWithDefault(this, 2, 0));
+};
+
+
+/**
+ * @param {number} value
+ * @return {!proto.game.Leaderboard} returns this
+ */
+proto.game.Leaderboard.prototype.setTotalPlayers = function(value) {
+  return jspb.Message.setProto3IntField(this, 2, value);
+};
+
+
+/**
+ * optional LeaderboardEntry player_entry = 3;
+ * @return {?proto.game.LeaderboardEntry}
+ */
+proto.game.Leaderboard.prototype.getPlayerEntry = function() {
+  return /** @type{?proto.game.LeaderboardEntry} */ (
+    jspb.Message.getWrapperField(this, proto.game.LeaderboardEntry, 3));
+};
+
+
+/**
+ * @param {?proto.game.LeaderboardEntry|undefined} value
+ * @return {!proto.game.Leaderboard} returns this
+*/
+proto.game.Leaderboard.prototype.setPlayerEntry = function(value) {
+  return jspb.Message.setWrapperField(this, 3, value);
+};
+
+
+/**
+ * Clears the message field making it undefined.
+ * @return {!proto.game.Leaderboard} returns this
+ */
+proto.game.Leaderboard.prototype.clearPlayerEntry = function() {
+  return this.setPlayerEntry(undefined);
+};
+
+
+/**
+ * Returns whether this field is set.
+ * @return {boolean}
+ */
+proto.game.Leaderboard.prototype.hasPlayerEntry = function() {
+  return jspb.Message.getField(this, 3) != null;
+};
+
+
+/**
+ * optional uint64 version = 4;
+ * @return {number}
+ */
+proto.game.Leaderboard.prototype.getVersion = function() {
+  return /** @type {number} */ (jspb.Message.getFieldWithDefault(this, 4, 0));
+};
+
+
+/**
+ * @param {number} value
+ * @return {!proto.game.Leaderboard} returns this
+ */
+proto.game.Leaderboard.prototype.setVersion = function(value) {
+  return jspb.Message.setProto3IntField(this, 4, value);
+};
+
+
+/**
+ * optional bool not_modified = 5;
+ * @return {boolean}
+ */
+proto.game.Leaderboard.prototype.getNotModified = function() {
+  return /** @type {boolean} */ (jspb.Message.getBooleanFieldWithDefault(this, 5, false));
+};
+
+
+/**
+ * @param {boolean} value
+ * @return {!proto.game.Leaderboard} returns this
+ */
+proto.game.Leaderboard.prototype.setNotModified = function(value) {
+  return jspb.Message.setProto3BooleanField(this, 5, value);
+};
+
+
+
+/**
+ * List of repeated fields within this message type.
+ * @private {!Array<number>}
+ * @const
+ */
+proto.game.LeaderboardUpdate.repeatedFields_ = [4];
+
+
+
+if (jspb.Message.GENERATE_TO_OBJECT) {
+/**
+ * Creates an object representation of this proto.
+ * Field names that are reserved in JavaScript and will be renamed to pb_name.
+ * Optional fields that are not set will be set to undefined.
+ * To access a reserved field use, foo.pb_<name>, eg, foo.pb_default.
+ * For the list of reserved names please see:
+ *     net/proto2/compiler/js/internal/generator.cc#kKeyword.
+ * @param {boolean=} opt_includeInstance Deprecated. whether to include the
+ *     JSPB instance for transitional soy proto support:
+ *     http://goto/soy-param-migration
+ * @return {!Object}
+ */
+proto.game.LeaderboardUpdate.prototype.toObject = function(opt_includeInstance) {
+  return proto.game.LeaderboardUpdate.toObject(opt_includeInstance, this);
+};
+
+
+/**
+ * Static version of the {@see toObject} method.
+ * @param {boolean|undefined} includeInstance Deprecated. Whether to include
+ *     the JSPB instance for transitional soy proto support:
+ *     http://goto/soy-param-migration
+ * @param {!proto.game.LeaderboardUpdate} msg The msg instance to transform.
+ * @return {!Object}
+ * @suppress {unusedLocalVariables} f is only used for nested messages
+ */
+proto.game.LeaderboardUpdate.toObject = function(includeInstance, msg) {
+  var f, obj = {
+leaderboard: (f = msg.getLeaderboard()) && proto.game.Leaderboard.toObject(includeInstance, f),
+gameOver: jspb.Message.getBooleanFieldWithDefault(msg, 2, false),
+sequence: jspb.Message.getFieldWithDefault(msg, 3, 0),
+changesList: jspb.Message.toObjectList(msg.getChangesList(),
+    proto.game.LeaderboardEntry.toObject, includeInstance),
+totalPlayers: jspb.Message.getFieldWithDefault(msg, 5, 0)
+  };
+
+  if (includeInstance) {
+    obj.$jspbMessageInstance = msg;
+  }
+  return obj;
+};
+}
+
+
+/**
+ * Deserializes binary data (in protobuf wire format).
+ * @param {jspb.ByteSource} bytes The bytes to deserialize.
+ * @return {!proto.game.LeaderboardUpdate}
+ */
+proto.game.LeaderboardUpdate.deserializeBinary = function(bytes) {
+  var reader = new jspb.BinaryReader(bytes);
+  var msg = new proto.game.LeaderboardUpdate;
+  return proto.game.LeaderboardUpdate.deserializeBinaryFromReader(msg, reader);
+};
+
+
+/**
+ * Deserializes binary data (in protobuf wire format) from the
+ * given reader into the given message object.
+ * @param {!proto.game.LeaderboardUpdate} msg The message object to deserialize into.
+ * @param {!jspb.BinaryReader} reader The BinaryReader to use.
+ * @return {!proto.game.LeaderboardUpdate}
+ */
+proto.game.LeaderboardUpdate.deserializeBinaryFromReader = function(msg, reader) {
+  while (reader.nextField()) {
+    if (reader.isEndGroup()) {
+      break;
+    }
+    var field = reader.getFieldNumber();
+    switch (field) {
+    case 1:
+      var value = new proto.game.Leaderboard;
+      reader.readMessage(value,proto.game.Leaderboard.deserializeBinaryFromReader);
+      msg.setLeaderboard(value);
+      break;
+    case 2:
+      var value = /** @type {boolean} */ (reader.readBool());
+      msg.setGameOver(value);
+      break;
+    case 3:
+      var value = /** @type {number} */ (reader.readUint64());
+      msg.setSequence(value);
+      break;
+    case 4:
+      var value = new proto.game.LeaderboardEntry;
+      reader.readMessage(value,proto.game.LeaderboardEntry.deserializeBinaryFromReader);
+      msg.addChanges(value);
+      break;
+    case 5:
+      var value = /** @type {number} */ (reader.readInt32());
+      msg.setTotalPlayers(value);
+      break;
+    default:
+      reader.skipField();
+      break;
+    }
+  }
+  return msg;
+};
+
+
+/**
+ * Serializes the message to binary data (in protobuf wire format).
+ * @return {!Uint8Array}
+ */
+proto.game.LeaderboardUpdate.prototype.serializeBinary = function() {
+  var writer = new jspb.BinaryWriter();
+  proto.game.LeaderboardUpdate.serializeBinaryToWriter(this, writer);
+  return writer.getResultBuffer();
+};
+
+
+/**
+ * Serializes the given message to binary data (in protobuf wire
+ * format), writing to the given BinaryWriter.
+ * @param {!proto.game.LeaderboardUpdate} message
+ * @param {!jspb.BinaryWriter} writer
+ * @suppress {unusedLocalVariables} f is only used for nested messages
+ */
+proto.game.LeaderboardUpdate.serializeBinaryToWriter = function(message, writer) {
+  var f = undefined;
+  f = message.getLeaderboard();
+  if (f != null) {
+    writer.writeMessage(
+      1,
+      f,
+      proto.game.Leaderboard.serializeBinaryToWriter
+    );
+  }
+  f = message.getGameOver();
+  if (f) {
+    writer.writeBool(
+      2,
+      f
+    );
+  }
+  f = message.getSequence();
+  if (f !== 0) {
+    writer.writeUint64(
+      3,
+      f
+    );
+  }
+  f = message.getChangesList();
+  if (f.length > 0) {
+    writer.writeRepeatedMessage(
+      4,
+      f,
+      proto.game.LeaderboardEntry.serializeBinaryToWriter
+    );
+  }
+  f = message.getTotalPlayers();
+  if (f !== 0) {
+    writer.writeInt32(
+      5,
+      f
+    );
+  }
+};
+
+
+/**
+ * optional Leaderboard leaderboard = 1;
+ * @return {?proto.game.Leaderboard}
+ */
+proto.game.LeaderboardUpdate.prototype.getLeaderboard = function() {
+  return /** @type{?proto.game.Leaderboard} */ (
+    jspb.Message.getWrapperField(this, proto.game.Leaderboard, 1));
+};
+
+
+/**
+ * @param {?proto.game.Leaderboard|undefined} value
+ * @return {!proto.game.LeaderboardUpdate} returns this
+*/
+proto.game.LeaderboardUpdate.prototype.setLeaderboard = function(value) {
+  return jspb.Message.setWrapperField(this, 1, value);
+};
+
+
+/**
+ * Clears the message field making it undefined.
+ * @return {!proto.game.LeaderboardUpdate} returns this
+ */
+proto.game.LeaderboardUpdate.prototype.clearLeaderboard = function() {
+  return this.setLeaderboard(undefined);
+};
+
+
+/**
+ * Returns whether this field is set.
+ * @return {boolean}
+ */
+proto.game.LeaderboardUpdate.prototype.hasLeaderboard = function() {
+  return jspb.Message.getField(this, 1) != null;
+};
+
+
+/**
+ * optional bool game_over = 2;
+ * @return {boolean}
+ */
+proto.game.LeaderboardUpdate.prototype.getGameOver = function() {
+  return /** @type {boolean} */ (jspb.Message.getBooleanFieldWithDefault(this, 2, false));
+};
+
+
+/**
+ * @param {boolean} value
+ * @return {!proto.game.LeaderboardUpdate} returns this
+ */
+proto.game.LeaderboardUpdate.prototype.setGameOver = function(value) {
+  return jspb.Message.setProto3BooleanField(this, 2, value);
+};
+
+
+/**
+ * optional uint64 sequence = 3;
+ * @return {number}
+ */
+proto.game.LeaderboardUpdate.prototype.getSequence = function() {
+  return /** @type {number} */ (jspb.Message.getFieldWithDefault(this, 3, 0));
+};
+
+
+/**
+ * @param {number} value
+ * @return {!proto.game.LeaderboardUpdate} returns this
+ */
+proto.game.LeaderboardUpdate.prototype.setSequence = function(value) {
+  return jspb.Message.setProto3IntField(this, 3, value);
+};
+
+
+/**
+ * repeated LeaderboardEntry changes = 4;
+ * @return {!Array<!proto.game.LeaderboardEntry>}
+ */
+proto.game.LeaderboardUpdate.prototype.getChangesList = function() {
+  return /** @type{!Array<!proto.game.LeaderboardEntry>} */ (
+    jspb.Message.getRepeatedWrapperField(this, proto.game.LeaderboardEntry, 4));
+};
+
+
+/**
+ * @param {!Array<!proto.game.LeaderboardEntry>} value
+ * @return {!proto.game.LeaderboardUpdate} returns this
+*/
+proto.game.LeaderboardUpdate.prototype.setChangesList = function(value) {
+  return jspb.Message.setRepeatedWrapperField(this, 4, value);
+};
+
+
+/**
+ * @param {!proto.game.LeaderboardEntry=} opt_value
+ * @param {number=} opt_index
+ * @return {!proto.game.LeaderboardEntry}
+ */
+proto.game.LeaderboardUpdate.prototype.addChanges = function(opt_value, opt_index) {
+  return jspb.Message.addToRepeatedWrapperField(this, 4, opt_value, proto.game.LeaderboardEntry, opt_index);
+};
+
+
+/**
+ * Clears the list making it empty but non-null.
+ * @return {!proto.game.LeaderboardUpdate} returns this
+ */
+proto.game.LeaderboardUpdate.prototype.clearChangesList = function() {
+  return this.setChangesList([]);
+};
+
+
+/**
+ * optional int32 total_players = 5;
+ * @return {number}
+ */
+proto.game.LeaderboardUpdate.prototype.getTotalPlayers = function() {
+  return /** @type {number} */ (jspb.Message.getFieldWithDefault(this, 5, 0));
+};
+
+
+/**
+ * @param {number} value
+ * @return {!proto.game.LeaderboardUpdate} returns this
+ */
+proto.game.LeaderboardUpdate.prototype.setTotalPlayers = function(value) {
+  return jspb.Message.setProto3IntField(this, 5, value);
+};
+
+
+
+
+
+if (jspb.Message.GENERATE_TO_OBJECT) {
+/**
+ * Creates an object representation of this proto.
+ * Field names that are reserved in JavaScript and will be renamed to pb_name.
+ * Optional fields that are not set will be set to undefined.
+ * To access a reserved field use, foo.pb_<name>, eg, foo.pb_default.
+ * For the list of reserved names please see:
+ *     net/proto2/compiler/js/internal/generator.cc#kKeyword.
+ * @param {boolean=} opt_includeInstance Deprecated. whether to include the
+ *     JSPB instance for transitional soy proto support:
+ *     http://goto/soy-param-migration
+ * @return {!Object}
+ */
+proto.game.TournamentRequest.prototype.toObject = function(opt_includeInstance) {
+  return proto.game.TournamentRequest.toObject(opt_includeInstance, this);
+};
+
+
+/**
+ * Static version of the {@see toObject} method.
+ * @param {boolean|undefined} includeInstance Deprecated. Whether to include
+ *     the JSPB instance for transitional soy proto support:
+ *     http://goto/soy-param-migration
+ * @param {!proto.game.TournamentRequest} msg The msg instance to transform.
+ * @return {!Object}
+ * @suppress {unusedLocalVariables} f is only used for nested messages
+ */
+proto.game.TournamentRequest.toObject = function(includeInstance, msg) {
+  var f, obj = {
+tournamentId: jspb.Message.getFieldWithDefault(msg, 1, ""),
+limit: jspb.Message.getFieldWithDefault(msg, 2, 0),
+intervalMs: jspb.Message.getFieldWithDefault(msg, 3, 0)
+  };
+
+  if (includeInstance) {
+    obj.$jspbMessageInstance = msg;
+  }
+  return obj;
+};
+}
+
+
+/**
+ * Deserializes binary data (in protobuf wire format).
+ * @param {jspb.ByteSource} bytes The bytes to deserialize.
+ * @return {!proto.game.TournamentRequest}
+ */
+proto.game.TournamentRequest.deserializeBinary = function(bytes) {
+  var reader = new jspb.BinaryReader(bytes);
+  var msg = new proto.game.TournamentRequest;
+  return proto.game.TournamentRequest.deserializeBinaryFromReader(msg, reader);
+};
+
+
+/**
+ * Deserializes binary data (in protobuf wire format) from the
+ * given reader into the given message object.
+ * @param {!proto.game.TournamentRequest} msg The message object to deserialize into.
+ * @param {!jspb.BinaryReader} reader The BinaryReader to use.
+ * @return {!proto.game.TournamentRequest}
+ */
+proto.game.TournamentRequest.deserializeBinaryFromReader = function(msg, reader) {
+  while (reader.nextField()) {
+    if (reader.isEndGroup()) {
+      break;
+    }
+    var field = reader.getFieldNumber();
+    switch (field) {
+    case 1:
+      var value = /** @type {string} */ (reader.readString());
+      msg.setTournamentId(value);
+      break;
+    case 2:
+      var value = /** @type {number} */ (reader.readInt32());
+      msg.setLimit(value);
+      break;
+    case 3:
+      var value = /** @type {number} */ (reader.readInt32());
+      msg.setIntervalMs(value);
+      break;
+    default:
+      reader.skipField();
+      break;
+    }
+  }
+  return msg;
+};
+
+
+/**
+ * Serializes the message to binary data (in protobuf wire format).
+ * @return {!Uint8Array}
+ */
+proto.game.TournamentRequest.prototype.serializeBinary = function() {
+  var writer = new jspb.BinaryWriter();
+  proto.game.TournamentRequest.serializeBinaryToWriter(this, writer);
+  return writer.getResultBuffer();
+};
+
+
+/**
+ * Serializes the given message to binary data (in protobuf wire
+ * format), writing to the given BinaryWriter.
+ * @param {!proto.game.TournamentRequest} message
+ * @param {!jspb.BinaryWriter} writer
+ * @suppress {unusedLocalVariables} f is only used for nested messages
+ */
+proto.game.TournamentRequest.serializeBinaryToWriter = function(message, writer) {
+  var f = undefined;
+  f = message.getTournamentId();
+  if (f.length > 0) {
+    writer.writeString(
+      1,
+      f
+    );
+  }
+  f = message.getLimit();
+  if (f !== 0) {
+    writer.writeInt32(
+      2,
+      f
+    );
+  }
+  f = message.getIntervalMs();
+  if (f !== 0) {
+    writer.writeInt32(
+      3,
+      f
+    );
+  }
+};
+
+
+/**
+ * optional string tournament_id = 1;
+ * @return {string}
+ */
+proto.game.TournamentRequest.prototype.getTournamentId = function() {
+  return /** @type {string} */ (jspb.Message.getFieldWithDefault(this, 1, ""));
+};
+
+
+/**
+ * @param {string} value
+ * @return {!proto.game.TournamentRequest} returns this
+ */
+proto.game.TournamentRequest.prototype.setTournamentId = function(value) {
+  return jspb.Message.setProto3StringField(this, 1, value);
+};
+
+
+/**
+ * optional int32 limit = 2;
+ * @return {number}
+ */
+proto.game.TournamentRequest.prototype.getLimit = function() {
+  return /** @type {number} */ (jspb.Message.getFieldWithDefault(this, 2, 0));
+};
+
+
+/**
+ * @param {number} value
+ * @return {!proto.game.TournamentRequest} returns this
+ */
+proto.game.TournamentRequest.prototype.setLimit = function(value) {
+  return jspb.Message.setProto3IntField(this, 2, value);
+};
+
+
+/**
+ * optional int32 interval_ms = 3;
+ * @return {number}
+ */
+proto.game.TournamentRequest.prototype.getIntervalMs = function() {
+  return /** @type {number} */ (jspb.Message.getFieldWithDefault(this, 3, 0));
+};
+
+
+/**
+ * @param {number} value
+ * @return {!proto.game.TournamentRequest} returns this
+ */
+proto.game.TournamentRequest.prototype.setIntervalMs = function(value) {
+  return jspb.Message.setProto3IntField(this, 3, value);
+};
+
+
+
+/**
+ * List of repeated fields within this message type.
+ * @private {!Array<number>}
+ * @const
+ */
+proto.game.TournamentLeaderboard.repeatedFields_ = [2];
+
+
+
+if (jspb.Message.GENERATE_TO_OBJECT) {
+/**
+ * Creates an object representation of this proto.
+ * Field names that are reserved in JavaScript and will be renamed to pb_name.
+ * Optional fields that are not set will be set to undefined.
+ * To access a reserved field use, foo.pb_<name>, eg, foo.pb_default.
+ * For the list of reserved names please see:
+ *     net/proto2/compiler/js/internal/generator.cc#kKeyword.
+ * @param {boolean=} opt_includeInstance Deprecated. whether to include the
+ *     JSPB instance for transitional soy proto support:
+ *     http://goto/soy-param-migration
+ * @return {!Object}
+ */
+proto.game.TournamentLeaderboard.prototype.toObject = function(opt_includeInstance) {
+  return proto.game.TournamentLeaderboard.toObject(opt_includeInstance, this);
+};
+
+
+/**
+ * Static version of the {@see toObject} method.
+ * @param {boolean|undefined} includeInstance Deprecated. Whether to include
+ *     the JSPB instance for transitional soy proto support:
+ *     http://goto/soy-param-migration
+ * @param {!proto.game.TournamentLeaderboard} msg The msg instance to transform.
+ * @return {!Object}
+ * @suppress {unusedLocalVariables} f is only used for nested messages
+ */
+proto.game.TournamentLeaderboard.toObject = function(includeInstance, msg) {
+  var f, obj = {
+tournamentId: jspb.Message.getFieldWithDefault(msg, 1, ""),
+entriesList: jspb.Message.toObjectList(msg.getEntriesList(),
+    proto.game.LeaderboardEntry.toObject, includeInstance),
+totalGames: jspb.Message.getFieldWithDefault(msg, 3, 0),
+totalPlayers: jspb.Message.getFieldWithDefault(msg, 4, 0),
+version: jspb.Message.getFieldWithDefault(msg, 5, 0)
+  };
+
+  if (includeInstance) {
+    obj.$jspbMessageInstance = msg;
+  }
+  return obj;
+};
+}
+
+
+/**
+ * Deserializes binary data (in protobuf wire format).
+ * @param {jspb.ByteSource} bytes The bytes to deserialize.
+ * @return {!proto.game.TournamentLeaderboard}
+ */
+proto.game.TournamentLeaderboard.deserializeBinary = function(bytes) {
+  var reader = new jspb.BinaryReader(bytes);
+  var msg = new proto.game.TournamentLeaderboard;
+  return proto.game.TournamentLeaderboard.deserializeBinaryFromReader(msg, reader);
+};
+
+
+/**
+ * Deserializes binary data (in protobuf wire format) from the
+ * given reader into the given message object.
+ * @param {!proto.game.TournamentLeaderboard} msg The message object to deserialize into.
+ * @param {!jspb.BinaryReader} reader The BinaryReader to use.
+ * @return {!proto.game.TournamentLeaderboard}
+ */
+proto.game.TournamentLeaderboard.deserializeBinaryFromReader = function(msg, reader) {
+  while (reader.nextField()) {
+    if (reader.isEndGroup()) {
+      break;
+    }
+    var field = reader.getFieldNumber();
+    switch (field) {
+    case 1:
+      var value = /** @type {string} */ (reader.readString());
+      msg.setTournamentId(value);
+      break;
+    case 2:
+      var value = new proto.game.LeaderboardEntry;
+      reader.readMessage(value,proto.game.LeaderboardEntry.deserializeBinaryFromReader);
+      msg.addEntries(value);
+      break;
+    case 3:
+      var value = /** @type {number} */ (reader.readInt32());
+      msg.setTotalGames(value);
+      break;
+    case 4:
+      var value = /** @type {number} */ (reader.readInt32());
+      msg.setTotalPlayers(value);
+      break;
+    case 5:
+      var value = /** @type {number} */ (reader.readUint64());
+      msg.setVersion(value);
+      break;
+    default:
+      reader.skipField();
+      break;
+    }
+  }
+  return msg;
+};
+
+
+/**
+ * Serializes the message to binary data (in protobuf wire format).
+ * @return {!Uint8Array}
+ */
+proto.game.TournamentLeaderboard.prototype.serializeBinary = function() {
+  var writer = new jspb.BinaryWriter();
+  proto.game.TournamentLeaderboard.serializeBinaryToWriter(this, writer);
+  return writer.getResultBuffer();
+};
+
+
+/**
+ * Serializes the given message to binary data (in protobuf wire
+ * format), writing to the given BinaryWriter.
+ * @param {!proto.game.TournamentLeaderboard} message
+ * @param {!jspb.BinaryWriter} writer
+ * @suppress {unusedLocalVariables} f is only used for nested messages
+ */
+proto.game.TournamentLeaderboard.serializeBinaryToWriter = function(message, writer) {
+  var f = undefined;
+  f = message.getTournamentId();
+  if (f.length > 0) {
+    writer.writeString(
+      1,
+      f
+    );
+  }
+  f = message.getEntriesList();
+  if (f.length > 0) {
+    writer.writeRepeatedMessage(
+      2,
+      f,
+      proto.game.LeaderboardEntry.serializeBinaryToWriter
+    );
+  }
+  f = message.getTotalGames();
+  if (f !== 0) {
+    writer.writeInt32(
+      3,
+      f
+    );
+  }
+  f = message.getTotalPlayers();
+  if (f !== 0) {
+    writer.writeInt32(
+      4,
+      f
+    );
+  }
+  f = message.getVersion();
+  if (f !== 0) {
+    writer.writeUint64(
+      5,
+      f
+    );
+  }
+};
+
+
+/**
+ * optional string tournament_id = 1;
+ * @return {string}
+ */
+proto.game.TournamentLeaderboard.prototype.getTournamentId = function() {
+  return /** @type {string} */ (jspb.Message.getFieldWithDefault(this, 1, ""));
+};
+
+
+/**
+ * @param {string} value
+ * @return {!proto.game.TournamentLeaderboard} returns this
+ */
+proto.game.TournamentLeaderboard.prototype.setTournamentId = function(value) {
+  return jspb.Message.setProto3StringField(this, 1, value);
+};
+
+
+/**
+ * repeated LeaderboardEntry entries = 2;
+ * @return {!Array<!proto.game.LeaderboardEntry>}
+ */
+proto.game.TournamentLeaderboard.prototype.getEntriesList = function() {
+  return /** @type{!Array<!proto.game.LeaderboardEntry>} */ (
+    jspb.Message.getRepeatedWrapperField(this, proto.game.LeaderboardEntry, 2));
+};
+
+
+/**
+ * @param {!Array<!proto.game.LeaderboardEntry>} value
+ * @return {!proto.game.TournamentLeaderboard} returns this
+*/
+proto.game.TournamentLeaderboard.prototype.setEntriesList = function(value) {
+  return jspb.Message.setRepeatedWrapperField(this, 2, value);
+};
+
+
+/**
+ * @param {!proto.game.LeaderboardEntry=} opt_value
+ * @param {number=} opt_index
+ * @return {!proto.game.LeaderboardEntry}
+ */
+proto.game.TournamentLeaderboard.prototype.addEntries = function(opt_value, opt_index) {
+  return jspb.Message.addToRepeatedWrapperField(this, 2, opt_value, proto.game.LeaderboardEntry, opt_index);
+};
+
+
+/**
+ * Clears the list making it empty but non-null.
+ * @return {!proto.game.TournamentLeaderboard} returns this
+ */
+proto.game.TournamentLeaderboard.prototype.clearEntriesList = function() {
+  return this.setEntriesList([]);
+};
+
+
+/**
+ * optional int32 total_games = 3;
+ * @return {number}
+ */
+proto.game.TournamentLeaderboard.prototype.getTotalGames = function() {
+  return /** @type {number} */ (jspb.Message.getFieldWithDefault(this, 3, 0));
+};
+
+
+/**
+ * @param {number} value
+ * @return {!proto.game.TournamentLeaderboard} returns this
+ */
+proto.game.TournamentLeaderboard.prototype.setTotalGames = function(value) {
+  return jspb.Message.setProto3IntField(this, 3, value);
+};
+
+
+/**
+ * optional int32 total_players = 4;
+ * @return {number}
+ */
+proto.game.TournamentLeaderboard.prototype.getTotalPlayers = function() {
+  return /** @type {number} */ (jspb.Message.getFieldWithDefault(this, 4, 0));
+};
+
+
+/**
+ * @param {number} value
+ * @return {!proto.game.TournamentLeaderboard} returns this
+ */
+proto.game.TournamentLeaderboard.prototype.setTotalPlayers = function(value) {
+  return jspb.Message.setProto3IntField(this, 4, value);
+};
+
+
+/**
+ * optional uint64 version = 5;
+ * @return {number}
+ */
+proto.game.TournamentLeaderboard.prototype.getVersion = function() {
+  return /** @type {number} */ (jspb.Message.getFieldWithDefault(this, 5, 0));
+};
+
+
+/**
+ * @param {number} value
+ * @return {!proto.game.TournamentLeaderboard} returns this
+ */
+proto.game.TournamentLeaderboard.prototype.setVersion = function(value) {
+  return jspb.Message.setProto3IntField(this, 5, value);
+};
+
+
+
+/**
+ * Oneof group definitions for this message. Each group defines the field
+ * numbers belonging to that group. When of these fields' value is set, all
+ * other fields in the group are cleared. During deserialization, if multiple
+ * fields are encountered for a group, only the last value seen will be kept.
+ * @private {!Array<!Array<number>>}
+ * @const
+ */
+proto.game.SessionRequest.oneofGroups_ = [[1,2]];
+
+/**
+ * @enum {number}
+ */
+proto.game.SessionRequest.PayloadCase = {
+  PAYLOAD_NOT_SET: 0,
+  JOIN: 1,
+  ANSWER: 2
+};
+
+/**
+ * @return {proto.game.SessionRequest.PayloadCase}
+ */
+proto.game.SessionRequest.prototype.getPayloadCase = function() {
+  return /** @type {proto.game.SessionRequest.PayloadCase} */(jspb.Message.computeOneofCase(this, proto.game.SessionRequest.oneofGroups_[0]));
+};
+
+
+
+if (jspb.Message.GENERATE_TO_OBJECT) {
+/**
+ * Creates an object representation of this proto.
+ * Field names that are reserved in JavaScript and will be renamed to pb_name.
+ * Optional fields that are not set will be set to undefined.
+ * To access a reserved field use, foo.pb_<name>, eg, foo.pb_default.
+ * For the list of reserved names please see:
+ *     net/proto2/compiler/js/internal/generator.cc#kKeyword.
+ * @param {boolean=} opt_includeInstance Deprecated. whether to include the
+ *     JSPB instance for transitional soy proto support:
+ *     http://goto/soy-param-migration
+ * @return {!Object}
+ */
+proto.game.SessionRequest.prototype.toObject = function(opt_includeInstance) {
+  return proto.game.SessionRequest.toObject(opt_includeInstance, this);
+};
+
+
+/**
+ * Static version of the {@see toObject} method.
+ * @param {boolean|undefined} includeInstance Deprecated. Whether to include
+ *     the JSPB instance for transitional soy proto support:
+ *     http://goto/soy-param-migration
+ * @param {!proto.game.SessionRequest} msg The msg instance to transform.
+ * @return {!Object}
+ * @suppress {unusedLocalVariables} f is only used for nested messages
+ */
+proto.game.SessionRequest.toObject = function(includeInstance, msg) {
+  var f, obj = {
+join: (f = msg.getJoin()) && proto.game.GameRequest.toObject(includeInstance, f),
+answer: (f = msg.getAnswer()) && proto.game.AnswerRequest.toObject(includeInstance, f)
+  };
+
+  if (includeInstance) {
+    obj.$jspbMessageInstance = msg;
+  }
+  return obj;
+};
+}
+
+
+/**
+ * Deserializes binary data (in protobuf wire format).
+ * @param {jspb.ByteSource} bytes The bytes to deserialize.
+ * @return {!proto.game.SessionRequest}
+ */
+proto.game.SessionRequest.deserializeBinary = function(bytes) {
+  var reader = new jspb.BinaryReader(bytes);
+  var msg = new proto.game.SessionRequest;
+  return proto.game.SessionRequest.deserializeBinaryFromReader(msg, reader);
+};
+
+
+/**
+ * Deserializes binary data (in protobuf wire format) from the
+ * given reader into the given message object.
+ * @param {!proto.game.SessionRequest} msg The message object to deserialize into.
+ * @param {!jspb.BinaryReader} reader The BinaryReader to use.
+ * @return {!proto.game.SessionRequest}
+ */
+proto.game.SessionRequest.deserializeBinaryFromReader = function(msg, reader) {
+  while (reader.nextField()) {
+    if (reader.isEndGroup()) {
+      break;
+    }
+    var field = reader.getFieldNumber();
+    switch (field) {
+    case 1:
+      var value = new proto.game.GameRequest;
+      reader.readMessage(value,proto.game.GameRequest.deserializeBinaryFromReader);
+      msg.setJoin(value);
+      break;
+    case 2:
+      var value = new proto.game.AnswerRequest;
+      reader.readMessage(value,proto.game.AnswerRequest.deserializeBinaryFromReader);
+      msg.setAnswer(value);
+      break;
+    default:
+      reader.skipField();
+      break;
+    }
+  }
+  return msg;
+};
+
+
+/**
+ * Serializes the message to binary data (in protobuf wire format).
+ * @return {!Uint8Array}
+ */
+proto.game.SessionRequest.prototype.serializeBinary = function() {
+  var writer = new jspb.BinaryWriter();
+  proto.game.SessionRequest.serializeBinaryToWriter(this, writer);
+  return writer.getResultBuffer();
+};
+
+
+/**
+ * Serializes the given message to binary data (in protobuf wire
+ * format), writing to the given BinaryWriter.
+ * @param {!proto.game.SessionRequest} message
+ * @param {!jspb.BinaryWriter} writer
+ * @suppress {unusedLocalVariables} f is only used for nested messages
+ */
+proto.game.SessionRequest.serializeBinaryToWriter = function(message, writer) {
+  var f = undefined;
+  f = message.getJoin();
+  if (f != null) {
+    writer.writeMessage(
+      1,
+      f,
+      proto.game.GameRequest.serializeBinaryToWriter
+    );
+  }
+  f = message.getAnswer();
+  if (f != null) {
+    writer.writeMessage(
+      2,
+      f,
+      proto.game.AnswerRequest.serializeBinaryToWriter
+    );
+  }
+};
+
+
+/**
+ * optional GameRequest join = 1;
+ * @return {?proto.game.GameRequest}
+ */
+proto.game.SessionRequest.prototype.getJoin = function() {
+  return /** @type{?proto.game.GameRequest} */ (
+    jspb.Message.getWrapperField(this, proto.game.GameRequest, 1));
+};
+
+
+/**
+ * @param {?proto.game.GameRequest|undefined} value
+ * @return {!proto.game.SessionRequest} returns this
+*/
+proto.game.SessionRequest.prototype.setJoin = function(value) {
+  return jspb.Message.setOneofWrapperField(this, 1, proto.game.SessionRequest.oneofGroups_[0], value);
+};
+
+
+/**
+ * Clears the message field making it undefined.
+ * @return {!proto.game.SessionRequest} returns this
+ */
+proto.game.SessionRequest.prototype.clearJoin = function() {
+  return this.setJoin(undefined);
+};
+
+
+/**
+ * Returns whether this field is set.
+ * @return {boolean}
+ */
+proto.game.SessionRequest.prototype.hasJoin = function() {
+  return jspb.Message.getField(this, 1) != null;
+};
+
+
+/**
+ * optional AnswerRequest answer = 2;
+ * @return {?proto.game.AnswerRequest}
+ */
+proto.game.SessionRequest.prototype.getAnswer = function() {
+  return /** @type{?proto.game.AnswerRequest} */ (
+    jspb.Message.getWrapperField(this, proto.game.AnswerRequest, 2));
+};
+
+
+/**
+ * @param {?proto.game.AnswerRequest|undefined} value
+ * @return {!proto.game.SessionRequest} returns this
+*/
+proto.game.SessionRequest.prototype.setAnswer = function(value) {
+  return jspb.Message.setOneofWrapperField(this, 2, proto.game.SessionRequest.oneofGroups_[0], value);
+};
+
+
+/**
+ * Clears the message field making it undefined.
+ * @return {!proto.game.SessionRequest} returns this
+ */
+proto.game.SessionRequest.prototype.clearAnswer = function() {
+  return this.setAnswer(undefined);
+};
+
+
+/**
+ * Returns whether this field is set.
+ * @return {boolean}
+ */
+proto.game.SessionRequest.prototype.hasAnswer = function() {
+  return jspb.Message.getField(this, 2) != null;
+};
+
+
+
+
+
+if (jspb.Message.GENERATE_TO_OBJECT) {
+/**
+ * Creates an object representation of this proto.
+ * Field names that are reserved in JavaScript and will be renamed to pb_name.
+ * Optional fields that are not set will be set to undefined.
+ * To access a reserved field use, foo.pb_<name>, eg, foo.pb_default.
+ * For the list of reserved names please see:
+ *     net/proto2/compiler/js/internal/generator.cc#kKeyword.
+ * @param {boolean=} opt_includeInstance Deprecated. whether to include the
+ *     JSPB instance for transitional soy proto support:
+ *     http://goto/soy-param-migration
+ * @return {!Object}
+ */
+proto.game.RoundTransition.prototype.toObject = function(opt_includeInstance) {
+  return proto.game.RoundTransition.toObject(opt_includeInstance, this);
+};
+
+
+/**
+ * Static version of the {@see toObject} method.
+ * @param {boolean|undefined} includeInstance Deprecated. Whether to include
+ *     the JSPB instance for transitional soy proto support:
+ *     http://goto/soy-param-migration
+ * @param {!proto.game.RoundTransition} msg The msg instance to transform.
+ * @return {!Object}
+ * @suppress {unusedLocalVariables} f is only used for nested messages
+ */
+proto.game.RoundTransition.toObject = function(includeInstance, msg) {
+  var f, obj = {
+completedRound: jspb.Message.getFieldWithDefault(msg, 1, 0),
+nextRound: jspb.Message.getFieldWithDefault(msg, 2, 0),
+totalRounds: jspb.Message.getFieldWithDefault(msg, 3, 0),
+gameOver: jspb.Message.getBooleanFieldWithDefault(msg, 4, false),
+timedOut: jspb.Message.getBooleanFieldWithDefault(msg, 5, false)
+  };
+
+  if (includeInstance) {
+    obj.$jspbMessageInstance = msg;
+  }
+  return obj;
+};
+}
+
+
+/**
+ * Deserializes binary data (in protobuf wire format).
+ * @param {jspb.ByteSource} bytes The bytes to deserialize.
+ * @return {!proto.game.RoundTransition}
+ */
+proto.game.RoundTransition.deserializeBinary = function(bytes) {
+  var reader = new jspb.BinaryReader(bytes);
+  var msg = new proto.game.RoundTransition;
+  return proto.game.RoundTransition.deserializeBinaryFromReader(msg, reader);
+};
+
+
+/**
+ * Deserializes binary data (in protobuf wire format) from the
+ * given reader into the given message object.
+ * @param {!proto.game.RoundTransition} msg The message object to deserialize into.
+ * @param {!jspb.BinaryReader} reader The BinaryReader to use.
+ * @return {!proto.game.RoundTransition}
+ */
+proto.game.RoundTransition.deserializeBinaryFromReader = function(msg, reader) {
+  while (reader.nextField()) {
+    if (reader.isEndGroup()) {
+      break;
+    }
+    var field = reader.getFieldNumber();
+    switch (field) {
+    case 1:
+      var value = /** @type {number} */ (reader.readInt32());
+      msg.setCompletedRound(value);
+      break;
+    case 2:
+      var value = /** @type {number} */ (reader.readInt32());
+      msg.setNextRound(value);
+      break;
+    case 3:
+      var value = /** @type {number} */ (reader.readInt32());
+      msg.setTotalRounds(value);
+      break;
+    case 4:
+      var value = /** @type {boolean} */ (reader.readBool());
+      msg.setGameOver(value);
+      break;
+    case 5:
+      var value = /** @type {boolean} */ (reader.readBool());
+      msg.setTimedOut(value);
+      break;
+    default:
+      reader.skipField();
+      break;
+    }
+  }
+  return msg;
+};
+
+
+/**
+ * Serializes the message to binary data (in protobuf wire format).
+ * @return {!Uint8Array}
+ */
+proto.game.RoundTransition.prototype.serializeBinary = function() {
+  var writer = new jspb.BinaryWriter();
+  proto.game.RoundTransition.serializeBinaryToWriter(this, writer);
+  return writer.getResultBuffer();
+};
+
+
+/**
+ * Serializes the given message to binary data (in protobuf wire
+ * format), writing to the given BinaryWriter.
+ * @param {!proto.game.RoundTransition} message
+ * @param {!jspb.BinaryWriter} writer
+ * @suppress {unusedLocalVariables} f is only used for nested messages
+ */
+proto.game.RoundTransition.serializeBinaryToWriter = function(message, writer) {
+  var f = undefined;
+  f = message.getCompletedRound();
+  if (f !== 0) {
+    writer.writeInt32(
+      1,
+      f
+    );
+  }
+  f = message.getNextRound();
+  if (f !== 0) {
+    writer.writeInt32(
+      2,
+      f
+    );
+  }
+  f = message.getTotalRounds();
+  if (f !== 0) {
+    writer.writeInt32(
+      3,
+      f
+    );
+  }
+  f = message.getGameOver();
+  if (f) {
+    writer.writeBool(
+      4,
+      f
+    );
+  }
+  f = message.getTimedOut();
+  if (f) {
+    writer.writeBool(
+      5,
+      f
+    );
+  }
+};
+
+
+/**
+ * optional int32 completed_round = 1;
+ * @return {number}
+ */
+proto.game.RoundTransition.prototype.getCompletedRound = function() {
+  return /** @type {number} */ (jspb.Message.getFieldWithDefault(this, 1, 0));
+};
+
+
+/**
+ * @param {number} value
+ * @return {!proto.game.RoundTransition} returns this
+ */
+proto.game.RoundTransition.prototype.setCompletedRound = function(value) {
+  return jspb.Message.setProto3IntField(this, 1, value);
+};
+
+
+/**
+ * optional int32 next_round = 2;
+ * @return {number}
+ */
+proto.game.RoundTransition.prototype.getNextRound = function() {
+  return /** @type {number} */ (jspb.Message.getFieldWithDefault(this, 2, 0));
+};
+
+
+/**
+ * @param {number} value
+ * @return {!proto.game.RoundTransition} returns this
+ */
+proto.game.RoundTransition.prototype.setNextRound = function(value) {
+  return jspb.Message.setProto3IntField(this, 2, value);
+};
+
+
+/**
+ * optional int32 total_rounds = 3;
+ * @return {number}
+ */
+proto.game.RoundTransition.prototype.getTotalRounds = function() {
+  return /** @type {number} */ (jspb.Message.getFieldWithDefault(this, 3, 0));
+};
+
+
+/**
+ * @param {number} value
+ * @return {!proto.game.RoundTransition} returns this
+ */
+proto.game.RoundTransition.prototype.setTotalRounds = function(value) {
+  return jspb.Message.setProto3IntField(this, 3, value);
+};
+
+
+/**
+ * optional bool game_over = 4;
+ * @return {boolean}
+ */
+proto.game.RoundTransition.prototype.getGameOver = function() {
+  return /** @type {boolean} */ (jspb.Message.getBooleanFieldWithDefault(this, 4, false));
+};
+
+
+/**
+ * @param {boolean} value
+ * @return {!proto.game.RoundTransition} returns this
+ */
+proto.game.RoundTransition.prototype.setGameOver = function(value) {
+  return jspb.Message.setProto3BooleanField(this, 4, value);
+};
+
+
+/**
+ * optional bool timed_out = 5;
+ * @return {boolean}
+ */
+proto.game.RoundTransition.prototype.getTimedOut = function() {
+  return /** @type {boolean} */ (jspb.Message.getBooleanFieldWithDefault(this, 5, false));
+};
+
+
+/**
+ * @param {boolean} value
+ * @return {!proto.game.RoundTransition} returns this
+ */
+proto.game.RoundTransition.prototype.setTimedOut = function(value) {
+  return jspb.Message.setProto3BooleanField(this, 5, value);
+};
+
+
+
+/**
+ * Oneof group definitions for this message. Each group defines the field
+ * numbers belonging to that group. When of these fields' value is set, all
+ * other fields in the group are cleared. During deserialization, if multiple
+ * fields are encountered for a group, only the last value seen will be kept.
+ * @private {!Array<!Array<number>>}
+ * @const
+ */
+proto.game.SessionEvent.oneofGroups_ = [[1,2,3]];
+
+/**
+ * @enum {number}
+ */
+proto.game.SessionEvent.EventCase = {
+  EVENT_NOT_SET: 0,
+  QUESTION: 1,
+  ANSWER_RESULT: 2,
+  ROUND: 3
+};
+
+/**
+ * @return {proto.game.SessionEvent.EventCase}
+ */
+proto.game.SessionEvent.prototype.getEventCase = function() {
+  return /** @type {proto.game.SessionEvent.EventCase} */(jspb.Message.computeOneofCase(this, proto.game.SessionEvent.oneofGroups_[0]));
+};
+
+
+
+if (jspb.Message.GENERATE_TO_OBJECT) {
+/**
+ * Creates an object representation of this proto.
+ * Field names that are reserved in JavaScript and will be renamed to pb_name.
+ * Optional fields that are not set will be set to undefined.
+ * To access a reserved field use, foo.pb_<name>, eg, foo.pb_default.
+ * For the list of reserved names please see:
+ *     net/proto2/compiler/js/internal/generator.cc#kKeyword.
+ * @param {boolean=} opt_includeInstance Deprecated. whether to include the
+ *     JSPB instance for transitional soy proto support:
+ *     http://goto/soy-param-migration
+ * @return {!Object}
+ */
+proto.game.SessionEvent.prototype.toObject = function(opt_includeInstance) {
+  return proto.game.SessionEvent.toObject(opt_includeInstance, this);
+};
+
+
+/**
+ * Static version of the {@see toObject} method.
+ * @param {boolean|undefined} includeInstance Deprecated. Whether to include
+ *     the JSPB instance for transitional soy proto support:
+ *     http://goto/soy-param-migration
+ * @param {!proto.game.SessionEvent} msg The msg instance to transform.
+ * @return {!Object}
+ * @suppress {unusedLocalVariables} f is only used for nested messages
+ */
+proto.game.SessionEvent.toObject = function(includeInstance, msg) {
+  var f, obj = {
+question: (f = msg.getQuestion()) && proto.game.QuestionCard.toObject(includeInstance, f),
+answerResult: (f = msg.getAnswerResult()) && proto.game.AnswerResult.toObject(includeInstance, f),
+round: (f = msg.getRound()) && proto.game.RoundTransition.toObject(includeInstance, f)
+  };
+
+  if (includeInstance) {
+    obj.$jspbMessageInstance = msg;
+  }
+  return obj;
+};
+}
+
+
+/**
+ * Deserializes binary data (in protobuf wire format).
+ * @param {jspb.ByteSource} bytes The bytes to deserialize.
+ * @return {!proto.game.SessionEvent}
+ */
+proto.game.SessionEvent.deserializeBinary = function(bytes) {
+  var reader = new jspb.BinaryReader(bytes);
+  var msg = new proto.game.SessionEvent;
+  return proto.game.SessionEvent.deserializeBinaryFromReader(msg, reader);
+};
+
+
+/**
+ * Deserializes binary data (in protobuf wire format) from the
+ * given reader into the given message object.
+ * @param {!proto.game.SessionEvent} msg The message object to deserialize into.
+ * @param {!jspb.BinaryReader} reader The BinaryReader to use.
+ * @return {!proto.game.SessionEvent}
+ */
+proto.game.SessionEvent.deserializeBinaryFromReader = function(msg, reader) {
+  while (reader.nextField()) {
+    if (reader.isEndGroup()) {
+      break;
+    }
+    var field = reader.getFieldNumber();
+    switch (field) {
+    case 1:
+      var value = new proto.game.QuestionCard;
+      reader.readMessage(value,proto.game.QuestionCard.deserializeBinaryFromReader);
+      msg.setQuestion(value);
+      break;
+    case 2:
+      var value = new proto.game.AnswerResult;
+      reader.readMessage(value,proto.game.AnswerResult.deserializeBinaryFromReader);
+      msg.setAnswerResult(value);
+      break;
+    case 3:
+      var value = new proto.game.RoundTransition;
+      reader.readMessage(value,proto.game.RoundTransition.deserializeBinaryFromReader);
+      msg.setRound(value);
+      break;
+    default:
+      reader.skipField();
+      break;
+    }
+  }
+  return msg;
+};
+
+
+/**
+ * Serializes the message to binary data (in protobuf wire format).
+ * @return {!Uint8Array}
+ */
+proto.game.SessionEvent.prototype.serializeBinary = function() {
+  var writer = new jspb.BinaryWriter();
+  proto.game.SessionEvent.serializeBinaryToWriter(this, writer);
+  return writer.getResultBuffer();
+};
+
+
+/**
+ * Serializes the given message to binary data (in protobuf wire
+ * format), writing to the given BinaryWriter.
+ * @param {!proto.game.SessionEvent} message
+ * @param {!jspb.BinaryWriter} writer
+ * @suppress {unusedLocalVariables} f is only used for nested messages
+ */
+proto.game.SessionEvent.serializeBinaryToWriter = function(message, writer) {
+  var f = undefined;
+  f = message.getQuestion();
+  if (f != null) {
+    writer.writeMessage(
+      1,
+      f,
+      proto.game.QuestionCard.serializeBinaryToWriter
+    );
+  }
+  f = message.getAnswerResult();
+  if (f != null) {
+    writer.writeMessage(
+      2,
+      f,
+      proto.game.AnswerResult.serializeBinaryToWriter
+    );
+  }
+  f = message.getRound();
+  if (f != null) {
+    writer.writeMessage(
+      3,
+      f,
+      proto.game.RoundTransition.serializeBinaryToWriter
+    );
+  }
+};
+
+
+/**
+ * optional QuestionCard question = 1;
+ * @return {?proto.game.QuestionCard}
+ */
+proto.game.SessionEvent.prototype.getQuestion = function() {
+  return /** @type{?proto.game.QuestionCard} */ (
+    jspb.Message.getWrapperField(this, proto.game.QuestionCard, 1));
+};
+
+
+/**
+ * @param {?proto.game.QuestionCard|undefined} value
+ * @return {!proto.game.SessionEvent} returns this
+*/
+proto.game.SessionEvent.prototype.setQuestion = function(value) {
+  return jspb.Message.setOneofWrapperField(this, 1, proto.game.SessionEvent.oneofGroups_[0], value);
+};
+
+
+/**
+ * Clears the message field making it undefined.
+ * @return {!proto.game.SessionEvent} returns this
+ */
+proto.game.SessionEvent.prototype.clearQuestion = function() {
+  return this.setQuestion(undefined);
+};
+
+
+/**
+ * Returns whether this field is set.
+ * @return {boolean}
+ */
+proto.game.SessionEvent.prototype.hasQuestion = function() {
+  return jspb.Message.getField(this, 1) != null;
+};
+
+
+/**
+ * optional AnswerResult answer_result = 2;
+ * @return {?proto.game.AnswerResult}
+ */
+proto.game.SessionEvent.prototype.getAnswerResult = function() {
+  return /** @type{?proto.game.AnswerResult} */ (
+    jspb.Message.getWrapperField(this, proto.game.AnswerResult, 2));
+};
+
+
+/**
+ * @param {?proto.game.AnswerResult|undefined} value
+ * @return {!proto.game.SessionEvent} returns this
+*/
+proto.game.SessionEvent.prototype.setAnswerResult = function(value) {
+  return jspb.Message.setOneofWrapperField(this, 2, proto.game.SessionEvent.oneofGroups_[0], value);
+};
+
+
+/**
+ * Clears the message field making it undefined.
+ * @return {!proto.game.SessionEvent} returns this
+ */
+proto.game.SessionEvent.prototype.clearAnswerResult = function() {
+  return this.setAnswerResult(undefined);
+};
+
+
+/**
+ * Returns whether this field is set.
+ * @return {boolean}
+ */
+proto.game.SessionEvent.prototype.hasAnswerResult = function() {
+  return jspb.Message.getField(this, 2) != null;
+};
+
+
+/**
+ * optional RoundTransition round = 3;
+ * @return {?proto.game.RoundTransition}
+ */
+proto.game.SessionEvent.prototype.getRound = function() {
+  return /** @type{?proto.game.RoundTransition} */ (
+    jspb.Message.getWrapperField(this, proto.game.RoundTransition, 3));
+};
+
+
+/**
+ * @param {?proto.game.RoundTransition|undefined} value
+ * @return {!proto.game.SessionEvent} returns this
+*/
+proto.game.SessionEvent.prototype.setRound = function(value) {
+  return jspb.Message.setOneofWrapperField(this, 3, proto.game.SessionEvent.oneofGroups_[0], value);
+};
+
+
+/**
+ * Clears the message field making it undefined.
+ * @return {!proto.game.SessionEvent} returns this
+ */
+proto.game.SessionEvent.prototype.clearRound = function() {
+  return this.setRound(undefined);
+};
+
+
+/**
+ * Returns whether this field is set.
+ * @return {boolean}
+ */
+proto.game.SessionEvent.prototype.hasRound = function() {
+  return jspb.Message.getField(this, 3) != null;
+};
+
+
+
+
+
+if (jspb.Message.GENERATE_TO_OBJECT) {
+/**
+ * Creates an object representation of this proto.
+ * Field names that are reserved in JavaScript and will be renamed to pb_name.
+ * Optional fields that are not set will be set to undefined.
+ * To access a reserved field use, foo.pb_<name>, eg, foo.pb_default.
+ * For the list of reserved names please see:
+ *     net/proto2/compiler/js/internal/generator.cc#kKeyword.
+ * @param {boolean=} opt_includeInstance Deprecated. whether to include the
+ *     JSPB instance for transitional soy proto support:
+ *     http://goto/soy-param-migration
+ * @return {!Object}
+ */
+proto.game.MatchRequest.prototype.toObject = function(opt_includeInstance) {
+  return proto.game.MatchRequest.toObject(opt_includeInstance, this);
+};
+
+
+/**
+ * Static version of the {@see toObject} method.
+ * @param {boolean|undefined} includeInstance Deprecated. Whether to include
+ *     the JSPB instance for transitional soy proto support:
+ *     http://goto/soy-param-migration
+ * @param {!proto.game.MatchRequest} msg The msg instance to transform.
+ * @return {!Object}
+ * @suppress {unusedLocalVariables} f is only used for nested messages
+ */
+proto.game.MatchRequest.toObject = function(includeInstance, msg) {
+  var f, obj = {
+playerName: jspb.Message.getFieldWithDefault(msg, 1, ""),
+roomSize: jspb.Message.getFieldWithDefault(msg, 2, 0),
+skill: jspb.Message.getFieldWithDefault(msg, 3, 0),
+region: jspb.Message.getFieldWithDefault(msg, 4, "")
+  };
+
+  if (includeInstance) {
+    obj.$jspbMessageInstance = msg;
+  }
+  return obj;
+};
+}
+
+
+/**
+ * Deserializes binary data (in protobuf wire format).
+ * @param {jspb.ByteSource} bytes The bytes to deserialize.
+ * @return {!proto.game.MatchRequest}
+ */
+proto.game.MatchRequest.deserializeBinary = function(bytes) {
+  var reader = new jspb.BinaryReader(bytes);
+  var msg = new proto.game.MatchRequest;
+  return proto.game.MatchRequest.deserializeBinaryFromReader(msg, reader);
+};
+
+
+/**
+ * Deserializes binary data (in protobuf wire format) from the
+ * given reader into the given message object.
+ * @param {!proto.game.MatchRequest} msg The message object to deserialize into.
+ * @param {!jspb.BinaryReader} reader The BinaryReader to use.
+ * @return {!proto.game.MatchRequest}
+ */
+proto.game.MatchRequest.deserializeBinaryFromReader = function(msg, reader) {
+  while (reader.nextField()) {
+    if (reader.isEndGroup()) {
+      break;
+    }
+    var field = reader.getFieldNumber();
+    switch (field) {
+    case 1:
+      var value = /** @type {string} */ (reader.readString());
+      msg.setPlayerName(value);
+      break;
+    case 2:
+      var value = /** @type {number} */ (reader.readInt32());
+      msg.setRoomSize(value);
+      break;
+    case 3:
+      var value = /** @type {number} */ (reader.readInt32());
+      msg.setSkill(value);
+      break;
+    case 4:
+      var value = /** @type {string} */ (reader.readString());
+      msg.setRegion(value);
+      break;
+    default:
+      reader.skipField();
+      break;
+    }
+  }
+  return msg;
+};
+
+
+/**
+ * Serializes the message to binary data (in protobuf wire format).
+ * @return {!Uint8Array}
+ */
+proto.game.MatchRequest.prototype.serializeBinary = function() {
+  var writer = new jspb.BinaryWriter();
+  proto.game.MatchRequest.serializeBinaryToWriter(this, writer);
+  return writer.getResultBuffer();
+};
+
+
+/**
+ * Serializes the given message to binary data (in protobuf wire
+ * format), writing to the given BinaryWriter.
+ * @param {!proto.game.MatchRequest} message
+ * @param {!jspb.BinaryWriter} writer
+ * @suppress {unusedLocalVariables} f is only used for nested messages
+ */
+proto.game.MatchRequest.serializeBinaryToWriter = function(message, writer) {
+  var f = undefined;
+  f = message.getPlayerName();
+  if (f.length > 0) {
+    writer.writeString(
+      1,
+      f
+    );
+  }
+  f = message.getRoomSize();
+  if (f !== 0) {
+    writer.writeInt32(
+      2,
+      f
+    );
+  }
+  f = message.getSkill();
+  if (f !== 0) {
+    writer.writeInt32(
+      3,
+      f
+    );
+  }
+  f = message.getRegion();
+  if (f.length > 0) {
+    writer.writeString(
+      4,
+      f
+    );
+  }
+};
+
+
+/**
+ * optional string player_name = 1;
+ * @return {string}
+ */
+proto.game.MatchRequest.prototype.getPlayerName = function() {
+  return /** @type {string} */ (jspb.Message.getFieldWithDefault(this, 1, ""));
+};
+
+
+/**
+ * @param {string} value
+ * @return {!proto.game.MatchRequest} returns this
+ */
+proto.game.MatchRequest.prototype.setPlayerName = function(value) {
+  return jspb.Message.setProto3StringField(this, 1, value);
+};
+
+
+/**
+ * optional int32 room_size = 2;
+ * @return {number}
+ */
+proto.game.MatchRequest.prototype.getRoomSize = function() {
+  return /** @type {number} */ (jspb.Message.getFieldWithDefault(this, 2, 0));
+};
+
+
+/**
+ * @param {number} value
+ * @return {!proto.game.MatchRequest} returns this
+ */
+proto.game.MatchRequest.prototype.setRoomSize = function(value) {
+  return jspb.Message.setProto3IntField(this, 2, value);
+};
+
+
+/**
+ * optional int32 skill = 3;
+ * @return {number}
+ */
+proto.game.MatchRequest.prototype.getSkill = function() {
+  return /** @type {number} */ (jspb.Message.getFieldWithDefault(this, 3, 0));
+};
+
+
+/**
+ * @param {number} value
+ * @return {!proto.game.MatchRequest} returns this
+ */
+proto.game.MatchRequest.prototype.setSkill = function(value) {
+  return jspb.Message.setProto3IntField(this, 3, value);
+};
+
+
+/**
+ * optional string region = 4;
+ * @return {string}
+ */
+proto.game.MatchRequest.prototype.getRegion = function() {
+  return /** @type {string} */ (jspb.Message.getFieldWithDefault(this, 4, ""));
+};
+
+
+/**
+ * @param {string} value
+ * @return {!proto.game.MatchRequest} returns this
+ */
+proto.game.MatchRequest.prototype.setRegion = function(value) {
+  return jspb.Message.setProto3StringField(this, 4, value);
+};
+
+
+
+
+
+if (jspb.Message.GENERATE_TO_OBJECT) {
+/**
+ * Creates an object representation of this proto.
+ * Field names that are reserved in JavaScript and will be renamed to pb_name.
+ * Optional fields that are not set will be set to undefined.
+ * To access a reserved field use, foo.pb_<name>, eg, foo.pb_default.
+ * For the list of reserved names please see:
+ *     net/proto2/compiler/js/internal/generator.cc#kKeyword.
+ * @param {boolean=} opt_includeInstance Deprecated. whether to include the
+ *     JSPB instance for transitional soy proto support:
+ *     http://goto/soy-param-migration
+ * @return {!Object}
+ */
+proto.game.MatchUpdate.prototype.toObject = function(opt_includeInstance) {
+  return proto.game.MatchUpdate.toObject(opt_includeInstance, this);
+};
+
+
+/**
+ * Static version of the {@see toObject} method.
+ * @param {boolean|undefined} includeInstance Deprecated. Whether to include
+ *     the JSPB instance for transitional soy proto support:
+ *     http://goto/soy-param-migration
+ * @param {!proto.game.MatchUpdate} msg The msg instance to transform.
+ * @return {!Object}
+ * @suppress {unusedLocalVariables} f is only used for nested messages
+ */
+proto.game.MatchUpdate.toObject = function(includeInstance, msg) {
+  var f, obj = {
+matched: jspb.Message.getBooleanFieldWithDefault(msg, 1, false),
+playersWaiting: jspb.Message.getFieldWithDefault(msg, 2, 0),
+playerId: jspb.Message.getFieldWithDefault(msg, 3, ""),
+gameId: jspb.Message.getFieldWithDefault(msg, 4, "")
+  };
+
+  if (includeInstance) {
+    obj.$jspbMessageInstance = msg;
+  }
+  return obj;
+};
+}
+
+
+/**
+ * Deserializes binary data (in protobuf wire format).
+ * @param {jspb.ByteSource} bytes The bytes to deserialize.
+ * @return {!proto.game.MatchUpdate}
+ */
+proto.game.MatchUpdate.deserializeBinary = function(bytes) {
+  var reader = new jspb.BinaryReader(bytes);
+  var msg = new proto.game.MatchUpdate;
+  return proto.game.MatchUpdate.deserializeBinaryFromReader(msg, reader);
+};
+
+
+/**
+ * Deserializes binary data (in protobuf wire format) from the
+ * given reader into the given message object.
+ * @param {!proto.game.MatchUpdate} msg The message object to deserialize into.
+ * @param {!jspb.BinaryReader} reader The BinaryReader to use.
+ * @return {!proto.game.MatchUpdate}
+ */
+proto.game.MatchUpdate.deserializeBinaryFromReader = function(msg, reader) {
+  while (reader.nextField()) {
+    if (reader.isEndGroup()) {
+      break;
+    }
+    var field = reader.getFieldNumber();
+    switch (field) {
+    case 1:
+      var value = /** @type {boolean} */ (reader.readBool());
+      msg.setMatched(value);
+      break;
+    case 2:
+      var value = /** @type {number} */ (reader.readInt32());
+      msg.setPlayersWaiting(value);
+      break;
+    case 3:
+      var value = /** @type {string} */ (reader.readString());
+      msg.setPlayerId(value);
+      break;
+    case 4:
+      var value = /** @type {string} */ (reader.readString());
+      msg.setGameId(value);
+      break;
+    default:
+      reader.skipField();
+      break;
+    }
+  }
+  return msg;
+};
+
+
+/**
+ * Serializes the message to binary data (in protobuf wire format).
+ * @return {!Uint8Array}
+ */
+proto.game.MatchUpdate.prototype.serializeBinary = function() {
+  var writer = new jspb.BinaryWriter();
+  proto.game.MatchUpdate.serializeBinaryToWriter(this, writer);
+  return writer.getResultBuffer();
+};
+
+
+/**
+ * Serializes the given message to binary data (in protobuf wire
+ * format), writing to the given BinaryWriter.
+ * @param {!proto.game.MatchUpdate} message
+ * @param {!jspb.BinaryWriter} writer
+ * @suppress {unusedLocalVariables} f is only used for nested messages
+ */
+proto.game.MatchUpdate.serializeBinaryToWriter = function(message, writer) {
+  var f = undefined;
+  f = message.getMatched();
+  if (f) {
+    writer.writeBool(
+      1,
+      f
+    );
+  }
+  f = message.getPlayersWaiting();
+  if (f !== 0) {
+    writer.writeInt32(
+      2,
+      f
+    );
+  }
+  f = message.getPlayerId();
+  if (f.length > 0) {
+    writer.writeString(
+      3,
+      f
+    );
+  }
+  f = message.getGameId();
+  if (f.length > 0) {
+    writer.writeString(
+      4,
+      f
+    );
+  }
+};
+
+
+/**
+ * optional bool matched = 1;
+ * @return {boolean}
+ */
+proto.game.MatchUpdate.prototype.getMatched = function() {
+  return /** @type {boolean} */ (jspb.Message.getBooleanFieldWithDefault(this, 1, false));
+};
+
+
+/**
+ * @param {boolean} value
+ * @return {!proto.game.MatchUpdate} returns this
+ */
+proto.game.MatchUpdate.prototype.setMatched = function(value) {
+  return jspb.Message.setProto3BooleanField(this, 1, value);
+};
+
+
+/**
+ * optional int32 players_waiting = 2;
+ * @return {number}
+ */
+proto.game.MatchUpdate.prototype.getPlayersWaiting = function() {
+  return /** @type {number} */ (jspb.Message.getFieldWithDefault(this, 2, 0));
+};
+
+
+/**
+ * @param {number} value
+ * @return {!proto.game.MatchUpdate} returns this
+ */
+proto.game.MatchUpdate.prototype.setPlayersWaiting = function(value) {
+  return jspb.Message.setProto3IntField(this, 2, value);
+};
+
+
+/**
+ * optional string player_id = 3;
+ * @return {string}
+ */
+proto.game.MatchUpdate.prototype.getPlayerId = function() {
+  return /** @type {string} */ (jspb.Message.getFieldWithDefault(this, 3, ""));
+};
+
+
+/**
+ * @param {string} value
+ * @return {!proto.game.MatchUpdate} returns this
+ */
+proto.game.MatchUpdate.prototype.setPlayerId = function(value) {
+  return jspb.Message.setProto3StringField(this, 3, value);
+};
+
+
+/**
+ * optional string game_id = 4;
+ * @return {string}
+ */
+proto.game.MatchUpdate.prototype.getGameId = function() {
+  return /** @type {string} */ (jspb.Message.getFieldWithDefault(this, 4, ""));
+};
+
+
+/**
+ * @param {string} value
+ * @return {!proto.game.MatchUpdate} returns this
+ */
+proto.game.MatchUpdate.prototype.setGameId = function(value) {
+  return jspb.Message.setProto3StringField(this, 4, value);
+};
+
+
+
+
+
+if (jspb.Message.GENERATE_TO_OBJECT) {
+/**
+ * Creates an object representation of this proto.
+ * Field names that are reserved in JavaScript and will be renamed to pb_name.
+ * Optional fields that are not set will be set to undefined.
+ * To access a reserved field use, foo.pb_<name>, eg, foo.pb_default.
+ * For the list of reserved names please see:
+ *     net/proto2/compiler/js/internal/generator.cc#kKeyword.
+ * @param {boolean=} opt_includeInstance Deprecated. whether to include the
+ *     JSPB instance for transitional soy proto support:
+ *     http://goto/soy-param-migration
+ * @return {!Object}
+ */
+proto.game.ShardMapRequest.prototype.toObject = function(opt_includeInstance) {
+  return proto.game.ShardMapRequest.toObject(opt_includeInstance, this);
+};
+
+
+/**
+ * Static version of the {@see toObject} method.
+ * @param {boolean|undefined} includeInstance Deprecated. Whether to include
+ *     the JSPB instance for transitional soy proto support:
+ *     http://goto/soy-param-migration
+ * @param {!proto.game.ShardMapRequest} msg The msg instance to transform.
+ * @return {!Object}
+ * @suppress {unusedLocalVariables} f is only used for nested messages
+ */
+proto.game.ShardMapRequest.toObject = function(includeInstance, msg) {
+  var f, obj = {
+gameId: jspb.Message.getFieldWithDefault(msg, 1, "")
+  };
+
+  if (includeInstance) {
+    obj.$jspbMessageInstance = msg;
+  }
+  return obj;
+};
+}
+
+
+/**
+ * Deserializes binary data (in protobuf wire format).
+ * @param {jspb.ByteSource} bytes The bytes to deserialize.
+ * @return {!proto.game.ShardMapRequest}
+ */
+proto.game.ShardMapRequest.deserializeBinary = function(bytes) {
+  var reader = new jspb.BinaryReader(bytes);
+  var msg = new proto.game.ShardMapRequest;
+  return proto.game.ShardMapRequest.deserializeBinaryFromReader(msg, reader);
+};
+
+
+/**
+ * Deserializes binary data (in protobuf wire format) from the
+ * given reader into the given message object.
+ * @param {!proto.game.ShardMapRequest} msg The message object to deserialize into.
+ * @param {!jspb.BinaryReader} reader The BinaryReader to use.
+ * @return {!proto.game.ShardMapRequest}
+ */
+proto.game.ShardMapRequest.deserializeBinaryFromReader = function(msg, reader) {
+  while (reader.nextField()) {
+    if (reader.isEndGroup()) {
+      break;
+    }
+    var field = reader.getFieldNumber();
+    switch (field) {
+    case 1:
+      var value = /** @type {string} */ (reader.readString());
+      msg.setGameId(value);
+      break;
+    default:
+      reader.skipField();
+      break;
+    }
+  }
+  return msg;
+};
+
+
+/**
+ * Serializes the message to binary data (in protobuf wire format).
+ * @return {!Uint8Array}
  */
-proto.game.LeaderboardEntry.prototype.getScore = function() {
-  return /** @type {number} */ (jspb.Message.getFieldWithDefault(this, 3, 0));
+proto.game.ShardMapRequest.prototype.serializeBinary = function() {
+  var writer = new jspb.BinaryWriter();
+  proto.game.ShardMapRequest.serializeBinaryToWriter(this, writer);
+  return writer.getResultBuffer();
 };
 
 
 /**
- * @param {number} value
- * @return {!proto.game.LeaderboardEntry} returns this
+ * Serializes the given message to binary data (in protobuf wire
+ * format), writing to the given BinaryWriter.
+ * @param {!proto.game.ShardMapRequest} message
+ * @param {!jspb.BinaryWriter} writer
+ * @suppress {unusedLocalVariables} f is only used for nested messages
  */
-proto.game.LeaderboardEntry.prototype.setScore = function(value) {
-  return jspb.Message.setProto3IntField(this, 3, value);
+proto.game.ShardMapRequest.serializeBinaryToWriter = function(message, writer) {
+  var f = undefined;
+  f = message.getGameId();
+  if (f.length > 0) {
+    writer.writeString(
+      1,
+      f
+    );
+  }
 };
 
 
 /**
- * optional int32 rank = 4;
- * @return {number}
+ * optional string game_id = 1;
+ * @return {string}
  */
-proto.game.LeaderboardEntry.prototype.getRank = function() {
-  return /** @type {number} */ (jspb.Message.getFieldWithDefault(this, 4, 0));
+proto.game.ShardMapRequest.prototype.getGameId = function() {
+  return /** @type {string} */ (jspb.Message.getFieldWithDefault(this, 1, ""));
 };
 
 
 /**
- * @param {number} value
- * @return {!proto.game.LeaderboardEntry} returns this
+ * @param {string} value
+ * @return {!proto.game.ShardMapRequest} returns this
  */
-proto.game.LeaderboardEntry.prototype.setRank = function(value) {
-  return jspb.Message.setProto3IntField(this, 4, value);
+proto.game.ShardMapRequest.prototype.setGameId = function(value) {
+  return jspb.Message.setProto3StringField(this, 1, value);
 };
 
 
 
-/**
- * List of repeated fields within this message type.
- * @private {!Array<number>}
- * @const
- */
-proto.game.Leaderboard.repeatedFields_ = [1];
-
 
 
 if (jspb.Message.GENERATE_TO_OBJECT) {
@@ -1992,8 +6077,8 @@ if (jspb.Message.GENERATE_TO_OBJECT) {
  *     http://goto/soy-param-migration
  * @return {!Object}
  */
-proto.game.Leaderboard.prototype.toObject = function(opt_includeInstance) {
-  return proto.game.Leaderboard.toObject(opt_includeInstance, this);
+proto.game.ShardInfo.prototype.toObject = function(opt_includeInstance) {
+  return proto.game.ShardInfo.toObject(opt_includeInstance, this);
 };
 
 
@@ -2002,14 +6087,14 @@ proto.game.Leaderboard.prototype.toObject = function(opt_includeInstance) {
  * @param {boolean|undefined} includeInstance Deprecated. Whether to include
  *     the JSPB instance for transitional soy proto support:
  *     http://goto/soy-param-migration
- * @param {!proto.game.Leaderboard} msg The msg instance to transform.
+ * @param {!proto.game.ShardInfo} msg The msg instance to transform.
  * @return {!Object}
  * @suppress {unusedLocalVariables} f is only used for nested messages
  */
-proto.game.Leaderboard.toObject = function(includeInstance, msg) {
+proto.game.ShardInfo.toObject = function(includeInstance, msg) {
   var f, obj = {
-entriesList: jspb.Message.toObjectList(msg.getEntriesList(),
-    proto.game.LeaderboardEntry.toObject, includeInstance)
+shardId: jspb.Message.getFieldWithDefault(msg, 1, 0),
+address: jspb.Message.getFieldWithDefault(msg, 2, "")
   };
 
   if (includeInstance) {
@@ -2023,23 +6108,23 @@ entriesList: jspb.Message.toObjectList(msg.getEntriesList(),
 /**
  * Deserializes binary data (in protobuf wire format).
  * @param {jspb.ByteSource} bytes The bytes to deserialize.
- * @return {!proto.game.Leaderboard}
+ * @return {!proto.game.ShardInfo}
  */
-proto.game.Leaderboard.deserializeBinary = function(bytes) {
+proto.game.ShardInfo.deserializeBinary = function(bytes) {
   var reader = new jspb.BinaryReader(bytes);
-  var msg = new proto.game.Leaderboard;
-  return proto.game.Leaderboard.deserializeBinaryFromReader(msg, reader);
+  var msg = new proto.game.ShardInfo;
+  return proto.game.ShardInfo.deserializeBinaryFromReader(msg, reader);
 };
 
 
 /**
  * Deserializes binary data (in protobuf wire format) from the
  * given reader into the given message object.
- * @param {!proto.game.Leaderboard} msg The message object to deserialize into.
+ * @param {!proto.game.ShardInfo} msg The message object to deserialize into.
  * @param {!jspb.BinaryReader} reader The BinaryReader to use.
- * @return {!proto.game.Leaderboard}
+ * @return {!proto.game.ShardInfo}
  */
-proto.game.Leaderboard.deserializeBinaryFromReader = function(msg, reader) {
+proto.game.ShardInfo.deserializeBinaryFromReader = function(msg, reader) {
   while (reader.nextField()) {
     if (reader.isEndGroup()) {
       break;
@@ -2047,9 +6132,12 @@ proto.game.Leaderboard.deserializeBinaryFromReader = function(msg, reader) {
     var field = reader.getFieldNumber();
     switch (field) {
     case 1:
-      var value = new proto.game.LeaderboardEntry;
-      reader.readMessage(value,proto.game.LeaderboardEntry.deserializeBinaryFromReader);
-      msg.addEntries(value);
+      var value = /** @type {number} */ (reader.readInt32());
+      msg.setShardId(value);
+      break;
+    case 2:
+      var value = /** @type {string} */ (reader.readString());
+      msg.setAddress(value);
       break;
     default:
       reader.skipField();
@@ -2064,9 +6152,9 @@ proto.game.Leaderboard.deserializeBinaryFromReader = function(msg, reader) {
  * Serializes the message to binary data (in protobuf wire format).
  * @return {!Uint8Array}
  */
-proto.game.Leaderboard.prototype.serializeBinary = function() {
+proto.game.ShardInfo.prototype.serializeBinary = function() {
   var writer = new jspb.BinaryWriter();
-  proto.game.Leaderboard.serializeBinaryToWriter(this, writer);
+  proto.game.ShardInfo.serializeBinaryToWriter(this, writer);
   return writer.getResultBuffer();
 };
 
@@ -2074,62 +6162,73 @@ proto.game.Leaderboard.prototype.serializeBinary = function() {
 /**
  * Serializes the given message to binary data (in protobuf wire
  * format), writing to the given BinaryWriter.
- * @param {!proto.game.Leaderboard} message
+ * @param {!proto.game.ShardInfo} message
  * @param {!jspb.BinaryWriter} writer
  * @suppress {unusedLocalVariables} f is only used for nested messages
  */
-proto.game.Leaderboard.serializeBinaryToWriter = function(message, writer) {
+proto.game.ShardInfo.serializeBinaryToWriter = function(message, writer) {
   var f = undefined;
-  f = message.getEntriesList();
-  if (f.length > 0) {
-    writer.writeRepeatedMessage(
+  f = message.getShardId();
+  if (f !== 0) {
+    writer.writeInt32(
       1,
-      f,
-      proto.game.LeaderboardEntry.serializeBinaryToWriter
+      f
+    );
+  }
+  f = message.getAddress();
+  if (f.length > 0) {
+    writer.writeString(
+      2,
+      f
     );
   }
 };
 
 
 /**
- * repeated LeaderboardEntry entries = 1;
- * @return {!Array<!proto.game.LeaderboardEntry>}
+ * optional int32 shard_id = 1;
+ * @return {number}
  */
-proto.game.Leaderboard.prototype.getEntriesList = function() {
-  return /** @type{!Array<!proto.game.LeaderboardEntry>} */ (
-    jspb.Message.getRepeatedWrapperField(this, proto.game.LeaderboardEntry, 1));
+proto.game.ShardInfo.prototype.getShardId = function() {
+  return /** @type {number} */ (jspb.Message.getFieldWithDefault(this, 1, 0));
 };
 
 
 /**
- * @param {!Array<!proto.game.LeaderboardEntry>} value
- * @return {!proto.game.Leaderboard} returns this
-*/
-proto.game.Leaderboard.prototype.setEntriesList = function(value) {
-  return jspb.Message.setRepeatedWrapperField(this, 1, value);
+ * @param {number} value
+ * @return {!proto.game.ShardInfo} returns this
+ */
+proto.game.ShardInfo.prototype.setShardId = function(value) {
+  return jspb.Message.setProto3IntField(this, 1, value);
 };
 
 
 /**
- * @param {!proto.game.LeaderboardEntry=} opt_value
- * @param {number=} opt_index
- * @return {!proto.game.LeaderboardEntry}
+ * optional string address = 2;
+ * @return {string}
  */
-proto.game.Leaderboard.prototype.addEntries = function(opt_value, opt_index) {
-  return jspb.Message.addToRepeatedWrapperField(this, 1, opt_value, proto.game.LeaderboardEntry, opt_index);
+proto.game.ShardInfo.prototype.getAddress = function() {
+  return /** @type {string} */ (jspb.Message.getFieldWithDefault(this, 2, ""));
 };
 
 
 /**
- * Clears the list making it empty but non-null.
- * @return {!proto.game.Leaderboard} returns this
+ * @param {string} value
+ * @return {!proto.game.ShardInfo} returns this
  */
-proto.game.Leaderboard.prototype.clearEntriesList = function() {
-  return this.setEntriesList([]);
+proto.game.ShardInfo.prototype.setAddress = function(value) {
+  return jspb.Message.setProto3StringField(this, 2, value);
 };
 
 
 
+/**
+ * List of repeated fields within this message type.
+ * @private {!Array<number>}
+ * @const
+ */
+proto.game.ShardMap.repeatedFields_ = [1];
+
 
 
 if (jspb.Message.GENERATE_TO_OBJECT) {
@@ -2145,8 +6244,8 @@ if (jspb.Message.GENERATE_TO_OBJECT) {
  *     http://goto/soy-param-migration
  * @return {!Object}
  */
-proto.game.LeaderboardUpdate.prototype.toObject = function(opt_includeInstance) {
-  return proto.game.LeaderboardUpdate.toObject(opt_includeInstance, this);
+proto.game.ShardMap.prototype.toObject = function(opt_includeInstance) {
+  return proto.game.ShardMap.toObject(opt_includeInstance, this);
 };
 
 
@@ -2155,14 +6254,18 @@ proto.game.LeaderboardUpdate.prototype.toObject = function(opt_includeInstance)
  * @param {boolean|undefined} includeInstance Deprecated. Whether to include
  *     the JSPB instance for transitional soy proto support:
  *     http://goto/soy-param-migration
- * @param {!proto.game.LeaderboardUpdate} msg The msg instance to transform.
+ * @param {!proto.game.ShardMap} msg The msg instance to transform.
  * @return {!Object}
  * @suppress {unusedLocalVariables} f is only used for nested messages
  */
-proto.game.LeaderboardUpdate.toObject = function(includeInstance, msg) {
+proto.game.ShardMap.toObject = function(includeInstance, msg) {
   var f, obj = {
-leaderboard: (f = msg.getLeaderboard()) && proto.game.Leaderboard.toObject(includeInstance, f),
-gameOver: jspb.Message.getBooleanFieldWithDefault(msg, 2, false)
+shardsList: jspb.Message.toObjectList(msg.getShardsList(),
+    proto.game.ShardInfo.toObject, includeInstance),
+virtualNodes: jspb.Message.getFieldWithDefault(msg, 2, 0),
+shardId: jspb.Message.getFieldWithDefault(msg, 3, 0),
+liveGames: jspb.Message.getFieldWithDefault(msg, 4, 0),
+ownerShardId: jspb.Message.getFieldWithDefault(msg, 5, 0)
   };
 
   if (includeInstance) {
@@ -2176,23 +6279,23 @@ gameOver: jspb.Message.getBooleanFieldWithDefault(msg, 2, false)
 /**
  * Deserializes binary data (in protobuf wire format).
  * @param {jspb.ByteSource} bytes The bytes to deserialize.
- * @return {!proto.game.LeaderboardUpdate}
+ * @return {!proto.game.ShardMap}
  */
-proto.game.LeaderboardUpdate.deserializeBinary = function(bytes) {
+proto.game.ShardMap.deserializeBinary = function(bytes) {
   var reader = new jspb.BinaryReader(bytes);
-  var msg = new proto.game.LeaderboardUpdate;
-  return proto.game.LeaderboardUpdate.deserializeBinaryFromReader(msg, reader);
+  var msg = new proto.game.ShardMap;
+  return proto.game.ShardMap.deserializeBinaryFromReader(msg, reader);
 };
 
 
 /**
  * Deserializes binary data (in protobuf wire format) from the
  * given reader into the given message object.
- * @param {!proto.game.LeaderboardUpdate} msg The message object to deserialize into.
+ * @param {!proto.game.ShardMap} msg The message object to deserialize into.
  * @param {!jspb.BinaryReader} reader The BinaryReader to use.
- * @return {!proto.game.LeaderboardUpdate}
+ * @return {!proto.game.ShardMap}
  */
-proto.game.LeaderboardUpdate.deserializeBinaryFromReader = function(msg, reader) {
+proto.game.ShardMap.deserializeBinaryFromReader = function(msg, reader) {
   while (reader.nextField()) {
     if (reader.isEndGroup()) {
       break;
@@ -2200,13 +6303,25 @@ proto.game.LeaderboardUpdate.deserializeBinaryFromReader = function(msg, reader)
     var field = reader.getFieldNumber();
     switch (field) {
     case 1:
-      var value = new proto.game.Leaderboard;
-      reader.readMessage(value,proto.game.Leaderboard.deserializeBinaryFromReader);
-      msg.setLeaderboard(value);
+      var value = new proto.game.ShardInfo;
+      reader.readMessage(value,proto.game.ShardInfo.deserializeBinaryFromReader);
+      msg.addShards(value);
       break;
     case 2:
-      var value = /** @type {boolean} */ (reader.readBool());
-      msg.setGameOver(value);
+      var value = /** @type {number} */ (reader.readInt32());
+      msg.setVirtualNodes(value);
+      break;
+    case 3:
+      var value = /** @type {number} */ (reader.readInt32());
+      msg.setShardId(value);
+      break;
+    case 4:
+      var value = /** @type {number} */ (reader.readInt32());
+      msg.setLiveGames(value);
+      break;
+    case 5:
+      var value = /** @type {number} */ (reader.readInt32());
+      msg.setOwnerShardId(value);
       break;
     default:
       reader.skipField();
@@ -2221,9 +6336,9 @@ proto.game.LeaderboardUpdate.deserializeBinaryFromReader = function(msg, reader)
  * Serializes the message to binary data (in protobuf wire format).
  * @return {!Uint8Array}
  */
-proto.game.LeaderboardUpdate.prototype.serializeBinary = function() {
+proto.game.ShardMap.prototype.serializeBinary = function() {
   var writer = new jspb.BinaryWriter();
-  proto.game.LeaderboardUpdate.serializeBinaryToWriter(this, writer);
+  proto.game.ShardMap.serializeBinaryToWriter(this, writer);
   return writer.getResultBuffer();
 };
 
@@ -2231,82 +6346,158 @@ proto.game.LeaderboardUpdate.prototype.serializeBinary = function() {
 /**
  * Serializes the given message to binary data (in protobuf wire
  * format), writing to the given BinaryWriter.
- * @param {!proto.game.LeaderboardUpdate} message
+ * @param {!proto.game.ShardMap} message
  * @param {!jspb.BinaryWriter} writer
  * @suppress {unusedLocalVariables} f is only used for nested messages
  */
-proto.game.LeaderboardUpdate.serializeBinaryToWriter = function(message, writer) {
+proto.game.ShardMap.serializeBinaryToWriter = function(message, writer) {
   var f = undefined;
-  f = message.getLeaderboard();
-  if (f != null) {
-    writer.writeMessage(
+  f = message.getShardsList();
+  if (f.length > 0) {
+    writer.writeRepeatedMessage(
       1,
       f,
-      proto.game.Leaderboard.serializeBinaryToWriter
+      proto.game.ShardInfo.serializeBinaryToWriter
     );
   }
-  f = message.getGameOver();
-  if (f) {
-    writer.writeBool(
+  f = message.getVirtualNodes();
+  if (f !== 0) {
+    writer.writeInt32(
       2,
       f
     );
   }
+  f = message.getShardId();
+  if (f !== 0) {
+    writer.writeInt32(
+      3,
+      f
+    );
+  }
+  f = message.getLiveGames();
+  if (f !== 0) {
+    writer.writeInt32(
+      4,
+      f
+    );
+  }
+  f = message.getOwnerShardId();
+  if (f !== 0) {
+    writer.writeInt32(
+      5,
+      f
+    );
+  }
 };
 
 
 /**
- * optional Leaderboard leaderboard = 1;
- * @return {?proto.game.Leaderboard}
+ * repeated ShardInfo shards = 1;
+ * @return {!Array<!proto.game.ShardInfo>}
  */
-proto.game.LeaderboardUpdate.prototype.getLeaderboard = function() {
-  return /** @type{?proto.game.Leaderboard} */ (
-    jspb.Message.getWrapperField(this, proto.game.Leaderboard, 1));
+proto.game.ShardMap.prototype.getShardsList = function() {
+  return /** @type{!Array<!proto.game.ShardInfo>} */ (
+    jspb.Message.getRepeatedWrapperField(this, proto.game.ShardInfo, 1));
 };
 
 
 /**
- * @param {?proto.game.Leaderboard|undefined} value
- * @return {!proto.game.LeaderboardUpdate} returns this
+ * @param {!Array<!proto.game.ShardInfo>} value
+ * @return {!proto.game.ShardMap} returns this
 */
-proto.game.LeaderboardUpdate.prototype.setLeaderboard = function(value) {
-  return jspb.Message.setWrapperField(this, 1, value);
+proto.game.ShardMap.prototype.setShardsList = function(value) {
+  return jspb.Message.setRepeatedWrapperField(this, 1, value);
 };
 
 
 /**
- * Clears the message field making it undefined.
- * @return {!proto.game.LeaderboardUpdate} returns this
+ * @param {!proto.game.ShardInfo=} opt_value
+ * @param {number=} opt_index
+ * @return {!proto.game.ShardInfo}
  */
-proto.game.LeaderboardUpdate.prototype.clearLeaderboard = function() {
-  return this.setLeaderboard(undefined);
+proto.game.ShardMap.prototype.addShards = function(opt_value, opt_index) {
+  return jspb.Message.addToRepeatedWrapperField(this, 1, opt_value, proto.game.ShardInfo, opt_index);
 };
 
 
 /**
- * Returns whether this field is set.
- * @return {boolean}
+ * Clears the list making it empty but non-null.
+ * @return {!proto.game.ShardMap} returns this
  */
-proto.game.LeaderboardUpdate.prototype.hasLeaderboard = function() {
-  return jspb.Message.getField(this, 1) != null;
+proto.game.ShardMap.prototype.clearShardsList = function() {
+  return this.setShardsList([]);
 };
 
 
 /**
- * optional bool game_over = 2;
- * @return {boolean}
+ * optional int32 virtual_nodes = 2;
+ * @return {number}
  */
-proto.game.LeaderboardUpdate.prototype.getGameOver = function() {
-  return /** @type {boolean} */ (jspb.Message.getBooleanFieldWithDefault(this, 2, false));
+proto.game.ShardMap.prototype.getVirtualNodes = function() {
+  return /** @type {number} */ (jspb.Message.getFieldWithDefault(this, 2, 0));
 };
 
 
 /**
- * @param {boolean} value
- * @return {!proto.game.LeaderboardUpdate} returns this
+ * @param {number} value
+ * @return {!proto.game.ShardMap} returns this
  */
-proto.game.LeaderboardUpdate.prototype.setGameOver = function(value) {
-  return jspb.Message.setProto3BooleanField(this, 2, value);
+proto.game.ShardMap.prototype.setVirtualNodes = function(value) {
+  return jspb.Message.setProto3IntField(this, 2, value);
+};
+
+
+/**
+ * optional int32 shard_id = 3;
+ * @return {number}
+ */
+proto.game.ShardMap.prototype.getShardId = function() {
+  return /** @type {number} */ (jspb.Message.getFieldWithDefault(this, 3, 0));
+};
+
+
+/**
+ * @param {number} value
+ * @return {!proto.game.ShardMap} returns this
+ */
+proto.game.ShardMap.prototype.setShardId = function(value) {
+  return jspb.Message.setProto3IntField(this, 3, value);
+};
+
+
+/**
+ * optional int32 live_games = 4;
+ * @return {number}
+ */
+proto.game.ShardMap.prototype.getLiveGames = function() {
+  return /** @type {number} */ (jspb.Message.getFieldWithDefault(this, 4, 0));
+};
+
+
+/**
+ * @param {number} value
+ * @return {!proto.game.ShardMap} returns this
+ */
+proto.game.ShardMap.prototype.setLiveGames = function(value) {
+  return jspb.Message.setProto3IntField(this, 4, value);
+};
+
+
+/**
+ * optional int32 owner_shard_id = 5;
+ * @return {number}
+ */
+proto.game.ShardMap.prototype.getOwnerShardId = function() {
+  return /** @type {number} */ (jspb.Message.getFieldWithDefault(this, 5, 0));
+};
+
+
+/**
+ * @param {number} value
+ * @return {!proto.game.ShardMap} returns this
+ */
+proto.game.ShardMap.prototype.setOwnerShardId = function(value) {
+  return jspb.Message.setProto3IntField(this, 5, value);
 };
 
 
@@ -2,7 +2,8 @@ import React, { useEffect, useState } from 'react';
 import { GameServiceClient } from '../grpc/game_grpc_web_pb';
 import {
   GameRequest,
-  AnswerRequest
+  AnswerRequest,
+  SessionEvent
 } from '../grpc/game_pb';
 import { useGame } from '../context/GameContext';
 import { useNavigate } from 'react-router-dom';
@@ -21,40 +22,6 @@ function Game() {
   const [loading, setLoading] = useState(false);
   const navigate = useNavigate();
 
-  const fetchNextQuestion = () => {
-    const request = new GameRequest();
-    request.setGameId(gameId);
-    request.setPlayerId(playerId);
-
-    client.getNextQuestion(request, {}, (err, response) => {
-      if (err) {
-        console.error('GetNextQuestion error:', err.message);
-        return;
-      }
-
-      if (!response.getQuestionText()) {
-        setQuestion(null);  // Game over or waiting
-        client.getLeaderboard(request, {}, (err, leaderboardResponse) => {
-          if (err) {
-            console.error('GetLeaderboard error:', err.message);
-            return;
-          }
-
-          navigate('/leaderboard')
-        });
-        return;
-      }
-
-      setQuestion({
-        id: response.getQuestionId(),
-        text: response.getQuestionText(),
-        options: response.getOptionsList()
-      });
-      setResult(null);
-      setSelectedOption('');
-    });
-  };
-
   const submitAnswer = () => {
     if (!selectedOption || !question) return;
 
@@ -79,14 +46,47 @@ function Game() {
         points: res.getPointsAwarded(),
         explanation: res.getExplanation()
       });
-
-      setTimeout(fetchNextQuestion, 5000);
     });
   };
 
+  // The server pushes each question and round transition over one stream,
+  // so there is nothing to poll.
   useEffect(() => {
-    fetchNextQuestion();
-  }, []);
+    const request = new GameRequest();
+    request.setGameId(gameId);
+    request.setPlayerId(playerId);
+
+    const stream = client.watchSession(request, {});
+    stream.on('data', (event) => {
+      switch (event.getEventCase()) {
+        case SessionEvent.EventCase.QUESTION: {
+          const card = event.getQuestion();
+          setQuestion({
+            id: card.getQuestionId(),
+            text: card.getQuestionText(),
+            options: card.getOptionsList()
+          });
+          setResult(null);
+          setSelectedOption('');
+          break;
+        }
+        case SessionEvent.EventCase.ROUND:
+          if (event.getRound().getGameOver()) {
+            setQuestion(null);
+            stream.cancel();
+            navigate('/leaderboard');
+          }
+          break;
+        default:
+          break;
+      }
+    });
+    stream.on('error', (err) => {
+      console.error('WatchSession error:', err.message);
+    });
+
+    return () => stream.cancel();
+  }, [gameId, playerId, navigate]);
 
   if (!question) return <h2>Waiting for next question...</h2>;
 
@@ -6,24 +6,75 @@ import { GameId } from '../grpc/game_pb';
 
 const client = new GameServiceClient('http://localhost:8080', null, null);
 
+// The first update on a stream is the full board; later ones carry only the
+// players whose score or rank changed. Remove those players, then re-insert
+// them in ascending rank order; everyone else keeps their relative order.
+function applyDelta(board, update) {
+  const entries = { ...board.entries };
+  const moved = new Set();
+  update.getChangesList().forEach((change) => moved.add(change.getPlayerIndex()));
+  const order = board.order.filter((index) => !moved.has(index));
+  update.getChangesList().forEach((change) => {
+    const index = change.getPlayerIndex();
+    const known = entries[index] || { name: change.getPlayerName() };
+    entries[index] = { ...known, score: change.getScore() };
+    order.splice(change.getRank() - 1, 0, index);
+  });
+  return { sequence: update.getSequence(), order, entries };
+}
+
+function fullBoard(update) {
+  const entries = {};
+  const order = update.getLeaderboard().getEntriesList().map((entry) => {
+    entries[entry.getPlayerIndex()] = { name: entry.getPlayerName(), score: entry.getScore() };
+    return entry.getPlayerIndex();
+  });
+  return { sequence: update.getSequence(), order, entries };
+}
+
 function Leaderboard() {
   const { gameId } = useGame();
-  const [entries, setEntries] = useState([]);
+  const [board, setBoard] = useState({ sequence: null, order: [], entries: {} });
 
   useEffect(() => {
-    client.getLeaderboard(new GameId().setGameId(gameId), {}, (err, response) => {
-      setEntries(response.getEntriesList())
-      // setEntries(update.getLeaderboard().getEntriesList());
-    });
-  }, []);
+    let stream = null;
+    let current = null;
+    let closed = false;
+
+    const open = () => {
+      current = null;
+      stream = client.streamLeaderboard(new GameId().setGameId(gameId), {});
+      stream.on('data', (update) => {
+        if (update.hasLeaderboard()) {
+          current = fullBoard(update);
+        } else if (current === null || update.getSequence() !== current.sequence + 1) {
+          // Missed an update: reopen the stream to get a fresh full board.
+          stream.cancel();
+          if (!closed) open();
+          return;
+        } else {
+          current = applyDelta(current, update);
+        }
+        setBoard(current);
+        if (update.getGameOver()) stream.cancel();
+      });
+      stream.on('error', (err) => console.error('StreamLeaderboard error:', err.message));
+    };
+
+    open();
+    return () => {
+      closed = true;
+      if (stream) stream.cancel();
+    };
+  }, [gameId]);
 
   return (
     <Card elevation={3} sx={{ padding: 2 }}>
       <Typography variant="h5" align="center">Leaderboard</Typography>
       <List>
-        {entries.map((entry, i) => (
-          <ListItem key={i}>
-            {entry.getRank()}. {entry.getPlayerName()} - {entry.getScore()} pts
+        {board.order.map((index, i) => (
+          <ListItem key={index}>
+            {i + 1}. {board.entries[index].name} - {board.entries[index].score} pts
           </ListItem>
         ))}
       </List>